@@ -1,8 +1,20 @@
 
 # src\file_conversor\__main__.py
 
+import sys
+
 # user provided imports
-from file_conversor.cli.__main__ import main as main
+from file_conversor.daemon_protocol import DaemonProtocol
+
+
+def main() -> None:
+    """ Main entry point (forwards the invocation to the worker daemon, if running). """
+    exit_code = DaemonProtocol.forward_cli(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from file_conversor.cli.__main__ import main as cli_main
+    cli_main()
 
 
 # Start the application
@@ -5,14 +5,14 @@ This module provides functionalities for handling external backends.
 """
 
 import os
-import shutil
+import threading
 
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable, Self
 
 import typer
 
-from file_conversor.config import LOG, get_translation
+from file_conversor.config import LOG, ProbeCache, Tracer, get_translation
 
 # user-provided imports
 from file_conversor.dependency import AbstractPackageManager
@@ -28,19 +28,38 @@ class AbstractBackend:
     Class that provides an interface for handling internal/external backends.
     """
 
+    @classmethod
+    def lazy(cls, *args: Any, **kwargs: Any) -> Callable[[], Self]:
+        """
+        Get a backend factory that creates the backend on first call (thread-safe), and reuses it afterwards.
+
+        Batch commands create backends inside their steps, so batches with nothing to process (e.g., ``--skip-up-to-date``) never check dependencies.
+
+        :param args: Backend constructor arguments.
+        :param kwargs: Backend constructor keyword arguments.
+        """
+        lock = threading.Lock()
+        backends: list[Self] = []
+
+        def _get() -> Self:
+            with lock:
+                if not backends:
+                    backends.append(cls(*args, **kwargs))
+                return backends[0]
+        return _get
+
     @classmethod
     def find_in_path(cls, name: str | Path) -> Path:
         """
-        Finds name path in PATH env
+        Finds name path in PATH env (cached, see ``ProbeCache``)
 
         :return: Path for name
 
         :raises FileNotFoundError: if name not found
         """
-        path_str = shutil.which(name)
-        if not path_str:
+        path = ProbeCache.which(name)
+        if not path:
             raise FileNotFoundError(f"'{name}' {_('not found in PATH environment')}")
-        path = Path(path_str).resolve()
         logger.info(f"'{name}' {_('found')}: {path}")
         return path
 
@@ -73,13 +92,19 @@ class AbstractBackend:
         self._pkg_managers: set[AbstractPackageManager] = pkg_managers if pkg_managers else set()
         self._install_answer = install_answer
 
-        self.verify_missing_deps()
+        # trace backend construction (dependency checks are the expensive part)
+        with Tracer.span(f"{type(self).__name__}()", "backend"):
+            self.verify_missing_deps()
 
     def verify_missing_deps(self):
         """
         Verify and install missing external dependencies, if they are not installed.
         :raises RuntimeError: Cannot install missing dependency.
         """
+        with Tracer.span("verify_missing_deps", "backend", backend=type(self).__name__):
+            self._verify_missing_deps()
+
+    def _verify_missing_deps(self):
         # identify OS and package manager
         os_type = AbstractSystem.Platform.get()
         for pkg_mgr in self._pkg_managers:
@@ -9,13 +9,10 @@ from typing import Any
 from file_conversor.backend.audio_video.codec.video.ffmpeg_video_codec import FFmpegVideoCodec
 from file_conversor.backend.audio_video.codec.video.__quality_opts_helper import QualityOptsHelper
 
-# determine number of threads for encoding
-_threads = FFmpegVideoCodec.get_cpu_count()
 
-
-def _get_tile_column_option() -> dict[str, str]:
+def _get_tile_column_option(threads: int) -> dict[str, str]:
     # max 2 tile columns for VP9/AV1 (avoid quality loss)
-    tile_column = min(int(math.log2(_threads)), 2)
+    tile_column = min(int(math.log2(threads)), 2)
     if tile_column <= 0:
         return {}
     return {"-tile-columns": str(tile_column)}
@@ -50,15 +47,17 @@ class Av1VpxCodecs(Enum):
 
     @property
     def options(self) -> dict[str, Any]:
+        # number of threads granted to current job
+        threads = FFmpegVideoCodec.get_cpu_count()
         match self:
             case self.VP8_LIB:
                 return {
-                    "-threads": _threads,
+                    "-threads": threads,
                 }
             case self.VP9_LIB | self.AV1_LIB:
                 return {
-                    "-threads": _threads,  # set number of threads
-                    **_get_tile_column_option(),  # set tile columns based on CPU threads
+                    "-threads": threads,  # set number of threads
+                    **_get_tile_column_option(threads),  # set tile columns based on CPU threads
                     "-row-mt": "1",  # enable row-based multi-threading
                 }
             case _:
@@ -7,7 +7,7 @@ from file_conversor.backend.audio_video.codec.abstract_ffmpeg_codec import (
     AbstractFFmpegCodec,
 )
 from file_conversor.backend.audio_video.filter.ffmpeg_filter import FFmpegFilter
-from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.config import LOG, ResourceGovernor, get_translation
 
 
 _ = get_translation()
@@ -32,7 +32,8 @@ class FFmpegVideoCodec(AbstractFFmpegCodec):
 
     @classmethod
     def get_cpu_count(cls) -> int:
-        return Environment.get_cpu_count()
+        """Get number of CPU threads granted to current job."""
+        return ResourceGovernor.get_threads()
 
     def __init__(
         self,
@@ -4,10 +4,8 @@
 This module provides functionalities for handling audio and video files using FFmpeg.
 """
 
-import subprocess
-
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 # user-provided imports
 from file_conversor.backend.audio_video.abstract_ffmpeg_backend import (
@@ -23,7 +21,7 @@ from file_conversor.backend.audio_video.container.format_container import (
 )
 from file_conversor.backend.audio_video.ffprobe_backend import FFprobeBackend
 from file_conversor.backend.audio_video.filter.ffmpeg_filter import FFmpegFilter
-from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.config import LOG, Environment, ResourceGovernor, get_translation
 from file_conversor.system import System
 from file_conversor.utils.formatters import get_output_file
 
@@ -99,30 +97,27 @@ class FFmpegBackend(AbstractFFmpegBackend):
         self._video_bitrate: int = -1
 
         self._progress_callback: Callable[[float], Any] | None = None
+        self._ffprobe_backend: FFprobeBackend | None = None
 
     def _execute_progress_callback(
         self,
-        process: subprocess.Popen[Any],
+        lines: Iterable[str],
     ):
-        """returns output lines read"""
+        """Parse output lines (progress), while process runs"""
         import re
 
-        lines: list[str] = []
         PROGRESS_RE = re.compile(r'time=(\d+):(\d+):([\d\.]+)')
 
-        ffprobe_backend = FFprobeBackend(install_deps=self._install_deps, verbose=self._verbose)
         if not self._input_file:
             raise RuntimeError(f"{_('Input file not set')}")
+        if self._ffprobe_backend is None:
+            # reused by all encodes of this backend (dependency checks run once)
+            self._ffprobe_backend = FFprobeBackend(install_deps=self._install_deps, verbose=self._verbose)
 
-        file_duration_secs = ffprobe_backend.get_duration(self._input_file)
-        while process.poll() is None:
-            if not process.stdout:
-                continue
-
-            line = process.stdout.readline()
+        file_duration_secs = self._ffprobe_backend.get_duration(self._input_file)
+        for line in lines:
             match = PROGRESS_RE.search(line)
             if not match:
-                lines.append(line)
                 continue
             hours = int(match.group(1))
             minutes = int(match.group(2))
@@ -132,7 +127,6 @@ class FFmpegBackend(AbstractFFmpegBackend):
             progress = 100.0 * (float(current_time) / file_duration_secs)
             if self._progress_callback:
                 self._progress_callback(progress)
-        return lines
 
     def _set_input_file(self, input_file: Path):
         """
@@ -310,18 +304,11 @@ class FFmpegBackend(AbstractFFmpegBackend):
         # remove empty strings
         ffmpeg_command = [arg for arg in ffmpeg_command if arg != ""]
 
-        # Execute the FFmpeg command
-        process = Environment.run_nowait(
-            *ffmpeg_command,
+        # Execute the FFmpeg command (output lines parsed as they arrive)
+        self._execute_progress_callback(
+            lines=Environment.stream_lines(*ffmpeg_command),
         )
 
-        out_lines = self._execute_progress_callback(
-            process=process,
-        )
-
-        Environment.check_returncode(process, out_lines=out_lines)
-        return process
-
     def execute(
         self,
         progress_callback: Callable[[float], Any] | None = None,
@@ -335,9 +322,8 @@ class FFmpegBackend(AbstractFFmpegBackend):
         :param pass_num: Pass number for multi-pass encoding (0 for single pass, 1 for first pass, 2 for second pass). Defaults to 0.
         :param out_opts: FFmpeg custom out options. Defaults to None.
 
-        :return: Subprocess.Popen object
-
         :raises RuntimeError: If FFmpeg encounters an error during execution.
+        :raises subprocess.CalledProcessError: If FFmpeg fails.
         """
         self._progress_callback = progress_callback
 
@@ -353,6 +339,8 @@ class FFmpegBackend(AbstractFFmpegBackend):
         self._out_opts = [
             *self._get_two_pass_options(pass_num),
             *self._out_container.get_options(),
+            # limit encoder threads to the CPU tokens granted to parallel jobs
+            *(["-threads", str(ResourceGovernor.get_threads())] if ResourceGovernor.is_governed() else []),
             *(out_opts or []),
         ]
 
@@ -92,6 +92,44 @@ class StageConfigDataModel(BaseModel):
             cmd_list.append(cmd)
         return cmd_list
 
+    def get_input_files(self) -> list[Path]:
+        """ Get input files of the stage (ignores folders and hidden files, e.g. config file and batch journals) """
+        return [
+            in_path for in_path in self.in_dir.glob("*")
+            if in_path.is_file() and not in_path.name.startswith(".")
+        ]
+
+    def execute_file(self, in_path: Path) -> list[Path]:
+        """
+        Process a single input file.
+
+        :param in_path: Input file.
+
+        :return: Output files created by the stage command.
+
+        :raises subprocess.CalledProcessError: if the stage command fails (partial outputs are removed).
+        """
+        import subprocess
+
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        existing = set(self.out_dir.iterdir())
+        try:
+            cmd_list = self._gen_cmd_list(in_path)
+            logger.debug("Command list: '%s'", cmd_list)
+            process = Environment.run(*cmd_list)
+            logger.debug("Processing file '%s': [bold green]%s[/] (%s)", in_path, _('SUCCESS'), process.returncode)
+        except Exception as e:
+            logger.error(f"Processing file '{in_path}': [bold red]{_('FAILED')}[/]")
+            logger.error(f"{str(e)}")
+            if isinstance(e, subprocess.CalledProcessError):
+                logger.error(f"Stdout:\n{e.stdout}")
+                logger.error(f"Stderr:\n{e.stderr}")
+            for path in set(self.out_dir.iterdir()) - existing:
+                if path.is_file():
+                    path.unlink()
+            raise
+        return sorted(path for path in set(self.out_dir.iterdir()) - existing if path.is_file() and not path.name.startswith("."))
+
     def execute(
         self,
         progress_callback: Callable[[float], Any] = lambda p: p,
@@ -101,36 +139,19 @@ class StageConfigDataModel(BaseModel):
 
         :raises subprocess.CalledProcessError: if a stage failes
         """
-        import subprocess
-
         logger.info(f"{_('Executing batch stage')} '{self.out_dir}' ...")
         self.out_dir.mkdir(parents=True, exist_ok=True)
 
-        total_files = sum(1 for _ in self.in_dir.glob("*"))
-        for i, in_path in enumerate(self.in_dir.glob("*"), start=1):
-            # ignore folders and config file
-            if in_path.is_dir() or in_path.name == _PIPELINE_CONFIG_FILENAME:
-                continue
-
-            # execute cmd
+        in_paths = self.get_input_files()  # single folder scan
+        for i, in_path in enumerate(in_paths, start=1):
             try:
-                cmd_list = self._gen_cmd_list(in_path)
-                logger.debug(f"Command list: '{cmd_list}'")
-                process = Environment.run(*cmd_list)
-
-                logger.debug(f"Processing file '{in_path}': [bold green]{_('SUCCESS')}[/] ({process.returncode})")
-
-                # update progress
-                progress = float(i) / total_files * 100.0
-                progress_callback(progress)
-            except Exception as e:
-                logger.error(f"Processing file '{in_path}': [bold red]{_('FAILED')}[/]")
-                logger.error(f"{str(e)}")
-                if isinstance(e, subprocess.CalledProcessError):
-                    logger.error(f"Stdout:\n{e.stdout}")
-                    logger.error(f"Stderr:\n{e.stderr}")
+                self.execute_file(in_path)
+            except Exception:
                 _clean_dir(self.out_dir)
                 raise
+            # update progress
+            progress = float(i) / len(in_paths) * 100.0
+            progress_callback(progress)
         # success, clean input_path
         _clean_dir(self.in_dir)
 
@@ -143,6 +164,27 @@ class PipelineConfigDataModel(BaseModel):
     folder: Path
     stages: list[StageConfigDataModel]
 
+    def execute_file(self, in_path: Path) -> list[Path]:
+        """
+        Run a single file through all stages (outputs of each stage are the inputs of the next one).
+        Inputs of each stage are removed once the stage succeeds (like ``StageConfigDataModel.execute()``).
+
+        :param in_path: Input file (inside pipeline folder).
+
+        :return: Output files of the last stage.
+
+        :raises subprocess.CalledProcessError: if a stage fails (its input files are kept).
+        """
+        in_paths = [in_path]
+        for stage in self.stages:
+            out_paths: list[Path] = []
+            for stage_in_path in in_paths:
+                out_paths.extend(stage.execute_file(stage_in_path))
+            for stage_in_path in in_paths:
+                stage_in_path.unlink(missing_ok=True)
+            in_paths = out_paths
+        return in_paths
+
     def add_stage(self, out_dir: str, command: str):
         stage: str = f"{len(self.stages)}_{out_dir}"
 
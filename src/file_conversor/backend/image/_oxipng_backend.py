@@ -12,7 +12,7 @@ from typing import Any
 
 # user-provided imports
 from file_conversor.backend.abstract_backend import AbstractBackend
-from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.config import LOG, Environment, ResourceGovernor, get_translation
 from file_conversor.dependency import AptPackageManager, BrewPackageManager, DnfPackageManager, ScoopPackageManager
 
 
@@ -95,6 +95,7 @@ class OxiPNGBackend(AbstractBackend):  # pyright: ignore[reportUnusedClass]
         command = [
             f"{self._oxipng_bin}",
             f"-o", f"{compression_level}",
+            f"--threads", f"{ResourceGovernor.get_threads()}",
         ]
         if strip_metadata:
             command.extend([f"--strip", f"safe",])
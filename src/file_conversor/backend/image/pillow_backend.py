@@ -8,7 +8,7 @@ from enum import StrEnum
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+from PIL import Image, ImageEnhance, ImageFilter, ImageMode, ImageOps
 from PIL.ExifTags import TAGS
 
 from file_conversor.backend.abstract_backend import AbstractBackend
@@ -152,6 +152,26 @@ class PillowBackend(AbstractBackend):
 
     EXTERNAL_DEPENDENCIES: set[str] = set()
 
+    MEMORY_COPIES = 3
+    """ full size images held at once (decoded input, converted / enhanced copy, output) """
+
+    @classmethod
+    def estimate_memory(cls, input_file: Path) -> int:
+        """
+        Estimate peak memory needed to process input file (only reads image header).
+
+        :param input_file: Input image file.
+
+        :return: Estimated peak memory in bytes.
+        """
+        with Image.open(input_file) as img:
+            width, height = img.size
+            mode = ImageMode.getmode(img.mode)
+            bytes_per_band = int(mode.typestr[-1]) if mode.typestr[-1].isdigit() else 1
+            # images are usually converted to RGB / RGBA before processing
+            bytes_per_pixel = max(len(mode.bands) * bytes_per_band, 4)
+        return width * height * bytes_per_pixel * cls.MEMORY_COPIES
+
     def __init__(self, verbose: bool = False,):
         """
         Initialize the ``pillow`` backend
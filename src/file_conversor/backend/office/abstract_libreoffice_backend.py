@@ -1,5 +1,7 @@
 # src\file_conversor\backend\office\abstract_libreoffice_backend.py
 
+import os
+
 from pathlib import Path
 from typing import override
 
@@ -54,6 +56,19 @@ class AbstractLibreofficeBackend(AbstractBackend, ConvertProtocol):
 
         self._libreoffice_bin = self.find_in_path("soffice")
 
+    def _get_profile_args(self) -> list[str]:
+        """
+        Get isolated user profile args for parallel workers (``soffice`` instances sharing a profile block each other).
+        """
+        import multiprocessing
+        import tempfile
+        import threading
+
+        if threading.current_thread() is threading.main_thread() and multiprocessing.parent_process() is None:
+            return []
+        profile_dir = Path(tempfile.gettempdir()) / f"file_conversor_lo_{os.getpid()}_{threading.get_ident()}"
+        return [f"-env:UserInstallation={profile_dir.as_uri()}"]
+
     @override
     def convert(
         self,
@@ -66,6 +81,7 @@ class AbstractLibreofficeBackend(AbstractBackend, ConvertProtocol):
         # Execute command
         process = Environment.run(
             str(self._libreoffice_bin),
+            *self._get_profile_args(),
             "--headless",
             "--convert-to",
             str(output_format),
@@ -10,7 +10,7 @@ from typing import Any, Callable
 from file_conversor.backend.abstract_backend import AbstractBackend
 
 # user-provided imports
-from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.config import LOG, Environment, ResourceGovernor, get_translation
 from file_conversor.dependency import BrewPackageManager, ScoopPackageManager
 
 
@@ -217,6 +217,8 @@ class GhostscriptBackend(AbstractBackend):
             # set non-interactive mode
             f"-dNOPAUSE",
             f"-dBATCH",
+            # rendering threads granted to current job
+            f"-dNumRenderingThreads={ResourceGovernor.get_threads()}",
         ]
 
     def _get_inout_options(self, in_path: Path, out_path: Path) -> list[str]:
@@ -318,30 +320,16 @@ class GhostscriptBackend(AbstractBackend):
         # set input/output files
         command.extend(self._get_inout_options(in_path, out_path))
 
-        # Execute the FFmpeg command
-        process = Environment.run_nowait(
-            *command,
-        )
-
-        # process output
-        out_lines: list[str] = []
+        # Execute the Ghostscript command (output lines parsed as they arrive)
         num_pages: int = 0
         progress: float = 0.0
-        while process.poll() is None:
-            if not process.stdout:
-                continue
-            line = process.stdout.readline()
-            out_lines.append(line)  # collect output lines for error checking
-
+        for line in Environment.stream_lines(*command):
             num_pages = self._get_num_pages(line) or num_pages
             progress = self._get_progress(num_pages, line) or progress
 
             if progress_callback:
                 progress_callback(progress)
 
-        Environment.check_returncode(process, out_lines=out_lines)
-        return process
-
 
 __all__ = [
     "GhostscriptBackend",
@@ -9,7 +9,7 @@ from file_conversor.backend.git_backend import GitBackend
 from file_conversor.backend.http_backend import HttpBackend
 
 # user-provided imports
-from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.config import LOG, Environment, ProbeCache, ResourceGovernor, get_translation
 from file_conversor.dependency import BrewPackageManager, ScoopPackageManager
 
 
@@ -90,6 +90,19 @@ class OcrMyPDFBackend(AbstractBackend):
         if lang not in available_languages:
             raise RuntimeError(f"{_('Failed to install language')} '{lang}'.")
 
+    def _list_langs(self, watch: list[Path] | None = None) -> str:
+        """
+        Get ``tesseract --list-langs`` output (cached, see ``ProbeCache``).
+
+        :param watch: Paths that invalidate the cached output when changed (e.g., tessdata directory). Defaults to None.
+        """
+        return ProbeCache.get(
+            self._tesseract_bin,
+            "--list-langs",
+            compute=lambda: Environment.run(str(self._tesseract_bin), "--list-langs").stdout,
+            watch=watch or [],
+        )
+
     def get_tessdata_dir(self) -> Path:
         """
         Get the tessdata directory.
@@ -100,11 +113,7 @@ class OcrMyPDFBackend(AbstractBackend):
         """
         import re
 
-        process = Environment.run(
-            str(self._tesseract_bin),
-            "--list-langs",
-        )
-        lines: list[str] = process.stdout.splitlines()
+        lines = self._list_langs().splitlines()
         for line in lines:
             match = re.match(r"^List of available languages in \"(.+)\"", line)
             if not match:
@@ -137,13 +146,9 @@ class OcrMyPDFBackend(AbstractBackend):
 
         :return: List of available languages.
         """
-        process = Environment.run(
-            str(self._tesseract_bin),
-            "--list-langs",
-        )
         # First line is usually 'List of available languages (x):'
         langs: set[str] = set()
-        for line in process.stdout.splitlines()[1:]:
+        for line in self._list_langs(watch=[self._tessdata_dir]).splitlines()[1:]:
             line_parsed = str(line).strip().lower()
             if not line_parsed or line_parsed == "none" or line_parsed.startswith("list of available"):
                 continue
@@ -163,15 +168,13 @@ class OcrMyPDFBackend(AbstractBackend):
         :param output_file: Output file
         :param input_file: Input file. 
         :param languages: Languages to use in OCR
-        :param num_processes: Number of processes to use. Defaults to 0 (max number of CPU cores).
+        :param num_processes: Number of processes to use. Defaults to 0 (CPU threads granted to current job).
 
         :raises FileNotFoundError: if input file not found
         """
-        import os
-
         import ocrmypdf
 
-        num_processes = num_processes if num_processes > 0 else max(1, os.cpu_count() or 1)
+        num_processes = num_processes if num_processes > 0 else ResourceGovernor.get_threads()
 
         ocrmypdf.ocr(  # pyright: ignore[reportUnknownMemberType]
             input_file_or_options=input_file.resolve(),
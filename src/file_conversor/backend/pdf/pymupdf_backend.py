@@ -32,6 +32,25 @@ class PyMuPDFBackend(AbstractBackend):
 
     EXTERNAL_DEPENDENCIES: set[str] = set()
 
+    @classmethod
+    def estimate_memory(cls, input_file: Path, dpi: int = 200) -> int:
+        """
+        Estimate peak memory needed to render input file (page pixmap, plus document size).
+
+        Pages are assumed to share the size of the first page (only the first page is loaded, so huge documents are cheap to estimate).
+
+        :param input_file: Input PDF file.
+        :param dpi: DPI for rendering images. Defaults to 200.
+
+        :return: Estimated peak memory in bytes.
+        """
+        import fitz  # pyright: ignore[reportMissingTypeStubs] # pymupdf
+        with fitz.open(str(input_file)) as doc:
+            rect = doc.load_page(0).rect if doc.page_count > 0 else None  # pyright: ignore[reportUnknownMemberType]
+            page_area: float = (rect.width * rect.height) if rect is not None else 0.0  # pyright: ignore[reportUnknownMemberType]
+        pixmap_size = page_area * (dpi / 72.0) ** 2 * 4  # RGBA pixmap, 72 points per inch
+        return int(pixmap_size) + input_file.stat().st_size
+
     def __init__(
         self,
         verbose: bool = False,
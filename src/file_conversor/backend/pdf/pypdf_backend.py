@@ -293,7 +293,7 @@ class PyPDFBackend(AbstractBackend):
                 rotation = rotations.get(i, self.Rotation.DEG_0)
 
                 # execute page rotation
-                logger.debug(f"Rotating page {i} by {rotation} deg")
+                logger.debug("Rotating page %d by %s deg", i, rotation)
                 if rotation.value > 0:
                     page.rotate(rotation.value)  # clockwise: 90, 180, 270
                 writer.add_page(page)
@@ -1,32 +1,19 @@
 # src\file_conversor\cli\__init__.py
 
+from __future__ import annotations  # option help texts are translated when the CLI is built (not on import)
+
 import contextlib
+import importlib
 import sys
 
 from enum import Enum
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 
 # user-provided imports
-from file_conversor.cli._utils import AbstractTyperGroup
-
-# CLI
-from file_conversor.cli.audio import AudioTyperGroup
-from file_conversor.cli.config import ConfigTyperGroup
-from file_conversor.cli.doc import DocTyperGroup
-from file_conversor.cli.ebook import EbookTyperGroup
-from file_conversor.cli.hash import HashTyperGroup
-from file_conversor.cli.image import ImageTyperGroup
-from file_conversor.cli.pdf import PdfTyperGroup
-from file_conversor.cli.pipeline import PipelineTyperGroup
-from file_conversor.cli.ppt import PptTyperGroup
-from file_conversor.cli.text import TextTyperGroup
-from file_conversor.cli.video import VideoTyperGroup
-from file_conversor.cli.lin import LinTyperGroup
-from file_conversor.cli.win import WinTyperGroup
-from file_conversor.cli.xls import XlsTyperGroup
+from file_conversor.cli._utils import AbstractTyperGroup, LazyTyperGroup
 
 # CORE
 from file_conversor.config import (
@@ -34,12 +21,18 @@ from file_conversor.config import (
     CONFIG,
     LOG,
     STATE,
+    BackgroundMode,
     Environment,
+    ProbeCache,
+    ProcessAccounting,
+    Tracer,
     get_system_locale,
     get_translation,
 )
 from file_conversor.config.log import Log
+from file_conversor.daemon_protocol import DaemonProtocol
 from file_conversor.system import System
+from file_conversor.utils.validators import check_file_size_format
 
 
 _ = get_translation()
@@ -54,6 +47,44 @@ def _no_log_callback(value: bool):
     STATE.logfile.enabled = not value
 
 
+def _jobs_callback(value: int | None):
+    if value is not None:
+        STATE.jobs.value = value
+
+
+def _memory_budget_callback(value: str | None):
+    if value is not None:
+        STATE.memory_budget.value = check_file_size_format(value) or "0"
+
+
+def _resume_callback(value: bool):
+    STATE.resume.enabled = value
+
+
+def _plan_callback(value: bool):
+    STATE.plan.enabled = value
+
+
+def _background_callback(value: bool):
+    STATE.background.enabled = value
+    if value:
+        BackgroundMode.apply()  # in-process steps (and threads started later) also run in background
+
+
+def _skip_up_to_date_callback(value: bool):
+    STATE.skip_up_to_date.enabled = value
+
+
+def _include_callback(value: list[str] | None):
+    if value:
+        STATE.input_filter.include = value
+
+
+def _exclude_callback(value: list[str] | None):
+    if value:
+        STATE.input_filter.exclude = value
+
+
 def _no_progress_callback(value: bool):
     STATE.progress.enabled = not value
 
@@ -73,6 +104,21 @@ def _debug_callback(value: bool):
         STATE.loglevel.level = Log.Level.DEBUG
 
 
+def _trace_callback(value: Path | None):
+    if value is not None:
+        Tracer.enable(value.resolve())
+
+
+def _accounting_callback(value: bool):
+    if value:
+        ProcessAccounting.enable()
+
+
+def _refresh_probes_callback(value: bool):
+    if value:
+        ProbeCache.clear()
+
+
 def _version_callback(value: bool):
     if not value:
         return
@@ -96,17 +142,59 @@ def _self_test_callback(value: bool):
     raise typer.Exit()
 
 
+_GROUP_CLASSES = {
+    "audio": "AudioTyperGroup",
+    "bench": "BenchTyperGroup",
+    "config": "ConfigTyperGroup",
+    "daemon": "DaemonTyperGroup",
+    "doc": "DocTyperGroup",
+    "ebook": "EbookTyperGroup",
+    "hash": "HashTyperGroup",
+    "image": "ImageTyperGroup",
+    "lin": "LinTyperGroup",
+    "pdf": "PdfTyperGroup",
+    "pipeline": "PipelineTyperGroup",
+    "ppt": "PptTyperGroup",
+    "queue": "QueueTyperGroup",
+    "text": "TextTyperGroup",
+    "video": "VideoTyperGroup",
+    "watch": "WatchTyperGroup",
+    "win": "WinTyperGroup",
+    "xls": "XlsTyperGroup",
+}
+""" command group classes, per subpackage (imported on first access) """
+
+
+def __getattr__(name: str) -> Any:
+    for subpackage, class_name in _GROUP_CLASSES.items():
+        if class_name == name:
+            return getattr(importlib.import_module(f"{__name__}.{subpackage}"), class_name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 class AppTyperGroup(AbstractTyperGroup):
     # PANELS
     class Panels(Enum):
-        OFFICE = _("Office files")
-        FILE = _("Other files")
-        UTILS_CONFIG = _("Utils and Config")
+        OFFICE = "office"
+        FILE = "file"
+        UTILS_CONFIG = "utils_config"
+
+        def get_title(self) -> str:
+            """ Panel title (translated on use) """
+            match self:
+                case AppTyperGroup.Panels.OFFICE:
+                    return _("Office files")
+                case AppTyperGroup.Panels.FILE:
+                    return _("Other files")
+                case AppTyperGroup.Panels.UTILS_CONFIG:
+                    return _("Utils and Config")
 
     # COMMANDS
     class Commands(Enum):
         AUDIO = "audio"
+        BENCH = "bench"
         CONFIG = "config"
+        DAEMON = "daemon"
         DOC = "doc"
         EBOOK = "ebook"
         HASH = "hash"
@@ -114,8 +202,10 @@ class AppTyperGroup(AbstractTyperGroup):
         PDF = "pdf"
         PIPELINE = "pipeline"
         PPT = "ppt"
+        QUEUE = "queue"
         TEXT = "text"
         VIDEO = "video"
+        WATCH = "watch"
         WIN = "win"
         LIN = "lin"
         XLS = "xls"
@@ -160,6 +250,74 @@ class AppTyperGroup(AbstractTyperGroup):
             callback=_overwrite_output_callback,
             is_flag=True,
         )] = False,
+        jobs: Annotated[int | None, typer.Option(  # noqa: ARG003
+            "--jobs", "-j",
+            help=f"{_('Max parallel jobs for batch commands (0 = number of CPU threads)')}. {_('Defaults to')} 'jobs' config (see 'config show').",
+            callback=_jobs_callback,
+            min=0,
+        )] = None,
+        memory_budget: Annotated[str | None, typer.Option(  # noqa: ARG003
+            "--memory-budget", "-mb",
+            help=f"{_('Memory budget for parallel jobs, e.g. 8G (jobs only start if their estimated peak memory fits, huge inputs run alone). 0 = 75% of physical memory')}. {_('Defaults to')} 'memory_budget' config (see 'config show').",
+            callback=_memory_budget_callback,
+        )] = None,
+        resume: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--resume", "-rs",
+            help=f"{_('Resume interrupted batch (skip files completed in the batch journal and clean orphaned step files)')}. Defaults to False (start a new batch).",
+            callback=_resume_callback,
+            is_flag=True,
+        )] = False,
+        plan: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--plan", "-pl",
+            help=f"{_('Dry run: print the files that would be processed, with estimated duration and output size (based on probe data and throughput of previous runs), without converting anything')}. Defaults to False.",
+            callback=_plan_callback,
+            is_flag=True,
+        )] = False,
+        background: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--background", "-bg",
+            help=f"{_('Run in background (low-impact) execution class: CPU niceness and idle I/O priority for conversions and their tools, plus CPU / memory caps under systemd (see background_* config)')}.",
+            callback=_background_callback,
+            is_flag=True,
+        )] = False,
+        skip_up_to_date: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--skip-up-to-date", "-su",
+            help=f"{_('Skip input files whose output is newer than the input (make-style), and overwrite outdated outputs')}. Defaults to False.",
+            callback=_skip_up_to_date_callback,
+            is_flag=True,
+        )] = False,
+        include: Annotated[list[str] | None, typer.Option(  # noqa: ARG003
+            "--include", "-inc",
+            help=f"{_('Include glob for files found inside input folders (e.g. *.pdf, drafts/*). Can be used multiple times')}.",
+            callback=_include_callback,
+        )] = None,
+        exclude: Annotated[list[str] | None, typer.Option(  # noqa: ARG003
+            "--exclude", "-exc",
+            help=f"{_('Exclude glob for files / folders found inside input folders (e.g. .git, *_old.*). Can be used multiple times')}.",
+            callback=_exclude_callback,
+        )] = None,
+        trace: Annotated[Path | None, typer.Option(  # noqa: ARG003
+            "--trace", "-tr",
+            help=f"{_('Save tracing spans (batch steps, processes, backends) to a JSON file, in Chrome trace-event format (open it in Perfetto / chrome://tracing)')}.",
+            callback=_trace_callback,
+            dir_okay=False,
+        )] = None,
+        accounting: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--accounting", "-ac",
+            help=f"{_('Collect resource usage (wall time, CPU time, max RSS, python heap peak) of external tools and batch steps, and print a per-tool summary at the end of each batch')}.",
+            callback=_accounting_callback,
+            is_flag=True,
+        )] = False,
+        refresh_probes: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--refresh-probes", "-rp",
+            help=f"{_('Discard cached dependency probes (executables found in PATH, tool capabilities) and probe them again')}.",
+            callback=_refresh_probes_callback,
+            is_flag=True,
+        )] = False,
+        no_daemon: Annotated[bool, typer.Option(  # noqa: ARG003
+            "--no-daemon", "-nd",
+            help=f"{_('Run in this process, even if the worker daemon is running')}. Defaults to False (forward invocation to the daemon, if running).",
+            is_flag=True,
+        )] = False,
         version: Annotated[bool, typer.Option(  # noqa: ARG003
             "--version", "-V",
             help=_("Display version"),
@@ -177,6 +335,8 @@ class AppTyperGroup(AbstractTyperGroup):
             # show version info (if debug mode is enabled)
             _version_callback(debug)
 
+        if not STATE.loglevel.level.is_debug():
+            return  # skip startup diagnostics (they load the language list and configuration)
         logger.debug(f"Command: {sys.argv}")
         # Environment.get_executable()
         logger.debug(f"Working directory: {Path().resolve()}")
@@ -202,27 +362,49 @@ class AppTyperGroup(AbstractTyperGroup):
             ),
         )
 
-        # add subcommands
-        self.add(
+        # add subcommands (imported only when selected)
+        self.add_lazy(
             # OFFICE
-            DocTyperGroup(self.Commands.DOC.value, rich_help_panel=self.Panels.OFFICE.value),
-            XlsTyperGroup(self.Commands.XLS.value, rich_help_panel=self.Panels.OFFICE.value),
-            PptTyperGroup(self.Commands.PPT.value, rich_help_panel=self.Panels.OFFICE.value),
+            self._lazy(self.Commands.DOC, self.Panels.OFFICE),
+            self._lazy(self.Commands.XLS, self.Panels.OFFICE),
+            self._lazy(self.Commands.PPT, self.Panels.OFFICE),
 
             # FILE
-            AudioTyperGroup(self.Commands.AUDIO.value, rich_help_panel=self.Panels.FILE.value),
-            VideoTyperGroup(self.Commands.VIDEO.value, rich_help_panel=self.Panels.FILE.value),
-            ImageTyperGroup(self.Commands.IMAGE.value, rich_help_panel=self.Panels.FILE.value),
-            PdfTyperGroup(self.Commands.PDF.value, rich_help_panel=self.Panels.FILE.value),
-            EbookTyperGroup(self.Commands.EBOOK.value, rich_help_panel=self.Panels.FILE.value),
-            TextTyperGroup(self.Commands.TEXT.value, rich_help_panel=self.Panels.FILE.value),
-            HashTyperGroup(self.Commands.HASH.value, rich_help_panel=self.Panels.FILE.value),
+            self._lazy(self.Commands.AUDIO, self.Panels.FILE),
+            self._lazy(self.Commands.VIDEO, self.Panels.FILE),
+            self._lazy(self.Commands.IMAGE, self.Panels.FILE),
+            self._lazy(self.Commands.PDF, self.Panels.FILE),
+            self._lazy(self.Commands.EBOOK, self.Panels.FILE),
+            self._lazy(self.Commands.TEXT, self.Panels.FILE),
+            self._lazy(self.Commands.HASH, self.Panels.FILE),
 
             # UTILS and CONFIG
-            WinTyperGroup(self.Commands.WIN.value, rich_help_panel=self.Panels.UTILS_CONFIG.value, hidden=System.Platform.get() != System.Platform.WINDOWS),
-            LinTyperGroup(self.Commands.LIN.value, rich_help_panel=self.Panels.UTILS_CONFIG.value, hidden=System.Platform.get() != System.Platform.LINUX),
-            ConfigTyperGroup(self.Commands.CONFIG.value, rich_help_panel=self.Panels.UTILS_CONFIG.value),
-            PipelineTyperGroup(self.Commands.PIPELINE.value, rich_help_panel=self.Panels.UTILS_CONFIG.value),
+            self._lazy(self.Commands.WIN, self.Panels.UTILS_CONFIG, load_all=True, hidden=System.Platform.get() != System.Platform.WINDOWS),
+            self._lazy(self.Commands.LIN, self.Panels.UTILS_CONFIG, load_all=True, hidden=System.Platform.get() != System.Platform.LINUX),
+            self._lazy(self.Commands.CONFIG, self.Panels.UTILS_CONFIG),
+            self._lazy(self.Commands.PIPELINE, self.Panels.UTILS_CONFIG),
+            self._lazy(self.Commands.BENCH, self.Panels.UTILS_CONFIG),
+            self._lazy(self.Commands.DAEMON, self.Panels.UTILS_CONFIG, hidden=not DaemonProtocol.is_supported()),
+            self._lazy(self.Commands.QUEUE, self.Panels.UTILS_CONFIG),
+            self._lazy(self.Commands.WATCH, self.Panels.UTILS_CONFIG),
+        )
+
+    @classmethod
+    def _lazy(cls, command: Commands, panel: Panels, load_all: bool = False, **kwargs: Any) -> LazyTyperGroup.Entry:
+        """
+        Get lazy group entry of a command (group class ``<Name>TyperGroup``, in ``file_conversor.cli.<name>``).
+
+        :param command: Command group.
+        :param panel: Help panel.
+        :param load_all: Load every other group first (context menu commands). Defaults to False.
+        :param kwargs: Additional group constructor arguments (e.g., ``hidden``).
+        """
+        return LazyTyperGroup.Entry(
+            name=command.value,
+            import_path=f"{__name__}.{command.value}:{_GROUP_CLASSES[command.value]}",
+            rich_help_panel=panel.get_title(),
+            kwargs=kwargs,
+            load_all=load_all,
         )
 
     def run(self):
@@ -2,7 +2,7 @@
 # src\file_conversor\cli\__main__.py
 
 # user provided imports
-from file_conversor.cli import LOG, STATE, AppTyperGroup, get_translation
+from file_conversor.cli import LOG, STATE, AppTyperGroup, Tracer, get_translation
 from file_conversor.main_helper import MainHelper
 
 
@@ -10,7 +10,7 @@ _ = get_translation()
 logger = LOG.getLogger(__name__)
 
 
-def _start_cli() -> int:
+def start_cli() -> int:
     """ Starts the CLI application. """
     try:
         cli_app = AppTyperGroup()
@@ -32,6 +32,8 @@ def _start_cli() -> int:
         if debug_mode:
             raise
         return 1
+    finally:
+        Tracer.save()
 
 # Entry point of the app
 
@@ -39,7 +41,7 @@ def _start_cli() -> int:
 def main() -> None:
     """ Main entry point for the CLI application. """
     main_helper = MainHelper()
-    main_helper.run(_start_cli)
+    main_helper.run(start_cli)
 
 
 # Start the application
@@ -3,6 +3,9 @@
 # export core utils
 from file_conversor.cli._utils.abstract_typer_command import *
 from file_conversor.cli._utils.abstract_typer_group import *
+from file_conversor.cli._utils.command_capture import *
+from file_conversor.cli._utils.command_index import *
+from file_conversor.cli._utils.lazy_typer_group import *
 from file_conversor.cli._utils.rich_progress_bar import *
 from file_conversor.cli._utils.typer import *
 
@@ -7,6 +7,9 @@ from typing import Any, Callable, Protocol
 import typer
 import typer.core
 
+# user-provided modules
+from file_conversor.cli._utils.lazy_typer_group import LazyTyperGroup
+
 
 class GetTyperProtocol(Protocol):
     def get_typer(self) -> typer.Typer: ...
@@ -81,6 +84,13 @@ class AbstractTyperGroup:
         for obj in objs:
             self._typer_cmd.add_typer(obj.get_typer())
 
+    def add_lazy(self, *entries: LazyTyperGroup.Entry):
+        """Add subcommand groups that are only imported when selected (see ``LazyTyperGroup``)."""
+        group_cls = self._typer_cmd.info.cls
+        if not (isinstance(group_cls, type) and issubclass(group_cls, LazyTyperGroup)):
+            group_cls = LazyTyperGroup
+        self._typer_cmd.info.cls = group_cls.bind({entry.name: entry for entry in entries})
+
     def get_typer(self) -> typer.Typer:
         return self._typer_cmd
 
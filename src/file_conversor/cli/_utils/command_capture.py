@@ -0,0 +1,48 @@
+# src\file_conversor\cli\_utils\command_capture.py
+
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+# user-provided modules
+from file_conversor.config import STATE, Environment, get_translation
+
+
+if TYPE_CHECKING:
+    from file_conversor.command.abstract_cmd import AbstractCommand
+
+
+_ = get_translation()
+
+
+class CommandCapture:
+    @classmethod
+    def from_args(cls, ctx: typer.Context, args: list[str]) -> tuple['AbstractCommand[Any, Any]', dict[str, Any]]:
+        """
+        Parse CLI arguments into a command model and CLI states (the command is not executed).
+
+        :param ctx: CLI context of the calling command (arguments are parsed by its root command, the app).
+        :param args: CLI arguments (global options and command).
+
+        :raises ValueError: if arguments do not run a command.
+        """
+        from file_conversor.command.abstract_cmd import AbstractCommand, CommandCapturedError
+
+        states = STATE.to_dict()
+        try:
+            with AbstractCommand.capture():
+                ctx.find_root().command.main(
+                    args=args,
+                    prog_name=Environment.get_app_name(),
+                    standalone_mode=False,
+                )
+        except CommandCapturedError as e:
+            return e.command, STATE.to_dict()
+        finally:
+            STATE.from_dict(states)
+        raise ValueError(f"{_('Arguments do not run a command')}: {' '.join(args)}")
+
+
+__all__ = [
+    "CommandCapture",
+]
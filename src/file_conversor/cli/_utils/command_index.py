@@ -0,0 +1,87 @@
+# src\file_conversor\cli\_utils\command_index.py
+
+import json
+import re
+
+from pathlib import Path
+from typing import Any, Iterable, cast
+
+# user-provided modules
+from file_conversor.config.environment import Environment
+from file_conversor.config.locale import get_translation
+from file_conversor.config.log import LOG
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class CommandIndex:
+    """
+    Prebuilt index of CLI command groups (help texts), so ``--help`` and shell completion do not import every group.
+
+    The index is generated at build time (see ``CommandIndexBuilder``), with translatable messages marked, and translated when read.
+    Indexes that do not match the registered groups are ignored (groups are imported instead).
+    """
+    _INDEX_FILE = "command_index.json"
+    MSGID_START = "\x02"
+    """ start of a translatable message (msgid), in index files """
+    MSGID_END = "\x03"
+    """ end of a translatable message (msgid), in index files """
+    _MSGID_RE = re.compile(f"{MSGID_START}(.*?){MSGID_END}", re.DOTALL)
+
+    __index: dict[str, dict[str, str]] | None = None
+
+    @classmethod
+    def get_file(cls) -> Path:
+        """Get command index file."""
+        return Environment.get_build_data_folder() / cls._INDEX_FILE
+
+    @classmethod
+    def _translate(cls, text: str | None) -> str | None:
+        if text is None:
+            return None
+        return cls._MSGID_RE.sub(lambda match: _(match.group(1)), text)
+
+    @classmethod
+    def load(cls) -> dict[str, dict[str, str]]:
+        """Load command index (empty if missing or invalid)."""
+        index: dict[str, dict[str, str]] | None = cls.__index
+        if index is None:
+            try:
+                data = cast("dict[str, Any]", json.loads(cls.get_file().read_text(encoding="utf-8")))
+                groups = data.get("groups")
+                index = cast("dict[str, dict[str, str]]", groups) if isinstance(groups, dict) else {}
+            except (OSError, ValueError, AttributeError, KeyError) as e:
+                logger.debug(f"Cannot load command index: {repr(e)}")
+                index = {}
+            cls.__index = index
+        return index
+
+    @classmethod
+    def reload(cls):
+        """Reload command index from disk on next use (e.g., index regenerated)."""
+        cls.__index = None
+
+    @classmethod
+    def get(cls, name: str, names: Iterable[str]) -> dict[str, str | None] | None:
+        """
+        Get indexed group (translated ``help`` and ``short_help``).
+
+        :param name: Group name.
+        :param names: Registered group names (index is ignored if it does not match them).
+
+        :return: Indexed group, or None if not indexed.
+        """
+        index = cls.load()
+        if set(index) != set(names) or name not in index:
+            return None
+        return {
+            "help": cls._translate(index[name].get("help")),
+            "short_help": cls._translate(index[name].get("short_help")),
+        }
+
+
+__all__ = [
+    "CommandIndex",
+]
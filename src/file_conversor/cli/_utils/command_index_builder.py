@@ -0,0 +1,64 @@
+# src\file_conversor\cli\_utils\command_index_builder.py
+
+import json
+import sys
+
+from pathlib import Path
+
+import typer.main
+
+# user-provided modules
+from file_conversor.cli import AppTyperGroup
+from file_conversor.cli._utils.command_index import CommandIndex
+from file_conversor.cli._utils.lazy_typer_group import LazyTyperGroup
+from file_conversor.config.locale import set_translation
+from file_conversor.config.log import LOG
+
+
+logger = LOG.getLogger(__name__)
+
+
+class CommandIndexBuilder:
+    """
+    Command index generator (build time, see ``CommandIndex``).
+
+    Not exported by ``file_conversor.cli._utils``, as it imports the CLI app itself.
+    """
+    @classmethod
+    def generate(cls, output_file: Path | None = None):
+        """
+        Generate command index, importing every command group.
+
+        Must run in a fresh interpreter (e.g., ``python -c``), so translatable messages of the groups are marked.
+
+        :param output_file: Index file. Defaults to ``CommandIndex.get_file()``.
+
+        :raises RuntimeError: if command groups were already imported.
+        """
+        group = typer.main.get_command(AppTyperGroup().get_typer())
+        if not isinstance(group, LazyTyperGroup):
+            raise RuntimeError("App command group is not lazy")
+        modules = [entry.import_path.split(":")[0] for entry in group.lazy_groups.values()]
+        if any(module in sys.modules for module in modules):
+            raise RuntimeError("Command groups already imported, generate the command index in a fresh interpreter")
+
+        # mark translatable messages (msgids are translated at runtime)
+        set_translation(lambda message: f"{CommandIndex.MSGID_START}{message}{CommandIndex.MSGID_END}")
+        try:
+            groups: dict[str, dict[str, str | None]] = {}
+            for name in group.lazy_groups:
+                command = group.load(name)
+                groups[name] = {"help": command.help, "short_help": command.short_help}
+        finally:
+            set_translation(None)
+
+        output_file = output_file or CommandIndex.get_file()
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(json.dumps({"groups": groups}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        CommandIndex.reload()
+        logger.info(f"Command index generated: {output_file} ({len(groups)} groups)")
+
+
+__all__ = [
+    "CommandIndexBuilder",
+]
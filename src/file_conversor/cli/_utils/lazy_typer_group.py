@@ -0,0 +1,102 @@
+# src\file_conversor\cli\_utils\lazy_typer_group.py
+
+import importlib
+
+from dataclasses import dataclass, field
+from typing import Any, override
+
+import typer
+import typer.core
+import typer.main
+
+# user-provided modules
+from file_conversor.cli._utils.command_index import CommandIndex
+from file_conversor.config.tracer import Tracer
+
+
+class LazyTyperGroup(typer.core.TyperGroup):
+    """
+    Typer (click) group that imports its subcommand groups only when they are selected.
+
+    ``--help`` and shell completion of groups not imported yet use the prebuilt command index (see ``CommandIndex``).
+    """
+    @dataclass
+    class Entry:
+        name: str
+        import_path: str
+        """ ``module:class`` of the ``AbstractTyperGroup`` """
+        rich_help_panel: str | None = None
+        kwargs: dict[str, Any] = field(default_factory=dict[str, Any])
+        """ additional group constructor arguments (e.g., ``hidden``) """
+        load_all: bool = False
+        """ load every other group first (e.g., context menu commands, that collect menu items from all commands) """
+
+    lazy_groups: dict[str, 'LazyTyperGroup.Entry'] = {}
+
+    @classmethod
+    def bind(cls, entries: dict[str, 'LazyTyperGroup.Entry']) -> type['LazyTyperGroup']:
+        """Get group class bound to lazy entries (typer instantiates the group class itself)."""
+        return type(cls.__name__, (cls,), {"lazy_groups": {**cls.lazy_groups, **entries}})
+
+    @override
+    def list_commands(self, ctx: Any) -> list[str]:
+        commands = super().list_commands(ctx)
+        return [*self.lazy_groups, *(name for name in commands if name not in self.lazy_groups)]
+
+    @override
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_groups:
+            return command
+        return self._get_placeholder(cmd_name) or self.load(cmd_name)
+
+    @override
+    def resolve_command(self, ctx: Any, args: list[str]) -> Any:
+        if args and args[0] in self.lazy_groups:
+            self.load(args[0])
+        return super().resolve_command(ctx, args)
+
+    def load(self, name: str) -> typer.core.TyperGroup:
+        """
+        Import and add a lazy group (no-op if already loaded).
+
+        :param name: Group name.
+        """
+        if self.lazy_groups[name].load_all:
+            for other in self.lazy_groups:
+                self._load(other)
+        return self._load(name)
+
+    def _load(self, name: str) -> typer.core.TyperGroup:
+        command = self.commands.get(name)
+        if isinstance(command, typer.core.TyperGroup):
+            return command
+        entry = self.lazy_groups[name]
+        with Tracer.span(f"load {name}", "cli"):
+            module_name, class_name = entry.import_path.split(":")
+            group_cls = getattr(importlib.import_module(module_name), class_name)
+            typer_app: typer.Typer = group_cls(name, rich_help_panel=entry.rich_help_panel, **entry.kwargs).get_typer()
+            typer_app.rich_markup_mode = self.rich_markup_mode
+            group = typer.main.get_group(typer_app)
+        self.add_command(group, name)
+        return group
+
+    def _get_placeholder(self, name: str) -> typer.core.TyperGroup | None:
+        """Get group placeholder (help texts only), from the command index. None if group is not indexed."""
+        indexed = CommandIndex.get(name, names=self.lazy_groups.keys())
+        if indexed is None:
+            return None
+        entry = self.lazy_groups[name]
+        return typer.core.TyperGroup(
+            name=name,
+            help=indexed["help"],
+            short_help=indexed["short_help"],
+            hidden=bool(entry.kwargs.get("hidden", False)),
+            rich_help_panel=entry.rich_help_panel,
+            rich_markup_mode=self.rich_markup_mode,
+        )
+
+
+__all__ = [
+    "LazyTyperGroup",
+]
@@ -1,6 +1,6 @@
 # src\file_conversor\cli\_utils\rich_progress_bar.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import TracebackType
 from typing import Optional, Self, Type
 
@@ -8,11 +8,22 @@ import rich.progress
 
 from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
 
+# user-provided modules
+from file_conversor.command.progress_aggregator import ProgressAggregator
+
 
 @dataclass
 class RichTask:
+    MAX_WORKERS_SHOWN = 3
+    """ max files in flight shown next to the progress bar """
+
     task_obj: rich.progress.Task | None = None
     progress: rich.progress.Progress | None = None
+    aggregator: ProgressAggregator = field(init=False)
+    """ Rate limited progress sink (pass as ``progress_callback`` to report per-file progress of batch commands) """
+
+    def __post_init__(self):
+        self.aggregator = ProgressAggregator(self._set_completed, workers_callback=self._set_workers)
 
     @property
     def description(self) -> str | None:
@@ -62,16 +73,28 @@ class RichTask:
             return
         self.progress.update(self.task_obj.id, visible=value)
 
+    def _set_completed(self, completed: float):
+        self.completed = completed
+
+    def _set_workers(self, workers: dict[str, float]):
+        if not self.progress or not self.task_obj:
+            return
+        shown = [f"{name} {progress:.0f}%" for name, progress in list(workers.items())[:self.MAX_WORKERS_SHOWN]]
+        if len(workers) > self.MAX_WORKERS_SHOWN:
+            shown.append(f"+{len(workers) - self.MAX_WORKERS_SHOWN}")
+        self.progress.update(self.task_obj.id, workers=" | ".join(shown))
+
     def update(self, completed: float):
-        """ Set the task progress to completed value. """
+        """ Set the task progress to completed value (rate limited, see ``progress_rate`` config). """
         if not self.progress or not self.task_obj:
             return
-        self.completed = completed
+        self.aggregator(completed)
 
     def stop(self):
         """ Stop the task progress. """
         if not self.progress or not self.task_obj:
             return
+        self.aggregator.flush()
         self.progress.stop_task(self.task_obj.id)
 
 
@@ -82,12 +105,14 @@ class RichProgressBar:
         super().__init__()
 
         self._rich_progress: Progress | None = None
+        self._tasks: list[RichTask] = []
         if progress_enabled:
             self._rich_progress = Progress(
                 TextColumn("[bold blue]{task.description}"),
                 BarColumn(bar_width=40),
                 "[bold white][progress.percentage]{task.percentage:>3.0f}%",
                 TimeRemainingColumn(),
+                TextColumn("[dim]{task.fields[workers]}"),
             )
 
     def __enter__(self) -> Self:
@@ -108,6 +133,8 @@ class RichProgressBar:
     def stop(self):
         """ Stop the progress bar. """
         if self._rich_progress:
+            for task in self._tasks:
+                task.aggregator.flush()  # pending (rate limited) updates
             self._rich_progress.stop()
 
     def add_task(
@@ -125,9 +152,10 @@ class RichProgressBar:
         """
         if not self._rich_progress:
             return RichTask()
-        task_id = self._rich_progress.add_task(description, total=total)
-        task = self._rich_progress.tasks[task_id]
-        return RichTask(task_obj=task, progress=self._rich_progress)
+        task_id = self._rich_progress.add_task(description, total=total, workers="")
+        task = RichTask(task_obj=self._rich_progress.tasks[task_id], progress=self._rich_progress)
+        self._tasks.append(task)
+        return task
 
 
 __all__ = [
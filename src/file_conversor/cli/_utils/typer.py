@@ -8,6 +8,7 @@ from typer.models import OptionInfo
 
 # user-provided modules
 from file_conversor.config.locale import get_translation
+from file_conversor.config.state import STATE
 from file_conversor.utils.validators import (
     check_dir_exists,
     check_file_format,
@@ -23,8 +24,8 @@ def InputFilesArgument(file_formats: Iterable[str] | None = None):
     if not file_formats:
         file_formats = ["*"]
     return typer.Argument(
-        help=f"{_('Input files')} ({', '.join(file_formats)})",
-        callback=lambda x: check_file_format(x, [] if "*" in file_formats else file_formats, exists=True),  # pyright: ignore[reportUnknownArgumentType]
+        help=f"{_('Input files or folders')} ({', '.join(file_formats)})",
+        callback=lambda x: check_file_format(x, [] if "*" in file_formats else file_formats, exists=True, allow_dirs=True),  # pyright: ignore[reportUnknownArgumentType]
     )
 
 
@@ -41,7 +42,7 @@ def OutputDirOption() -> OptionInfo:
     return typer.Option(
         "--output-dir", "-od",
         help=f"{_('Output directory')}. {_('Defaults to current working directory')}.",
-        callback=lambda x: check_dir_exists(x, mkdir=True),  # pyright: ignore[reportUnknownArgumentType]
+        callback=lambda x: x if STATE.plan.enabled else check_dir_exists(x, mkdir=True),  # pyright: ignore[reportUnknownArgumentType]
     )
 
 
@@ -58,7 +58,7 @@ class AudioCheckCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = AudioCheckCommand(
                 input_files=input_files,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
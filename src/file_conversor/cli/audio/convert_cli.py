@@ -12,7 +12,7 @@ from file_conversor.cli._utils.typer import (
     InputFilesArgument,
     OutputDirOption,
 )
-from file_conversor.command import AudioConvertCommand, AudioConvertOutFormats
+from file_conversor.command.audio import AudioConvertCommand, AudioConvertOutFormats
 from file_conversor.config import (
     CONFIG,
     LOG,
@@ -71,7 +71,7 @@ class AudioConvertCLI(AbstractTyperCommand):
                 file_format=file_format,
                 audio_bitrate=audio_bitrate,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
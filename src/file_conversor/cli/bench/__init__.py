@@ -0,0 +1,49 @@
+# src\file_conversor\cli\bench\__init__.py
+
+from enum import Enum
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperGroup
+from file_conversor.cli.bench.run_cli import BenchRunCLI
+from file_conversor.cli.bench.startup_cli import BenchStartupCLI
+from file_conversor.config.locale import get_translation
+
+
+_ = get_translation()
+
+
+class BenchTyperGroup(AbstractTyperGroup):
+    """Bench group command class."""
+
+    class Panels(Enum):
+        NONE = None
+
+    class Commands(Enum):
+        RUN = "run"
+        STARTUP = "startup"
+
+    def __init__(self, group_name: str, rich_help_panel: str) -> None:
+        super().__init__(
+            group_name=group_name,
+            help=_("Benchmark backends (throughput, latency, peak memory) and app startup (import time)"),
+            rich_help_panel=rich_help_panel,
+        )
+
+        # add subcommands
+        self.add(
+            BenchRunCLI(
+                group_name=group_name,
+                command_name=self.Commands.RUN.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            BenchStartupCLI(
+                group_name=group_name,
+                command_name=self.Commands.STARTUP.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+        )
+
+
+__all__ = [
+    "BenchTyperGroup",
+]
@@ -0,0 +1,78 @@
+# src\file_conversor\cli\bench\run_cli.py
+
+import json
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from rich import print_json
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand, RichProgressBar
+from file_conversor.command.bench import BenchRunCommand, BenchSuite
+from file_conversor.config import LOG, STATE, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class BenchRunCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Bench run command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.run,
+            help=f"""
+    {_('Run fixed workloads against each backend (deterministic inputs, generated locally), and report files/s, MB/s, p50/p95 latency and peak RSS as JSON.')}
+
+    {_('Suites whose external tools are missing are skipped.')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+
+- `file_conversor {group_name} {command_name} -s pillow-resize -s pypdf-merge -n 20 -of bench.json` 
+""")
+
+    def run(
+        self,
+        suites: Annotated[list[BenchSuite] | None, typer.Option(
+            "--suite", "-s",
+            help=f"{_('Benchmark suite. Can be used multiple times')}. {_('Defaults to all suites')}.",
+        )] = None,
+        files: Annotated[int, typer.Option(
+            "--files", "-n",
+            help=f"{_('Number of files processed by each suite')}.",
+            min=1,
+        )] = 10,
+        output_file: Annotated[Path | None, typer.Option(
+            "--output-file", "-of",
+            help=f"{_('Save results to a JSON file')}. {_('Defaults to None')} ({_('only print results')}).",
+            dir_okay=False,
+        )] = None,
+    ):
+        with RichProgressBar(STATE.progress.enabled) as progress_bar:
+            task = progress_bar.add_task(_("Benchmarking:"))
+            command = BenchRunCommand(
+                suites=suites or list(BenchSuite),
+                files=files,
+                progress_callback=task.aggregator,
+            )
+            command.execute()
+
+        output = json.dumps(command.output, indent=2)
+        print_json(output)
+        if output_file is not None:
+            output_file.write_text(output, encoding="utf-8")
+            logger.info(f"{_('Benchmark results saved')}: '{output_file}'")
+
+
+__all__ = [
+    "BenchRunCLI",
+]
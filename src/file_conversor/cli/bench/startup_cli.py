@@ -0,0 +1,84 @@
+# src\file_conversor\cli\bench\startup_cli.py
+
+import json
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from rich import print_json
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand, RichProgressBar
+from file_conversor.command.bench import BenchStartupCommand, BenchStartupTarget
+from file_conversor.config import LOG, STATE, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class BenchStartupCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Bench startup command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.startup,
+            help=f"""
+    {_('Run the app entry points (CLI --version, a subcommand --help, GUI up to window creation) multiple times under "python -X importtime", and report p50/p95 wall time and the modules with the highest import time as JSON.')}
+
+    {_('Targets whose dependencies are missing are skipped.')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+
+- `file_conversor {group_name} {command_name} -t version -t help -n 50 -of startup.json` 
+""")
+
+    def startup(
+        self,
+        targets: Annotated[list[BenchStartupTarget] | None, typer.Option(
+            "--target", "-t",
+            help=f"{_('Entry point to benchmark. Can be used multiple times')}. {_('Defaults to all entry points')}.",
+        )] = None,
+        runs: Annotated[int, typer.Option(
+            "--runs", "-n",
+            help=f"{_('Number of runs of each entry point')}.",
+            min=1,
+        )] = 20,
+        top: Annotated[int, typer.Option(
+            "--top",
+            help=f"{_('Number of modules reported in each ranking')}.",
+            min=1,
+        )] = 15,
+        output_file: Annotated[Path | None, typer.Option(
+            "--output-file", "-of",
+            help=f"{_('Save results to a JSON file')}. {_('Defaults to None')} ({_('only print results')}).",
+            dir_okay=False,
+        )] = None,
+    ):
+        with RichProgressBar(STATE.progress.enabled) as progress_bar:
+            task = progress_bar.add_task(_("Benchmarking:"))
+            command = BenchStartupCommand(
+                targets=targets or list(BenchStartupTarget),
+                runs=runs,
+                top=top,
+                progress_callback=task.aggregator,
+            )
+            command.execute()
+
+        output = json.dumps(command.output, indent=2)
+        print_json(output)
+        if output_file is not None:
+            output_file.write_text(output, encoding="utf-8")
+            logger.info(f"{_('Benchmark results saved')}: '{output_file}'")
+
+
+__all__ = [
+    "BenchStartupCLI",
+]
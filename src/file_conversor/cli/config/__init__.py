@@ -5,6 +5,8 @@ from enum import Enum
 
 # user-provided modules
 from file_conversor.cli._utils.abstract_typer_group import AbstractTyperGroup
+from file_conversor.cli.config.cache_clear_cli import ConfigCacheClearCLI
+from file_conversor.cli.config.cache_show_cli import ConfigCacheShowCLI
 from file_conversor.cli.config.set_cli import ConfigSetCLI
 from file_conversor.cli.config.show_cli import ConfigShowCLI
 from file_conversor.config.locale import get_translation
@@ -21,6 +23,8 @@ class ConfigTyperGroup(AbstractTyperGroup):
     class Commands(Enum):
         SHOW = "show"
         SET = "set"
+        CACHE_SHOW = "cache-show"
+        CACHE_CLEAR = "cache-clear"
 
     def __init__(self, group_name: str, rich_help_panel: str) -> None:
         super().__init__(
@@ -41,6 +45,16 @@ class ConfigTyperGroup(AbstractTyperGroup):
                 command_name=self.Commands.SET.value,
                 rich_help_panel=self.Panels.NONE.value,
             ),
+            ConfigCacheShowCLI(
+                group_name=group_name,
+                command_name=self.Commands.CACHE_SHOW.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            ConfigCacheClearCLI(
+                group_name=group_name,
+                command_name=self.Commands.CACHE_CLEAR.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
         )
 
 
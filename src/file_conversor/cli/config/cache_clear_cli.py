@@ -0,0 +1,37 @@
+# src\file_conversor\cli\config\cache_clear_cli.py
+
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.config import ConfigCacheClearCommand
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+# create command
+
+
+class ConfigCacheClearCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Config cache-clear command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.cache_clear,
+            help=_('Clear the conversion result cache'),
+            epilog=f"""
+    **{_('Examples')}:** 
+
+        - `file_conversor {group_name} {command_name}`
+    """)
+
+    def cache_clear(self):
+        ConfigCacheClearCommand().execute()
+
+
+__all__ = [
+    "ConfigCacheClearCLI",
+]
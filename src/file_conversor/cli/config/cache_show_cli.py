@@ -0,0 +1,46 @@
+# src\file_conversor\cli\config\cache_show_cli.py
+
+
+from rich import print
+from rich.pretty import Pretty
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.config import ConfigCacheShowCommand
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.formatters import format_bytes
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+# create command
+
+
+class ConfigCacheShowCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Config cache-show command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.cache_show,
+            help=_('Show the conversion result cache statistics (size, entries, hits and misses)'),
+            epilog=f"""
+    **{_('Examples')}:** 
+
+        - `file_conversor {group_name} {command_name}`
+    """)
+
+    def cache_show(self):
+        command = ConfigCacheShowCommand()
+        command.execute()
+        print(f"{_('Result cache')}:", Pretty({
+            **command.output,
+            "size": format_bytes(command.output["size"]),
+        }, expand_all=True))
+
+
+__all__ = [
+    "ConfigCacheShowCLI",
+]
@@ -13,6 +13,7 @@ from file_conversor.cli._utils.typer import VideoEncodingSpeedOption, VideoQuali
 from file_conversor.command.config import ConfigSetCommand
 from file_conversor.command.config.set_cmd import (
     ConfigSetAudioOutFormat,
+    ConfigSetExecutor,
     ConfigSetImageFitMode,
     ConfigSetImagePageLayout,
     ConfigSetImageResamplingOption,
@@ -29,6 +30,7 @@ from file_conversor.config import (
     locale,
 )
 from file_conversor.utils.validators import (
+    check_file_size_format,
     check_is_bool_or_none,
     check_valid_options,
 )
@@ -122,6 +124,47 @@ class ConfigSetCLI(AbstractTyperCommand):
         pdf_compression: Annotated[ConfigSetPdfCompression, typer.Option("--pdf-compression", "-pc",
                                                                          help=f"{_('Compression level (high compression = low quality).')} {_('Defaults to')} {CONFIG.pdf_compression}.",
                                                                          )] = ConfigSetPdfCompression(CONFIG.pdf_compression),
+        jobs: Annotated[int, typer.Option("--jobs", "-j",
+                                          help=f"{_('Max parallel jobs for batch commands (0 = number of CPU threads)')}.",
+                                          min=0,
+                                          )] = CONFIG.jobs,
+        executor: Annotated[ConfigSetExecutor, typer.Option("--executor", "-ex",
+                                                            help=f"{_('Batch executor (serial, thread pool, process pool or staged pipeline).')} {_('Defaults to')} {CONFIG.executor}.",
+                                                            )] = ConfigSetExecutor(CONFIG.executor),
+        cpu_tokens: Annotated[int, typer.Option("--cpu-tokens", "-ct",
+                                                help=f"{_('CPU threads shared by parallel jobs and their tools (0 = number of CPU threads)')}.",
+                                                min=0,
+                                                )] = CONFIG.cpu_tokens,
+        cpu_affinity: Annotated[bool, typer.Option("--cpu-affinity/--no-cpu-affinity", "-ca/-nca",
+                                                   help=_("Pin parallel jobs (and their child tools) to the CPUs granted to them (Linux only)."),
+                                                   )] = CONFIG.cpu_affinity,
+        memory_budget: Annotated[str, typer.Option("--memory-budget", "-mb",
+                                                   help=f"{_('Memory budget for parallel jobs, e.g. 8G (0 = 75% of physical memory).')} {_('Defaults to')} {CONFIG.memory_budget}.",
+                                                   callback=check_file_size_format,
+                                                   )] = CONFIG.memory_budget,
+        result_cache: Annotated[bool, typer.Option("--result-cache/--no-result-cache", "-rc/-nrc",
+                                                   help=_("Enable or disable conversion result cache (reuse outputs of unchanged input files)."),
+                                                   )] = CONFIG.result_cache,
+        result_cache_max_size: Annotated[str, typer.Option("--result-cache-max-size", "-rcs",
+                                                           help=f"{_('Max conversion result cache size (e.g. 500M, 2G).')} {_('Defaults to')} {CONFIG.result_cache_max_size}.",
+                                                           callback=check_file_size_format,
+                                                           )] = CONFIG.result_cache_max_size,
+        progress_rate: Annotated[float, typer.Option("--progress-rate", "-pr",
+                                                     help=f"{_('Max progress bar updates per second (0 = unlimited).')} {_('Defaults to')} {CONFIG.progress_rate}.",
+                                                     min=0.0,
+                                                     )] = CONFIG.progress_rate,
+        background_nice: Annotated[int, typer.Option("--background-nice", "-bn",
+                                                     help=f"{_('CPU niceness of child processes in background mode (--background).')} {_('Defaults to')} {CONFIG.background_nice}.",
+                                                     min=0, max=19,
+                                                     )] = CONFIG.background_nice,
+        background_cpu_quota: Annotated[int, typer.Option("--background-cpu-quota", "-bcq",
+                                                          help=f"{_('CPU cap of each child process in background mode, in % of one CPU, e.g. 200 = 2 CPUs (0 = no cap, requires systemd).')} {_('Defaults to')} {CONFIG.background_cpu_quota}.",
+                                                          min=0,
+                                                          )] = CONFIG.background_cpu_quota,
+        background_memory_max: Annotated[str, typer.Option("--background-memory-max", "-bmm",
+                                                           help=f"{_('Memory cap of each child process in background mode, e.g. 4G (0 = no cap, requires systemd).')} {_('Defaults to')} {CONFIG.background_memory_max}.",
+                                                           callback=check_file_size_format,
+                                                           )] = CONFIG.background_memory_max,
     ):
         # update the configuration dictionary
         command = ConfigSetCommand(
@@ -141,6 +184,17 @@ class ConfigSetCLI(AbstractTyperCommand):
             image_page_size=image_page_size.value,
             image_resampling=image_resampling.value,
             pdf_compression=pdf_compression.value,
+            jobs=jobs,
+            executor=executor.value,
+            cpu_tokens=cpu_tokens,
+            cpu_affinity=cpu_affinity,
+            memory_budget=memory_budget,
+            result_cache=result_cache,
+            result_cache_max_size=result_cache_max_size,
+            progress_rate=progress_rate,
+            background_nice=background_nice,
+            background_cpu_quota=background_cpu_quota,
+            background_memory_max=background_memory_max,
         )
         command.execute()
         print(f"{_('Configuration')}:", Pretty(command.to_dict(), expand_all=True))
@@ -0,0 +1,57 @@
+# src\file_conversor\cli\daemon\__init__.py
+
+from enum import Enum
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperGroup
+from file_conversor.cli.daemon.start_cli import DaemonStartCLI
+from file_conversor.cli.daemon.status_cli import DaemonStatusCLI
+from file_conversor.cli.daemon.stop_cli import DaemonStopCLI
+from file_conversor.config.locale import get_translation
+
+
+_ = get_translation()
+
+
+class DaemonTyperGroup(AbstractTyperGroup):
+    """Daemon group command class."""
+
+    class Panels(Enum):
+        NONE = None
+
+    class Commands(Enum):
+        START = "start"
+        STOP = "stop"
+        STATUS = "status"
+
+    def __init__(self, group_name: str, rich_help_panel: str, hidden: bool = False) -> None:
+        super().__init__(
+            group_name=group_name,
+            help=_("Worker daemon (keeps the app warm, CLI commands run in it while it is running)"),
+            rich_help_panel=rich_help_panel,
+            hidden=hidden,
+        )
+
+        # add subcommands
+        self.add(
+            DaemonStartCLI(
+                group_name=group_name,
+                command_name=self.Commands.START.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            DaemonStopCLI(
+                group_name=group_name,
+                command_name=self.Commands.STOP.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            DaemonStatusCLI(
+                group_name=group_name,
+                command_name=self.Commands.STATUS.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+        )
+
+
+__all__ = [
+    "DaemonTyperGroup",
+]
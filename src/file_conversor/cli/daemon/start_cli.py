@@ -0,0 +1,41 @@
+# src\file_conversor\cli\daemon\start_cli.py
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.daemon import DaemonStartCommand
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class DaemonStartCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Daemon start command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.start,
+            help=f"""
+    {_('Start the worker daemon (in the foreground, until stopped). It keeps modules, configuration and locale loaded, and runs jobs sent over a Unix domain socket.')}
+
+    {_('While it is running, other CLI commands run inside it (use --no-daemon to run them locally).')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+
+- `file_conversor {group_name} {command_name} &` 
+""")
+
+    def start(self):
+        command = DaemonStartCommand()
+        command.execute()
+
+
+__all__ = [
+    "DaemonStartCLI",
+]
@@ -0,0 +1,42 @@
+# src\file_conversor\cli\daemon\status_cli.py
+
+from rich import print
+from rich.pretty import Pretty
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.daemon import DaemonStatusCommand
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class DaemonStatusCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Daemon status command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.status,
+            help=_('Show the worker daemon status (pid, socket, uptime and jobs).'),
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+""")
+
+    def status(self):
+        command = DaemonStatusCommand()
+        command.execute()
+        if not command.output:
+            logger.warning(f"{_('Daemon is not running')}.")
+            return
+        print(f"{_('Daemon')}:", Pretty(command.output, expand_all=True))
+
+
+__all__ = [
+    "DaemonStatusCLI",
+]
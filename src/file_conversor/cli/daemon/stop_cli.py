@@ -0,0 +1,39 @@
+# src\file_conversor\cli\daemon\stop_cli.py
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.daemon import DaemonStopCommand
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class DaemonStopCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Daemon stop command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.stop,
+            help=_('Stop the worker daemon (running jobs are finished first).'),
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+""")
+
+    def stop(self):
+        command = DaemonStopCommand()
+        command.execute()
+        if command.output:
+            logger.info(f"{_('Daemon stopped')}.")
+        else:
+            logger.warning(f"{_('Daemon is not running')}.")
+
+
+__all__ = [
+    "DaemonStopCLI",
+]
@@ -70,7 +70,7 @@ class DocConvertCLI(AbstractTyperCommand):
                 input_files=input_files,
                 file_format=file_format,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -67,7 +67,7 @@ class EbookConvertCLI(AbstractTyperCommand):
                 input_files=input_files,
                 file_format=file_format,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -56,7 +56,7 @@ class HashCheckCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = HashCheckCommand(
                 input_files=input_files,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
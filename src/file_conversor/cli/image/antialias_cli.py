@@ -73,7 +73,7 @@ class ImageAntialiasCLI(AbstractTyperCommand):
                 radius=radius,
                 algorithm=algorithm,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -48,7 +48,7 @@ class ImageBlurCLI(AbstractTyperCommand):
                 input_files=input_files,
                 radius=radius,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -72,7 +72,7 @@ class ImageCompressCLI(AbstractTyperCommand):
                 input_files=input_files,
                 quality=quality,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
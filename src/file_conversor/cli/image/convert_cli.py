@@ -71,7 +71,7 @@ class ImageConvertCLI(AbstractTyperCommand):
                 file_format=file_format,
                 quality=quality,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
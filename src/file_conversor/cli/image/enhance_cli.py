@@ -101,7 +101,7 @@ class ImageEnhanceCLI(AbstractTyperCommand):
                 color=color,
                 sharpness=sharpness,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
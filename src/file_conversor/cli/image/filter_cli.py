@@ -66,7 +66,7 @@ class ImageFilterCLI(AbstractTyperCommand):
                 input_files=input_files,
                 filters=filters,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
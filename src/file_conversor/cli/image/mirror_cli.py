@@ -71,7 +71,7 @@ class ImageMirrorCLI(AbstractTyperCommand):
                 input_files=input_files,
                 axis=axis,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
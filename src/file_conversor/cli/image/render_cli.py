@@ -64,7 +64,7 @@ class ImageRenderCLI(AbstractTyperCommand):
                 file_format=file_format,
                 dpi=dpi,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -98,7 +98,7 @@ class ImageResizeCLI(AbstractTyperCommand):
                 width=width,
                 resampling=resampling,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -80,7 +80,7 @@ class ImageRotateCLI(AbstractTyperCommand):
                 rotation=normalize_degree(rotation),
                 resampling=resampling,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
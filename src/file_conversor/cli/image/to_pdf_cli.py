@@ -99,7 +99,7 @@ class ImageToPdfCLI(AbstractTyperCommand):
                 page_size=page_size,
                 set_metadata=set_metadata,
                 output_file=output_file,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -13,7 +13,7 @@ from file_conversor.cli._utils.typer import (
     OutputDirOption,
     RadiusOption,
 )
-from file_conversor.command import ImageUnsharpCommand
+from file_conversor.command.image import ImageUnsharpCommand
 from file_conversor.config import LOG, STATE, get_translation
 
 
@@ -65,7 +65,7 @@ class ImageUnsharpCLI(AbstractTyperCommand):
                 strength=strength,
                 threshold=threshold,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -41,7 +41,7 @@ class LinInstallMenuCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Installing context menu:"))
             command = LinInstallMenuCommand(
                 rebuild_cache=rebuild_cache,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
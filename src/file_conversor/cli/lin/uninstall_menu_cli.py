@@ -29,7 +29,7 @@ class LinUninstallMenuCLI(AbstractTyperCommand):
         with RichProgressBar(STATE.progress.enabled) as progress_bar:
             task = progress_bar.add_task(_("Uninstalling context menu:"))
             command = LinUninstallMenuCommand(
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
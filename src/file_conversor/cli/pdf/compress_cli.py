@@ -66,7 +66,7 @@ class PdfCompressCLI(AbstractTyperCommand):
                 input_files=input_files,
                 compression=compression,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
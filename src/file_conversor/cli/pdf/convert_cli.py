@@ -13,7 +13,7 @@ from file_conversor.cli._utils.typer import (
     OutputDirOption,
     PasswordOption,
 )
-from file_conversor.command import PdfConvertCommand
+from file_conversor.command.pdf import PdfConvertCommand
 from file_conversor.command.pdf.convert_cmd import PdfConvertOutFormats
 from file_conversor.config import CONFIG, LOG, STATE, get_translation
 from file_conversor.system import ContextMenu, ContextMenuItem
@@ -74,7 +74,7 @@ class PdfConvertCLI(AbstractTyperCommand):
                 dpi=dpi,
                 password=password,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
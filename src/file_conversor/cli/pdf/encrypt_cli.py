@@ -92,7 +92,7 @@ class PdfEncryptCLI(AbstractTyperCommand):
                 permissions=permissions,
                 algorithm=algorithm,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
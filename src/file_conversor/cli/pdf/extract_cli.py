@@ -82,7 +82,7 @@ class PdfExtractCLI(AbstractTyperCommand):
                 pages=parse_pdf_pages(pages),
                 password=password,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -59,7 +59,7 @@ class PdfMergeCLI(AbstractTyperCommand):
                 input_files=input_files,
                 password=password,
                 output_file=output_file,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -62,7 +62,7 @@ class PdfRepairCLI(AbstractTyperCommand):
                 input_files=input_files,
                 password=password,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
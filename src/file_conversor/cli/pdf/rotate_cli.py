@@ -90,7 +90,7 @@ class PdfRotateCLI(AbstractTyperCommand):
                     },
                     password=password,
                     output_dir=output_dir,
-                    progress_callback=task.update,
+                    progress_callback=task.aggregator,
                 )
                 command.execute()
             except ValueError as e:
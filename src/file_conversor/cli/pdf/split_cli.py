@@ -72,7 +72,7 @@ class PdfSplitCLI(AbstractTyperCommand):
                 input_files=input_files,
                 password=password,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
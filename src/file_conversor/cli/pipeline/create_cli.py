@@ -50,7 +50,7 @@ class PipelineCreateCLI(AbstractTyperCommand):
             command = PipelineCreateCommand(
                 pipeline_dir=pipeline_dir,
                 stages=stages,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -44,7 +44,7 @@ class PipelineExecuteCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = PipelineExecuteCommand(
                 pipeline_dir=pipeline_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -0,0 +1,56 @@
+# src\file_conversor\cli\queue\__init__.py
+
+from enum import Enum
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperGroup
+from file_conversor.cli.queue.run_cli import QueueRunCLI
+from file_conversor.cli.queue.status_cli import QueueStatusCLI
+from file_conversor.cli.queue.submit_cli import QueueSubmitCLI
+from file_conversor.config.locale import get_translation
+
+
+_ = get_translation()
+
+
+class QueueTyperGroup(AbstractTyperGroup):
+    """Queue group command class."""
+
+    class Panels(Enum):
+        NONE = None
+
+    class Commands(Enum):
+        SUBMIT = "submit"
+        STATUS = "status"
+        RUN = "run"
+
+    def __init__(self, group_name: str, rich_help_panel: str) -> None:
+        super().__init__(
+            group_name=group_name,
+            help=_("Persistent job queue (submit commands, run them later with a worker pool)"),
+            rich_help_panel=rich_help_panel,
+        )
+
+        # add subcommands
+        self.add(
+            QueueSubmitCLI(
+                group_name=group_name,
+                command_name=self.Commands.SUBMIT.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            QueueStatusCLI(
+                group_name=group_name,
+                command_name=self.Commands.STATUS.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            QueueRunCLI(
+                group_name=group_name,
+                command_name=self.Commands.RUN.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+        )
+
+
+__all__ = [
+    "QueueTyperGroup",
+]
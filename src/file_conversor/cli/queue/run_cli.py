@@ -0,0 +1,67 @@
+# src\file_conversor\cli\queue\run_cli.py
+
+from typing import Annotated
+
+import typer
+
+from rich import print
+from rich.pretty import Pretty
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand, RichProgressBar
+from file_conversor.command.queue import QueueRunCommand
+from file_conversor.config import LOG, STATE, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class QueueRunCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Queue run command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.run,
+            help=f"""
+    {_('Run queued jobs with a worker pool (highest priority first), until the queue is empty.')}
+
+    {_('Failed jobs are retried (see `queue submit --retries`). Several `queue run` invocations can drain the same queue.')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+
+- `file_conversor {group_name} {command_name} --workers 4 --wait` 
+""")
+
+    def run(
+        self,
+        workers: Annotated[int, typer.Option(
+            "--workers", "-w",
+            help=f"{_('Number of worker processes')}.",
+            min=1,
+        )] = 1,
+        wait: Annotated[bool, typer.Option(
+            "--wait", "-wt",
+            help=f"{_('Wait for new jobs, instead of stopping when the queue is empty (stop with Ctrl+C)')}.",
+            is_flag=True,
+        )] = False,
+    ):
+        with RichProgressBar(STATE.progress.enabled) as progress_bar:
+            task = progress_bar.add_task(_("Running jobs:"))
+            command = QueueRunCommand(
+                workers=workers,
+                wait=wait,
+                progress_callback=task.aggregator,
+            )
+            command.execute()
+        print(f"{_('Queue')}:", Pretty(command.stats, expand_all=True))
+
+
+__all__ = [
+    "QueueRunCLI",
+]
@@ -0,0 +1,65 @@
+# src\file_conversor\cli\queue\status_cli.py
+
+from typing import Annotated
+
+import typer
+
+from rich import print
+from rich.pretty import Pretty
+from rich.table import Table
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.job_queue import JobQueue
+from file_conversor.command.queue import QueueStatusCommand
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class QueueStatusCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Queue status command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.status,
+            help=_('Show the job queue status (jobs per status, mean job duration, throughput) and the latest jobs.'),
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name}` 
+
+- `file_conversor {group_name} {command_name} -s failed -l 50` 
+""")
+
+    def status(
+        self,
+        status: Annotated[JobQueue.Status | None, typer.Option(
+            "--status", "-s",
+            help=f"{_('List only jobs with this status')}. {_('Defaults to all jobs')}.",
+        )] = None,
+        limit: Annotated[int, typer.Option(
+            "--limit", "-l",
+            help=f"{_('Max jobs listed')}.",
+            min=0,
+        )] = 10,
+    ):
+        command = QueueStatusCommand(status=status, limit=limit)
+        command.execute()
+        print(f"{_('Queue')}:", Pretty(command.stats, expand_all=True))
+        if not command.jobs:
+            return
+
+        table = Table(*command.jobs[0].keys())
+        for job in command.jobs:
+            table.add_row(*("" if value is None else str(value) for value in job.values()))
+        print(table)
+
+
+__all__ = [
+    "QueueStatusCLI",
+]
@@ -0,0 +1,72 @@
+# src\file_conversor\cli\queue\submit_cli.py
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand, CommandCapture
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.queue import QueueSubmitCommand
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class QueueSubmitCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Queue submit command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.submit,
+            help=f"""
+    {_('Add a command to the job queue (the command is parsed now, and runs later with `queue run`).')}
+
+    {_('Global options (e.g., --overwrite-output) go after --, along with the command.')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name} -- image resize input_file.jpg -s 0.5` 
+
+- `file_conversor {group_name} {command_name} -p 10 -r 2 -- -oo pdf compress input_file.pdf` 
+""")
+
+    def submit(
+        self,
+        ctx: typer.Context,
+        args: Annotated[list[str], typer.Argument(
+            help=f"{_('Command to queue (CLI arguments, after --)')}.",
+            show_default=False,
+        )],
+        priority: Annotated[int, typer.Option(
+            "--priority", "-p",
+            help=f"{_('Job priority (higher runs first)')}.",
+        )] = 0,
+        retries: Annotated[int, typer.Option(
+            "--retries", "-r",
+            help=f"{_('Max retries, if the job fails')}.",
+            min=0,
+        )] = 0,
+    ):
+        command, state = CommandCapture.from_args(ctx, args)
+        submit_command = QueueSubmitCommand(
+            command=DaemonClient.get_command_name(command),
+            options=command.model_dump(mode="json"),
+            state=state,
+            cwd=Path.cwd(),
+            priority=priority,
+            retries=retries,
+        )
+        submit_command.execute()
+        logger.info(f"{_('Job submitted')}: {submit_command.job_id} ({type(command).__qualname__})")
+
+
+__all__ = [
+    "QueueSubmitCLI",
+]
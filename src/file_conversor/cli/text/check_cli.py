@@ -52,7 +52,7 @@ class TextCheckCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = TextCheckCommand(
                 input_files=input_files,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -56,7 +56,7 @@ class TextCompressCLI(AbstractTyperCommand):
             command = TextCompressCommand(
                 input_files=input_files,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
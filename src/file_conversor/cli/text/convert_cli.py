@@ -59,7 +59,7 @@ class TextConvertCLI(AbstractTyperCommand):
                 input_files=input_files,
                 file_format=file_format,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
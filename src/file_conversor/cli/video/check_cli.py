@@ -51,7 +51,7 @@ class VideoCheckCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = VideoCheckCommand(
                 input_files=input_files,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -86,7 +86,7 @@ class VideoCompressCLI(AbstractTyperCommand):
                 video_quality=video_quality,
                 file_format=file_format,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
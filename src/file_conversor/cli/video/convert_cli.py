@@ -137,7 +137,7 @@ class VideoConvertCLI(AbstractTyperCommand):
                 deshake=deshake,
                 unsharp=unsharp,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
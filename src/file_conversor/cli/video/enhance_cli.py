@@ -176,7 +176,7 @@ class VideoEnhanceCLI(AbstractTyperCommand):
                 deshake=deshake,
                 unsharp=unsharp,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -84,7 +84,7 @@ class VideoExecuteCLI(AbstractTyperCommand):
                 video_filters=video_filters,
                 ffmpeg_args=ffmpeg_args,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
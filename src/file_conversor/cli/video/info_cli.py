@@ -72,7 +72,7 @@ class VideoInfoCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = VideoInfoCommand(
                 input_files=input_files,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -47,7 +47,7 @@ class VideoListFormatsCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Processing files:"))
             command = VideoListFormatsCommand(
                 desired_format=file_format,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
             for data in command.output:
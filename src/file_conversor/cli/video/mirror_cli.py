@@ -100,7 +100,7 @@ class VideoMirrorCLI(AbstractTyperCommand):
                 video_encoding_speed=video_encoding_speed,
                 video_quality=video_quality,
                 output_dir=output_dir,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -0,0 +1,49 @@
+# src\file_conversor\cli\watch\__init__.py
+
+from enum import Enum
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperGroup
+from file_conversor.cli.watch.pipeline_cli import WatchPipelineCLI
+from file_conversor.cli.watch.run_cli import WatchRunCLI
+from file_conversor.config.locale import get_translation
+
+
+_ = get_translation()
+
+
+class WatchTyperGroup(AbstractTyperGroup):
+    """Watch group command class."""
+
+    class Panels(Enum):
+        NONE = None
+
+    class Commands(Enum):
+        RUN = "run"
+        PIPELINE = "pipeline"
+
+    def __init__(self, group_name: str, rich_help_panel: str) -> None:
+        super().__init__(
+            group_name=group_name,
+            help=_("Watch folders (hot folders), and process each new file as soon as it is complete"),
+            rich_help_panel=rich_help_panel,
+        )
+
+        # add subcommands
+        self.add(
+            WatchRunCLI(
+                group_name=group_name,
+                command_name=self.Commands.RUN.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+            WatchPipelineCLI(
+                group_name=group_name,
+                command_name=self.Commands.PIPELINE.value,
+                rich_help_panel=self.Panels.NONE.value,
+            ),
+        )
+
+
+__all__ = [
+    "WatchTyperGroup",
+]
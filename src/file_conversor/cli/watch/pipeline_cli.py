@@ -0,0 +1,72 @@
+# src\file_conversor\cli\watch\pipeline_cli.py
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand
+from file_conversor.command.watch import WatchPipelineCommand
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.folder_watcher import FolderWatcher
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class WatchPipelineCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Watch pipeline command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.pipeline,
+            help=f"""
+    {_('Watch a pipeline folder, and run each new file through all pipeline stages (instead of re-running `pipeline execute`).')}
+
+    {_('Files are processed once their size is stable (partially written files are skipped). Files that fail are kept in the pipeline folder.')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name} c:/Users/Alice/Desktop/pipeline_name` 
+""")
+
+    def pipeline(
+        self,
+        pipeline_dir: Annotated[Path, typer.Argument(
+            help=f"{_('Pipeline folder')}",
+            exists=True,
+            file_okay=False,
+        )],
+        stable_time: Annotated[float, typer.Option(
+            "--stable-time", "-t",
+            help=f"{_('Time (seconds) a file must be unchanged before it is processed')}.",
+            min=0.0,
+        )] = FolderWatcher.STABLE_TIME,
+        skip_existing: Annotated[bool, typer.Option(
+            "--skip-existing", "-se",
+            help=f"{_('Ignore files already inside the pipeline folder')}. Defaults to False (process them).",
+            is_flag=True,
+        )] = False,
+        idle_timeout: Annotated[float | None, typer.Option(
+            "--idle-timeout", "-it",
+            help=f"{_('Stop after N seconds without new files')}. {_('Defaults to None')} ({_('watch until interrupted')}).",
+            min=0.0,
+        )] = None,
+    ):
+        command = WatchPipelineCommand(
+            pipeline_dir=pipeline_dir,
+            existing=not skip_existing,
+            stable_time=stable_time,
+            idle_timeout=idle_timeout,
+        )
+        command.execute()
+
+
+__all__ = [
+    "WatchPipelineCLI",
+]
@@ -0,0 +1,83 @@
+# src\file_conversor\cli\watch\run_cli.py
+
+from typing import Annotated
+
+import typer
+
+# user-provided modules
+from file_conversor.cli._utils import AbstractTyperCommand, CommandCapture
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.watch import WatchRunCommand
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.folder_watcher import FolderWatcher
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class WatchRunCLI(AbstractTyperCommand):
+    def __init__(self, group_name: str, command_name: str, rich_help_panel: str | None) -> None:
+        """Watch run command class."""
+        super().__init__(
+            rich_help_panel=rich_help_panel,
+            group_name=group_name,
+            command_name=command_name,
+            function=self.run,
+            help=f"""
+    {_('Watch the input folders of a command, and run the command for each new file (inotify on Linux, polling on other platforms).')}
+
+    {_('Files are processed once their size is stable (partially written files are skipped). The output folder must be outside the watched folders.')}
+""",
+            epilog=f"""
+**{_('Examples')}:** 
+
+- `file_conversor {group_name} {command_name} -- image resize hot_folder/ -s 0.5 -od D:/Resized` 
+
+- `file_conversor {group_name} {command_name} -t 5 -- -oo pdf compress hot_folder/ -od D:/Compressed` 
+""")
+
+    def run(
+        self,
+        ctx: typer.Context,
+        args: Annotated[list[str], typer.Argument(
+            help=f"{_('Command to run (CLI arguments, after --), with input folders to watch')}.",
+            show_default=False,
+        )],
+        stable_time: Annotated[float, typer.Option(
+            "--stable-time", "-t",
+            help=f"{_('Time (seconds) a file must be unchanged before it is processed')}.",
+            min=0.0,
+        )] = FolderWatcher.STABLE_TIME,
+        skip_existing: Annotated[bool, typer.Option(
+            "--skip-existing", "-se",
+            help=f"{_('Ignore files already inside the folders')}. Defaults to False (process them).",
+            is_flag=True,
+        )] = False,
+        no_recursive: Annotated[bool, typer.Option(
+            "--no-recursive", "-nr",
+            help=f"{_('Do not watch subfolders')}.",
+            is_flag=True,
+        )] = False,
+        idle_timeout: Annotated[float | None, typer.Option(
+            "--idle-timeout", "-it",
+            help=f"{_('Stop after N seconds without new files')}. {_('Defaults to None')} ({_('watch until interrupted')}).",
+            min=0.0,
+        )] = None,
+    ):
+        command, state = CommandCapture.from_args(ctx, args)
+        watch_command = WatchRunCommand(
+            command=DaemonClient.get_command_name(command),
+            options=command.model_dump(mode="json"),
+            state=state,
+            recursive=not no_recursive,
+            existing=not skip_existing,
+            stable_time=stable_time,
+            idle_timeout=idle_timeout,
+        )
+        watch_command.execute()
+
+
+__all__ = [
+    "WatchRunCLI",
+]
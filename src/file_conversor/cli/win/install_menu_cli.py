@@ -42,7 +42,7 @@ class WinInstallMenuCLI(AbstractTyperCommand):
             task = progress_bar.add_task(_("Installing context menu:"))
             command = WinInstallMenuCommand(
                 reboot_explorer=reboot_explorer,
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -33,7 +33,7 @@ class WinRestartExplorerCLI(AbstractTyperCommand):
         with RichProgressBar(STATE.progress.enabled) as progress_bar:
             task = progress_bar.add_task(_("Restarting explorer.exe:"))
             command = WinRestartExplorerCommand(
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -33,7 +33,7 @@ class WinUninstallMenuCLI(AbstractTyperCommand):
         with RichProgressBar(STATE.progress.enabled) as progress_bar:
             task = progress_bar.add_task(_("Uninstalling context menu:"))
             command = WinUninstallMenuCommand(
-                progress_callback=task.update,
+                progress_callback=task.aggregator,
             )
             command.execute()
 
@@ -1,16 +1,84 @@
-# src\file_conversor\interfaces\__init__.py
-
-from file_conversor.command.audio import *
-from file_conversor.command.data_models import *
-from file_conversor.command.doc import *
-from file_conversor.command.ebook import *
-from file_conversor.command.hash import *
-from file_conversor.command.image import *
-from file_conversor.command.pdf import *
-from file_conversor.command.pipeline import *
-from file_conversor.command.ppt import *
-from file_conversor.command.progress_manager import *
-from file_conversor.command.text import *
-from file_conversor.command.video import *
-from file_conversor.command.win import *
-from file_conversor.command.xls import *
+# src\file_conversor\command\__init__.py
+
+"""
+This module exports the app commands.
+
+Submodules are imported on first access, so importing one command (e.g., ``file_conversor.command.hash``) does not import them all.
+"""
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from file_conversor.command.audio import *
+    from file_conversor.command.batch_executor import *
+    from file_conversor.command.batch_journal import *
+    from file_conversor.command.batch_planner import *
+    from file_conversor.command.batch_scheduler import *
+    from file_conversor.command.bench import *
+    from file_conversor.command.daemon import *
+    from file_conversor.command.daemon_client import *
+    from file_conversor.command.daemon_server import *
+    from file_conversor.command.data_models import *
+    from file_conversor.command.doc import *
+    from file_conversor.command.ebook import *
+    from file_conversor.command.hash import *
+    from file_conversor.command.image import *
+    from file_conversor.command.job_queue import *
+    from file_conversor.command.pdf import *
+    from file_conversor.command.pipeline import *
+    from file_conversor.command.ppt import *
+    from file_conversor.command.progress_aggregator import *
+    from file_conversor.command.progress_manager import *
+    from file_conversor.command.queue import *
+    from file_conversor.command.result_cache import *
+    from file_conversor.command.text import *
+    from file_conversor.command.throughput_history import *
+    from file_conversor.command.video import *
+    from file_conversor.command.watch import *
+    from file_conversor.command.win import *
+    from file_conversor.command.xls import *
+
+_SUBMODULES = (
+    "audio",
+    "batch_executor",
+    "batch_journal",
+    "batch_planner",
+    "batch_scheduler",
+    "bench",
+    "daemon",
+    "daemon_client",
+    "daemon_server",
+    "data_models",
+    "doc",
+    "ebook",
+    "hash",
+    "image",
+    "job_queue",
+    "pdf",
+    "pipeline",
+    "ppt",
+    "progress_aggregator",
+    "progress_manager",
+    "queue",
+    "result_cache",
+    "text",
+    "throughput_history",
+    "video",
+    "watch",
+    "win",
+    "xls",
+)
+
+
+def __getattr__(name: str) -> Any:
+    for submodule in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{submodule}")
+        exported = getattr(module, "__all__", None)
+        if (name in exported) if exported is not None else hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,12 +1,28 @@
 # src/file_conversor/command/abstract_cmd.py
 
 from abc import abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import StrEnum
-from typing import Annotated, Any, Callable, Iterable
+from typing import Annotated, Any, Callable, Generator, Iterable, override
 
 from pydantic import BaseModel, Field
 
 
+class CommandCapturedError(Exception):
+    """ Raised when a command is created inside ``AbstractCommand.capture()`` (stops the caller before the command executes). """
+
+    def __init__(self, command: 'AbstractCommand[Any, Any]') -> None:
+        super().__init__(f"Command captured: {type(command).__qualname__}")
+        self.command = command
+
+
+_capture_enabled: ContextVar[bool] = ContextVar("command_capture", default=False)
+
+_tool_stamps: dict[frozenset[str], dict[str, str]] = {}
+""" external dependencies => tool stamps (probed once per process, see ``AbstractCommand.get_cache_fingerprint()``) """
+
+
 class AbstractCommand[InFormatStrEnum: StrEnum, OutFormatStrEnum: StrEnum](BaseModel):
     """
     Abstract base class for all commands in the file conversor application.
@@ -14,6 +30,26 @@ class AbstractCommand[InFormatStrEnum: StrEnum, OutFormatStrEnum: StrEnum](BaseM
     """
     progress_callback: Annotated[Callable[[float], Any], Field(exclude=True)] = lambda p: p  # default to a no-op callback
 
+    @override
+    def model_post_init(self, context: Any) -> None:
+        super().model_post_init(context)
+        if _capture_enabled.get():
+            _capture_enabled.set(False)  # only the first (outermost) command is captured
+            raise CommandCapturedError(self)
+
+    @classmethod
+    @contextmanager
+    def capture(cls) -> Generator[None, None, None]:
+        """
+        Capture the first command created inside this context (e.g., by a CLI function), instead of executing it.
+        The command creation raises ``CommandCapturedError`` (holding the command model).
+        """
+        token = _capture_enabled.set(True)
+        try:
+            yield
+        finally:
+            _capture_enabled.reset(token)
+
     @classmethod
     @abstractmethod
     def _external_dependencies(cls) -> Iterable[str]:  # noqa: S100
@@ -58,8 +94,41 @@ class AbstractCommand[InFormatStrEnum: StrEnum, OutFormatStrEnum: StrEnum](BaseM
         Check if all external dependencies required by the command are available.
         This method can be overridden by concrete command classes to implement specific checks.
         """
-        import shutil
-        return all(shutil.which(dep) is not None for dep in cls._external_dependencies())  # noqa: S5864
+        from file_conversor.config import ProbeCache
+        return all(ProbeCache.which(dep) is not None for dep in cls._external_dependencies())  # noqa: S5864
+
+    def get_cache_fingerprint(self) -> str | None:
+        """
+        Get command fingerprint, used as part of result cache keys.
+        It changes when the command options, the app version or the external dependencies (executables) change.
+
+        :return: Fingerprint, or None if ``result_cache`` config is disabled (external dependencies are not probed).
+        """
+        import hashlib
+        import json
+
+        from file_conversor.config import CONFIG, Environment, ProbeCache
+
+        if not CONFIG.result_cache:
+            return None
+
+        deps = frozenset(self._external_dependencies())
+        tools = _tool_stamps.get(deps)
+        if tools is None:
+            tools = {}
+            for dep in sorted(deps):
+                dep_path = ProbeCache.which(dep)
+                if dep_path:
+                    tools[dep] = f"{dep_path}:{ProbeCache.get_stamp(dep_path)}"
+            _tool_stamps[deps] = tools
+
+        fingerprint = json.dumps({
+            "command": type(self).__qualname__,
+            "options": self.model_dump(mode="json", exclude={"input_files", "output_dir", "output"}),
+            "app_version": Environment.get_app_version(),
+            "tools": tools,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
 
     def set_progress_callback(self, callback: Callable[[float], Any]) -> None:
         """
@@ -76,4 +145,5 @@ class AbstractCommand[InFormatStrEnum: StrEnum, OutFormatStrEnum: StrEnum](BaseM
 
 __all__ = [
     "AbstractCommand",
+    "CommandCapturedError",
 ]
@@ -40,7 +40,7 @@ class AudioCheckCommand(AbstractCommand[AudioCheckInFormats, AudioCheckOutFormat
 
     @override
     def execute(self):
-        backend = FFprobeBackend(
+        get_backend = FFprobeBackend.lazy(
             install_deps=CONFIG.install_deps,
             verbose=STATE.loglevel.get().is_verbose(),
         )
@@ -50,11 +50,14 @@ class AudioCheckCommand(AbstractCommand[AudioCheckInFormats, AudioCheckOutFormat
             output_dir=Path(),
             out_stem="_",
             overwrite_output=True,
+            journal=False,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]) -> None:
             try:
-                backend.info(data.input_file)
+                get_backend().info(data.input_file)
                 self.progress_callback(get_progress(100.0))
             except Exception as e:
                 logger.error(f"{_('Error checking file')} '{data.input_file}': {e}")
@@ -43,21 +43,23 @@ class AudioConvertCommand(AbstractCommand[AudioConvertInFormats, AudioConvertOut
 
     @override
     def execute(self):
-        # init ffmpeg
-        ffmpeg_backend = FFmpegBackend(
-            install_deps=CONFIG.install_deps,
-            verbose=STATE.loglevel.get().is_verbose(),
-            overwrite_output=STATE.overwrite_output.enabled,
-        )
-
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]) -> None:
+            # init ffmpeg (per file, as files may be processed in parallel)
+            ffmpeg_backend = FFmpegBackend(
+                install_deps=CONFIG.install_deps,
+                verbose=STATE.loglevel.get().is_verbose(),
+                overwrite_output=data.overwrite_output,
+            )
             ffmpeg_backend.set_files(
                 input_file=data.input_file,
                 output_file=data.output_file,
@@ -0,0 +1,282 @@
+# src\file_conversor\command\batch_executor.py
+
+import itertools
+import queue
+import threading
+
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from enum import StrEnum
+from typing import Any, Callable, Iterable, Sequence
+
+# user-provided modules
+from file_conversor.config import CONFIG, LOG, STATE, Environment, ResourceGovernor, Tracer, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+# process mode state (set by worker initializer, inside forked children only)
+_fork_func: Callable[[Any], Any] | None = None
+_fork_queue: Any = None
+
+# pipeline mode end-of-stream marker
+_STOP = object()
+
+
+def _init_forked(func: Callable[[Any], Any], relay_queue: Any, worker_counter: Any, workers: int, memory_counter: Any) -> None:
+    """ Process worker initializer (runs once inside each forked child). """
+    global _fork_func, _fork_queue  # noqa: PLW0603
+    _fork_func, _fork_queue = func, relay_queue
+    with worker_counter.get_lock():
+        worker_idx = worker_counter.value
+        worker_counter.value += 1
+    ResourceGovernor.set_partition(worker_idx, workers)  # workers never pin the same CPUs
+    ResourceGovernor.share_memory(memory_counter)  # jobs are admitted against the memory used by all workers
+
+
+def _run_forked(item: Any) -> None:
+    """ Process worker entry point (runs inside a forked child). """
+    if _fork_func is None:
+        raise RuntimeError("BatchExecutor - worker function not set in child process")
+    try:
+        _fork_func(item)
+    finally:
+        Tracer.flush()  # spans are merged by parent process
+
+
+class BatchExecutor:
+    """
+    Pluggable executor used to process batch items (serial, thread pool or process pool).
+    """
+
+    class Mode(StrEnum):
+        SERIAL = "serial"
+        """ process one item at a time, in the calling thread """
+        THREAD = "thread"
+        """ process items using a thread pool (best for external tools and GIL-releasing libs) """
+        PROCESS = "process"
+        """ process items using a process pool (requires ``fork``, falls back to THREAD otherwise) """
+        PIPELINE = "pipeline"
+        """ process multi-step items as a staged pipeline (step N of item i+1 overlaps step N+1 of item i) """
+
+    @classmethod
+    def from_state(cls, jobs: int | None = None) -> 'BatchExecutor':
+        """
+        Create executor based on app state / configuration.
+
+        :param jobs: Max parallel jobs. Defaults to None (use ``--jobs`` option / ``jobs`` config).
+        """
+        return cls(
+            jobs=STATE.jobs.value if jobs is None else jobs,
+            mode=cls.Mode(CONFIG.executor),
+        )
+
+    @classmethod
+    def in_worker(cls) -> bool:
+        """Check if running inside a process worker (forked child)."""
+        return _fork_queue is not None
+
+    @classmethod
+    def relay(cls, message: Any) -> bool:
+        """
+        Relay a message from a forked worker to the parent process.
+
+        :param message: Picklable message.
+
+        :return: True if message was relayed (running inside a process worker), False otherwise.
+        """
+        if _fork_queue is None:
+            return False
+        _fork_queue.put(message)
+        return True
+
+    def __init__(self, jobs: int = 1, mode: Mode = Mode.THREAD) -> None:
+        """
+        Inits executor.
+
+        :param jobs: Max parallel jobs. If 0, use number of CPU threads available. Defaults to 1 (serial).
+        :param mode: Executor mode. Defaults to THREAD.
+        """
+        super().__init__()
+        if jobs < 0:
+            raise ValueError("jobs must be >= 0")
+        self._jobs = jobs if jobs > 0 else Environment.get_cpu_count()
+        self._mode = mode if (self._jobs > 1 or mode == BatchExecutor.Mode.PIPELINE) else BatchExecutor.Mode.SERIAL
+
+        if self._mode == BatchExecutor.Mode.PROCESS and not self._fork_available():
+            logger.warning(f"{_('Process executor requires fork() support. Falling back to thread executor')}.")
+            self._mode = BatchExecutor.Mode.THREAD
+
+    @property
+    def jobs(self) -> int:
+        return self._jobs if self._mode != BatchExecutor.Mode.SERIAL else 1
+
+    @property
+    def mode(self) -> Mode:
+        return self._mode
+
+    def _fork_available(self) -> bool:
+        import multiprocessing
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        relay_callback: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """
+        Execute ``func`` for every item. Stops submitting new items on first failure.
+
+        :param func: Function executed for each item.
+        :param items: Items to process (consumed lazily).
+        :param relay_callback: Parent-side callback for messages sent by process workers using ``BatchExecutor.relay()``. Defaults to None.
+
+        :raises Exception: first exception raised by ``func``.
+        """
+        logger.debug(f"Batch executor: [bold]{self._mode.value}[/] ({self.jobs} jobs)")
+        match self._mode:
+            case BatchExecutor.Mode.SERIAL:
+                for item in items:
+                    func(item)
+            case BatchExecutor.Mode.THREAD:
+                with ThreadPoolExecutor(max_workers=self._jobs, thread_name_prefix="fc_worker") as pool:
+                    self._submit_all(pool, func, items)
+            case BatchExecutor.Mode.PROCESS:
+                self._map_process(func, items, relay_callback)
+            case BatchExecutor.Mode.PIPELINE:
+                self.map_stages([func], items)
+
+    def map_stages(
+        self,
+        stages: Sequence[Callable[[Any], Any]],
+        items: Iterable[Any],
+    ) -> None:
+        """
+        Execute ``stages`` for every item, in order (output of stage N is the input of stage N+1).
+
+        In PIPELINE mode, each stage runs in its own worker threads (``jobs`` per stage), connected by bounded queues.
+        In other modes, all stages of an item are executed by the same worker (see ``map()``).
+
+        :param stages: Stage functions. Each receives the value returned by the previous stage (first stage receives the item).
+        :param items: Items to process (consumed lazily).
+
+        :raises Exception: first exception raised by a stage.
+        """
+        if self._mode != BatchExecutor.Mode.PIPELINE:
+            def _run_all(item: Any):
+                for stage in stages:
+                    item = stage(item)
+            self.map(_run_all, items)
+            return
+
+        logger.debug(f"Batch executor: [bold]{self._mode.value}[/] ({len(stages)} stages, {self._jobs} jobs per stage)")
+        queues: list[queue.Queue[Any]] = [queue.Queue(maxsize=self._jobs) for _ in range(len(stages) + 1)]
+        stop_event = threading.Event()
+        errors: list[BaseException] = []
+        errors_lock = threading.Lock()
+
+        def _worker(stage_idx: int):
+            in_queue, out_queue = queues[stage_idx], queues[stage_idx + 1]
+            while (item := in_queue.get()) is not _STOP:
+                if stop_event.is_set():
+                    continue  # keep draining, so upstream stages never block
+                try:
+                    out_queue.put(stages[stage_idx](item))
+                except BaseException as e:  # noqa: BLE001
+                    with errors_lock:
+                        errors.append(e)
+                    stop_event.set()
+
+        def _sink():
+            while queues[-1].get() is not _STOP:
+                pass
+
+        stage_threads: list[list[threading.Thread]] = [
+            [
+                threading.Thread(target=_worker, args=(stage_idx,), name=f"fc_stage{stage_idx}_{worker_idx}", daemon=True)
+                for worker_idx in range(self._jobs)
+            ]
+            for stage_idx in range(len(stages))
+        ]
+        sink_thread = threading.Thread(target=_sink, name="fc_stage_sink", daemon=True)
+        for thread in itertools.chain(*stage_threads, [sink_thread]):
+            thread.start()
+
+        try:
+            for item in items:
+                if stop_event.is_set():
+                    break
+                queues[0].put(item)
+        finally:
+            # shutdown stages in order (all workers of a stage finish before stopping the next one)
+            for stage_idx, threads in enumerate(stage_threads):
+                for _ in threads:
+                    queues[stage_idx].put(_STOP)
+                for thread in threads:
+                    thread.join()
+            queues[-1].put(_STOP)
+            sink_thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _map_process(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        relay_callback: Callable[[Any], Any] | None,
+    ) -> None:
+        import multiprocessing
+
+        ctx = multiprocessing.get_context("fork")
+        relay_queue = ctx.SimpleQueue()
+        worker_counter, memory_counter = ctx.Value("i", 0), ctx.Value("q", 0)
+
+        def _drain():
+            while (message := relay_queue.get()) is not None:
+                if relay_callback:
+                    relay_callback(message)
+
+        drain_thread = threading.Thread(target=_drain, name="fc_relay", daemon=True)
+        try:
+            with ProcessPoolExecutor(max_workers=self._jobs, mp_context=ctx, initializer=_init_forked, initargs=(func, relay_queue, worker_counter, self._jobs, memory_counter)) as pool:
+                # fork all workers (first submit), before helper threads run: children must not inherit threads / held locks
+                Environment.stop_supervisor()
+                with LOG.paused():
+                    pool.submit(int).result()
+                drain_thread.start()
+                self._submit_all(pool, _run_forked, items)
+        finally:
+            if drain_thread.is_alive():
+                relay_queue.put(None)
+                drain_thread.join()
+
+    def _submit_all(self, pool: Executor, func: Callable[[Any], Any], items: Iterable[Any]) -> None:
+        """ Submit items with bounded in-flight work (keeps memory flat for large batches). """
+        max_in_flight = 2 * self._jobs
+        pending: set[Future[Any]] = set()
+        error: BaseException | None = None
+
+        def _collect(done: set[Future[Any]]) -> BaseException | None:
+            for future in done:
+                if (exc := future.exception()) is not None:
+                    return exc
+            return None
+
+        for item in items:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                error = _collect(done)
+            if error is not None:
+                break
+            pending.add(pool.submit(func, item))
+
+        done, pending = wait(pending)
+        error = error or _collect(done)
+        if error is not None:
+            raise error
+
+__all__ = [
+    "BatchExecutor",
+]
@@ -0,0 +1,208 @@
+# src\file_conversor\command\batch_journal.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, TextIO
+
+# user-provided modules
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class BatchJournal:
+    """
+    Append-only batch journal (JSON lines), used to resume interrupted batches.
+
+    Each step of each file writes a ``start`` record before running and a ``done`` record (with output size) after completion.
+    Records are written through a single open file (per process), and synced to disk per completed file (see ``sync()``).
+    """
+    FILENAME = ".file_conversor_journal_{key}.jsonl"
+    SYNC_RECORDS = 64
+    """ max records written without syncing to disk """
+
+    class Event:
+        START = "start"
+        DONE = "done"
+
+    @classmethod
+    def get_key(cls, *parts: Any) -> str:
+        """
+        Get batch key (journals of different batches in the same output folder never clash).
+
+        :param parts: Batch identity (e.g., input files, output naming, steps).
+        """
+        return hashlib.sha256(json.dumps([str(part) for part in parts]).encode("utf-8")).hexdigest()[:16]
+
+    def __init__(self, output_dir: Path, key: str, resume: bool = False) -> None:
+        """
+        Inits batch journal.
+
+        :param output_dir: Batch output folder (journal is stored inside it).
+        :param key: Batch key (see ``get_key()``).
+        :param resume: If True, load existing journal records. Otherwise, start a new journal (for this batch key).
+        """
+        super().__init__()
+        self._path = output_dir / self.FILENAME.format(key=key)
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._pid = os.getpid()
+        self._unsynced = 0
+        self._started: set[tuple[str, str, int]] = set()
+        self._done: dict[tuple[str, str, int], dict[str, Any]] = {}
+
+        if resume:
+            self._load()
+        elif self._path.exists():
+            self._path.unlink()  # same batch started again, from scratch
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _load(self):
+        if not self._path.exists():
+            logger.warning(f"{_('Batch journal not found, nothing to resume')}: '{self._path}'")
+            return
+        with open(self._path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    key = (record["input"], record["output"], int(record["step"]))
+                except (ValueError, KeyError, TypeError):
+                    continue  # truncated record (crash while writing)
+                if record.get("event") == self.Event.DONE:
+                    self._done[key] = record
+                else:
+                    self._started.add(key)
+        logger.info(f"{_('Batch journal loaded')}: {len(self._done)} {_('completed steps')}")
+
+    def _get_file(self) -> TextIO:
+        # called with lock held. Process workers (forked) open their own file
+        if self._file is None or self._pid != os.getpid():
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "a", encoding="utf-8")  # noqa: SIM115 - kept open until close()
+            self._pid = os.getpid()
+            self._unsynced = 0
+        return self._file
+
+    def _append(self, record: dict[str, Any]):
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            file = self._get_file()
+            file.write(line)
+            file.flush()  # records survive a crash of the app (sync survives a crash of the system)
+            self._unsynced += 1
+            if self._unsynced >= self.SYNC_RECORDS:
+                self._sync()
+
+    def _sync(self):
+        # called with lock held
+        if self._file is not None and self._pid == os.getpid() and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def sync(self):
+        """Sync written records to disk (e.g., after a file is completed)."""
+        with self._lock:
+            self._sync()
+
+    def close(self, remove: bool = False):
+        """
+        Close journal file.
+
+        :param remove: Remove journal (e.g., batch completed, nothing to resume). Defaults to False.
+        """
+        with self._lock:
+            if not remove:
+                self._sync()
+            if self._file is not None and self._pid == os.getpid():
+                self._file.close()
+            self._file = None
+        if remove:
+            self._path.unlink(missing_ok=True)
+
+    def _get_key(self, input_file: Path, output_file: Path, step: int) -> tuple[str, str, int]:
+        return (str(input_file), str(output_file), step)
+
+    def record_start(self, input_file: Path, output_file: Path, step: int):
+        """
+        Record step start.
+
+        :param input_file: Batch input file.
+        :param output_file: Step output file.
+        :param step: Step index.
+        """
+        self._append({
+            "event": self.Event.START,
+            "input": str(input_file),
+            "output": str(output_file),
+            "step": step,
+            "time": time.time(),
+        })
+
+    def record_done(self, input_file: Path, output_file: Path, step: int, usage: list[dict[str, Any]] | None = None):
+        """
+        Record step completion (with input / output sizes and timestamps).
+
+        :param input_file: Batch input file.
+        :param output_file: Step output file.
+        :param step: Step index.
+        :param usage: Resource usage of the step (see ``ProcessAccounting``). Defaults to None (not recorded).
+        """
+        input_stat = input_file.stat()
+        output_size = output_file.stat().st_size if output_file.exists() else -1
+        self._append({
+            "event": self.Event.DONE,
+            "input": str(input_file),
+            "input_size": input_stat.st_size,
+            "input_mtime": input_stat.st_mtime,
+            "output": str(output_file),
+            "output_size": output_size,
+            "step": step,
+            "time": time.time(),
+            **({"usage": usage} if usage else {}),
+        })
+
+    def is_done(self, input_file: Path, output_file: Path, step: int) -> bool:
+        """
+        Check if step is completed (input unchanged and output intact since completion).
+
+        :param input_file: Batch input file.
+        :param output_file: Step output file.
+        :param step: Step index.
+        """
+        record = self._done.get(self._get_key(input_file, output_file, step))
+        if record is None:
+            return False
+        try:
+            input_stat = input_file.stat()
+            if input_stat.st_size != record["input_size"] or input_stat.st_mtime != record["input_mtime"]:
+                return False
+            output_size = output_file.stat().st_size if output_file.exists() else -1
+        except OSError:
+            return False
+        return output_size == record["output_size"]
+
+    def is_orphan(self, input_file: Path, output_file: Path, step: int) -> bool:
+        """
+        Check if step output was left behind by an interrupted run (started, but never completed).
+
+        :param input_file: Batch input file.
+        :param output_file: Step output file.
+        :param step: Step index.
+        """
+        key = self._get_key(input_file, output_file, step)
+        return key in self._started and key not in self._done
+
+
+__all__ = [
+    "BatchJournal",
+]
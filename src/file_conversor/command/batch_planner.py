@@ -0,0 +1,141 @@
+# src\file_conversor\command\batch_planner.py
+
+import shutil
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# user-provided modules
+from file_conversor.command.throughput_history import ThroughputHistory
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.formatters import format_bytes
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class BatchPlanner:
+    """
+    Dry-run batch plan (see ``--plan``): files that would be processed, with estimated duration and output size.
+
+    Estimates combine probe data (command cost estimator, e.g., media duration or PDF pages) with the
+    throughput of previous runs (see ``ThroughputHistory``). Conversions that never ran have unknown durations,
+    and their output size is assumed to be the input size.
+    """
+
+    @dataclass
+    class Entry:
+        input_file: Path
+        output_file: Path
+        in_size: int
+        cost: float
+        duration: float | None
+        """ estimated duration (seconds), None if unknown """
+        out_size: int | None
+        """ estimated output size (bytes), None if unknown """
+
+    def __init__(self, jobs: int = 1) -> None:
+        """
+        Inits batch planner.
+
+        :param jobs: Parallel jobs (used to estimate the wall time).
+        """
+        super().__init__()
+        self._jobs = max(jobs, 1)
+        self._entries: list[BatchPlanner.Entry] = []
+        self._stats: dict[str, dict[str, float] | None] = {}
+
+    def add(self, input_file: Path, output_file: Path, key: str, cost: float) -> 'BatchPlanner.Entry':
+        """
+        Add file to the plan.
+
+        :param input_file: Input file.
+        :param output_file: Output file.
+        :param key: Conversion key (see ``ThroughputHistory.get_key()``).
+        :param cost: Estimated cost of the input file (see ``BatchScheduler``).
+        """
+        if key not in self._stats:
+            self._stats[key] = ThroughputHistory.get_stats(key)
+        try:
+            in_size = input_file.stat().st_size
+        except OSError:
+            in_size = 0
+        duration, out_size = ThroughputHistory.estimate(key, cost, in_size, stats=self._stats[key] or {})
+        entry = BatchPlanner.Entry(input_file, output_file, in_size, cost, duration, out_size)
+        self._entries.append(entry)
+        return entry
+
+    def get_entries(self) -> list['BatchPlanner.Entry']:
+        return list(self._entries)
+
+    def get_totals(self) -> dict[str, Any]:
+        """Get plan totals (files, sizes, summed duration, wall time with parallel jobs, files with unknown estimates)."""
+        duration = sum(entry.duration or 0.0 for entry in self._entries)
+        return {
+            "files": len(self._entries),
+            "in_size": sum(entry.in_size for entry in self._entries),
+            "out_size": sum(entry.in_size if entry.out_size is None else entry.out_size for entry in self._entries),
+            "duration": duration,
+            "wall_time": duration / min(self._jobs, max(len(self._entries), 1)),
+            "unknown": sum(1 for entry in self._entries if entry.duration is None),
+        }
+
+    @classmethod
+    def _format_duration(cls, seconds: float | None) -> str:
+        if seconds is None:
+            return "?"
+        minutes, secs = divmod(int(round(seconds)), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}" if minutes else f"{seconds:.1f}s"
+
+    def _get_free_space(self, output_dir: Path) -> int | None:
+        folder = output_dir.resolve()
+        while not folder.exists() and folder != folder.parent:
+            folder = folder.parent  # output folder is not created in plan mode
+        try:
+            return shutil.disk_usage(folder).free
+        except OSError:
+            return None
+
+    def print(self, output_dir: Path):
+        """
+        Print plan (per file and totals).
+
+        :param output_dir: Output folder (free space is checked against the estimated output size).
+        """
+        from rich import print
+        from rich.table import Table
+
+        totals = self.get_totals()
+        table = Table(title=f"{_('Batch plan')} ({_('dry run')})", show_footer=True)
+        table.add_column(_("Input"), footer=f"{totals['files']} {_('files')}")
+        table.add_column(_("Output"))
+        table.add_column(_("Size"), justify="right", footer=format_bytes(totals["in_size"]))
+        table.add_column(_("Est. duration"), justify="right", footer=self._format_duration(totals["duration"]))
+        table.add_column(_("Est. output"), justify="right", footer=format_bytes(totals["out_size"]))
+        for entry in self._entries:
+            table.add_row(
+                str(entry.input_file),
+                str(entry.output_file),
+                format_bytes(entry.in_size),
+                self._format_duration(entry.duration),
+                "?" if entry.out_size is None else format_bytes(entry.out_size),
+            )
+        print(table)
+
+        print(f"{_('Estimated wall time')} ({self._jobs} {_('jobs')}): [bold]{self._format_duration(totals['wall_time'])}[/]")
+        if totals["unknown"]:
+            logger.warning(f"{totals['unknown']} {_('files without throughput history (run a small batch first, to improve estimates)')}.")
+
+        free_space = self._get_free_space(output_dir)
+        if free_space is not None:
+            print(f"{_('Estimated output size')}: [bold]{format_bytes(totals['out_size'])}[/] ({_('free space')}: {format_bytes(free_space)})")
+            if totals["out_size"] > free_space:
+                logger.warning(f"{_('Not enough free space in output folder')} '{output_dir}'.")
+
+
+__all__ = [
+    "BatchPlanner",
+]
@@ -0,0 +1,122 @@
+# src\file_conversor\command\batch_scheduler.py
+
+import itertools
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+# user-provided modules
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class BatchScheduler:
+    """
+    Longest-job-first batch scheduler (based on per-file cost estimates).
+    """
+    WINDOW = 4096
+    """ max files estimated / sorted at once (keeps memory flat for huge input folders) """
+    FIRST_WINDOW_PER_JOB = 2
+    """ first window size (per job), doubled each window up to ``WINDOW`` (work starts early on streamed inputs) """
+
+    @classmethod
+    def file_size(cls, input_file: Path) -> float:
+        """ Default cost estimate (file size in bytes) """
+        return float(input_file.stat().st_size)
+
+    def __init__(
+        self,
+        estimator: Callable[[Path], float] | None = None,
+        jobs: int = 1,
+        sort: bool = True,
+    ) -> None:
+        """
+        Inits scheduler.
+
+        :param estimator: Cost estimator (e.g., duration, number of pages). Defaults to None (file size).
+        :param jobs: Parallel jobs used to estimate costs. Defaults to 1.
+        :param sort: Sort files longest-first. If False, keep input order and use file sizes as cost (see ``schedule_windows()``). Defaults to True.
+        """
+        super().__init__()
+        self._estimator = estimator or BatchScheduler.file_size
+        self._jobs = max(jobs, 1)
+        self._sort = sort
+
+    def estimate_cost(self, input_file: Path, estimator: Callable[[Path], float] | None = None) -> float | None:
+        """
+        Estimate cost of a file, or None if unknown (estimate failed).
+
+        :param input_file: File to estimate.
+        :param estimator: Cost estimator. Defaults to None (scheduler estimator).
+        """
+        try:
+            cost = (estimator or self._estimator)(input_file)
+        except Exception as e:
+            logger.debug("Cost estimate failed for '%s': %r", input_file, e)
+            return None
+        return cost if cost > 0 else None
+
+    def _iter_windows[T](self, items: Iterable[T], get_path: Callable[[T], Path], estimator: Callable[[Path], float] | None = None) -> Iterator[list[tuple[T, float]]]:
+        iterator = iter(items)
+        window_size = self.FIRST_WINDOW_PER_JOB * self._jobs
+        with ThreadPoolExecutor(max_workers=self._jobs, thread_name_prefix="fc_estimate") as pool:
+            while window := list(itertools.islice(iterator, window_size)):
+                window_size = min(2 * window_size, self.WINDOW)
+                costs = list(pool.map(self.estimate_cost, [get_path(item) for item in window], itertools.repeat(estimator)))
+
+                known_costs = [c for c in costs if c is not None]
+                mean_cost = (sum(known_costs) / len(known_costs)) if known_costs else 1.0
+                yield [
+                    (item, mean_cost if cost is None else cost)
+                    for item, cost in zip(window, costs, strict=True)
+                ]
+
+    def estimate[T](self, items: Iterable[T], get_path: Callable[[T], Path]) -> Iterator[tuple[T, float]]:
+        """
+        Estimate costs of items, keeping input order (in windows of up to ``WINDOW`` items).
+
+        :param items: Items to estimate (consumed lazily, one window at a time).
+        :param get_path: Get input file from item.
+
+        :return: Iterator of (item, estimated cost). Unknown costs are replaced by the window mean cost.
+        """
+        for window in self._iter_windows(items, get_path):
+            yield from window
+
+    def schedule_windows[T](self, items: Iterable[T], get_path: Callable[[T], Path]) -> Iterator[list[tuple[T, float]]]:
+        """
+        Order items longest-first, one window (up to ``WINDOW`` items) at a time.
+
+        If sorting is disabled, items keep input order, and their file size is used as cost (cheap, no estimator calls).
+
+        :param items: Items to schedule (consumed lazily, one window at a time).
+        :param get_path: Get input file from item.
+
+        :return: Iterator of windows, lists of (item, estimated cost). Unknown costs are replaced by the window mean cost.
+        """
+        if not self._sort:
+            yield from self._iter_windows(items, get_path, BatchScheduler.file_size)
+            return
+        for window in self._iter_windows(items, get_path):
+            window.sort(key=lambda x: x[1], reverse=True)  # stable, keeps input order for ties
+            yield window
+
+    def schedule[T](self, items: Iterable[T], get_path: Callable[[T], Path]) -> Iterator[tuple[T, float]]:
+        """
+        Order items longest-first (see ``schedule_windows()``).
+
+        :param items: Items to schedule (consumed lazily, one window at a time).
+        :param get_path: Get input file from item.
+
+        :return: Iterator of (item, estimated cost).
+        """
+        for window in self.schedule_windows(items, get_path):
+            yield from window
+
+__all__ = [
+    "BatchScheduler",
+]
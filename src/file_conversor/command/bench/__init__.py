@@ -0,0 +1,5 @@
+# src\file_conversor\command\bench\__init__.py
+
+from file_conversor.command.bench._bench_suite import *
+from file_conversor.command.bench.run_cmd import *
+from file_conversor.command.bench.startup_cmd import *
@@ -0,0 +1,119 @@
+# src\file_conversor\command\bench\_bench_suite.py
+
+import random
+
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from PIL import Image
+
+from file_conversor.backend.abstract_backend import AbstractBackend
+from file_conversor.backend.audio_video import FFmpegBackend
+from file_conversor.backend.image import PillowBackend
+from file_conversor.backend.pdf import GhostscriptBackend, PyPDFBackend
+
+# user-provided modules
+from file_conversor.config import LOG, Environment, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class BenchSuite(StrEnum):
+    """
+    Fixed benchmark workloads (one per backend), using deterministic inputs generated locally.
+    """
+    PILLOW_RESIZE = "pillow-resize"
+    PYPDF_MERGE = "pypdf-merge"
+    GHOSTSCRIPT_COMPRESS = "ghostscript-compress"
+    FFMPEG_EXECUTE = "ffmpeg-execute"
+
+    @classmethod
+    def _generate_image(cls, seed: int, size: tuple[int, int] = (1920, 1080)) -> Image.Image:
+        """ Deterministic photo-like image (smooth seeded noise). """
+        rng = random.Random(seed)  # noqa: S311 - reproducible test input, not used for security
+        low_res = (size[0] // 16, size[1] // 16)
+        img = Image.frombytes("RGB", low_res, rng.randbytes(low_res[0] * low_res[1] * 3))
+        return img.resize(size, Image.Resampling.BICUBIC)
+
+    def get_backend(self) -> AbstractBackend:
+        """
+        Create suite backend.
+
+        :raises RuntimeError: if external dependency is missing (never installs dependencies).
+        :raises FileNotFoundError: if external tool not found.
+        """
+        match self:
+            case BenchSuite.PILLOW_RESIZE:
+                return PillowBackend()
+            case BenchSuite.PYPDF_MERGE:
+                return PyPDFBackend()
+            case BenchSuite.GHOSTSCRIPT_COMPRESS:
+                return GhostscriptBackend(install_deps=False)
+            case BenchSuite.FFMPEG_EXECUTE:
+                return FFmpegBackend(install_deps=False, overwrite_output=True)
+
+    def prepare(self, work_dir: Path, files: int) -> list[list[Path]]:
+        """
+        Generate deterministic inputs.
+
+        :param work_dir: Folder for inputs / outputs.
+        :param files: Number of workload items.
+
+        :return: Input files of each workload item.
+        """
+        items: list[list[Path]] = []
+        for idx in range(files):
+            match self:
+                case BenchSuite.PILLOW_RESIZE:
+                    input_file = work_dir / f"input_{idx}.jpg"
+                    self._generate_image(idx).save(input_file, quality=90)
+                    items.append([input_file])
+                case BenchSuite.PYPDF_MERGE:
+                    input_files = [work_dir / f"input_{idx}_{part}.pdf" for part in range(4)]
+                    for part, input_file in enumerate(input_files):
+                        pages = [self._generate_image(1000 * idx + 10 * part + page, size=(320, 240)) for page in range(5)]
+                        pages[0].save(input_file, save_all=True, append_images=pages[1:])
+                    items.append(input_files)
+                case BenchSuite.GHOSTSCRIPT_COMPRESS:
+                    input_file = work_dir / f"input_{idx}.pdf"
+                    pages = [self._generate_image(10 * idx + page) for page in range(2)]
+                    pages[0].save(input_file, save_all=True, append_images=pages[1:], resolution=300.0)
+                    items.append([input_file])
+                case BenchSuite.FFMPEG_EXECUTE:
+                    input_file = work_dir / f"input_{idx}.mkv"
+                    Environment.run(
+                        str(AbstractBackend.find_in_path("ffmpeg")), "-y", "-loglevel", "error",
+                        "-f", "lavfi", "-i", f"testsrc2=duration=2:size=640x360:rate=30,hue=h={idx * 10}",
+                        "-f", "lavfi", "-i", f"sine=frequency={220 + idx * 20}:duration=2",
+                        "-c:v", "mpeg4", "-q:v", "2", "-c:a", "pcm_s16le",
+                        str(input_file),
+                    )
+                    items.append([input_file])
+        return items
+
+    def run(self, backend: Any, input_files: list[Path], output_file: Path):
+        """
+        Run workload item.
+
+        :param backend: Suite backend (see ``get_backend()``).
+        :param input_files: Input files of workload item.
+        :param output_file: Output file (without suffix).
+        """
+        match self:
+            case BenchSuite.PILLOW_RESIZE:
+                backend.resize(output_file=output_file.with_suffix(".jpg"), input_file=input_files[0], width=None, scale=0.5)
+            case BenchSuite.PYPDF_MERGE:
+                backend.merge(output_file=output_file.with_suffix(".pdf"), input_files=input_files)
+            case BenchSuite.GHOSTSCRIPT_COMPRESS:
+                backend.compress(output_file=output_file.with_suffix(".pdf"), input_file=input_files[0], compression_level=GhostscriptBackend.Compression.MEDIUM)
+            case BenchSuite.FFMPEG_EXECUTE:
+                backend.set_files(input_file=input_files[0], output_file=output_file.with_suffix(".mp4"))
+                backend.execute()
+
+
+__all__ = [
+    "BenchSuite",
+]
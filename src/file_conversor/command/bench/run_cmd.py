@@ -0,0 +1,162 @@
+# src\file_conversor\command\bench\run_cmd.py
+
+import math
+import tempfile
+import time
+
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.bench._bench_suite import BenchSuite
+from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.system import System
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+BenchRunExternalDependencies: set[str] = set()  # suites with missing external tools are skipped
+
+
+class BenchRunInFormats(StrEnum):
+    pass  # no input formats, as inputs are generated locally
+
+
+class BenchRunOutFormats(StrEnum):
+    pass  # no output formats, as this command only reports metrics
+
+
+class BenchRunCommand(AbstractCommand[BenchRunInFormats, BenchRunOutFormats]):
+    suites: list[BenchSuite] = list(BenchSuite)
+    files: int = 10
+    output: dict[str, Any] = {}
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return BenchRunExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return BenchRunInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return BenchRunOutFormats
+
+    @classmethod
+    def percentile(cls, values: list[float], percent: float) -> float:
+        """ Nearest-rank percentile. """
+        ordered = sorted(values)
+        rank = max(1, math.ceil(percent / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+    @classmethod
+    def _get_peak_rss(cls) -> tuple[int | None, int | None]:
+        """ Get peak RSS in bytes of this process, and of its (waited) child processes. None if unknown. """
+        try:
+            import resource
+        except ImportError:
+            return None, None
+        # linux reports KiB, macOS reports bytes
+        unit = 1 if System.Platform.get() == System.Platform.MACOS else 1024
+        return (
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+        )
+
+    def _run_suite(self, suite: BenchSuite) -> dict[str, Any]:
+        try:
+            backend = suite.get_backend()
+        except (RuntimeError, FileNotFoundError) as e:
+            logger.warning(f"{_('Benchmark suite skipped')} '{suite.value}': {e}")
+            return {"status": "skipped", "reason": str(e)}
+
+        with tempfile.TemporaryDirectory(prefix="file_conversor_bench_") as tmp_dir:
+            work_dir = Path(tmp_dir)
+            items = suite.prepare(work_dir, self.files)
+            total_bytes = sum(f.stat().st_size for input_files in items for f in input_files)
+
+            latencies: list[float] = []
+            start = time.perf_counter()
+            for idx, input_files in enumerate(items):
+                item_start = time.perf_counter()
+                suite.run(backend, input_files, work_dir / f"output_{idx}")
+                latencies.append(time.perf_counter() - item_start)
+            seconds = time.perf_counter() - start
+
+        peak_rss, peak_rss_children = self._get_peak_rss()
+        return {
+            "status": "ok",
+            "files": len(items),
+            "bytes": total_bytes,
+            "seconds": seconds,
+            "files_per_s": len(items) / seconds,
+            "mb_per_s": total_bytes / (1024.0 * 1024.0) / seconds,
+            "latency_p50_ms": 1000.0 * self.percentile(latencies, 50),
+            "latency_p95_ms": 1000.0 * self.percentile(latencies, 95),
+            "peak_rss": peak_rss,
+            "peak_rss_children": peak_rss_children,
+        }
+
+    def _run_suite_isolated(self, suite: BenchSuite) -> dict[str, Any]:
+        """
+        Run suite in a forked process (peak RSS of each suite is measured separately).
+
+        Without ``fork``, the suite runs in-process and its result is marked as not isolated (peak RSS includes previous suites).
+        """
+        import multiprocessing
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return {**self._run_suite(suite), "isolated": False}
+
+        ctx = multiprocessing.get_context("fork")
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+
+        def _target():
+            try:
+                send_conn.send(self._run_suite(suite))
+            except Exception as e:
+                send_conn.send({"status": "error", "reason": repr(e)})
+
+        process = ctx.Process(target=_target, name=f"fc_bench_{suite.value}")
+        process.start()
+        send_conn.close()
+        try:
+            return {**recv_conn.recv(), "isolated": True}
+        except EOFError:
+            return {"status": "error", "reason": f"benchmark process exited with code {process.exitcode}", "isolated": True}
+        finally:
+            process.join()
+
+    @override
+    def execute(self):
+        results: dict[str, Any] = {}
+        for idx, suite in enumerate(self.suites, start=1):
+            logger.info(f"{_('Running benchmark suite')} '{suite.value}' ...")
+            results[suite.value] = self._run_suite_isolated(suite)
+            self.progress_callback(100.0 * idx / len(self.suites))
+
+        self.output = {
+            "version": Environment.get_app_version(),
+            "python": Environment.get_python_version(),
+            "platform": str(System.Platform.get()),
+            "cpu_count": Environment.get_cpu_count(),
+            "files": self.files,
+            "suites": results,
+        }
+        logger.debug(f"{_('Benchmark results')}: {self.output}")
+
+
+__all__ = [
+    "BenchRunExternalDependencies",
+    "BenchRunInFormats",
+    "BenchRunOutFormats",
+    "BenchRunCommand",
+]
@@ -0,0 +1,183 @@
+# src\file_conversor\command\bench\startup_cmd.py
+
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from enum import StrEnum
+from typing import Any, Callable, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.bench.run_cmd import BenchRunCommand
+from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.system import System
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+BenchStartupExternalDependencies: set[str] = set()
+
+
+class BenchStartupInFormats(StrEnum):
+    pass  # no input formats, as this command runs the app entry points
+
+
+class BenchStartupOutFormats(StrEnum):
+    pass  # no output formats, as this command only reports metrics
+
+
+class BenchStartupTarget(StrEnum):
+    """ App entry points measured by the startup benchmark. """
+    VERSION = "version"
+    HELP = "help"
+    GUI = "gui"
+
+    def get_args(self) -> list[str]:
+        """ Get python interpreter arguments that run the entry point. """
+        match self:
+            case BenchStartupTarget.VERSION:
+                return ["-m", "file_conversor", "--no-daemon", "--version"]
+            case BenchStartupTarget.HELP:
+                return ["-m", "file_conversor", "--no-daemon", "image", "convert", "--help"]
+            case BenchStartupTarget.GUI:
+                # GUI entry point, up to main window creation (no event loop)
+                return ["-c", (
+                    "import sys\n"
+                    "from file_conversor.gui.__main__ import QApplication, MainWindowGUI\n"
+                    "app = QApplication(sys.argv)\n"
+                    "window = MainWindowGUI()\n"
+                )]
+
+    def check_dependencies(self) -> str | None:
+        """ Get reason why the entry point cannot run. None if it can. """
+        if self == BenchStartupTarget.GUI and importlib.util.find_spec("PySide6") is None:
+            return _("PySide6 is not installed")
+        return None
+
+
+class BenchStartupCommand(AbstractCommand[BenchStartupInFormats, BenchStartupOutFormats]):
+    targets: list[BenchStartupTarget] = list(BenchStartupTarget)
+    runs: int = 20
+    top: int = 15
+    output: dict[str, Any] = {}
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return BenchStartupExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return BenchStartupInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return BenchStartupOutFormats
+
+    @classmethod
+    def parse_importtime(cls, stderr: str) -> dict[str, tuple[int, int, int]]:
+        """
+        Parse ``python -X importtime`` report.
+
+        :param stderr: Interpreter stderr.
+
+        :return: ``{module: (self_us, cumulative_us, depth)}``.
+        """
+        modules: dict[str, tuple[int, int, int]] = {}
+        for line in stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                continue  # header
+            name = fields[2].rstrip()
+            depth = (len(name) - len(name.lstrip()) - 3) // 2  # " " separator, then 2 spaces per nesting level (top-level is 1)
+            modules[name.strip()] = (int(fields[0]), int(fields[1]), depth)
+        return modules
+
+    def _run_target(self, target: BenchStartupTarget, on_run: Callable[[], None]) -> dict[str, Any]:
+        reason = target.check_dependencies()
+        if reason is not None:
+            logger.warning(f"{_('Startup benchmark skipped')} '{target.value}': {reason}")
+            return {"status": "skipped", "reason": reason}
+
+        env = {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+        cmd = [sys.executable, "-X", "importtime", *target.get_args()]
+        wall_times: list[float] = []
+        self_us: dict[str, list[int]] = {}
+        cumulative_us: dict[str, list[int]] = {}
+        import_us: list[float] = []
+        for _idx in range(self.runs):
+            start = time.perf_counter()
+            process = subprocess.run(cmd, capture_output=True, text=True, env=env, check=False)  # noqa: S603
+            wall_times.append(time.perf_counter() - start)
+            if process.returncode != 0:
+                last_line = (process.stderr.strip().splitlines() or [""])[-1]
+                return {"status": "error", "reason": f"exit code {process.returncode}: {last_line}"}
+
+            modules = self.parse_importtime(process.stderr)
+            import_us.append(sum(cumulative for _self, cumulative, depth in modules.values() if depth == 0))
+            for name, (self_time, cumulative, _depth) in modules.items():
+                self_us.setdefault(name, []).append(self_time)
+                cumulative_us.setdefault(name, []).append(cumulative)
+            on_run()
+
+        def _top(times: dict[str, list[int]], prefix: str = "") -> list[dict[str, Any]]:
+            medians = {name: statistics.median(values) / 1000.0 for name, values in times.items() if name.startswith(prefix)}
+            ranked = sorted(medians.items(), key=lambda item: item[1], reverse=True)[:self.top]
+            return [{"module": name, "ms": ms} for name, ms in ranked]
+
+        return {
+            "status": "ok",
+            "runs": self.runs,
+            "wall_p50_ms": 1000.0 * BenchRunCommand.percentile(wall_times, 50),
+            "wall_p95_ms": 1000.0 * BenchRunCommand.percentile(wall_times, 95),
+            "import_p50_ms": BenchRunCommand.percentile(import_us, 50) / 1000.0,
+            "modules": len(cumulative_us),
+            "top_cumulative": _top(cumulative_us),
+            "top_self": _top(self_us),
+            "top_app_cumulative": _top(cumulative_us, prefix="file_conversor"),
+        }
+
+    @override
+    def execute(self):
+        results: dict[str, Any] = {}
+        total_runs = len(self.targets) * self.runs
+        done = 0
+
+        def _on_run():
+            nonlocal done
+            done += 1
+            self.progress_callback(100.0 * done / total_runs)
+
+        for target in self.targets:
+            logger.info(f"{_('Running startup benchmark')} '{target.value}' ...")
+            results[target.value] = self._run_target(target, _on_run)
+
+        self.progress_callback(100.0)
+        self.output = {
+            "version": Environment.get_app_version(),
+            "python": Environment.get_python_version(),
+            "platform": str(System.Platform.get()),
+            "cpu_count": Environment.get_cpu_count(),
+            "runs": self.runs,
+            "targets": results,
+        }
+        logger.debug(f"{_('Benchmark results')}: {self.output}")
+
+
+__all__ = [
+    "BenchStartupExternalDependencies",
+    "BenchStartupInFormats",
+    "BenchStartupOutFormats",
+    "BenchStartupTarget",
+    "BenchStartupCommand",
+]
@@ -1,4 +1,6 @@
 # src\file_conversor\command\config\__init__.py
 
+from file_conversor.command.config.cache_clear_cmd import *
+from file_conversor.command.config.cache_show_cmd import *
 from file_conversor.command.config.set_cmd import *
 from file_conversor.command.config.show_cmd import *
@@ -0,0 +1,51 @@
+# src\file_conversor\command\config\cache_clear_cmd.py
+
+from enum import StrEnum
+from typing import override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.result_cache import ResultCache
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+ConfigCacheClearExternalDependencies: set[str] = set()  # no external dependencies, as this command only clears the result cache
+
+
+class ConfigCacheClearInFormats(StrEnum):
+    pass  # no input formats, as this command only clears the result cache
+
+
+class ConfigCacheClearOutFormats(StrEnum):
+    pass  # no output formats, as this command only clears the result cache
+
+
+class ConfigCacheClearCommand(AbstractCommand[ConfigCacheClearInFormats, ConfigCacheClearOutFormats]):
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return ConfigCacheClearExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return ConfigCacheClearInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return ConfigCacheClearOutFormats
+
+    @override
+    def execute(self):
+        ResultCache.clear()
+        logger.info(f"{_('Result cache cleared')}")
+
+
+__all__ = [
+    "ConfigCacheClearCommand",
+]
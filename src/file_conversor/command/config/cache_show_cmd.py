@@ -0,0 +1,53 @@
+# src\file_conversor\command\config\cache_show_cmd.py
+
+from enum import StrEnum
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.result_cache import ResultCache
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+ConfigCacheShowExternalDependencies: set[str] = set()  # no external dependencies, as this command only reads the result cache
+
+
+class ConfigCacheShowInFormats(StrEnum):
+    pass  # no input formats, as this command only reads the result cache
+
+
+class ConfigCacheShowOutFormats(StrEnum):
+    pass  # no output formats, as this command only reads the result cache
+
+
+class ConfigCacheShowCommand(AbstractCommand[ConfigCacheShowInFormats, ConfigCacheShowOutFormats]):
+    output: dict[str, Any] = {}
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return ConfigCacheShowExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return ConfigCacheShowInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return ConfigCacheShowOutFormats
+
+    @override
+    def execute(self):
+        self.output = ResultCache.get_stats()
+        logger.debug(f"{_('Result cache')}: {self.output}")
+
+
+__all__ = [
+    "ConfigCacheShowCommand",
+]
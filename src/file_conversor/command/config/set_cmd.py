@@ -9,6 +9,7 @@ from file_conversor.backend.audio_video import FFmpegBackend
 from file_conversor.backend.image import Img2PDFBackend, PillowBackend
 from file_conversor.backend.pdf import GhostscriptBackend
 from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.batch_executor import BatchExecutor
 from file_conversor.config import LOG, Configuration, ConfigurationData, get_translation
 
 
@@ -38,6 +39,8 @@ ConfigSetImageResamplingOption = PillowBackend.ResamplingOption
 
 ConfigSetPdfCompression = GhostscriptBackend.Compression
 
+ConfigSetExecutor = BatchExecutor.Mode
+
 
 class ConfigSetCommand(AbstractCommand[ConfigSetInFormats, ConfigSetOutFormats], ConfigurationData):
     @classmethod
@@ -76,6 +79,7 @@ __all__ = [
     "ConfigSetImagePageLayout",
     "ConfigSetImageResamplingOption",
     "ConfigSetPdfCompression",
+    "ConfigSetExecutor",
 
     "ConfigSetCommand",
 ]
@@ -0,0 +1,5 @@
+# src\file_conversor\command\daemon\__init__.py
+
+from file_conversor.command.daemon.start_cmd import *
+from file_conversor.command.daemon.status_cmd import *
+from file_conversor.command.daemon.stop_cmd import *
@@ -0,0 +1,52 @@
+# src\file_conversor\command\daemon\start_cmd.py
+
+from enum import StrEnum
+from typing import override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.daemon_server import DaemonServer
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+DaemonStartExternalDependencies: set[str] = set()  # no external dependencies, as jobs check their own dependencies
+
+
+class DaemonStartInFormats(StrEnum):
+    pass  # no input formats, as this command only runs the daemon
+
+
+class DaemonStartOutFormats(StrEnum):
+    pass  # no output formats, as this command only runs the daemon
+
+
+class DaemonStartCommand(AbstractCommand[DaemonStartInFormats, DaemonStartOutFormats]):
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return DaemonStartExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return DaemonStartInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return DaemonStartOutFormats
+
+    @override
+    def execute(self):
+        server = DaemonServer()
+        self.progress_callback(100.0)
+        server.serve()
+
+
+__all__ = [
+    "DaemonStartCommand",
+]
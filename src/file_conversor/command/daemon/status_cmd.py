@@ -0,0 +1,55 @@
+# src\file_conversor\command\daemon\status_cmd.py
+
+from enum import StrEnum
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+DaemonStatusExternalDependencies: set[str] = set()  # no external dependencies, as this command only queries the daemon
+
+
+class DaemonStatusInFormats(StrEnum):
+    pass  # no input formats, as this command only queries the daemon
+
+
+class DaemonStatusOutFormats(StrEnum):
+    pass  # no output formats, as this command only queries the daemon
+
+
+class DaemonStatusCommand(AbstractCommand[DaemonStatusInFormats, DaemonStatusOutFormats]):
+    output: dict[str, Any] = {}
+    """Daemon status (empty if daemon is not running)"""
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return DaemonStatusExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return DaemonStatusInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return DaemonStatusOutFormats
+
+    @override
+    def execute(self):
+        self.output = DaemonClient.get_status() or {}
+        self.output.pop("type", None)
+        logger.debug(f"{_('Daemon status')}: {self.output}")
+
+
+__all__ = [
+    "DaemonStatusCommand",
+]
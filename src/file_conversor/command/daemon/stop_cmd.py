@@ -0,0 +1,54 @@
+# src\file_conversor\command\daemon\stop_cmd.py
+
+from enum import StrEnum
+from typing import override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+DaemonStopExternalDependencies: set[str] = set()  # no external dependencies, as this command only stops the daemon
+
+
+class DaemonStopInFormats(StrEnum):
+    pass  # no input formats, as this command only stops the daemon
+
+
+class DaemonStopOutFormats(StrEnum):
+    pass  # no output formats, as this command only stops the daemon
+
+
+class DaemonStopCommand(AbstractCommand[DaemonStopInFormats, DaemonStopOutFormats]):
+    output: bool = False
+    """True if daemon was running"""
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return DaemonStopExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return DaemonStopInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return DaemonStopOutFormats
+
+    @override
+    def execute(self):
+        self.output = DaemonClient.shutdown()
+        self.progress_callback(100.0)
+
+
+__all__ = [
+    "DaemonStopCommand",
+]
@@ -0,0 +1,137 @@
+# src\file_conversor\command\daemon_client.py
+
+import importlib
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+# user-provided modules
+from file_conversor.command.progress_aggregator import ProgressAggregator
+from file_conversor.config import CONFIG, LOG, STATE, get_translation
+from file_conversor.daemon_protocol import DaemonProtocol
+
+
+if TYPE_CHECKING:
+    from file_conversor.command.abstract_cmd import AbstractCommand
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class DaemonClient:
+    """
+    Client of the worker daemon (see ``DaemonServer``), that submits command models as jobs.
+
+    Jobs carry the command model (``model_dump()``), the CLI states and configuration of this process.
+    The daemon replies with progress events and the final command model (e.g., ``output`` fields).
+    """
+
+    @classmethod
+    def _request(cls, message: dict[str, Any], socket_path: Path | None = None) -> dict[str, Any] | None:
+        sock = DaemonProtocol.connect(socket_path)
+        if sock is None:
+            return None
+        with sock, sock.makefile("rb") as sock_file:
+            DaemonProtocol.send(sock, message)
+            return DaemonProtocol.receive(sock_file)
+
+    @classmethod
+    def get_status(cls, socket_path: Path | None = None) -> dict[str, Any] | None:
+        """
+        Get daemon status.
+
+        :param socket_path: Daemon socket. Defaults to None (use ``DaemonProtocol.get_socket_path()``).
+
+        :return: Daemon status (pid, version, uptime, jobs), or None if daemon is not running.
+        """
+        return cls._request({"type": "status"}, socket_path)
+
+    @classmethod
+    def is_running(cls, socket_path: Path | None = None) -> bool:
+        return cls.get_status(socket_path) is not None
+
+    @classmethod
+    def shutdown(cls, socket_path: Path | None = None) -> bool:
+        """
+        Stop daemon (running jobs are finished first).
+
+        :param socket_path: Daemon socket. Defaults to None (use ``DaemonProtocol.get_socket_path()``).
+
+        :return: True if daemon was running, False otherwise.
+        """
+        return cls._request({"type": "shutdown"}, socket_path) is not None
+
+    @classmethod
+    def get_command_class(cls, name: str) -> type['AbstractCommand[Any, Any]']:
+        """
+        Get command class from its name.
+
+        :param name: Command name (``module:QualName``).
+
+        :raises ValueError: if name is not a command class.
+        """
+        from file_conversor.command.abstract_cmd import AbstractCommand
+
+        module_name, _sep, class_name = name.partition(":")
+        if not module_name.startswith("file_conversor.command."):
+            raise ValueError(f"{_('Invalid command')} '{name}'")
+        command_cls = getattr(importlib.import_module(module_name), class_name, None)
+        if not isinstance(command_cls, type) or not issubclass(command_cls, AbstractCommand):
+            raise ValueError(f"{_('Invalid command')} '{name}'")
+        return cast("type[AbstractCommand[Any, Any]]", command_cls)
+
+    @classmethod
+    def get_command_name(cls, command: 'AbstractCommand[Any, Any]') -> str:
+        return f"{type(command).__module__}:{type(command).__qualname__}"
+
+    @classmethod
+    def submit(cls, command: 'AbstractCommand[Any, Any]', socket_path: Path | None = None) -> bool:
+        """
+        Run command in the daemon (blocks until finished). Progress is reported to ``command.progress_callback``,
+        and command fields are updated with the daemon results.
+
+        :param command: Command to run.
+        :param socket_path: Daemon socket. Defaults to None (use ``DaemonProtocol.get_socket_path()``).
+
+        :return: True if command ran in the daemon, False if daemon is not running.
+
+        :raises RuntimeError: if command failed in the daemon.
+        """
+        sock = DaemonProtocol.connect(socket_path)
+        if sock is None:
+            return False
+        logger.debug(f"{_('Submitting job to daemon')}: {cls.get_command_name(command)}")
+
+        with sock, sock.makefile("rb") as sock_file:
+            DaemonProtocol.send_request(sock, {
+                "type": "job",
+                "command": cls.get_command_name(command),
+                "options": command.model_dump(mode="json"),
+                "state": STATE.to_dict(),
+                "config": CONFIG.to_dict(),
+            })
+            while (message := DaemonProtocol.receive(sock_file)) is not None:
+                match message.get("type"):
+                    case "progress":
+                        command.progress_callback(float(message["progress"]))
+                    case "workers" if isinstance(command.progress_callback, ProgressAggregator):
+                        workers: dict[str, float | None] = dict.fromkeys(command.progress_callback.get_workers())
+                        workers.update(message["workers"])
+                        command.progress_callback.update(workers=workers)
+                    case "done":
+                        result = type(command).model_validate(message["result"])
+                        for name in type(command).model_fields:
+                            if name != "progress_callback":
+                                setattr(command, name, getattr(result, name))
+                        return True
+                    case "error":
+                        raise RuntimeError(f"{message.get('error_type', 'Exception')} ({message.get('error')})")
+                    case _:
+                        logger.debug(f"Unknown daemon message: {message}")
+        raise RuntimeError(_("Daemon closed the connection before the job finished"))
+
+
+__all__ = [
+    "DaemonClient",
+]
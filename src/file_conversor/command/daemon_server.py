@@ -0,0 +1,244 @@
+# src\file_conversor\command\daemon_server.py
+
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+import threading
+import time
+
+from pathlib import Path
+from typing import Any
+
+# user-provided modules
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.progress_aggregator import ProgressAggregator
+from file_conversor.config import CONFIG, LOG, STATE, Configuration, Environment, get_translation
+from file_conversor.daemon_protocol import DaemonProtocol
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class DaemonServer:
+    """
+    Worker daemon, that keeps the interpreter warm (modules, configuration, locale) and runs jobs sent by clients (see ``DaemonProtocol``).
+
+    Each job runs in a process forked from the warm daemon (jobs run in parallel, isolated from each other).
+    A job stops when its client disconnects.
+    """
+    POLL_INTERVAL = 0.5
+    """ interval (seconds) to reap finished jobs """
+    REQUEST_TIMEOUT = 5.0
+    """ max time (seconds) to receive a request """
+    RECV_SIZE = 64 * 1024
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        """
+        Inits daemon server.
+
+        :param socket_path: Daemon socket. Defaults to None (use ``DaemonProtocol.get_socket_path()``).
+
+        :raises RuntimeError: if platform does not support the daemon.
+        """
+        super().__init__()
+        if not DaemonProtocol.is_supported():
+            raise RuntimeError(_("Daemon requires Unix domain sockets (not supported by this platform)"))
+        self._socket_path = socket_path or DaemonProtocol.get_socket_path()
+        self._server: socket.socket | None = None
+        self._started = time.monotonic()
+        self._jobs: set[int] = set()  # pids of running jobs
+        self._jobs_done = 0
+        self._running = False
+
+    @property
+    def socket_path(self) -> Path:
+        return self._socket_path
+
+    def get_status(self) -> dict[str, Any]:
+        return {
+            "type": "status",
+            "pid": os.getpid(),
+            "version": Environment.get_app_version(),
+            "socket": str(self._socket_path),
+            "uptime": time.monotonic() - self._started,
+            "jobs_running": len(self._jobs),
+            "jobs_done": self._jobs_done,
+        }
+
+    def _reap_jobs(self, block: bool = False):
+        while self._jobs:
+            try:
+                pid, _status = os.waitpid(-1, 0 if block else os.WNOHANG)
+            except ChildProcessError:
+                self._jobs.clear()
+                return
+            if pid == 0:
+                return
+            if pid in self._jobs:
+                self._jobs.discard(pid)
+                self._jobs_done += 1
+
+    def _bind(self) -> socket.socket:
+        if DaemonClient.is_running(self._socket_path):
+            raise RuntimeError(f"{_('Daemon is already running')} ('{self._socket_path}')")
+        self._socket_path.unlink(missing_ok=True)  # stale socket (daemon crashed)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pyright: ignore[reportAttributeAccessIssue]
+        umask = os.umask(0o077)  # socket is created private (only current user can submit jobs)
+        try:
+            server.bind(str(self._socket_path))
+        finally:
+            os.umask(umask)
+        server.listen()
+        return server
+
+    def serve(self):
+        """Run daemon until ``shutdown`` is requested (or SIGTERM / SIGINT)."""
+        self._server = self._bind()
+        logger.info(f"{_('Daemon listening on')} '{self._socket_path}' (pid {os.getpid()})")
+
+        def _stop(_signum: int, _frame: Any):
+            self._running = False
+        previous_handlers = {sig: signal.signal(sig, _stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+
+        self._running = True
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self._server, selectors.EVENT_READ)
+                while self._running:
+                    if selector.select(timeout=self.POLL_INTERVAL):
+                        conn, _addr = self._server.accept()
+                        self._handle(conn)
+                    self._reap_jobs()
+        finally:
+            self._server.close()
+            self._socket_path.unlink(missing_ok=True)
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+            logger.info(f"{_('Daemon stopping, waiting for running jobs')} ({len(self._jobs)}) ...")
+            self._reap_jobs(block=True)
+
+    def _handle(self, conn: socket.socket):
+        with conn:
+            fds: list[int] = []
+            try:
+                conn.settimeout(self.REQUEST_TIMEOUT)
+                data, fds, _flags, _addr = socket.recv_fds(conn, self.RECV_SIZE, 3)
+                while data and not data.endswith(b"\n") and len(data) < DaemonProtocol.MAX_MESSAGE_SIZE:
+                    chunk = conn.recv(self.RECV_SIZE)
+                    if not chunk:
+                        break
+                    data += chunk
+                message: dict[str, Any] = json.loads(data) if data.strip() else {}
+
+                match message.get("type"):
+                    case "status":
+                        DaemonProtocol.send(conn, self.get_status())
+                    case "shutdown":
+                        DaemonProtocol.send(conn, {"type": "ok"})
+                        self._running = False
+                    case "cli" | "job":
+                        conn.settimeout(None)
+                        pid = os.fork()
+                        if pid == 0:
+                            self._run_forked(conn, message, fds)  # never returns
+                        self._jobs.add(pid)
+                        logger.info(f"{_('Job started')}: {message.get('command') or message.get('argv')} (pid {pid})")
+                    case _:
+                        DaemonProtocol.send(conn, {"type": "error", "error_type": "ValueError", "error": f"unknown request '{message.get('type')}'"})
+            except (OSError, ValueError) as e:
+                logger.warning(f"{_('Invalid daemon request')}: {repr(e)}")
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+    def _run_forked(self, conn: socket.socket, message: dict[str, Any], fds: list[int]):
+        """Job process entry point (runs inside a forked child, never returns)."""
+        exit_code = 1
+        done = threading.Event()
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            if self._server is not None:
+                self._server.close()
+
+            # client stdin / stdout / stderr, working directory and environment
+            for name, fd in zip(message.get("fds", []), fds, strict=True):
+                os.dup2(fd, {"stdin": 0, "stdout": 1, "stderr": 2}[name])
+            os.chdir(message["cwd"])
+            os.environ.clear()
+            os.environ.update(message.get("env", {}))
+
+            import rich
+            rich.reconfigure()  # detect client terminal (colors, size)
+            Configuration.reload()
+            STATE.reset()
+
+            def _watch_client():
+                # client disconnected (e.g., Ctrl+C) => stop job
+                with conn.dup() as watch_conn:
+                    while watch_conn.recv(self.RECV_SIZE):
+                        pass
+                if not done.is_set():
+                    os.kill(os.getpid(), signal.SIGINT)
+            threading.Thread(target=_watch_client, name="fc_daemon_watch", daemon=True).start()
+
+            if message["type"] == "cli":
+                exit_code = self._run_cli(message)
+                done.set()
+                DaemonProtocol.send(conn, {"type": "exit", "code": exit_code})
+            else:
+                self._run_job(conn, message)
+                done.set()
+                exit_code = 0
+        except BaseException as e:
+            done.set()
+            try:
+                if message.get("type") == "cli":
+                    DaemonProtocol.send(conn, {"type": "exit", "code": exit_code})
+                else:
+                    DaemonProtocol.send(conn, {"type": "error", "error_type": type(e).__name__, "error": str(e)})
+            except OSError:
+                pass  # client is gone
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(exit_code)
+
+    def _run_cli(self, message: dict[str, Any]) -> int:
+        from file_conversor.cli.__main__ import start_cli
+
+        sys.argv = [DaemonProtocol.APP_NAME, *message["argv"]]
+        try:
+            return start_cli()
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+
+    def _run_job(self, conn: socket.socket, message: dict[str, Any]):
+        for name, value in message.get("config", {}).items():
+            setattr(CONFIG, name, value)
+        STATE.from_dict(message.get("state", {}))
+
+        aggregator = ProgressAggregator(
+            lambda p: DaemonProtocol.send(conn, {"type": "progress", "progress": p}),
+            workers_callback=lambda w: DaemonProtocol.send(conn, {"type": "workers", "workers": w}),
+        )
+        command_cls = DaemonClient.get_command_class(message["command"])
+        command = command_cls.model_validate({**message["options"], "progress_callback": aggregator})
+        command.execute()
+        aggregator.flush()
+        DaemonProtocol.send(conn, {"type": "done", "result": command.model_dump(mode="json")})
+
+
+__all__ = [
+    "DaemonServer",
+]
@@ -1,19 +1,38 @@
 # src\file_conversor\command\_data_models.py
 
+import functools
+import time
+
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Annotated, Any, Callable, Iterator
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 # user-provided modules
+from file_conversor.command.batch_executor import BatchExecutor
+from file_conversor.command.batch_journal import BatchJournal
+from file_conversor.command.batch_planner import BatchPlanner
+from file_conversor.command.batch_scheduler import BatchScheduler
+from file_conversor.command.progress_aggregator import ProgressAggregator
 from file_conversor.command.progress_manager import ProgressManager
-from file_conversor.config import LOG, get_translation
-from file_conversor.utils.formatters import get_output_file
+from file_conversor.command.result_cache import ResultCache
+from file_conversor.command.throughput_history import ThroughputHistory
+from file_conversor.config import CONFIG, LOG, STATE, ProcessAccounting, ResourceGovernor, Tracer, get_translation
+from file_conversor.utils.discovery import iter_files
+from file_conversor.utils.formatters import format_bytes, get_output_file, parse_bytes
 
 
 logger = LOG.getLogger(__name__)
 _ = get_translation()
 
+_USAGE_MESSAGE = "usage"
+"""process worker relay message (resource usage of a step)"""
+_CACHE_MESSAGE = "cache"
+"""process worker relay message (result cache hits / misses)"""
+_THROUGHPUT_MESSAGE = "throughput"
+"""process worker relay message (throughput history samples)"""
+
 
 class FilesDataModel(BaseModel):
     input_files: list[Path]
@@ -36,6 +55,8 @@ class FilesDataModel(BaseModel):
         for input_file in self.input_files:
             if not input_file.exists():
                 raise FileNotFoundError(f"Input file '{input_file}' does not exist")
+            if input_file.is_dir():
+                raise IsADirectoryError(f"Input file '{input_file}' is a directory (not supported by this command)")
 
         self.output_file = self.expand_and_normalize(self.output_file)
         if self.output_file.exists() and not self.overwrite_output:
@@ -55,9 +76,12 @@ class FilesDataModel(BaseModel):
 
         :param steps_callbacks: Callbacks for each step. Each callback receives the current InOutFileDataModel and progress_callback (calculates progress 0-100 for file).
         """
+        if STATE.plan.enabled:
+            raise RuntimeError(_("Plan mode (--plan) is only supported by batch commands"))
         progress_mgr = ProgressManager(steps_per_file=len(steps_callbacks))
-        for step_callback in steps_callbacks:
-            step_callback(self, progress_mgr.get_progress)
+        for idx, step_callback in enumerate(steps_callbacks):
+            with Tracer.span(f"step {idx}", "step", output_file=self.output_file):
+                step_callback(self, progress_mgr.get_progress)
             progress_mgr.next_step()
 
 
@@ -76,6 +100,8 @@ class FileDataModel(BaseModel):
         self.input_file = self.expand_and_normalize(self.input_file)
         if not self.input_file.exists():
             raise FileNotFoundError(f"Input file '{self.input_file}' does not exist")
+        if self.input_file.is_dir():
+            raise IsADirectoryError(f"Input file '{self.input_file}' is a directory (not supported by this command)")
 
         self.output_file = self.expand_and_normalize(self.output_file)
         if self.output_file.exists() and not self.overwrite_output:
@@ -95,8 +121,9 @@ class FileDataModel(BaseModel):
         :param steps_callbacks: Callbacks for each step. Each callback receives the current InOutFileDataModel and progress_callback (calculates progress 0-100 for file).
         """
         progress_mgr = ProgressManager(steps_per_file=len(steps_callbacks))
-        for step_callback in steps_callbacks:
-            step_callback(self, progress_mgr.get_progress)
+        for idx, step_callback in enumerate(steps_callbacks):
+            with Tracer.span(f"step {idx}", "step", output_file=self.output_file):
+                step_callback(self, progress_mgr.get_progress)
             progress_mgr.next_step()
 
 
@@ -106,6 +133,26 @@ class BatchFilesDataModel(BaseModel):
     overwrite_output: bool
     out_stem: str = ""
     out_suffix: str | None = None
+    jobs: int | None = None
+    """Max parallel jobs. Defaults to None (use ``--jobs`` option / ``jobs`` config). Use 1 for steps that are not thread-safe."""
+    progress_callback: Annotated[Callable[[float], Any], Field(exclude=True)] = lambda p: p
+    """Overall progress callback, used to relay progress reported by process workers. A ``ProgressAggregator`` also receives per-file progress of files in flight."""
+    cache_fingerprint: str | None = None
+    """Command fingerprint. If set (and ``result_cache`` config is enabled), output files are cached. Use only for single output commands."""
+    skip_up_to_date: bool | None = None
+    """Skip input files with up-to-date outputs (make-style). Outdated outputs of the remaining files are rebuilt (overwritten), even if ``overwrite_output`` is False. Defaults to None (use ``--skip-up-to-date`` option)."""
+    cost_estimator: Annotated[Callable[[Path], float] | None, Field(exclude=True)] = None
+    """Estimate input file processing cost (e.g., media duration, PDF pages), used to schedule longest jobs first and to weight progress. Defaults to None (file size)."""
+    memory_estimator: Annotated[Callable[[Path], int] | None, Field(exclude=True)] = None
+    """Estimate input file peak memory usage in bytes (e.g., decoded image size), used to admit only jobs that fit the ``--memory-budget``. Defaults to None (no memory admission)."""
+    in_formats: list[str] = []
+    """Supported input formats, used to filter files found inside input folders. If empty, accept all formats."""
+    include: list[str] | None = None
+    """Include globs for files found inside input folders. Defaults to None (use ``--include`` option)."""
+    exclude: list[str] | None = None
+    """Exclude globs for files found inside input folders. Defaults to None (use ``--exclude`` option)."""
+    journal: bool = True
+    """Write batch journal inside ``output_dir`` (used by ``--resume``). Disable for commands that do not write output files."""
 
     @classmethod
     def _get_step_file(cls, path: Path, step_idx: int) -> Path:
@@ -125,26 +172,105 @@ class BatchFilesDataModel(BaseModel):
         if self.output_dir.exists() and not self.output_dir.is_dir():
             raise NotADirectoryError(f"Output path '{self.output_dir}' is not a directory")
 
+        if self.include is None:
+            self.include = STATE.input_filter.include
+        if self.exclude is None:
+            self.exclude = STATE.input_filter.exclude
+
+        if self.skip_up_to_date is None:
+            self.skip_up_to_date = STATE.skip_up_to_date.enabled
+
+        if STATE.plan.enabled:
+            return self  # dry run, do not touch output folder
         self.output_dir.mkdir(parents=True, exist_ok=True)
         if not self.output_dir.exists():
             raise OSError(f"Output path '{self.output_dir}' does not exist")
 
         return self
 
-    def get_iterator(self):
-        for input_file in self.input_files:
-            # Determine output file path
-            output_file = get_output_file(
-                input_file=input_file,
-                output_dir=self.output_dir,
-                out_stem=self.out_stem,
-                out_suffix=self.out_suffix,
-            )
+    def _get_overwrite_output(self) -> bool:
+        """Overwrite output files (with ``skip_up_to_date``, existing outputs left to process are outdated)."""
+        return self.overwrite_output or bool(self.skip_up_to_date)
+
+    def _is_up_to_date(self, input_file: Path, output_file: Path) -> bool:
+        """Output is up to date if it is not empty, and newer than input file."""
+        try:
+            input_stat = input_file.stat()
+            output_stat = output_file.stat()
+        except OSError:
+            return False
+        return output_stat.st_size > 0 and output_stat.st_mtime >= input_stat.st_mtime
+
+    def _get_output_file(self, input_file: Path, output_dir: Path | None = None) -> Path:
+        return get_output_file(
+            input_file=input_file,
+            output_dir=output_dir or self.output_dir,
+            out_stem=self.out_stem,
+            out_suffix=self.out_suffix,
+        )
+
+    def _iter_input_files(self) -> Iterator[tuple[Path, Path]]:
+        """
+        Iterate over (input file, output file) pairs, lazily.
+        Input folders are scanned recursively (output folder mirrors the input folder structure).
+        """
+        for input_path in self.input_files:
+            if not input_path.is_dir():
+                yield input_path, self._get_output_file(input_path)
+                continue
+
+            for input_file in iter_files(input_path, file_formats=self.in_formats, include=self.include or [], exclude=self.exclude or []):
+                yield input_file, self._get_output_file(input_file, self.output_dir / input_file.parent.relative_to(input_path))
 
+    def _iter_pending_files(self) -> Iterator[tuple[Path, Path]]:
+        """
+        Iterate over (input file, output file) pairs left to process, lazily (see ``skip_up_to_date``).
+        Skipped files are counted after input folders are scanned (remaining outputs are missing or outdated).
+        """
+        total_files = skipped_files = 0
+        for input_file, output_file in self._iter_input_files():
+            total_files += 1
+            if self.skip_up_to_date and self._is_up_to_date(input_file, output_file):
+                skipped_files += 1
+                continue
+            yield input_file, output_file
+
+        if total_files == 0:
+            logger.warning(f"{_('No input files found')}.")
+        elif self.skip_up_to_date:
+            logger.info(f"{_('Up-to-date files skipped')}: {skipped_files} / {total_files}")
+            if skipped_files == total_files:
+                logger.info(f"{_('All files are up to date. Nothing to do')}.")
+
+    def _get_step_output_file(self, output_file: Path, step_idx: int, total_steps: int) -> Path:
+        return output_file if step_idx == (total_steps - 1) else self._get_step_file(output_file, step_idx)
+
+    def _get_resume_step(self, journal: BatchJournal, input_file: Path, output_file: Path, total_steps: int) -> int:
+        """
+        Get first step to run for input file (``total_steps`` if already completed), and clean orphaned step files.
+        """
+        first_step = 0
+        for step_idx in reversed(range(total_steps)):
+            if journal.is_done(input_file, self._get_step_output_file(output_file, step_idx, total_steps), step_idx):
+                first_step = step_idx + 1
+                break
+
+        for step_idx in range(total_steps):
+            step_output = self._get_step_output_file(output_file, step_idx, total_steps)
+            if step_idx == first_step - 1 or not step_output.exists():
+                continue  # resume point (or nothing to clean)
+            if step_idx < total_steps - 1 or journal.is_orphan(input_file, step_output, step_idx):
+                logger.debug("Removing orphaned file '%s' ...", step_output)
+                step_output.unlink()
+        return first_step
+
+    def get_iterator(self):
+        for input_file, output_file in self._iter_pending_files():
+            output_file.parent.mkdir(parents=True, exist_ok=True)
             yield FileDataModel(
                 input_file=input_file,
                 output_file=output_file,
-                overwrite_output=self.overwrite_output,
+                overwrite_output=self._get_overwrite_output(),
             )
 
     def get_list(self):
@@ -159,19 +285,277 @@ class BatchFilesDataModel(BaseModel):
 
         :param steps_callbacks: Callbacks for each step. Each callback receives the current InOutFileDataModel and progress_callback (calculates progress 0-100 for file).
         """
+        if STATE.plan.enabled:
+            self._plan()
+            return
+
         logger.info(f"[bold]{_('Processing files')}[/] ...")
-        progress_mgr = ProgressManager(len(self.input_files), steps_per_file=len(steps_callbacks))
-        for datamodel in self.get_iterator():
-            for idx, step_callback in enumerate(steps_callbacks):
-                step_datamodel = FileDataModel(
-                    input_file=datamodel.input_file if idx == 0 else self._get_step_file(datamodel.output_file, idx - 1),
-                    output_file=datamodel.output_file if idx == (len(steps_callbacks) - 1) else self._get_step_file(datamodel.output_file, idx),
-                    overwrite_output=datamodel.overwrite_output,
+        total_steps = len(steps_callbacks)
+        progress_mgr = ProgressManager(len(self.input_files), steps_per_file=total_steps)
+        executor = BatchExecutor.from_state(self.jobs)
+        journal = BatchJournal(self.output_dir, self._get_journal_key(total_steps), resume=STATE.resume.enabled) if self.journal else None
+
+        # CPU tokens per job (pipeline mode runs ``jobs`` workers per step)
+        cpu_share = ResourceGovernor.get_share(executor.jobs * (total_steps if executor.mode == BatchExecutor.Mode.PIPELINE else 1))
+
+        use_cache = self.cache_fingerprint is not None and CONFIG.result_cache
+        cache_max_size = parse_bytes(CONFIG.result_cache_max_size)
+
+        memory_budget = ResourceGovernor.get_memory_budget()  # shared by process workers (see ``BatchExecutor``)
+        # python heap peak is process-wide (unknown if steps of other files run in parallel threads)
+        trace_memory = executor.mode in (BatchExecutor.Mode.SERIAL, BatchExecutor.Mode.PROCESS)
+
+        def get_work_items():
+            total_files = 0
+            for file_idx, (input_file, output_file) in enumerate(self._iter_pending_files()):
+                total_files += 1
+                if file_idx >= progress_mgr.out_files:
+                    progress_mgr.set_out_files(file_idx + 1)  # input folders still being scanned
+
+                first_step = 0
+                if journal is not None and STATE.resume.enabled:
+                    first_step = self._get_resume_step(journal, input_file, output_file, total_steps)
+                if first_step >= total_steps:
+                    logger.info("%s '%s'", _('Skipping completed file'), input_file)
+                    self.progress_callback(progress_mgr.set_progress(file_idx, total_steps - 1, 100.0))
+                    continue
+
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                yield _BatchItem(
+                    file_idx=file_idx,
+                    datamodel=FileDataModel(
+                        input_file=input_file,
+                        output_file=output_file,
+                        overwrite_output=self._get_overwrite_output(),
+                    ),
+                    first_step=first_step,
                 )
-                step_callback(step_datamodel, progress_mgr.get_progress)
-                progress_mgr.next_step()
-                if idx > 0:
-                    step_datamodel.input_file.unlink(missing_ok=True)  # remove temp file
+
+            progress_mgr.set_out_files(max(total_files, 1))
+            self.progress_callback(progress_mgr.get_overall_progress() if total_files else 100.0)
+
+        aggregator = self.progress_callback if isinstance(self.progress_callback, ProgressAggregator) else None
+
+        def set_file_progress(file_idx: int, step_idx: int, progress: float, worker: str) -> float:
+            overall = progress_mgr.set_progress(file_idx, step_idx, progress)
+            if aggregator is not None:
+                file_done = step_idx == total_steps - 1 and progress >= 100.0
+                file_progress = 100.0 * (step_idx + progress / 100.0) / total_steps
+                aggregator.update(overall, workers={worker: None if file_done else file_progress})
+            return overall
+
+        def get_scheduled_items():
+            # longest-job-first avoids idle workers at the end of parallel batches (keep input order otherwise)
+            scheduler = BatchScheduler(self.cost_estimator, jobs=executor.jobs, sort=executor.jobs > 1)
+            for window in scheduler.schedule_windows(get_work_items(), get_path=lambda item: item.datamodel.input_file):
+                for item, cost in window:  # weights are known before the first file of the window runs
+                    progress_mgr.set_weight(item.file_idx, cost)
+                for item, cost in window:
+                    item.cost = cost
+                    if memory_budget > 0 and self.memory_estimator is not None:
+                        item.memory = self._estimate_memory(item.datamodel.input_file)
+                    yield item
+
+        def run_step(item: _BatchItem, idx: int) -> _BatchItem:
+            file_idx, datamodel = item.file_idx, item.datamodel
+            if use_cache and idx == 0:
+                item.cache_key = ResultCache.get_key(datamodel.input_file, str(self.cache_fingerprint), datamodel.output_file.suffix)
+                if ResultCache.restore(item.cache_key, datamodel.output_file):
+                    item.first_step = total_steps
+            worker = datamodel.input_file.name
+            if idx < item.first_step:
+                if not BatchExecutor.relay((file_idx, idx, 100.0, worker)):
+                    set_file_progress(file_idx, idx, 100.0, worker)
+                return item
+            if idx == item.first_step:
+                item.started = time.perf_counter()
+
+            step_datamodel = FileDataModel(
+                input_file=datamodel.input_file if idx == 0 else self._get_step_file(datamodel.output_file, idx - 1),
+                output_file=self._get_step_output_file(datamodel.output_file, idx, total_steps),
+                overwrite_output=datamodel.overwrite_output,
+            )
+
+            def get_progress(p: float) -> float:
+                if BatchExecutor.relay((file_idx, idx, p, worker)):
+                    return progress_mgr.get_overall_progress()  # tracked by the parent process (worker copy is stale)
+                return set_file_progress(file_idx, idx, p, worker)
+
+            if journal is not None:
+                journal.record_start(datamodel.input_file, step_datamodel.output_file, idx)
+            # wait for memory before taking CPU tokens (admitted jobs never hold idle CPUs)
+            with (
+                ResourceGovernor.acquire_memory(item.memory, budget=memory_budget),
+                ResourceGovernor.acquire(cpu_share),
+                Tracer.span(f"step {idx}", "step", input_file=datamodel.input_file, output_file=step_datamodel.output_file),
+                ProcessAccounting.collect() as usages,
+                ProcessAccounting.measure(trace_memory=trace_memory),
+            ):
+                steps_callbacks[idx](step_datamodel, get_progress)
+            get_progress(100.0)
+            usage = self._report_usage(datamodel.input_file, idx, usages)
+            if journal is not None:
+                journal.record_done(datamodel.input_file, step_datamodel.output_file, idx, usage=usage)
+            if journal is not None and idx == total_steps - 1:
+                journal.sync()  # one disk sync per file
+            if idx > 0:
+                step_datamodel.input_file.unlink(missing_ok=True)  # remove temp file
+            if idx == total_steps - 1:
+                if item.cache_key is not None:
+                    ResultCache.store(item.cache_key, datamodel.output_file, max_size=cache_max_size)
+                if item.first_step == 0 and item.started is not None:
+                    self._record_throughput(item, time.perf_counter() - item.started)
+            return item
+
+        def relay_progress(message: tuple[Any, ...]):
+            if message[0] == _USAGE_MESSAGE:
+                ProcessAccounting.add_totals([ProcessAccounting.Usage(**usage) for usage in message[1]])
+                return
+            if message[0] == _CACHE_MESSAGE:
+                ResultCache.add_counts(*message[1:])
+                return
+            if message[0] == _THROUGHPUT_MESSAGE:
+                ThroughputHistory.add_samples(message[1])
+                return
+            overall = set_file_progress(*message)
+            if aggregator is None:
+                self.progress_callback(overall)
+
+        stages = [functools.partial(run_step, idx=idx) for idx in range(total_steps)]
+        if executor.mode == BatchExecutor.Mode.PIPELINE:
+            # step N of file i+1 runs while step N+1 of file i is running
+            completed = False
+            try:
+                executor.map_stages(stages, get_scheduled_items())
+                completed = True
+            finally:
+                self._finish(aggregator, journal, completed)
+            return
+
+        def process_file(item: _BatchItem):
+            for stage in stages:
+                stage(item)
+            if BatchExecutor.in_worker():
+                # saved by the parent process, once per batch
+                if use_cache:
+                    BatchExecutor.relay((_CACHE_MESSAGE, *ResultCache.pop_counts()))
+                BatchExecutor.relay((_THROUGHPUT_MESSAGE, ThroughputHistory.pop_samples()))
+
+        completed = False
+        try:
+            executor.map(process_file, get_scheduled_items(), relay_callback=relay_progress)
+            completed = True
+        finally:
+            self._finish(aggregator, journal, completed)
+
+    def _plan(self):
+        """Dry run (``--plan``), print files that would be processed with estimated duration / output size. Nothing is written to disk."""
+        executor = BatchExecutor.from_state(self.jobs)
+        planner = BatchPlanner(jobs=executor.jobs)
+        scheduler = BatchScheduler(self.cost_estimator, jobs=executor.jobs)
+        for (input_file, output_file), cost in scheduler.estimate(self._iter_pending_files(), get_path=lambda item: item[0]):
+            planner.add(input_file, output_file, ThroughputHistory.get_key(input_file, output_file, self.out_stem), cost)
+        planner.print(self.output_dir)
+        self.progress_callback(100.0)
+
+    def _record_throughput(self, item: '_BatchItem', duration: float):
+        datamodel = item.datamodel
+        try:
+            in_size = datamodel.input_file.stat().st_size
+            out_size = datamodel.output_file.stat().st_size
+        except OSError:
+            return  # output not written (e.g., command with no output files)
+        cost = item.cost or BatchScheduler(self.cost_estimator).estimate_cost(datamodel.input_file)  # serial batches skip estimates
+        if cost is None:
+            return
+        key = ThroughputHistory.get_key(datamodel.input_file, datamodel.output_file, self.out_stem)
+        ThroughputHistory.record(key, cost, duration, in_size, out_size)
+
+    def _report_usage(self, input_file: Path, step_idx: int, usages: list[ProcessAccounting.Usage]) -> list[dict[str, Any]] | None:
+        """Log step resource usage, and relay it to the parent process (process workers). Returns usage for the batch journal."""
+        if not usages:
+            return None
+        usage = [u.to_dict() for u in usages]
+        BatchExecutor.relay((_USAGE_MESSAGE, usage))  # process worker totals are summarized by the parent process
+        for u in usages:
+            logger.debug("Resource usage '%s' (step %d): %s wall=%.2fs user=%.2fs sys=%.2fs max_rss=%s peak_heap=%s", input_file.name, step_idx, u.tool, u.wall_time, u.user_time, u.system_time, u.max_rss, u.peak_memory)
+        return usage
+
+    def _get_journal_key(self, total_steps: int) -> str:
+        """Batch journal key (same command and inputs), so other batches in the output folder keep their journals."""
+        return BatchJournal.get_key(
+            *sorted(str(f) for f in self.input_files),
+            self.out_stem,
+            self.out_suffix,
+            self.cache_fingerprint,
+            self.include,
+            self.exclude,
+            total_steps,
+        )
+
+    def _finish(self, aggregator: ProgressAggregator | None, journal: BatchJournal | None = None, completed: bool = False):
+        if journal is not None:
+            journal.close(remove=completed)  # completed batches have nothing to resume
+        ResultCache.flush()
+        ThroughputHistory.flush()
+        if ProcessAccounting.is_enabled():
+            ProcessAccounting.stop_tracing()  # tracing slows down every allocation of the app
+            self._print_usage_summary()
+            ProcessAccounting.reset()  # next batch (e.g., pipeline stage) starts a new summary
+        if aggregator is not None:
+            aggregator.flush()  # pending (rate limited) updates
+
+    def _print_usage_summary(self):
+        """Print per-tool resource usage of the batch (sorted by CPU time, see ``--accounting``)."""
+        summary = ProcessAccounting.get_summary()
+        if not summary:
+            return
+        from rich import print
+        from rich.table import Table
+
+        def format_size(size: float) -> str:
+            return format_bytes(size) if size else "-"  # unknown
+
+        table = Table(title=_("Resource usage"))
+        table.add_column(_("Tool"))
+        for column in (_("Runs"), _("Wall time"), _("User CPU"), _("System CPU"), _("Max RSS"), _("Peak heap")):
+            table.add_column(column, justify="right")
+        for tool, total in sorted(summary.items(), key=lambda item: -(item[1]["user_time"] + item[1]["system_time"])):
+            table.add_row(
+                tool,
+                str(int(total["count"])),
+                f"{total['wall_time']:.2f}s",
+                f"{total['user_time']:.2f}s",
+                f"{total['system_time']:.2f}s",
+                format_size(total["max_rss"]),
+                format_size(total["peak_memory"]),
+            )
+        print(table)
+
+    def _estimate_memory(self, input_file: Path) -> int:
+        if self.memory_estimator is None:
+            return 0
+        try:
+            return max(0, int(self.memory_estimator(input_file)))
+        except Exception as e:
+            logger.debug("Memory estimate failed for '%s': %r", input_file, e)
+            return 0
+
+
+@dataclass
+class _BatchItem:
+    """Batch work item (per-file state travels with the item, so process workers see it)."""
+    file_idx: int
+    datamodel: FileDataModel
+    first_step: int = 0
+    """First step to run (resumed batch / cache hit)"""
+    cache_key: str | None = None
+    memory: int = 0
+    """Estimated peak memory (bytes)"""
+    cost: float = 0.0
+    """Estimated cost (see ``BatchScheduler``)"""
+    started: float | None = None
+    """Processing start time (used to record throughput)"""
 
 
 __all__ = [
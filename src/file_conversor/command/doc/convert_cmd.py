@@ -47,6 +47,9 @@ class DocConvertCommand(AbstractCommand[DocConvertInFormats, DocConvertOutFormat
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            progress_callback=self.progress_callback,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            in_formats=self.get_in_formats(),
         )
 
         backend = LibreofficeWriterBackend(
@@ -48,6 +48,9 @@ class EbookConvertCommand(AbstractCommand[EbookConvertInFormats, EbookConvertOut
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         calibre_backend = CalibreBackend(
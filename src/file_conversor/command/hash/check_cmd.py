@@ -41,18 +41,21 @@ class HashCheckCommand(AbstractCommand[HashCheckInFormats, HashCheckOutFormats])
     @override
     def execute(self):
 
-        hash_backend = HashBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_hash_backend = HashBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=Path(),
             out_stem="_",
             overwrite_output=True,
+            journal=False,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Checking file')} '{data.input_file}' ...")
-            hash_backend.check(
+            get_hash_backend().check(
                 input_file=data.input_file,
                 progress_callback=lambda p: self.progress_callback(get_progress(p)),
             )
@@ -42,7 +42,7 @@ class ImageCompressCommand(AbstractCommand[ImageCompressInFormats, ImageCompress
 
     @override
     def execute(self):
-        compress_backend = CompressBackend(
+        get_compress_backend = CompressBackend.lazy(
             install_deps=CONFIG.install_deps,
             verbose=STATE.loglevel.get().is_verbose(),
         )
@@ -52,11 +52,14 @@ class ImageCompressCommand(AbstractCommand[ImageCompressInFormats, ImageCompress
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_compressed",
+            progress_callback=self.progress_callback,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
-            compress_backend.compress(
+            get_compress_backend().compress(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 quality=self.quality,
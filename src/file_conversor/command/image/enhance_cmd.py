@@ -48,18 +48,21 @@ class ImageEnhanceCommand(AbstractCommand[ImageEnhanceInFormats, ImageEnhanceOut
 
     @override
     def execute(self):
-        pillow_backend = PillowBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pillow_backend = PillowBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_enhanced",
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
+            memory_estimator=PillowBackend.estimate_memory,  # huge images run alone
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
-            pillow_backend.enhance(
+            get_pillow_backend().enhance(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 color_factor=self.color,
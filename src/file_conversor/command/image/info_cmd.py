@@ -43,20 +43,24 @@ class ImageInfoCommand(AbstractCommand[ImageInfoInFormats, ImageInfoOutFormats])
 
     @override
     def execute(self):
-        pillow_backend = PillowBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pillow_backend = PillowBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=Path(),
             out_stem="_",
             overwrite_output=True,
+            jobs=1,  # output is collected in order, in this process
+            journal=False,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
 
             # 📁 Informações gerais do arquivo
-            self.output[data.input_file] = pillow_backend.info(data.input_file)
+            self.output[data.input_file] = get_pillow_backend().info(data.input_file)
             self.progress_callback(get_progress(100.0))
 
         datamodel.execute(step_one)
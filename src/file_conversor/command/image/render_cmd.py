@@ -44,18 +44,20 @@ class ImageRenderCommand(AbstractCommand[ImageRenderInFormats, ImageRenderOutFor
 
     @override
     def execute(self):
-        pymusvg_backend = PyMuSVGBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pymusvg_backend = PyMuSVGBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_suffix=self.file_format.value,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
-            pymusvg_backend.convert(
+            get_pymusvg_backend().convert(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 dpi=self.dpi,
@@ -51,18 +51,21 @@ class ImageRotateCommand(AbstractCommand[ImageRotateInFormats, ImageRotateOutFor
         Rotate image files.
         """
 
-        pillow_backend = PillowBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pillow_backend = PillowBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_rotated",
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
+            memory_estimator=PillowBackend.estimate_memory,  # huge images run alone
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
-            pillow_backend.rotate(
+            get_pillow_backend().rotate(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 rotate=self.rotation,
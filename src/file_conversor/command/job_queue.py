@@ -0,0 +1,444 @@
+# src\file_conversor\command\job_queue.py
+
+import json
+import os
+import socket
+import sqlite3
+import time
+
+from contextlib import closing
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+# user-provided modules
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.config import LOG, STATE, Environment, get_translation
+
+
+if TYPE_CHECKING:
+    from file_conversor.command.abstract_cmd import AbstractCommand
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+def _run_worker_process(db_path: Path, wait: bool):
+    """ Worker process entry point. """
+    JobQueue(db_path).run_worker(wait=wait)
+
+
+class JobQueue:
+    """
+    Persistent job queue (SQLite), with priorities and retries.
+
+    Jobs store serialized command models (``model_dump()``), along with the CLI states and working directory
+    of the submitter. Workers (processes) claim jobs atomically, so several workers (and ``queue run`` invocations)
+    can drain the same queue.
+    """
+    DB_NAME = ".job_queue.sqlite"
+    BUSY_TIMEOUT = 30.0
+    """ max time (seconds) to wait for a locked database """
+    POLL_INTERVAL = 1.0
+    """ interval (seconds) to poll for new jobs (``wait`` mode) """
+
+    class Status(StrEnum):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    @dataclass
+    class Job:
+        id: int
+        command: str
+        options: dict[str, Any]
+        state: dict[str, Any]
+        cwd: str
+        priority: int
+        status: 'JobQueue.Status'
+        attempts: int
+        max_attempts: int
+        worker: str | None
+        error: str | None
+        submitted_at: float
+        started_at: float | None
+        finished_at: float | None
+        duration: float | None
+
+        @classmethod
+        def from_row(cls, row: sqlite3.Row) -> 'JobQueue.Job':
+            return cls(
+                id=row["id"],
+                command=row["command"],
+                options=json.loads(row["options"]),
+                state=json.loads(row["state"]),
+                cwd=row["cwd"],
+                priority=row["priority"],
+                status=JobQueue.Status(row["status"]),
+                attempts=row["attempts"],
+                max_attempts=row["max_attempts"],
+                worker=row["worker"],
+                error=row["error"],
+                submitted_at=row["submitted_at"],
+                started_at=row["started_at"],
+                finished_at=row["finished_at"],
+                duration=row["duration"],
+            )
+
+        def to_dict(self) -> dict[str, Any]:
+            """ Job summary (without command options / states). """
+            return {
+                "id": self.id,
+                "command": self.command.rpartition(":")[2],
+                "priority": self.priority,
+                "status": self.status.value,
+                "attempts": self.attempts,
+                "max_attempts": self.max_attempts,
+                "worker": self.worker,
+                "error": self.error,
+                "duration": self.duration,
+            }
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """
+        Inits job queue (creates the database, if needed).
+
+        :param db_path: Queue database. Defaults to None (``.job_queue.sqlite`` in the app data folder).
+        """
+        super().__init__()
+        self._db_path = db_path or (Environment.get_data_folder() / self.DB_NAME)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    command TEXT NOT NULL,
+                    options TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    cwd TEXT NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 1,
+                    worker TEXT,
+                    error TEXT,
+                    result TEXT,
+                    submitted_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    duration REAL
+                );
+                CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, priority DESC, id);
+            """)
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=self.BUSY_TIMEOUT, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")  # readers (status) do not block workers
+        return conn
+
+    @classmethod
+    def get_worker_name(cls) -> str:
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def submit(
+        self,
+        command: 'AbstractCommand[Any, Any]',
+        priority: int = 0,
+        retries: int = 0,
+        state: dict[str, Any] | None = None,
+        cwd: Path | None = None,
+    ) -> int:
+        """
+        Add command to the queue.
+
+        :param command: Command model.
+        :param priority: Job priority (higher runs first). Defaults to 0.
+        :param retries: Max retries, if job fails. Defaults to 0.
+        :param state: CLI states (see ``STATE.to_dict()``). Defaults to None (current states).
+        :param cwd: Working directory (relative paths). Defaults to None (current working directory).
+
+        :return: Job id.
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (command, options, state, cwd, priority, max_attempts, submitted_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    DaemonClient.get_command_name(command),
+                    json.dumps(command.model_dump(mode="json")),
+                    json.dumps(STATE.to_dict() if state is None else state),
+                    str(cwd or Path.cwd()),
+                    priority,
+                    retries + 1,
+                    time.time(),
+                ),
+            )
+            job_id = cursor.lastrowid or 0
+        logger.debug(f"{_('Job submitted')}: {job_id} ({type(command).__qualname__})")
+        return job_id
+
+    def claim(self, worker: str | None = None) -> 'JobQueue.Job | None':
+        """
+        Claim next pending job atomically (highest priority first, then oldest).
+
+        :param worker: Worker name. Defaults to None (``host:pid``).
+
+        :return: Claimed job, or None if queue is empty.
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")  # write lock, so two workers never claim the same job
+            try:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE status = ? ORDER BY priority DESC, id LIMIT 1",
+                    (self.Status.PENDING.value,),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, started_at = ?, error = NULL WHERE id = ?",
+                    (self.Status.RUNNING.value, worker or self.get_worker_name(), time.time(), row["id"]),
+                )
+                job_row = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return self.Job.from_row(job_row)
+
+    def complete(self, job: 'JobQueue.Job', result: dict[str, Any] | None = None):
+        """
+        Mark job as done.
+
+        :param job: Claimed job.
+        :param result: Command model after execution (e.g., ``output`` fields). Defaults to None.
+        """
+        finished_at = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, finished_at = ?, duration = ? WHERE id = ?",
+                (self.Status.DONE.value, json.dumps(result or {}), finished_at, finished_at - (job.started_at or finished_at), job.id),
+            )
+
+    def fail(self, job: 'JobQueue.Job', error: str) -> bool:
+        """
+        Mark job as failed (or pending again, if it has retries left).
+
+        :param job: Claimed job.
+        :param error: Error message.
+
+        :return: True if job was requeued (retry), False otherwise.
+        """
+        retry = job.attempts < job.max_attempts
+        finished_at = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ?, duration = ? WHERE id = ?",
+                (
+                    (self.Status.PENDING if retry else self.Status.FAILED).value,
+                    error,
+                    finished_at,
+                    finished_at - (job.started_at or finished_at),
+                    job.id,
+                ),
+            )
+        return retry
+
+    def requeue_stale(self) -> int:
+        """
+        Requeue running jobs whose worker process (on this host) no longer exists (e.g., worker was killed).
+
+        :return: Number of requeued jobs.
+        """
+        host = socket.gethostname()
+        stale: list[int] = []
+        with closing(self._connect()) as conn:
+            for row in conn.execute("SELECT id, worker FROM jobs WHERE status = ?", (self.Status.RUNNING.value,)):
+                worker_host, _sep, worker_pid = (row["worker"] or "").rpartition(":")
+                if worker_host != host or not worker_pid.isdigit():
+                    continue
+                try:
+                    os.kill(int(worker_pid), 0)
+                except ProcessLookupError:
+                    stale.append(row["id"])
+                except OSError:
+                    pass  # process exists (owned by another user)
+            conn.executemany(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0) WHERE id = ? AND status = ?",
+                [(self.Status.PENDING.value, job_id, self.Status.RUNNING.value) for job_id in stale],
+            )
+        if stale:
+            logger.warning(f"{_('Requeued stale jobs')}: {stale}")
+        return len(stale)
+
+    def get_job(self, job_id: int) -> 'JobQueue.Job | None':
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self.Job.from_row(row) if row else None
+
+    def get_result(self, job_id: int) -> dict[str, Any] | None:
+        """ Get command model after execution (only for finished jobs). """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row["result"]) if row and row["result"] else None
+
+    def list_jobs(self, status: 'JobQueue.Status | None' = None, limit: int = 100) -> list['JobQueue.Job']:
+        """
+        List jobs (newest first).
+
+        :param status: Filter by status. Defaults to None (all jobs).
+        :param limit: Max jobs listed. Defaults to 100.
+        """
+        query, params = "SELECT * FROM jobs", []
+        if status is not None:
+            query, params = query + " WHERE status = ?", [status.value]
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"{query} ORDER BY id DESC LIMIT ?", (*params, limit)).fetchall()
+        return [self.Job.from_row(row) for row in rows]
+
+    def get_stats(self) -> dict[str, Any]:
+        """ Get queue statistics (jobs per status, mean job duration and throughput of finished jobs). """
+        with closing(self._connect()) as conn:
+            counts = {row["status"]: row["count"] for row in conn.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status")}
+            row = conn.execute(
+                "SELECT COUNT(*) AS count, AVG(duration) AS mean, MIN(started_at) AS first, MAX(finished_at) AS last FROM jobs WHERE status = ?",
+                (self.Status.DONE.value,),
+            ).fetchone()
+        elapsed = (row["last"] - row["first"]) if row["count"] else 0.0
+        return {
+            **{status.value: counts.get(status.value, 0) for status in self.Status},
+            "mean_duration": row["mean"] or 0.0,
+            "throughput": (row["count"] / elapsed) if elapsed > 0 else 0.0,
+        }
+
+    def clear(self, statuses: list['JobQueue.Status'] | None = None) -> int:
+        """
+        Remove jobs from the queue.
+
+        :param statuses: Statuses removed. Defaults to None (finished jobs, done and failed).
+
+        :return: Number of removed jobs.
+        """
+        statuses = statuses or [self.Status.DONE, self.Status.FAILED]
+        with closing(self._connect()) as conn:
+            cursor = conn.executemany(
+                "DELETE FROM jobs WHERE status = ?",
+                [(status.value,) for status in statuses],
+            )  # rowcount sums all statuses
+        return cursor.rowcount
+
+    def run_job(self, job: 'JobQueue.Job') -> bool:
+        """
+        Execute claimed job (in this process), and record its outcome.
+
+        :param job: Claimed job.
+
+        :return: True if job succeeded, False otherwise.
+        """
+        cwd, states = Path.cwd(), STATE.to_dict()
+        try:
+            os.chdir(job.cwd)
+            STATE.from_dict(job.state)
+            command_cls = DaemonClient.get_command_class(job.command)
+            command = command_cls.model_validate(job.options)
+            command.execute()
+        except Exception as e:
+            error = f"{type(e).__name__} ({e})"
+            if self.fail(job, error):
+                error = f"{error} - {_('retrying')}"
+            logger.error(f"{_('Job failed')}: {job.id} - {error}")
+            return False
+        finally:
+            os.chdir(cwd)
+            STATE.from_dict(states)
+        self.complete(job, command.model_dump(mode="json"))
+        logger.info(f"{_('Job done')}: {job.id} ({command_cls.__qualname__})")
+        return True
+
+    def run_worker(self, wait: bool = False, max_jobs: int | None = None) -> int:
+        """
+        Run jobs until the queue is empty.
+
+        :param wait: Wait for new jobs, instead of stopping when the queue is empty. Defaults to False.
+        :param max_jobs: Max jobs run. Defaults to None (unlimited).
+
+        :return: Number of jobs run.
+        """
+        count = 0
+        while max_jobs is None or count < max_jobs:
+            job = self.claim()
+            if job is None:
+                if not wait:
+                    break
+                time.sleep(self.POLL_INTERVAL)
+                continue
+            self.run_job(job)
+            count += 1
+        return count
+
+    def run(self, workers: int = 1, wait: bool = False, progress_callback: Callable[[float], Any] = lambda p: p):
+        """
+        Drain queue with a worker pool (one process per worker).
+
+        :param workers: Number of workers. Defaults to 1 (run jobs in this process).
+        :param wait: Wait for new jobs, instead of stopping when the queue is empty. Defaults to False.
+        :param progress_callback: Progress callback (finished jobs, 0.0 - 100.0). Defaults to no-op.
+        """
+        import multiprocessing
+
+        from multiprocessing.context import ForkContext, SpawnContext
+
+        self.requeue_stale()
+        stats = self.get_stats()
+        finished_start = stats[self.Status.DONE] + stats[self.Status.FAILED]
+
+        def report():
+            stats = self.get_stats()
+            finished = stats[self.Status.DONE] + stats[self.Status.FAILED] - finished_start
+            total = finished + stats[self.Status.PENDING] + stats[self.Status.RUNNING]
+            progress_callback(100.0 * finished / total if total else 100.0)
+
+        if workers <= 1:
+            while True:
+                if self.run_worker(max_jobs=1):
+                    report()
+                    continue
+                if not wait:
+                    break
+                time.sleep(self.POLL_INTERVAL)
+            report()
+            return
+
+        context: ForkContext | SpawnContext = (
+            multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else multiprocessing.get_context("spawn")
+        )
+        processes = [
+            context.Process(target=_run_worker_process, args=(self._db_path, wait), name=f"fc_queue_{idx}")
+            for idx in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            while any(process.is_alive() for process in processes):
+                report()
+                for process in processes:
+                    process.join(timeout=self.POLL_INTERVAL / len(processes))
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            self.requeue_stale()  # jobs of terminated workers
+        report()
+
+
+__all__ = [
+    "JobQueue",
+]
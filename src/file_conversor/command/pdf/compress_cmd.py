@@ -4,7 +4,7 @@
 from pathlib import Path
 from typing import Callable, override
 
-from file_conversor.backend.pdf import GhostscriptBackend, PikePDFBackend
+from file_conversor.backend.pdf import GhostscriptBackend, PikePDFBackend, PyPDFBackend
 
 # user-provided modules
 from file_conversor.command.abstract_cmd import AbstractCommand
@@ -49,10 +49,10 @@ class PdfCompressCommand(AbstractCommand[PdfCompressInFormats, PdfCompressOutFor
 
     @override
     def execute(self):
-        pikepdf_backend = PikePDFBackend(
+        get_pikepdf_backend = PikePDFBackend.lazy(
             verbose=STATE.loglevel.get().is_verbose(),
         )
-        gs_backend = GhostscriptBackend(
+        get_gs_backend = GhostscriptBackend.lazy(
             install_deps=CONFIG.install_deps,
             verbose=STATE.loglevel.get().is_verbose(),
         )
@@ -61,12 +61,16 @@ class PdfCompressCommand(AbstractCommand[PdfCompressInFormats, PdfCompressOutFor
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
-            out_stem="_compressed"
+            out_stem="_compressed",
+            progress_callback=self.progress_callback,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            in_formats=self.get_in_formats(),
+            cost_estimator=PyPDFBackend.len,  # cost ~ number of pages
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ...")
-            gs_backend.compress(
+            get_gs_backend().compress(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 compression_level=self.compression,
@@ -74,7 +78,7 @@ class PdfCompressCommand(AbstractCommand[PdfCompressInFormats, PdfCompressOutFor
             )
 
         def step_two(data: FileDataModel, get_progress: Callable[[float], float]):
-            pikepdf_backend.compress(
+            get_pikepdf_backend().compress(
                 # files
                 input_file=data.input_file,
                 output_file=data.output_file,
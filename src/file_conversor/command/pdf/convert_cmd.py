@@ -59,11 +59,11 @@ class PdfConvertCommand(AbstractCommand[PdfConvertInFormats, PdfConvertOutFormat
             # try to use PyMuPDF for conversion, if the output format is supported by it
             out_format = PyMuPDFBackend.SupportedOutFormats(self.file_format.value)
 
-            backend = PyMuPDFBackend(verbose=STATE.loglevel.get().is_verbose())
+            get_backend = PyMuPDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
             def step_one_mupdf(data: FileDataModel, get_progress: Callable[[float], float]):
                 logger.info(f"[bold]{_('Converting file')}[/] '{data.input_file}' {_('with PyMuPDF backend')}...")
-                backend.convert(
+                get_backend().convert(
                     input_file=data.input_file,
                     output_file=data.output_file,
                     dpi=self.dpi,
@@ -75,11 +75,11 @@ class PdfConvertCommand(AbstractCommand[PdfConvertInFormats, PdfConvertOutFormat
             # try pdf2docx for conversion, if the output format is supported by it
             out_format = PDF2DOCXBackend.SupportedOutFormats(self.file_format.value)
 
-            backend = PDF2DOCXBackend(verbose=STATE.loglevel.get().is_verbose())
+            get_backend = PDF2DOCXBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
             def step_one_pdf2docx(data: FileDataModel, get_progress: Callable[[float], float]):
                 logger.info(f"[bold]{_('Converting file')}[/] '{data.input_file}' {_('with PDF2DOCX backend')}...")
-                backend.convert(
+                get_backend().convert(
                     input_file=data.input_file,
                     output_file=data.output_file,
                     password=self.password,
@@ -92,6 +92,9 @@ class PdfConvertCommand(AbstractCommand[PdfConvertInFormats, PdfConvertOutFormat
             output_dir=self.output_dir,
             out_suffix=out_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
+            memory_estimator=lambda input_file: PyMuPDFBackend.estimate_memory(input_file, dpi=self.dpi),
         )
 
         batch_datamodel.execute(step_one)
@@ -42,18 +42,20 @@ class PdfDecryptCommand(AbstractCommand[PdfDecryptInFormats, PdfDecryptOutFormat
 
     @override
     def execute(self):
-        pypdf_backend = PyPDFBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pypdf_backend = PyPDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_decrypted",
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Decrypting file')} '{data.input_file}' ...")
-            pypdf_backend.decrypt(
+            get_pypdf_backend().decrypt(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 password=self.password,
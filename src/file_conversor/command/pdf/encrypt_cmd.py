@@ -50,18 +50,20 @@ class PdfEncryptCommand(AbstractCommand[PdfEncryptInFormats, PdfEncryptOutFormat
 
     @override
     def execute(self):
-        backend = PyPDFBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_backend = PyPDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_encrypted",
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Encrypting file')} '{data.input_file}' ...")
-            backend.encrypt(
+            get_backend().encrypt(
                 # files
                 input_file=data.input_file,
                 output_file=data.output_file,
@@ -42,18 +42,20 @@ class PdfExtractImgCommand(AbstractCommand[PdfExtractImgInFormats, PdfExtractImg
 
     @override
     def execute(self):
-        pymupdf_backend = PyMuPDFBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pymupdf_backend = PyMuPDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             out_stem="_",
             overwrite_output=STATE.overwrite_output.enabled,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Extracting images from')} '{data.input_file}' ...")
-            pymupdf_backend.extract_images(
+            get_pymupdf_backend().extract_images(
                 # files
                 overwrite_output=data.overwrite_output,
                 input_file=data.input_file,
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, override
 
-from file_conversor.backend.pdf import OcrMyPDFBackend
+from file_conversor.backend.pdf import OcrMyPDFBackend, PyPDFBackend
 
 # user-provided modules
 from file_conversor.command.abstract_cmd import AbstractCommand
@@ -85,6 +85,10 @@ class PdfOcrCommand(AbstractCommand[PdfOcrInFormats, PdfOcrOutFormats]):
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_ocr",
+            jobs=1,  # ocrmypdf already parallelizes pages, and language install must run once,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
+            cost_estimator=PyPDFBackend.len,  # cost ~ number of pages
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
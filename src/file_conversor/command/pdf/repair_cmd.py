@@ -42,18 +42,20 @@ class PdfRepairCommand(AbstractCommand[PdfRepairInFormats, PdfRepairOutFormats])
 
     @override
     def execute(self):
-        pikepdf_backend = PikePDFBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pikepdf_backend = PikePDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_repaired",
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
-            pikepdf_backend.compress(
+            get_pikepdf_backend().compress(
                 # files
                 input_file=data.input_file,
                 output_file=data.output_file,
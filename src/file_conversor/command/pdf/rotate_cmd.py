@@ -53,18 +53,20 @@ class PdfRotateCommand(AbstractCommand[PdfRotateInFormats, PdfRotateOutFormats])
         """
         Rotate PDF pages.
         """
-        backend = PyPDFBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_backend = PyPDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             overwrite_output=STATE.overwrite_output.enabled,
             out_stem="_rotated",
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Processing file')} '{data.input_file}' ...")
-            backend.rotate(
+            get_backend().rotate(
                 input_file=data.input_file,
                 output_file=data.output_file,
                 decrypt_password=self.password,
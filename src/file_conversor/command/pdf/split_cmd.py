@@ -42,18 +42,20 @@ class PdfSplitCommand(AbstractCommand[PdfSplitInFormats, PdfSplitOutFormats]):
 
     @override
     def execute(self):
-        pypdf_backend = PyPDFBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_pypdf_backend = PyPDFBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             out_stem="_",
             overwrite_output=STATE.overwrite_output.enabled,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"Processing '{data.output_file}' ... ")
-            pypdf_backend.split(
+            get_pypdf_backend().split(
                 overwrite_output=data.overwrite_output,
                 input_file=data.input_file,
                 password=self.password,
@@ -7,7 +7,7 @@ from typing import override
 # user-provided modules
 from file_conversor.backend.batch_backend import BatchBackend
 from file_conversor.command.abstract_cmd import AbstractCommand
-from file_conversor.config import LOG, get_translation
+from file_conversor.config import LOG, STATE, get_translation
 
 
 _ = get_translation()
@@ -39,6 +39,8 @@ class PipelineExecuteCommand(AbstractCommand[PipelineExecuteInFormats, PipelineE
 
     @override
     def execute(self):
+        if STATE.plan.enabled:
+            raise RuntimeError(_("Plan mode (--plan) is not supported by pipelines (stage inputs are created by previous stages)"))
         logger.info("Executing pipeline ...")
         batch_backend = BatchBackend(self.pipeline_dir)
         batch_backend.load_config()
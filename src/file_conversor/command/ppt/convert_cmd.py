@@ -43,7 +43,7 @@ class PptConvertCommand(AbstractCommand[PptConvertInFormats, PptConvertOutFormat
 
     @override
     def execute(self):
-        backend = LibreofficeImpressBackend(
+        get_backend = LibreofficeImpressBackend.lazy(
             install_deps=CONFIG.install_deps,
             verbose=STATE.loglevel.get().is_verbose(),
         )
@@ -53,12 +53,15 @@ class PptConvertCommand(AbstractCommand[PptConvertInFormats, PptConvertOutFormat
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"[bold]{_('Converting files')}[/] ...")
             # Perform conversion
-            backend.convert(
+            get_backend().convert(
                 input_path=data.input_file,
                 output_path=data.output_file,
             )
@@ -0,0 +1,141 @@
+# src\file_conversor\command\progress_aggregator.py
+
+import os
+import threading
+import time
+
+from typing import Any, Callable
+
+# user-provided modules
+from file_conversor.config import CONFIG, get_translation
+
+
+_ = get_translation()
+
+
+class ProgressAggregator:
+    """
+    Central progress sink (thread-safe), that coalesces updates to at most ``rate`` updates per second.
+
+    Tracks overall progress and per-worker progress (e.g., files in flight). Process workers report
+    through the batch executor relay, so updates made inside forked workers are ignored here.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[float], Any] | None = None,
+        workers_callback: Callable[[dict[str, float]], Any] | None = None,
+        rate: float | None = None,
+    ) -> None:
+        """
+        Inits progress aggregator.
+
+        :param callback: Overall progress callback (0.0 - 100.0). Defaults to None (no-op).
+        :param workers_callback: Per-worker progress callback (worker name => 0.0 - 100.0). Defaults to None (no-op).
+        :param rate: Max updates per second (0 = unlimited). Defaults to None (use ``progress_rate`` config).
+        """
+        super().__init__()
+        rate = CONFIG.progress_rate if rate is None else rate
+        self._callback: Callable[[float], Any] = callback or (lambda p: p)
+        self._workers_callback: Callable[[dict[str, float]], Any] = workers_callback or (lambda w: w)
+        self._interval = (1.0 / rate) if rate > 0 else 0.0
+        self._pid = os.getpid()
+
+        self._lock = threading.RLock()
+        self._overall = 0.0
+        self._workers: dict[str, float] = {}
+        self._dirty = False
+        self._last_emit = float("-inf")
+        self._timer: threading.Timer | None = None
+
+    def __call__(self, progress: float) -> float:
+        """
+        Set overall progress (drop-in replacement of progress callbacks).
+
+        :param progress: Overall progress (0.0 - 100.0).
+
+        :return: Overall progress.
+        """
+        self.update(progress=progress)
+        return progress
+
+    def _is_forked(self) -> bool:
+        return os.getpid() != self._pid
+
+    def update(self, progress: float | None = None, workers: dict[str, float | None] | None = None):
+        """
+        Update overall and / or per-worker progress. Updates are emitted at most ``rate`` times per second
+        (100% overall progress is always emitted, pending updates are emitted when the interval ends).
+
+        :param progress: Overall progress (0.0 - 100.0). Defaults to None (unchanged).
+        :param workers: Per-worker progress (worker name => 0.0 - 100.0, or None to remove worker). Defaults to None (unchanged).
+        """
+        if self._is_forked():
+            return
+        with self._lock:
+            if progress is not None:
+                self._overall = min(max(progress, 0.0), 100.0)
+            for name, worker_progress in (workers or {}).items():
+                if worker_progress is None:
+                    self._workers.pop(name, None)
+                else:
+                    self._workers[name] = min(max(worker_progress, 0.0), 100.0)
+            self._dirty = True
+
+            remaining = self._last_emit + self._interval - time.monotonic()
+            if remaining <= 0 or self._overall >= 100.0:
+                self._emit()
+            elif self._timer is None:
+                self._timer = threading.Timer(remaining, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def set_worker(self, name: str, progress: float):
+        """
+        Set worker progress.
+
+        :param name: Worker name (e.g., input file name).
+        :param progress: Worker progress (0.0 - 100.0).
+        """
+        self.update(workers={name: progress})
+
+    def remove_worker(self, name: str):
+        """
+        Remove finished worker.
+
+        :param name: Worker name.
+        """
+        self.update(workers={name: None})
+
+    def get_overall(self) -> float:
+        """ Get overall progress (0.0 - 100.0) """
+        with self._lock:
+            return self._overall
+
+    def get_workers(self) -> dict[str, float]:
+        """ Get progress of active workers (worker name => 0.0 - 100.0) """
+        with self._lock:
+            return dict(self._workers)
+
+    def _emit(self):
+        # called with lock held (keeps emitted updates in order)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._dirty = False
+        self._last_emit = time.monotonic()
+        self._callback(self._overall)
+        self._workers_callback(dict(self._workers))
+
+    def flush(self):
+        """ Emit pending updates now. """
+        if self._is_forked():
+            return
+        with self._lock:
+            if self._dirty:
+                self._emit()
+
+
+__all__ = [
+    "ProgressAggregator",
+]
@@ -1,16 +1,20 @@
 # src\file_conversor\command\_progress_manager.py
 
+import threading
+
+from array import array
 
 # user-provided
 from file_conversor.config.locale import get_translation
 
+
 _ = get_translation()
 
 
 class ProgressManager:
     def __init__(self, out_files: int = 1, steps_per_file: int = 1):
         """
-        Inits progress manager
+        Inits progress manager (thread-safe)
 
         :param out_files: Number of output files
         :param steps_per_file: Number of processing steps per file
@@ -27,29 +31,111 @@ class ProgressManager:
         self._completed_files = 0
         self._current_step = 1
 
+        self._lock = threading.Lock()
+        # per-file arrays (compact for large batches)
+        self._files_progress = array("d")  # file_idx => progress (0.0 - 1.0)
+        self._files_weight = array("d")  # file_idx => estimated cost (0.0 = unknown, uses mean cost)
+
+        # running sums, to get overall progress in O(1)
+        self._weighted_progress = 0.0  # sum of weight * progress (weighted files)
+        self._weight_total = 0.0  # sum of weights
+        self._weighted_files = 0
+        self._unweighted_progress = 0.0  # sum of progress (unweighted files)
+
+    @property
+    def out_files(self) -> int:
+        return self._total_out_files
+
+    def _ensure_size(self, file_idx: int):
+        missing = file_idx + 1 - len(self._files_progress)
+        if missing > 0:
+            self._files_progress.extend([0.0] * missing)
+            self._files_weight.extend([0.0] * missing)
+
+    def _add_file(self, file_idx: int, sign: float):
+        """ Add (sign = 1) or remove (sign = -1) file from running sums. """
+        progress, weight = self._files_progress[file_idx], self._files_weight[file_idx]
+        if weight > 0:
+            self._weighted_progress += sign * weight * progress
+            self._weight_total += sign * weight
+            self._weighted_files += int(sign)
+        else:
+            self._unweighted_progress += sign * progress
+
+    def _get_overall_progress(self) -> float:
+        mean_weight = (self._weight_total / self._weighted_files) if self._weighted_files else 1.0
+        unweighted_files = self._total_out_files - self._weighted_files
+        total = self._weight_total + mean_weight * unweighted_files
+        return min(100.0 * (self._weighted_progress + mean_weight * self._unweighted_progress) / total, 100.0)
+
+    def set_out_files(self, out_files: int):
+        """
+        Update number of output files (e.g., while input folders are still being scanned). Safe to call from multiple threads.
+
+        :param out_files: Number of output files (>= 1).
+        """
+        if out_files < 1:
+            raise ValueError("total_out_files must be >= 1")
+        with self._lock:
+            for file_idx in range(out_files, len(self._files_progress)):
+                self._add_file(file_idx, -1.0)
+            del self._files_progress[out_files:]
+            del self._files_weight[out_files:]
+            self._total_out_files = out_files
+
+    def set_weight(self, file_idx: int, weight: float):
+        """
+        Set file weight (estimated cost), so overall progress is weighted by expected work. Safe to call from multiple threads.
+
+        :param file_idx: File index (0-based)
+        :param weight: Estimated cost (e.g., file size, duration, pages). If <= 0, use mean cost of weighted files.
+        """
+        if not (0 <= file_idx < self._total_out_files):
+            raise RuntimeError(f"ProgressManager - File index '{file_idx}' out of range (total out files '{self._total_out_files}')")
+        with self._lock:
+            self._ensure_size(file_idx)
+            self._add_file(file_idx, -1.0)
+            self._files_weight[file_idx] = max(weight, 0.0)
+            self._add_file(file_idx, 1.0)
+
     def _next_step(self):
         self._current_step += 1
         if self._current_step > self._total_steps_per_file:
             self._current_step = 1
             self._completed_files += 1
 
+    def set_progress(self, file_idx: int, step_idx: int, progress: float) -> float:
+        """
+        Set progress of a file step, and get overall progress (0.0 - 100.0). Safe to call from multiple threads.
+
+        :param file_idx: File index (0-based)
+        :param step_idx: Step index (0-based)
+        :param progress: Step progress (0.0 - 100.0)
+        """
+        if not (0 <= file_idx < self._total_out_files):
+            raise RuntimeError(f"ProgressManager - File index '{file_idx}' out of range (total out files '{self._total_out_files}')")
+
+        progress = min(max(progress, 0.0), 100.0)
+        file_progress = (step_idx + progress / 100.0) / self._total_steps_per_file
+        with self._lock:
+            self._ensure_size(file_idx)
+            self._add_file(file_idx, -1.0)
+            self._files_progress[file_idx] = file_progress
+            self._add_file(file_idx, 1.0)
+            return self._get_overall_progress()
+
+    def get_overall_progress(self) -> float:
+        """ Get overall progress (0.0 - 100.0) """
+        with self._lock:
+            return self._get_overall_progress()
+
     def get_progress(self, progress: float) -> float:
         """ Get overall progress (0.0 - 100.0) given current step """
         if self._completed_files > self._total_out_files:
             raise RuntimeError(f"ProgressManager - Completed '{self._completed_files}' files > '{self._total_out_files}' total out files")
-
-        file_progress = 100.0 / self._total_out_files
-        step_progress = file_progress / self._total_steps_per_file
-
-        # previous completed files
-        total_progress = self._completed_files * file_progress
-
-        # previous completed steps (of current file)
-        total_progress += (self._current_step - 1) * step_progress
-
-        # current step (of current file)
-        total_progress += (progress / 100.0) * step_progress
-        return total_progress
+        if self._completed_files == self._total_out_files:
+            return 100.0
+        return self.set_progress(self._completed_files, self._current_step - 1, progress)
 
     def next_step(self) -> float:
         """ Move to next step and return updated progress """
@@ -0,0 +1,5 @@
+# src\file_conversor\command\queue\__init__.py
+
+from file_conversor.command.queue.run_cmd import *
+from file_conversor.command.queue.status_cmd import *
+from file_conversor.command.queue.submit_cmd import *
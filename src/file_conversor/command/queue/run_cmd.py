@@ -0,0 +1,60 @@
+# src\file_conversor\command\queue\run_cmd.py
+
+from enum import StrEnum
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.job_queue import JobQueue
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+QueueRunExternalDependencies: set[str] = set()  # no external dependencies (checked by each job command)
+
+
+class QueueRunInFormats(StrEnum):
+    pass  # no input formats, as this command only runs queued jobs
+
+
+class QueueRunOutFormats(StrEnum):
+    pass  # no output formats, as this command only runs queued jobs
+
+
+class QueueRunCommand(AbstractCommand[QueueRunInFormats, QueueRunOutFormats]):
+    workers: int = 1
+    """Number of worker processes"""
+    wait: bool = False
+    """Wait for new jobs, instead of stopping when the queue is empty"""
+
+    stats: dict[str, Any] = {}
+    """Queue statistics, after run"""
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return QueueRunExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return QueueRunInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return QueueRunOutFormats
+
+    @override
+    def execute(self):
+        job_queue = JobQueue()
+        job_queue.run(workers=self.workers, wait=self.wait, progress_callback=self.progress_callback)
+        self.stats = job_queue.get_stats()
+
+
+__all__ = [
+    "QueueRunCommand",
+]
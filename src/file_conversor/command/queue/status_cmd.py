@@ -0,0 +1,63 @@
+# src\file_conversor\command\queue\status_cmd.py
+
+from enum import StrEnum
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.job_queue import JobQueue
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+QueueStatusExternalDependencies: set[str] = set()  # no external dependencies, as this command only reads the queue
+
+
+class QueueStatusInFormats(StrEnum):
+    pass  # no input formats, as this command only reads the queue
+
+
+class QueueStatusOutFormats(StrEnum):
+    pass  # no output formats, as this command only reads the queue
+
+
+class QueueStatusCommand(AbstractCommand[QueueStatusInFormats, QueueStatusOutFormats]):
+    status: JobQueue.Status | None = None
+    """List only jobs with this status (defaults to all jobs)"""
+    limit: int = 10
+    """Max jobs listed"""
+
+    stats: dict[str, Any] = {}
+    """Jobs per status, mean job duration (seconds) and throughput (jobs / second)"""
+    jobs: list[dict[str, Any]] = []
+    """Latest jobs"""
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return QueueStatusExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return QueueStatusInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return QueueStatusOutFormats
+
+    @override
+    def execute(self):
+        job_queue = JobQueue()
+        self.stats = job_queue.get_stats()
+        self.jobs = [job.to_dict() for job in job_queue.list_jobs(self.status, limit=self.limit)]
+        logger.debug(f"{_('Queue status')}: {self.stats}")
+
+
+__all__ = [
+    "QueueStatusCommand",
+]
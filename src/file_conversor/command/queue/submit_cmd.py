@@ -0,0 +1,74 @@
+# src\file_conversor\command\queue\submit_cmd.py
+
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.job_queue import JobQueue
+from file_conversor.config import LOG, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+QueueSubmitExternalDependencies: set[str] = set()  # no external dependencies, as this command only stores the job
+
+
+class QueueSubmitInFormats(StrEnum):
+    pass  # no input formats, as this command only stores the job
+
+
+class QueueSubmitOutFormats(StrEnum):
+    pass  # no output formats, as this command only stores the job
+
+
+class QueueSubmitCommand(AbstractCommand[QueueSubmitInFormats, QueueSubmitOutFormats]):
+    command: str
+    """Command name (``module:QualName``)"""
+    options: dict[str, Any]
+    """Command model (``model_dump()``)"""
+    state: dict[str, Any] | None = None
+    """CLI states (defaults to current states)"""
+    cwd: Path | None = None
+    """Working directory (defaults to current working directory)"""
+    priority: int = 0
+    retries: int = 0
+
+    job_id: int = 0
+    """Submitted job id"""
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return QueueSubmitExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return QueueSubmitInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return QueueSubmitOutFormats
+
+    @override
+    def execute(self):
+        command_cls = DaemonClient.get_command_class(self.command)
+        self.job_id = JobQueue().submit(
+            command_cls.model_validate(self.options),
+            priority=self.priority,
+            retries=self.retries,
+            state=self.state,
+            cwd=self.cwd,
+        )
+        self.progress_callback(100.0)
+
+
+__all__ = [
+    "QueueSubmitCommand",
+]
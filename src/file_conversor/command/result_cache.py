@@ -0,0 +1,246 @@
+# src\file_conversor\command\result_cache.py
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from pathlib import Path
+from typing import Any
+
+# user-provided modules
+from file_conversor.config import LOG, Environment, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    Content-addressed conversion result cache (LRU eviction, by last access time).
+
+    Entries are keyed by input file content, command fingerprint and output format.
+    The cache size is tracked incrementally (the cache folder is only scanned when it grows past ``max_size``).
+    """
+    _STATS_FILE = ".stats.json"
+    _TMP_SUFFIX = ".tmp"
+    _FICLONE = 0x40049409  # linux ioctl (reflink / copy-on-write clone)
+    _LOW_WATER_MARK = 0.9
+    """ eviction frees space down to 90% of max size (stores do not rescan the cache folder every time) """
+
+    __lock = threading.Lock()
+    __hits: int = 0
+    __misses: int = 0
+    __size: int | None = None
+    """ cache size estimate (entries stored by other processes are counted on next scan) """
+
+    @classmethod
+    def get_folder(cls) -> Path:
+        """Get result cache folder."""
+        cache_path = Environment.UserFolder.cache() / Environment.get_app_name() / "results"
+        cache_path.mkdir(parents=True, exist_ok=True)
+        return cache_path
+
+    @classmethod
+    def get_key(cls, input_file: Path, fingerprint: str, out_suffix: str) -> str:
+        """
+        Get cache key for a conversion.
+
+        :param input_file: Input file (its content is hashed).
+        :param fingerprint: Command fingerprint (see ``AbstractCommand.get_cache_fingerprint()``).
+        :param out_suffix: Output file suffix.
+        """
+        with open(input_file, "rb") as f:
+            content_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        return hashlib.sha256(f"{content_hash}|{fingerprint}|{out_suffix.lower()}".encode()).hexdigest()
+
+    @classmethod
+    def _get_entry(cls, key: str) -> Path:
+        return cls.get_folder() / key[:2] / key
+
+    @classmethod
+    def _clone(cls, src: Path, dst: Path):
+        """Copy file, using a reflink (copy-on-write) when supported by the filesystem."""
+        try:
+            import fcntl
+            with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+                fcntl.ioctl(f_dst.fileno(), cls._FICLONE, f_src.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+        shutil.copyfile(src, dst)
+
+    @classmethod
+    def restore(cls, key: str, output_file: Path) -> bool:
+        """
+        Restore cached result to output file.
+
+        :param key: Cache key.
+        :param output_file: Output file (overwritten if it exists).
+
+        :return: True if cache hit, False otherwise.
+        """
+        entry = cls._get_entry(key)
+        try:
+            os.utime(entry)  # mark as recently used
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            cls._clone(entry, output_file)
+        except FileNotFoundError:
+            cls._count(hit=False)
+            return False
+        logger.info(f"{_('Cache hit')}: '{output_file}'")
+        cls._count(hit=True)
+        return True
+
+    @classmethod
+    def store(cls, key: str, output_file: Path, max_size: int):
+        """
+        Store conversion result in cache.
+
+        :param key: Cache key.
+        :param output_file: Output file to store.
+        :param max_size: Max cache size in bytes (least recently used entries are evicted).
+        """
+        if not output_file.is_file():
+            return
+        entry = cls._get_entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_entry = entry.with_name(f"{entry.name}.{os.getpid()}_{threading.get_ident()}{cls._TMP_SUFFIX}")
+        try:
+            replaced_size = entry.stat().st_size
+        except FileNotFoundError:
+            replaced_size = 0
+        try:
+            cls._clone(output_file, tmp_entry)
+            os.replace(tmp_entry, entry)  # atomic, readers never see partial entries
+        finally:
+            tmp_entry.unlink(missing_ok=True)
+
+        with cls.__lock:
+            if cls.__size is None:
+                cls.__size = cls.__get_size()  # entry already stored, first store of this process
+            else:
+                cls.__size += entry.stat().st_size - replaced_size
+            evict = cls.__size > max_size
+        if evict:
+            cls.evict(max_size)
+
+    @classmethod
+    def __scan(cls) -> list[tuple[float, int, Path]]:
+        """Get cache entries (mtime, size, path). Temp files of in-flight stores are ignored."""
+        entries: list[tuple[float, int, Path]] = []
+        for path in cls.get_folder().glob("*/*"):
+            if path.suffix == cls._TMP_SUFFIX:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @classmethod
+    def __get_size(cls) -> int:
+        return sum(size for _mtime, size, _path in cls.__scan())
+
+    @classmethod
+    def evict(cls, max_size: int):
+        """
+        Evict least recently used entries, until cache size <= 90% of max_size.
+
+        :param max_size: Max cache size in bytes.
+        """
+        with cls.__lock:
+            entries = cls.__scan()
+            total_size = sum(size for _mtime, size, _path in entries)
+            if total_size > max_size:
+                for _mtime, size, path in sorted(entries):
+                    if total_size <= max_size * cls._LOW_WATER_MARK:
+                        break
+                    logger.debug(f"Evicting cache entry '{path.name}' ...")
+                    path.unlink(missing_ok=True)
+                    total_size -= size
+            cls.__size = total_size
+
+    @classmethod
+    def clear(cls):
+        """Remove all cache entries and reset counters."""
+        with cls.__lock:
+            Environment.remove(cls.get_folder(), remove_src=False)
+            cls.__hits, cls.__misses = 0, 0
+            cls.__size = 0
+
+    @classmethod
+    def _count(cls, hit: bool):
+        with cls.__lock:
+            if hit:
+                cls.__hits += 1
+            else:
+                cls.__misses += 1
+
+    @classmethod
+    def pop_counts(cls) -> tuple[int, int]:
+        """Get and reset hit / miss counters of this process (e.g., to relay them from a process worker to the parent process)."""
+        with cls.__lock:
+            counts = cls.__hits, cls.__misses
+            cls.__hits, cls.__misses = 0, 0
+        return counts
+
+    @classmethod
+    def add_counts(cls, hits: int, misses: int):
+        """
+        Add hit / miss counters (e.g., relayed from a process worker). Saved to disk by ``flush()``.
+
+        :param hits: Cache hits.
+        :param misses: Cache misses.
+        """
+        with cls.__lock:
+            cls.__hits += hits
+            cls.__misses += misses
+
+    @classmethod
+    def flush(cls):
+        """Save hit / miss counters of this process to disk."""
+        with cls.__lock:
+            if not (cls.__hits or cls.__misses):
+                return
+            stats = cls.__load_stats()
+            stats["hits"] += cls.__hits
+            stats["misses"] += cls.__misses
+            cls.__hits, cls.__misses = 0, 0
+            (cls.get_folder() / cls._STATS_FILE).write_text(json.dumps(stats))
+
+    @classmethod
+    def __load_stats(cls) -> dict[str, int]:
+        stats_file = cls.get_folder() / cls._STATS_FILE
+        stats: dict[str, Any]
+        try:
+            stats = json.loads(stats_file.read_text())
+        except (FileNotFoundError, ValueError):
+            stats = {}
+        return {
+            "hits": int(stats.get("hits", 0)),
+            "misses": int(stats.get("misses", 0)),
+        }
+
+    @classmethod
+    def get_stats(cls) -> dict[str, Any]:
+        """Get cache statistics (folder, entries, size, hits, misses)."""
+        cls.flush()
+        with cls.__lock:
+            entries = cls.__scan()
+            stats = cls.__load_stats()
+        return {
+            "folder": str(cls.get_folder()),
+            "entries": len(entries),
+            "size": sum(size for _mtime, size, _path in entries),
+            **stats,
+        }
+
+
+__all__ = [
+    "ResultCache",
+]
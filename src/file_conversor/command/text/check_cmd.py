@@ -41,18 +41,21 @@ class TextCheckCommand(AbstractCommand[TextCheckInFormats, TextCheckOutFormats])
 
     @override
     def execute(self):
-        text_backend = TextBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_text_backend = TextBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=Path(),
             out_stem="_",
             overwrite_output=STATE.overwrite_output.enabled,
+            journal=False,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Checking file')} '{data.input_file}' ...")
-            text_backend.check(
+            get_text_backend().check(
                 input_file=data.input_file,
             )
             self.progress_callback(get_progress(100.0))
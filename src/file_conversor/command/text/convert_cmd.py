@@ -43,17 +43,19 @@ class TextConvertCommand(AbstractCommand[TextConvertInFormats, TextConvertOutFor
 
     @override
     def execute(self):
-        text_backend = TextBackend(verbose=STATE.loglevel.get().is_verbose())
+        get_text_backend = TextBackend.lazy(verbose=STATE.loglevel.get().is_verbose())
 
         batch_datamodel = BatchFilesDataModel(
             input_files=self.input_files,
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
-            text_backend.convert(
+            get_text_backend().convert(
                 input_file=data.input_file,
                 output_file=data.output_file,
             )
@@ -0,0 +1,145 @@
+# src\file_conversor\command\throughput_history.py
+
+import json
+import os
+import threading
+
+from pathlib import Path
+from typing import Any, cast
+
+# user-provided modules
+from file_conversor.config import LOG, Environment, get_translation
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class ThroughputHistory:
+    """
+    Throughput history of previous runs (per conversion), used to estimate durations and output sizes (see ``--plan``).
+
+    Conversions are keyed by input suffix, output suffix and output stem (e.g., ``.png>.png:_resized``).
+    Costs use the unit of the command cost estimator (e.g., media duration, PDF pages, file size).
+    """
+    _HISTORY_FILE = ".throughput_history.json"
+    MAX_SAMPLES = 1000
+    """ max samples per conversion (older samples decay, so estimates follow recent runs) """
+
+    __lock = threading.Lock()
+    __pending: dict[str, dict[str, float]] = {}
+
+    @classmethod
+    def get_file(cls) -> Path:
+        """Get throughput history file."""
+        return Environment.get_data_folder() / cls._HISTORY_FILE
+
+    @classmethod
+    def get_key(cls, input_file: Path, output_file: Path, out_stem: str = "") -> str:
+        """
+        Get conversion key.
+
+        :param input_file: Input file.
+        :param output_file: Output file.
+        :param out_stem: Output stem (e.g., ``_resized``).
+        """
+        return f"{input_file.suffix.lower()}>{output_file.suffix.lower()}:{out_stem}"
+
+    @classmethod
+    def record(cls, key: str, cost: float, duration: float, in_size: int, out_size: int):
+        """
+        Record a processed file (saved to disk by ``flush()``).
+
+        :param key: Conversion key (see ``get_key()``).
+        :param cost: Estimated cost of the input file.
+        :param duration: Processing time (seconds).
+        :param in_size: Input file size (bytes).
+        :param out_size: Output file size (bytes).
+        """
+        cls.add_samples({key: {"count": 1.0, "cost": cost, "duration": duration, "in_size": float(in_size), "out_size": float(out_size)}})
+
+    @classmethod
+    def pop_samples(cls) -> dict[str, dict[str, float]]:
+        """Get and reset samples of this process not saved yet (e.g., to relay them from a process worker to the parent process)."""
+        with cls.__lock:
+            samples, cls.__pending = cls.__pending, {}
+        return samples
+
+    @classmethod
+    def add_samples(cls, samples: dict[str, dict[str, float]]):
+        """
+        Add accumulated samples (e.g., relayed from a process worker). Saved to disk by ``flush()``.
+
+        :param samples: Samples per conversion key (see ``pop_samples()``).
+        """
+        with cls.__lock:
+            for key, sample in samples.items():
+                pending = cls.__pending.setdefault(key, dict.fromkeys(sample, 0.0))
+                for name, value in sample.items():
+                    pending[name] = pending.get(name, 0.0) + value
+
+    @classmethod
+    def __load(cls) -> dict[str, dict[str, float]]:
+        try:
+            history: Any = json.loads(cls.get_file().read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        return cast("dict[str, dict[str, float]]", history) if isinstance(history, dict) else {}
+
+    @classmethod
+    def flush(cls):
+        """Merge samples of this process into the history file."""
+        with cls.__lock:
+            if not cls.__pending:
+                return
+            history = cls.__load()
+            for key, sample in cls.__pending.items():
+                entry = history.setdefault(key, dict.fromkeys(sample, 0.0))
+                for name, value in sample.items():
+                    entry[name] = entry.get(name, 0.0) + value
+                if entry["count"] > cls.MAX_SAMPLES:
+                    scale = cls.MAX_SAMPLES / entry["count"]
+                    history[key] = {name: value * scale for name, value in entry.items()}
+            cls.__pending.clear()
+
+            history_file = cls.get_file()
+            tmp_file = history_file.with_name(f"{history_file.name}.{os.getpid()}.tmp")
+            try:
+                tmp_file.write_text(json.dumps(history))
+                os.replace(tmp_file, history_file)  # atomic, readers never see partial files
+            except OSError as e:
+                logger.debug(f"Cannot save throughput history: {repr(e)}")
+            finally:
+                tmp_file.unlink(missing_ok=True)
+
+    @classmethod
+    def get_stats(cls, key: str) -> dict[str, float] | None:
+        """Get accumulated samples of a conversion (count, cost, duration, in_size, out_size), or None if never run."""
+        cls.flush()
+        with cls.__lock:
+            entry = cls.__load().get(key)
+        return entry if entry and entry.get("count", 0) > 0 else None
+
+    @classmethod
+    def estimate(cls, key: str, cost: float, in_size: int, stats: dict[str, Any] | None = None) -> tuple[float | None, int | None]:
+        """
+        Estimate processing time and output size of a file.
+
+        :param key: Conversion key (see ``get_key()``).
+        :param cost: Estimated cost of the input file.
+        :param in_size: Input file size (bytes).
+        :param stats: Conversion samples (see ``get_stats()``). Defaults to None (read history file).
+
+        :return: (duration in seconds, output size in bytes). None if conversion never ran.
+        """
+        stats = stats if stats is not None else cls.get_stats(key)
+        if not stats:
+            return None, None
+        duration = (stats["duration"] / stats["cost"] * cost) if stats["cost"] > 0 else (stats["duration"] / stats["count"])
+        out_size = (stats["out_size"] / stats["in_size"] * in_size) if stats["in_size"] > 0 else (stats["out_size"] / stats["count"])
+        return duration, int(out_size)
+
+
+__all__ = [
+    "ThroughputHistory",
+]
@@ -85,13 +85,8 @@ class FFmpegCmdHelper:
     ) -> None:
         super().__init__()
 
-        # init ffmpeg and ffprobe backends
-        self._ffmpeg_backend = FFmpegBackend(
-            install_deps=install_deps,
-            verbose=verbose,
-            overwrite_output=datamodel.overwrite_output,
-        )
-        self._ffprobe_backend = FFprobeBackend(
+        # init ffprobe backend on first use (ffmpeg backend is created per file, as files may be processed in parallel)
+        self._get_ffprobe_backend = FFprobeBackend.lazy(
             install_deps=install_deps,
             verbose=verbose,
         )
@@ -118,11 +113,25 @@ class FFmpegCmdHelper:
         self._video_filters: list[FFmpegFilter] = []
         self._ffmpeg_args: list[str] = []
 
-    def _set_video_bitrate_for_target_size(self, input_file: Path):
+    def _get_ffmpeg_backend(self, overwrite_output: bool) -> FFmpegBackend:
+        return FFmpegBackend(
+            install_deps=self._install_deps,
+            verbose=self._verbose,
+            overwrite_output=overwrite_output,
+        )
+
+    def _get_bitrates_for_target_size(self, input_file: Path) -> tuple[int, int]:
+        """
+        Get audio and video bitrates (kbps) for input file, considering target size (if any).
+
+        :param input_file: Input file.
+
+        :return: (audio_bitrate, video_bitrate)
+        """
         if self._target_size_bytes <= 0:
-            return
+            return self._audio_bitrate, self._video_bitrate
 
-        duration = self._ffprobe_backend.get_duration(input_file)
+        duration = self._get_ffprobe_backend().get_duration(input_file)
         if duration < 0:
             raise RuntimeError(_('Could not determine input file duration'))
 
@@ -131,15 +140,16 @@ class FFmpegCmdHelper:
         target_size_kbps = int(target_size_kbit / duration)
 
         # audio size
-        self._audio_bitrate = 128 if self._audio_bitrate <= 0 else self._audio_bitrate
-        self._video_bitrate = target_size_kbps - self._audio_bitrate
+        audio_bitrate = 128 if self._audio_bitrate <= 0 else self._audio_bitrate
+        video_bitrate = target_size_kbps - audio_bitrate
 
-        audio_bytes_per_sec = self._audio_bitrate / 8.0
+        audio_bytes_per_sec = audio_bitrate / 8.0
         audio_megabytes = audio_bytes_per_sec * duration / 1024.0
 
-        if self._video_bitrate < 1:
+        if video_bitrate < 1:
             target_size = format_bytes(self._target_size_bytes)
             raise RuntimeError(f"{_('Target size too small')}: {target_size}. {_(f'Increase target size to at least')} '{audio_megabytes + 0.100:.2f}M' {_('(might not be enougth to achieve good video quality)')}.")
+        return audio_bitrate, video_bitrate
 
     def set_codecs(
             self,
@@ -287,24 +297,25 @@ class FFmpegCmdHelper:
         self._ffmpeg_args = shlex.split(arg)
         return self
 
-    def _step_one(self, data: FileDataModel, get_progress: Callable[[float], float]):  # noqa: ARG002
+    def _step_one(self, data: FileDataModel, get_progress: Callable[[float], float]):
         logger.debug(f"Input file: {data.input_file}")
 
-        self._set_video_bitrate_for_target_size(data.input_file)
+        audio_bitrate, video_bitrate = self._get_bitrates_for_target_size(data.input_file)
         logger.debug(f"{_('Two-pass encoding:')} [bold]{'[blue]ENABLED' if self._two_pass else '[red]DISABLED'}[/]")
-        logger.debug(f"{_('Audio bitrate')}: [bold green]{self._audio_bitrate} kbps[/]")
-        logger.debug(f"{_('Video bitrate')}: [bold green]{self._video_bitrate} kbps[/]")
+        logger.debug(f"{_('Audio bitrate')}: [bold green]{audio_bitrate} kbps[/]")
+        logger.debug(f"{_('Video bitrate')}: [bold green]{video_bitrate} kbps[/]")
 
-        self._ffmpeg_backend.set_files(input_file=data.input_file, output_file=data.output_file)
-        self._ffmpeg_backend.set_audio_codec(
+        ffmpeg_backend = self._get_ffmpeg_backend(overwrite_output=data.overwrite_output)
+        ffmpeg_backend.set_files(input_file=data.input_file, output_file=data.output_file)
+        ffmpeg_backend.set_audio_codec(
             *self._audio_filters,
             codec=self._audio_codec,
-            bitrate=self._audio_bitrate,
+            bitrate=audio_bitrate,
         )
-        self._ffmpeg_backend.set_video_codec(
+        ffmpeg_backend.set_video_codec(
             *self._video_filters,
             codec=self._video_codec,
-            bitrate=self._video_bitrate,
+            bitrate=video_bitrate,
             profile_setting=self._video_profile,
             encoding_speed=self._video_encoding_speed,
             quality_setting=self._video_quality,
@@ -315,9 +326,9 @@ class FFmpegCmdHelper:
         step_progress: float = 0.50 if self._two_pass else 1.0
 
         def progress_callback(p: float):
-            return self._progress_callback(step_progress * (steps_completed * 100.0 + p))
+            return self._progress_callback(get_progress(step_progress * (steps_completed * 100.0 + p)))
 
-        self._ffmpeg_backend.execute(
+        ffmpeg_backend.execute(
             progress_callback=progress_callback,
             pass_num=1 if self._two_pass else 0,
             out_opts=self._ffmpeg_args,
@@ -325,7 +336,7 @@ class FFmpegCmdHelper:
 
         if self._two_pass:
             steps_completed += 1
-            self._ffmpeg_backend.execute(
+            ffmpeg_backend.execute(
                 progress_callback=progress_callback,
                 pass_num=2,
                 out_opts=self._ffmpeg_args,
@@ -334,6 +345,8 @@ class FFmpegCmdHelper:
         progress_callback(100.0)
 
     def execute(self) -> Self:
+        self._datamodel.progress_callback = self._progress_callback  # relay progress from process workers
+        self._datamodel.cost_estimator = lambda input_file: self._get_ffprobe_backend().get_duration(input_file)
         self._datamodel.execute(self._step_one)
         logger.info(f"{_('FFMpeg result')}: [green][bold]{_('SUCCESS')}[/bold][/green]")
         return self
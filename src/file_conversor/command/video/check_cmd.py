@@ -42,7 +42,7 @@ class VideoCheckCommand(AbstractCommand[VideoCheckInFormats, VideoCheckOutFormat
     @override
     def execute(self):
 
-        backend = FFprobeBackend(
+        get_backend = FFprobeBackend.lazy(
             install_deps=CONFIG.install_deps,
             verbose=STATE.loglevel.get().is_verbose(),
         )
@@ -52,13 +52,16 @@ class VideoCheckCommand(AbstractCommand[VideoCheckInFormats, VideoCheckOutFormat
             output_dir=Path(),
             out_stem="_",
             overwrite_output=STATE.overwrite_output.enabled,
+            journal=False,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Checking file')} '{data.input_file}' ...")
             # display current progress
             try:
-                backend.info(data.input_file)
+                get_backend().info(data.input_file)
             except Exception as e:
                 logger.error(f"{_('Error checking file')} '{data.input_file}': {e}")
             self.progress_callback(get_progress(100.0))
@@ -57,6 +57,8 @@ class VideoCompressCommand(AbstractCommand[VideoCompressInFormats, VideoCompress
             out_stem="_compressed",
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            in_formats=self.get_in_formats(),
         )
 
         ffmpeg_cmd_helper = FFmpegCmdHelper(
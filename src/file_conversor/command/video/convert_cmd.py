@@ -75,6 +75,8 @@ class VideoConvertCommand(AbstractCommand[VideoConvertInFormats, VideoConvertOut
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            cache_fingerprint=self.get_cache_fingerprint(),
+            in_formats=self.get_in_formats(),
         )
 
         ffmpeg_cmd_helper = FFmpegCmdHelper(
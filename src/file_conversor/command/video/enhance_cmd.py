@@ -71,6 +71,7 @@ class VideoEnhanceCommand(AbstractCommand[VideoEnhanceInFormats, VideoEnhanceOut
             out_suffix=self.file_format.value,
             out_stem="_enhanced",
             overwrite_output=STATE.overwrite_output.enabled,
+            in_formats=self.get_in_formats(),
         )
 
         ffmpeg_cmd_helper = FFmpegCmdHelper(
@@ -64,6 +64,7 @@ class VideoExecuteCommand(AbstractCommand[VideoExecuteInFormats, VideoExecuteOut
             output_dir=self.output_dir,
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            in_formats=self.get_in_formats(),
         )
 
         ffmpeg_cmd_helper = FFmpegCmdHelper(
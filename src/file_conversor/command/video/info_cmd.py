@@ -182,7 +182,7 @@ class VideoInfoCommand(AbstractCommand[VideoInfoInFormats, VideoInfoOutFormats])
 
     @override
     def execute(self):
-        backend = FFprobeBackend(
+        get_backend = FFprobeBackend.lazy(
             install_deps=CONFIG.install_deps,
             verbose=STATE.loglevel.get().is_verbose(),
         )
@@ -192,13 +192,17 @@ class VideoInfoCommand(AbstractCommand[VideoInfoInFormats, VideoInfoOutFormats])
             output_dir=Path(),
             out_stem="_",
             overwrite_output=STATE.overwrite_output.enabled,
+            jobs=1,  # output is collected in order, in this process
+            journal=False,
+            progress_callback=self.progress_callback,
+            in_formats=self.get_in_formats(),
         )
 
         def step_one(data: FileDataModel, get_progress: Callable[[float], float]):
             logger.info(f"{_('Getting info for file')} '{data.input_file}' ...")
             # display current progress
             try:
-                metadata = backend.info(data.input_file)
+                metadata = get_backend().info(data.input_file)
                 self.output.append(
                     VideoInfoDataModel(
                         filename=data.input_file,
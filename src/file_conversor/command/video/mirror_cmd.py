@@ -61,6 +61,7 @@ class VideoMirrorCommand(AbstractCommand[VideoMirrorInFormats, VideoMirrorOutFor
             out_stem="_mirrored",
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            in_formats=self.get_in_formats(),
         )
 
         ffmpeg_cmd_helper = FFmpegCmdHelper(
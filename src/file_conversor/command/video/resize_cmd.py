@@ -59,6 +59,7 @@ class VideoResizeCommand(AbstractCommand[VideoResizeInFormats, VideoResizeOutFor
             out_stem="_resized",
             out_suffix=self.file_format.value,
             overwrite_output=STATE.overwrite_output.enabled,
+            in_formats=self.get_in_formats(),
         )
 
         ffmpeg_cmd_helper = FFmpegCmdHelper(
@@ -0,0 +1,4 @@
+# src\file_conversor\command\watch\__init__.py
+
+from file_conversor.command.watch.pipeline_cmd import *
+from file_conversor.command.watch.run_cmd import *
@@ -0,0 +1,97 @@
+# src\file_conversor\command\watch\_watch_dispatcher.py
+
+import queue
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+
+# user-provided modules
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.folder_watcher import FolderWatcher
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class WatchDispatcher:
+    """
+    Dispatch files reported by folder watchers (one thread per watched folder) to a handler, one file at a time.
+
+    Handler errors are logged and counted (a failing file does not stop the watch).
+    """
+
+    def __init__(
+        self,
+        watchers: list[FolderWatcher],
+        max_files: int | None = None,
+        idle_timeout: float | None = None,
+        progress_callback: Callable[[float], Any] = lambda p: p,
+    ) -> None:
+        """
+        Inits watch dispatcher.
+
+        :param watchers: Folder watchers.
+        :param max_files: Stop after N files. Defaults to None (unlimited).
+        :param idle_timeout: Stop after N seconds without new files. Defaults to None (watch until interrupted).
+        :param progress_callback: Progress callback (only reported if ``max_files`` is set).
+        """
+        super().__init__()
+        self._watchers = watchers
+        self._max_files = max_files
+        self._idle_timeout = idle_timeout
+        self._progress_callback = progress_callback
+        self.processed = 0
+        self.failed = 0
+
+    def run(self, handler: Callable[[Path], Any]):
+        """
+        Watch folders, and run handler for each complete file (blocks until stopped).
+
+        :param handler: File handler.
+
+        :raises Exception: if a watcher fails (e.g., watched folder was removed).
+        """
+        stop_event = threading.Event()
+        files: queue.Queue[Path | BaseException] = queue.Queue()
+
+        def _watch(watcher: FolderWatcher):
+            try:
+                for path in watcher.watch(stop_event):
+                    files.put(path)
+            except BaseException as e:  # noqa: BLE001
+                files.put(e)
+
+        threads = [threading.Thread(target=_watch, args=(watcher,), name="fc_watch", daemon=True) for watcher in self._watchers]
+        for thread in threads:
+            thread.start()
+
+        last_file = time.monotonic()
+        try:
+            while self._max_files is None or self.processed + self.failed < self._max_files:
+                timeout = None if self._idle_timeout is None else max(self._idle_timeout - (time.monotonic() - last_file), 0.0)
+                try:
+                    path = files.get(timeout=timeout)
+                except queue.Empty:
+                    logger.info(f"{_('No new files for')} {self._idle_timeout}s, {_('stopping')} ...")
+                    break
+                if isinstance(path, BaseException):
+                    raise path
+
+                logger.info(f"{_('New file')}: '{path}'")
+                try:
+                    handler(path)
+                    self.processed += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.error(f"{_('Processing file')} '{path}': [bold red]{_('FAILED')}[/] - {type(e).__name__} ({e})")
+                last_file = time.monotonic()
+                if self._max_files:
+                    self._progress_callback(100.0 * (self.processed + self.failed) / self._max_files)
+        finally:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+        logger.info(f"{_('Watch finished')}: {self.processed} {_('processed')}, {self.failed} {_('failed')}")
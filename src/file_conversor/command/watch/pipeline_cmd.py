@@ -0,0 +1,82 @@
+# src\file_conversor\command\watch\pipeline_cmd.py
+
+from enum import StrEnum
+from pathlib import Path
+from typing import override
+
+# user-provided modules
+from file_conversor.backend.batch_backend import BatchBackend
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.watch._watch_dispatcher import WatchDispatcher
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.folder_watcher import FolderWatcher
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+WatchPipelineExternalDependencies = BatchBackend.EXTERNAL_DEPENDENCIES
+
+
+class WatchPipelineInFormats(StrEnum):
+    pass  # no input formats, as this command watches the pipeline folder
+
+
+class WatchPipelineOutFormats(StrEnum):
+    pass  # no output formats, as outputs are written by the pipeline stages
+
+
+class WatchPipelineCommand(AbstractCommand[WatchPipelineInFormats, WatchPipelineOutFormats]):
+    pipeline_dir: Path
+    existing: bool = True
+    """Process files already inside the pipeline folder"""
+    stable_time: float | None = None
+    """Time (seconds) a file must be unchanged before it is processed (defaults to ``FolderWatcher.STABLE_TIME``)"""
+    max_files: int | None = None
+    """Stop after N files (defaults to unlimited)"""
+    idle_timeout: float | None = None
+    """Stop after N seconds without new files (defaults to watch until interrupted)"""
+
+    processed: int = 0
+    failed: int = 0
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return WatchPipelineExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return WatchPipelineInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return WatchPipelineOutFormats
+
+    @override
+    def execute(self):
+        batch_backend = BatchBackend(self.pipeline_dir)
+        batch_backend.load_config()
+        pipeline = batch_backend.pipeline
+
+        # stage folders are subfolders of the pipeline folder (only its top level is watched)
+        watcher = FolderWatcher(
+            pipeline.folder,
+            file_filter=lambda path: not path.name.startswith("."),  # config file
+            recursive=False,
+            existing=self.existing,
+            stable_time=self.stable_time,
+        )
+        dispatcher = WatchDispatcher([watcher], max_files=self.max_files, idle_timeout=self.idle_timeout, progress_callback=self.progress_callback)
+        try:
+            dispatcher.run(pipeline.execute_file)
+        finally:
+            self.processed, self.failed = dispatcher.processed, dispatcher.failed
+
+
+__all__ = [
+    "WatchPipelineCommand",
+]
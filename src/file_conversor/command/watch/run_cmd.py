@@ -0,0 +1,116 @@
+# src\file_conversor\command\watch\run_cmd.py
+
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, override
+
+# user-provided modules
+from file_conversor.command.abstract_cmd import AbstractCommand
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.watch._watch_dispatcher import WatchDispatcher
+from file_conversor.config import LOG, STATE, get_translation
+from file_conversor.utils.discovery import match_file
+from file_conversor.utils.folder_watcher import FolderWatcher
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+WatchRunExternalDependencies: set[str] = set()  # no external dependencies (checked by the watched command)
+
+
+class WatchRunInFormats(StrEnum):
+    pass  # no input formats, as this command watches folders
+
+
+class WatchRunOutFormats(StrEnum):
+    pass  # no output formats, as outputs are written by the watched command
+
+
+class WatchRunCommand(AbstractCommand[WatchRunInFormats, WatchRunOutFormats]):
+    command: str
+    """Command name (``module:QualName``). Its input folders are watched, and it runs once for each new file."""
+    options: dict[str, Any]
+    """Command model (``model_dump()``)"""
+    state: dict[str, Any] | None = None
+    """CLI states (defaults to current states)"""
+    recursive: bool = True
+    existing: bool = True
+    """Process files already inside the folders"""
+    stable_time: float | None = None
+    """Time (seconds) a file must be unchanged before it is processed (defaults to ``FolderWatcher.STABLE_TIME``)"""
+    max_files: int | None = None
+    """Stop after N files (defaults to unlimited)"""
+    idle_timeout: float | None = None
+    """Stop after N seconds without new files (defaults to watch until interrupted)"""
+
+    processed: int = 0
+    failed: int = 0
+
+    @classmethod
+    @override
+    def _external_dependencies(cls):
+        return WatchRunExternalDependencies
+
+    @classmethod
+    @override
+    def _supported_in_formats(cls):
+        return WatchRunInFormats
+
+    @classmethod
+    @override
+    def _supported_out_formats(cls):
+        return WatchRunOutFormats
+
+    def _get_folders(self) -> list[Path]:
+        folders = [Path(path).resolve() for path in self.options.get("input_files", []) if Path(path).is_dir()]
+        if not folders:
+            raise ValueError(_("Watch mode requires input folders"))
+
+        output_dir = self.options.get("output_dir")
+        if output_dir is not None:
+            output_dir = Path(output_dir).resolve()
+            for folder in folders:
+                if output_dir == folder or (self.recursive and output_dir.is_relative_to(folder)):
+                    raise ValueError(f"{_('Output folder must be outside the watched folder')} '{folder}'")
+        return folders
+
+    @override
+    def execute(self):
+        if self.state is not None:
+            STATE.from_dict(self.state)
+        command_cls = DaemonClient.get_command_class(self.command)
+        folders = self._get_folders()
+        in_formats = command_cls.get_in_formats()
+        include, exclude = STATE.input_filter.include, STATE.input_filter.exclude
+
+        watchers = [
+            FolderWatcher(
+                folder,
+                file_filter=lambda path, folder=folder: match_file(path, folder, in_formats, include, exclude),
+                recursive=self.recursive,
+                existing=self.existing,
+                stable_time=self.stable_time,
+            )
+            for folder in folders
+        ]
+
+        def run_file(path: Path):
+            options: dict[str, Any] = {**self.options, "input_files": [str(path)]}
+            if "output_dir" in options:
+                # mirror input folder structure (like batch commands)
+                folder = next(folder for folder in folders if path.is_relative_to(folder))
+                options["output_dir"] = str(Path(options["output_dir"]).resolve() / path.parent.relative_to(folder))
+            command_cls.model_validate(options).execute()
+
+        dispatcher = WatchDispatcher(watchers, max_files=self.max_files, idle_timeout=self.idle_timeout, progress_callback=self.progress_callback)
+        try:
+            dispatcher.run(run_file)
+        finally:
+            self.processed, self.failed = dispatcher.processed, dispatcher.failed
+
+
+__all__ = [
+    "WatchRunCommand",
+]
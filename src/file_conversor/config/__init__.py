@@ -5,8 +5,13 @@
 This module initializes the app configuration modules.
 """
 
+from file_conversor.config.background_mode import *
 from file_conversor.config.config import *
 from file_conversor.config.environment import *
 from file_conversor.config.locale import *
 from file_conversor.config.log import *
+from file_conversor.config.probe_cache import *
+from file_conversor.config.process_accounting import *
+from file_conversor.config.resource_governor import *
 from file_conversor.config.state import *
+from file_conversor.config.tracer import *
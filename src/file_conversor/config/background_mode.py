@@ -0,0 +1,160 @@
+# src\file_conversor\config\background_mode.py
+
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import threading
+
+from pathlib import Path
+from typing import Any
+
+# user provided imports
+from file_conversor.config.config import Configuration
+from file_conversor.config.environment import Environment
+from file_conversor.config.log import LOG
+from file_conversor.config.state import STATE
+
+
+logger = LOG.getLogger(__name__)
+
+
+class BackgroundMode:
+    """
+    Background (low-impact) execution class (``--background``), so long batches only use idle capacity.
+
+    Child processes run with CPU niceness (``background_nice`` config) and idle I/O priority (Linux).
+    The calling thread is deprioritized before spawning, so children inherit its priority (Windows uses ``IDLE_PRIORITY_CLASS``).
+    Under systemd, children can also be capped (``background_cpu_quota`` / ``background_memory_max`` config),
+    using a transient cgroup scope (``systemd-run --scope``, that runs the command in place).
+    """
+    IOPRIO_CLASS_IDLE = 3
+    IOPRIO_CLASS_SHIFT = 13
+    IOPRIO_WHO_PROCESS = 1
+    IOPRIO_SET_SYSCALLS = {
+        "x86_64": 251,
+        "amd64": 251,
+        "i386": 289,
+        "i686": 289,
+        "aarch64": 30,
+        "arm64": 30,
+        "riscv64": 30,
+        "armv7l": 314,
+        "ppc64le": 273,
+        "ppc64": 273,
+        "s390x": 282,
+    }
+    """ ``ioprio_set`` syscall numbers (Linux, per architecture) """
+
+    __local = threading.local()
+    __scope_prefix: list[str] | None = None
+    __scope_checked: bool = False
+    __lock = threading.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return STATE.background.enabled
+
+    @classmethod
+    def apply(cls):
+        """Deprioritize calling thread (CPU niceness and idle I/O priority), once per thread. Threads and processes started by it inherit its priority."""
+        if getattr(cls.__local, "applied", False):
+            return
+        cls.__local.applied = True
+        cls._set_nice(Configuration.get().background_nice)
+        cls._set_idle_io()
+
+    @classmethod
+    def _set_nice(cls, nice: int):
+        if not hasattr(os, "setpriority"):
+            return
+        try:
+            current = os.getpriority(os.PRIO_PROCESS, 0)  # calling thread (linux)
+            if current < nice:
+                os.setpriority(os.PRIO_PROCESS, 0, nice)  # increasing niceness never requires privileges
+        except OSError as e:
+            logger.debug(f"Cannot set CPU niceness: {repr(e)}")
+
+    @classmethod
+    def _set_idle_io(cls):
+        syscall = cls.IOPRIO_SET_SYSCALLS.get(platform.machine().lower())
+        if not sys.platform.startswith("linux") or syscall is None:
+            return
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            if libc.syscall(syscall, cls.IOPRIO_WHO_PROCESS, 0, cls.IOPRIO_CLASS_IDLE << cls.IOPRIO_CLASS_SHIFT) != 0:
+                raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        except (OSError, AttributeError) as e:
+            logger.debug(f"Cannot set idle I/O priority: {repr(e)}")
+
+    @classmethod
+    def _get_scope_prefix(cls) -> list[str]:
+        """Get ``systemd-run`` prefix that caps children CPU / memory (empty if no cap is configured, or systemd is not available)."""
+        with cls.__lock:
+            if cls.__scope_checked:
+                return cls.__scope_prefix or []
+            cls.__scope_checked = True
+
+            from file_conversor.utils.formatters import parse_bytes
+
+            config = Configuration.get()
+            properties: list[str] = []
+            if config.background_cpu_quota > 0:
+                properties.extend(["-p", f"CPUQuota={config.background_cpu_quota}%"])
+            if (memory_max := parse_bytes(config.background_memory_max)) > 0:
+                properties.extend(["-p", f"MemoryMax={memory_max}"])
+            if not properties:
+                return []
+
+            systemd_run = shutil.which("systemd-run")
+            if systemd_run is None or not Path("/run/systemd/system").is_dir():
+                logger.warning("Background CPU / memory caps require systemd (cgroup scopes). Caps disabled.")
+                return []
+            user_mode = hasattr(os, "geteuid") and os.geteuid() != 0
+            prefix = [systemd_run, *(["--user"] if user_mode else []), "--scope", "--quiet", "--collect", *properties, "--"]
+            try:
+                # probe once (e.g., no user session manager, or controllers not delegated)
+                subprocess.run([*prefix, sys.executable, "-c", ""], check=True, capture_output=True, timeout=10)  # noqa: S603
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.warning(f"Cannot create background cgroup scope (systemd-run). Caps disabled: {repr(e)}")
+                return []
+            cls.__scope_prefix = prefix
+            logger.debug(f"Background cgroup scope: {' '.join(prefix)}")
+            return prefix
+
+    @classmethod
+    def prepare(cls, cmd: tuple[str, ...] | list[str], wrap: bool = True) -> tuple[list[str], dict[str, Any]]:
+        """
+        Prepare a child process command for the current execution class (no-op if background mode is disabled).
+
+        :param cmd: Command to run.
+        :param wrap: Allow cgroup scope prefix (disable for shell commands). Defaults to True.
+
+        :return: (command, additional ``subprocess.Popen`` keyword arguments).
+        """
+        if not cls.is_enabled():
+            return list(cmd), {}
+        cls.apply()
+        if sys.platform == "win32":
+            return list(cmd), {"creationflags": subprocess.IDLE_PRIORITY_CLASS}  # pyright: ignore[reportAttributeAccessIssue]
+        return [*(cls._get_scope_prefix() if wrap else []), *cmd], {}
+
+    @classmethod
+    def reset(cls):
+        """Reset cached cgroup scope settings (e.g., after configuration changes)."""
+        with cls.__lock:
+            cls.__scope_checked = False
+            cls.__scope_prefix = None
+
+
+# child processes started by ``Environment`` use the current execution class
+Environment.set_command_preparer(BackgroundMode.prepare)
+
+
+__all__ = [
+    "BackgroundMode",
+]
@@ -3,7 +3,7 @@
 import locale
 
 from pathlib import Path
-from typing import Any
+from typing import Any, cast, override
 
 from pydantic import BaseModel
 
@@ -47,6 +47,28 @@ class ConfigurationData(BaseModel):
     """Default image resampling algorithm"""
     pdf_compression: str = "medium"  # Default PDF compression level
     """Default PDF compression level"""
+    jobs: int = 1                  # Default parallel jobs for batch commands
+    """Default parallel jobs for batch commands (0 = number of CPU threads)"""
+    executor: str = "thread"       # Default batch executor
+    """Default batch executor (serial, thread, process, pipeline)"""
+    cpu_tokens: int = 0            # CPU tokens shared by parallel jobs
+    """CPU tokens (threads) shared by parallel jobs and their tools (0 = number of CPU threads)"""
+    cpu_affinity: bool = False     # Pin parallel jobs to their CPUs
+    """Pin parallel jobs (and their child tools) to the CPUs granted to them (Linux only)"""
+    memory_budget: str = "0"       # Memory budget for parallel jobs
+    """Memory budget for parallel jobs, e.g. 8G (0 = 75% of physical memory)"""
+    result_cache: bool = False     # Enable conversion result cache
+    """Enable conversion result cache (skip conversion of unchanged inputs)"""
+    result_cache_max_size: str = "1G"  # Max conversion result cache size
+    """Max conversion result cache size (least recently used results are evicted)"""
+    progress_rate: float = 10.0    # Max progress updates per second
+    """Max progress bar updates per second (0 = unlimited)"""
+    background_nice: int = 19      # CPU niceness in background mode
+    """CPU niceness of child processes in background mode (``--background``), 0-19"""
+    background_cpu_quota: int = 0  # CPU cap in background mode
+    """CPU cap of each child process in background mode, in % of one CPU, e.g. 200 = 2 CPUs (0 = no cap, requires systemd)"""
+    background_memory_max: str = "0"  # Memory cap in background mode
+    """Memory cap of each child process in background mode, e.g. 4G (0 = no cap, requires systemd)"""
 
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -55,13 +77,14 @@ class ConfigurationData(BaseModel):
 
 class Configuration:
     """Application configuration manager."""
-    __config_path = Environment.get_data_folder() / ".config.json"
+    __config_path: Path | None = None
     __data: ConfigurationData | None = None
 
     @classmethod
     def __load(cls) -> ConfigurationData:
-        if cls.__config_path.exists():
-            return ConfigurationData.model_validate_json(cls.__config_path.read_text())
+        config_path = cls.get_path()
+        if config_path.exists():
+            return ConfigurationData.model_validate_json(config_path.read_text())
         return cls.__reset()
 
     @classmethod
@@ -88,6 +111,8 @@ class Configuration:
     @classmethod
     def get_path(cls) -> Path:
         """Get configuration file path."""
+        if cls.__config_path is None:
+            cls.__config_path = Environment.get_data_folder() / ".config.json"
         return cls.__config_path
 
     @classmethod
@@ -96,20 +121,45 @@ class Configuration:
         if cls.__data is None:
             raise RuntimeError("Configuration data is not set.")
         json_str = cls.__data.model_dump_json(indent=2)
-        cls.__config_path.write_text(json_str)
+        cls.get_path().write_text(json_str)
 
     @classmethod
     def load(cls) -> None:
         """Load app configuration file"""
         cls.__data = cls.__load()
 
+    @classmethod
+    def reload(cls) -> None:
+        """Reload app configuration file, updating current configuration data in place (``CONFIG`` stays valid)."""
+        new_config = cls.__load()
+        if cls.__data is None:
+            cls.__data = new_config
+            return
+        for name in type(new_config).model_fields:
+            setattr(cls.__data, name, getattr(new_config, name))
+
     @classmethod
     def reset(cls) -> None:
         """Reset app configuration to factory defaults"""
         cls.__data = cls.__reset()
 
 
-CONFIG = Configuration.get()
+class _ConfigurationProxy:
+    """Current configuration data, loaded on first use (see ``Configuration.get()``)."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(Configuration.get(), name)
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(Configuration.get(), name, value)
+
+    @override
+    def __repr__(self) -> str:
+        return repr(Configuration.get())
+
+
+CONFIG = cast(ConfigurationData, _ConfigurationProxy())
 
 __all__ = [
     "Configuration",
@@ -1,15 +1,24 @@
 # src\file_conversor\config\environment.py
 
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
 
+from collections import deque
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterator, override
 
 from file_conversor.config.log import LOG
+from file_conversor.config.process_accounting import ProcessAccounting
+from file_conversor.config.tracer import Tracer
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 # Get app config
@@ -18,6 +27,7 @@ logger = LOG.getLogger(__name__)
 
 class Environment:
     __APP_NAME = f"file_conversor"
+    __command_preparer: Callable[[tuple[str, ...] | list[str], bool], tuple[list[str], dict[str, Any]]] | None = None
 
     class UserFolder(Enum):
         @classmethod
@@ -219,6 +229,11 @@ class Environment:
         # logger.debug(f"Locales path: {locales_path}")
         return cls.get_resources_folder() / ".locales"
 
+    @classmethod
+    def get_build_data_folder(cls) -> Path:
+        """Get the absolute path of data files generated at build time (e.g., command index)."""
+        return cls.get_resources_folder() / ".data"
+
     @classmethod
     def get_data_folder(cls) -> Path:
         """Get the app data folder."""
@@ -238,6 +253,29 @@ class Environment:
         """Get the path to the app icon."""
         return cls.get_icons_folder() / "icon.ico"
 
+    @classmethod
+    def set_command_preparer(cls, preparer: Callable[[tuple[str, ...] | list[str], bool], tuple[list[str], dict[str, Any]]] | None):
+        """
+        Set hook that prepares child process commands (e.g., ``BackgroundMode.prepare()``: niceness, I/O priority, cgroup caps).
+
+        :param preparer: Receives (command, allow command prefix), returns (command, additional ``subprocess.Popen`` keyword arguments). None = run commands as is.
+        """
+        cls.__command_preparer = preparer
+
+    @classmethod
+    def prepare_command(cls, cmd: tuple[str, ...] | list[str], wrap: bool = True) -> tuple[list[str], dict[str, Any]]:
+        """
+        Prepare a child process command (see ``set_command_preparer()``).
+
+        :param cmd: Command to run.
+        :param wrap: Allow command prefix (disable for shell commands). Defaults to True.
+
+        :return: (command, additional ``subprocess.Popen`` keyword arguments).
+        """
+        if cls.__command_preparer is None:
+            return list(cmd), {}
+        return cls.__command_preparer(cmd, wrap)
+
     @classmethod
     def get_app_name(cls) -> str:
         """Get the app name."""
@@ -288,23 +326,34 @@ class Environment:
         :param stderr: Capture stderr, or not. Defaults to ``subprocess.STDOUT``.
         :param kwargs: Additional keyword arguments for subprocess.Popen.
         """
-        logger.debug(f"Starting process ...")
-        logger.debug(f"{" ".join(cmd)}")
-
-        process = subprocess.Popen(  # noqa: S603
-            cmd,
-            stdin=kwargs.get("stdin"),
-            stdout=stdout,
-            stderr=stderr,
-            cwd=cwd,
-            env=env,
-            text=text,
-            encoding=encoding,
-
-            # options
-            close_fds=kwargs.get("close_fds", True),
-            shell=kwargs.get("shell", False),
-        )
+        logger.debug("Starting process ...")
+        logger.debug("%s", " ".join(cmd))
+
+        # background execution class (niceness, I/O priority, cgroup caps)
+        run_cmd, popen_kwargs = Environment.prepare_command(cmd, wrap=not kwargs.get("shell", False))
+
+        # resource usage is recorded when the process is waited for (see ``ProcessAccounting``)
+        if ProcessAccounting.is_enabled() and _ProcessSupervisor.USE_WAIT4:
+            popen_kwargs["tool"] = ProcessAccounting.get_tool(cmd[0])
+            popen_cls = _AccountedPopen
+        else:
+            popen_cls = subprocess.Popen
+        with Tracer.span(f"spawn {Path(cmd[0]).name}", "process", cmd=" ".join(cmd)):
+            process = popen_cls(  # noqa: S603
+                run_cmd,
+                stdin=kwargs.get("stdin"),
+                stdout=stdout,
+                stderr=stderr,
+                cwd=cwd,
+                env=env,
+                text=text,
+                encoding=encoding,
+
+                # options
+                close_fds=kwargs.get("close_fds", True),
+                shell=kwargs.get("shell", False),
+                **popen_kwargs,
+            )
         return process
 
     @classmethod
@@ -333,23 +382,24 @@ class Environment:
         :raises subprocess.CalledProcessError: if command failed (needs `wait` to work)
         :raises Exception: if communicate() failed (needs `wait` to work)
         """
-        process = cls.run_nowait(
-            *cmd,
-            text=text,
-            encoding=encoding,
-            env=env,
-            cwd=cwd,
-            stdout=stdout,
-            stderr=stderr,
-            **kwargs,
-        )
-        try:
-            output, error = process.communicate()
-        except Exception:
-            if process.poll() is None:
-                process.kill()
-                process.wait()
-            raise
+        with Tracer.span(f"run {Path(cmd[0]).name}", "process", cmd=" ".join(cmd)):
+            process = cls.run_nowait(
+                *cmd,
+                text=text,
+                encoding=encoding,
+                env=env,
+                cwd=cwd,
+                stdout=stdout,
+                stderr=stderr,
+                **kwargs,
+            )
+            try:
+                output, error = process.communicate()
+            except Exception:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                raise
 
         if process.returncode != 0:
             raise subprocess.CalledProcessError(
@@ -366,6 +416,136 @@ class Environment:
             stderr=error,
         )
 
+    @classmethod
+    async def run_async(cls,
+                        *cmd: str,
+                        line_callback: Callable[[str], Any] | None = None,
+                        timeout: float | None = None,
+                        check: bool = True,
+                        encoding: str | None = None,
+                        env: dict[str, Any] | None = None,
+                        cwd: str | Path | None = None,
+                        stderr: int | None = subprocess.STDOUT,
+                        ) -> subprocess.CompletedProcess[str]:
+        """
+        Run a process inside an asyncio event loop, parsing its output lines without blocking (one loop supervises many processes).
+
+        :param cmd: Command to run.
+        :param line_callback: Called for each output line (lines end with ``\\n`` or ``\\r``, e.g., progress lines). Defaults to None.
+        :param timeout: Max run time (seconds). Defaults to None (no limit).
+        :param check: Raise if process fails. Defaults to True.
+        :param encoding: Text encoding. Defaults to None (use system locale).
+        :param env: Environment (variables, PATH, etc). Defaults to None (same as the current python process).
+        :param cwd: Current working directory. Defaults to None (same as the current python process).
+        :param stderr: Capture stderr (``subprocess.PIPE``), merge into stdout (``subprocess.STDOUT``), or not. Defaults to ``subprocess.STDOUT``.
+
+        :return: Completed process (stdout / stderr hold the last ``_ProcessSupervisor.MAX_OUTPUT_LINES`` lines).
+            Resource usage is recorded by ``ProcessAccounting`` (if enabled).
+
+        :raises subprocess.CalledProcessError: if process failed (and ``check`` is True).
+        :raises subprocess.TimeoutExpired: if timeout expired (process is killed).
+        :raises asyncio.CancelledError: if task was cancelled (process is killed).
+        """
+        import asyncio
+        import locale
+
+        logger.debug("Starting process (async) ...")
+        logger.debug("%s", " ".join(cmd))
+
+        process = await _SupervisedProcess.start(*cmd, stderr=stderr, cwd=cwd, env=env)
+        encoding = encoding or locale.getpreferredencoding(False)
+        out_lines: deque[str] = deque(maxlen=_ProcessSupervisor.MAX_OUTPUT_LINES)
+        err_lines: deque[str] = deque(maxlen=_ProcessSupervisor.MAX_OUTPUT_LINES)
+
+        def on_line(lines: deque[str]) -> Callable[[str], None]:
+            def _on_line(line: str):
+                if line.strip():
+                    lines.append(line.strip())
+                if line_callback:
+                    line_callback(line)
+            return _on_line
+
+        readers = [_ProcessSupervisor.read_lines(process.stdout, encoding, on_line(out_lines))]  # pyright: ignore[reportArgumentType]
+        if process.stderr is not None:
+            readers.append(_ProcessSupervisor.read_lines(process.stderr, encoding, on_line(err_lines)))
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.gather(*readers)
+                await process.wait()
+        except TimeoutError:
+            await _ProcessSupervisor.kill(process)
+            raise subprocess.TimeoutExpired(cmd=list(cmd), timeout=timeout or 0.0, output="\n".join(out_lines), stderr="\n".join(err_lines)) from None
+        except BaseException:
+            await asyncio.shield(_ProcessSupervisor.kill(process))  # cancelled, or line_callback failed
+            raise
+        finally:
+            process.close()
+
+        result = subprocess.CompletedProcess(
+            args=list(cmd),
+            returncode=process.returncode or 0,
+            stdout="\n".join(out_lines),
+            stderr="\n".join(err_lines) if process.stderr is not None else None,
+        )
+        if check:
+            result.check_returncode()
+        return result
+
+    @classmethod
+    def stream_lines(cls,
+                     *cmd: str,
+                     timeout: float | None = None,
+                     encoding: str | None = None,
+                     env: dict[str, Any] | None = None,
+                     cwd: str | Path | None = None,
+                     ) -> Iterator[str]:
+        """
+        Run a process (supervised by a shared event loop, see ``run_async()``), and iterate over its output lines (stdout + stderr).
+
+        The calling thread sleeps while waiting for lines (no busy polling). Closing the iterator early kills the process.
+
+        :param cmd: Command to run.
+        :param timeout: Max run time (seconds). Defaults to None (no limit).
+        :param encoding: Text encoding. Defaults to None (use system locale).
+        :param env: Environment (variables, PATH, etc). Defaults to None (same as the current python process).
+        :param cwd: Current working directory. Defaults to None (same as the current python process).
+
+        :raises subprocess.CalledProcessError: if process failed (after its last line).
+        :raises subprocess.TimeoutExpired: if timeout expired.
+        """
+        import concurrent.futures
+        import queue
+
+        lines: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        collector = ProcessAccounting.get_collector()
+
+        async def run() -> subprocess.CompletedProcess[str]:
+            ProcessAccounting.set_collector(collector)  # usage belongs to the calling thread (e.g., batch step)
+            return await cls.run_async(*cmd, line_callback=lines.put, timeout=timeout, encoding=encoding, env=env, cwd=cwd)
+
+        with Tracer.span(f"run {Path(cmd[0]).name}", "process", cmd=" ".join(cmd)):
+            future = _ProcessSupervisor.submit(run())
+            future.add_done_callback(lambda _f: lines.put(None))
+            try:
+                while (line := lines.get()) is not None:
+                    yield line
+                future.result()
+            finally:
+                if not future.done():
+                    future.cancel()  # kills the process
+                    concurrent.futures.wait([future], timeout=_ProcessSupervisor.KILL_TIMEOUT + 1.0)
+
+    @classmethod
+    def stop_supervisor(cls) -> bool:
+        """
+        Stop the background thread that supervises processes (see ``stream_lines()``), if idle. It restarts on next use.
+
+        Call it before ``fork()``, so children do not inherit a running event loop.
+
+        :return: True if stopped (or not running), False if processes are still supervised.
+        """
+        return _ProcessSupervisor.stop()
+
     @classmethod
     def check_returncode(
         cls,
@@ -388,6 +568,254 @@ class Environment:
         super().__init__()
 
 
+class _ProcessSupervisor:
+    """ Asyncio event loop (background thread) that supervises the processes started by all threads (see ``Environment.stream_lines()``). """
+    USE_WAIT4 = hasattr(os, "wait4")
+    """ reap children with ``os.wait4()`` (resource usage) """
+    MAX_OUTPUT_LINES = 1000
+    """ output lines kept for error reports """
+    KILL_TIMEOUT = 2.0
+    """ time (seconds) a process has to terminate, before it is killed """
+    READ_SIZE = 64 * 1024
+    LINE_RE = re.compile(r"\r\n|\r|\n")
+
+    __lock = threading.Lock()
+    __loop: Any = None
+    __thread: threading.Thread | None = None
+    __active = 0
+
+    @classmethod
+    def submit(cls, coro: Any) -> Any:
+        """ Run coroutine in the supervisor event loop (started on first use). Returns a ``concurrent.futures.Future``. """
+        import asyncio
+
+        with cls.__lock:
+            if cls.__loop is None:
+                cls.__loop = asyncio.new_event_loop()
+                cls.__thread = threading.Thread(target=cls.__loop.run_forever, name="fc_process_supervisor", daemon=True)
+                cls.__thread.start()
+            cls.__active += 1
+            future = asyncio.run_coroutine_threadsafe(coro, cls.__loop)
+        future.add_done_callback(lambda _f: cls._done())
+        return future
+
+    @classmethod
+    def _done(cls):
+        with cls.__lock:
+            cls.__active -= 1
+
+    @classmethod
+    def stop(cls) -> bool:
+        """
+        Stop the event loop thread, if no process is supervised (restarted on next use).
+
+        :return: True if stopped (or not running), False if busy.
+        """
+        with cls.__lock:
+            if cls.__active > 0:
+                return False
+            if cls.__loop is not None and cls.__thread is not None:
+                cls.__loop.call_soon_threadsafe(cls.__loop.stop)
+                cls.__thread.join()
+                cls.__loop.close()
+            cls.__loop, cls.__thread = None, None
+            return True
+
+    @classmethod
+    def reset_after_fork(cls):
+        # the loop thread does not exist in forked children (e.g., process workers)
+        cls.__lock = threading.Lock()
+        cls.__loop, cls.__thread = None, None
+        cls.__active = 0
+
+    @classmethod
+    async def read_lines(cls, stream: Any, encoding: str, line_callback: Callable[[str], Any]):
+        """ Read stream until EOF, splitting lines on ``\\n``, ``\\r\\n`` or ``\\r``. """
+        import codecs
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        pending = ""
+        while chunk := await stream.read(cls.READ_SIZE):
+            pending += decoder.decode(chunk)
+            *lines, pending = cls.LINE_RE.split(pending)
+            for line in lines:
+                line_callback(line)
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            line_callback(pending)
+
+    @classmethod
+    async def kill(cls, process: '_SupervisedProcess'):
+        """ Terminate process (kill it, if it does not terminate in ``KILL_TIMEOUT`` seconds). """
+        import asyncio
+        import signal
+
+        if process.returncode is not None:
+            return
+        try:
+            process.send_signal(signal.SIGTERM)
+            try:
+                await asyncio.wait_for(process.wait(), cls.KILL_TIMEOUT)
+            except TimeoutError:
+                process.send_signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+                await process.wait()
+        except ProcessLookupError:
+            pass
+        logger.debug("Process %d stopped", process.pid)
+
+
+class _SupervisedProcess:
+    """ Child process supervised by an asyncio event loop. POSIX children are reaped with ``os.wait4()`` (resource usage). """
+
+    def __init__(self, cmd: tuple[str, ...], process: 'subprocess.Popen[Any] | asyncio.subprocess.Process', stdout: Any, stderr: Any, transports: list[Any]) -> None:
+        super().__init__()
+        self._tool = ProcessAccounting.get_tool(cmd[0])
+        self._process = process
+        """ ``subprocess.Popen`` (POSIX), or ``asyncio.subprocess.Process`` """
+        self._transports = transports
+        self._started = time.perf_counter()
+        self._reaper: Any = None
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @classmethod
+    async def start(cls, *cmd: str, stderr: int | None, cwd: str | Path | None, env: dict[str, Any] | None) -> '_SupervisedProcess':
+        import asyncio
+
+        run_cmd, popen_kwargs = Environment.prepare_command(cmd)
+        if not _ProcessSupervisor.USE_WAIT4:
+            process = await asyncio.create_subprocess_exec(*run_cmd, stdout=subprocess.PIPE, stderr=stderr, cwd=cwd, env=env, **popen_kwargs)
+            return cls(cmd, process, process.stdout, process.stderr, [])
+
+        loop = asyncio.get_running_loop()
+        process = subprocess.Popen(run_cmd, stdout=subprocess.PIPE, stderr=stderr, cwd=cwd, env=env, close_fds=True, **popen_kwargs)  # noqa: S603
+        streams: list[Any] = []
+        transports: list[Any] = []
+        for pipe in (process.stdout, process.stderr):
+            if pipe is None:
+                streams.append(None)
+                continue
+            reader = asyncio.StreamReader()
+            transport, _protocol = await loop.connect_read_pipe(lambda reader=reader: asyncio.StreamReaderProtocol(reader), pipe)
+            streams.append(reader)
+            transports.append(transport)
+        return cls(cmd, process, streams[0], streams[1], transports)
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    @property
+    def returncode(self) -> int | None:
+        return self._process.returncode
+
+    def send_signal(self, sig: int):
+        if self._process.returncode is not None:
+            return
+        if isinstance(self._process, subprocess.Popen):
+            os.kill(self._process.pid, sig)  # Popen.send_signal() may reap the process (usage would be lost)
+        else:
+            self._process.send_signal(sig)
+
+    async def wait(self) -> int:
+        """ Wait for process to exit, and record its resource usage. """
+        import asyncio
+
+        if self._process.returncode is not None:
+            return self._process.returncode
+        if not isinstance(self._process, subprocess.Popen):
+            returncode = await self._process.wait()
+            ProcessAccounting.record(ProcessAccounting.Usage(tool=self._tool, wall_time=time.perf_counter() - self._started))
+            return returncode
+
+        if self._reaper is None:
+            self._reaper = asyncio.ensure_future(self._wait4())
+        _pid, status, rusage = await asyncio.shield(self._reaper)  # wait may be cancelled (timeout), reaper is not
+        if self._process.returncode is None:
+            self._process.returncode = os.waitstatus_to_exitcode(status)
+            ProcessAccounting.record(ProcessAccounting.from_rusage(self._tool, time.perf_counter() - self._started, rusage))
+        return self._process.returncode
+
+    async def _wait4(self) -> tuple[int, int, Any]:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        pid = self._process.pid
+        try:
+            pidfd = os.pidfd_open(pid)  # readable when process exits (Linux)
+        except (AttributeError, OSError):
+            return await loop.run_in_executor(None, os.wait4, pid, 0)
+        try:
+            exited = loop.create_future()
+            loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+            try:
+                await exited
+            finally:
+                loop.remove_reader(pidfd)
+        finally:
+            os.close(pidfd)
+        return os.wait4(pid, 0)
+
+    def close(self):
+        for transport in self._transports:
+            transport.close()
+
+
+class _AccountedPopen(subprocess.Popen[Any]):
+    """ ``subprocess.Popen`` that reaps the child with ``os.wait4()``, recording its resource usage (see ``ProcessAccounting``). """
+
+    POLL_INTERVAL = 0.05
+    """ max time (seconds) between polls, in ``wait(timeout)`` """
+
+    def __init__(self, *args: Any, tool: str, **kwargs: Any) -> None:
+        self._accounting_tool = tool
+        self._accounting_started = time.perf_counter()
+        self._accounting_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    @override
+    def poll(self) -> int | None:
+        if self.returncode is None:
+            self._wait4(os.WNOHANG)
+        return self.returncode
+
+    @override
+    def wait(self, timeout: float | None = None) -> int:
+        if self.returncode is not None:
+            return self.returncode
+        if timeout is None:
+            while self.returncode is None:
+                self._wait4(0)
+            return self.returncode
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while (returncode := self.poll()) is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.POLL_INTERVAL)
+        return returncode
+
+    def _wait4(self, options: int):
+        with self._accounting_lock:
+            if self.returncode is not None:
+                return
+            try:
+                pid, status, rusage = os.wait4(self.pid, options)
+            except ChildProcessError:
+                self.returncode = 0  # already reaped (same as ``subprocess.Popen``)
+                return
+            if pid == 0:
+                return
+            self.returncode = os.waitstatus_to_exitcode(status)
+            ProcessAccounting.record(ProcessAccounting.from_rusage(self._accounting_tool, time.perf_counter() - self._accounting_started, rusage))
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ProcessSupervisor.reset_after_fork)
+
+
 __all__ = [
     "Environment",
 ]
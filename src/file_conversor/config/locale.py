@@ -1,23 +1,78 @@
 
 # src\file_conversor\config\locale.py
-from typing import Callable
+from collections.abc import Set
+from typing import Any, Callable, Iterable, Iterator, cast, override
 
 from rich import print
 
-from file_conversor.config.config import Configuration
+from file_conversor.config.config import CONFIG
 from file_conversor.config.environment import Environment
 
 
-CONFIG = Configuration.get()
+LANGUAGE_INDEX_FILE = "languages.json"
+""" language index (locales with compiled catalogs), generated at build time in ``Environment.get_build_data_folder()`` """
 
-AVAILABLE_LANGUAGES: set[str] = {
-    str(mo.relative_to(Environment.get_locales_folder()).parts[0])
-    for mo in Environment.get_locales_folder().glob("**/LC_MESSAGES/*.mo")
-}
+
+class AvailableLanguages(Set[str]):
+    """Available app languages, loaded on first use (language index, or locales folder scan if index is missing)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__languages: frozenset[str] | None = None
+
+    def __load(self) -> frozenset[str]:
+        if self.__languages is None:
+            self.__languages = frozenset(_load_available_languages())
+        return self.__languages
+
+    def reload(self):
+        """Reload available languages on next use (e.g., language index regenerated)."""
+        self.__languages = None
+
+    @override
+    def __contains__(self, value: object) -> bool:
+        return value in self.__load()
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__load())
+
+    @override
+    def __len__(self) -> int:
+        return len(self.__load())
+
+    @override
+    def __repr__(self) -> str:
+        return repr(set(self.__load()))
+
+    @override
+    @classmethod
+    def _from_iterable[S](cls, it: Iterable[S]) -> frozenset[S]:
+        """Build results of set operations (e.g., ``&``, ``|``) as plain frozen sets."""
+        return frozenset(it)
+
+
+AVAILABLE_LANGUAGES = AvailableLanguages()
 
 _translation_cache: dict[str, Callable[[str], str]] = {}
 
 
+def _load_available_languages() -> set[str]:
+    import json
+
+    try:
+        languages = json.loads((Environment.get_build_data_folder() / LANGUAGE_INDEX_FILE).read_text(encoding="utf-8"))
+        if isinstance(languages, list):
+            languages = cast("list[Any]", languages)
+            return {str(lang) for lang in languages}
+    except (OSError, ValueError):
+        """ index not generated (e.g., development tree), scan locales folder """
+    return {
+        str(mo.relative_to(Environment.get_locales_folder()).parts[0])
+        for mo in Environment.get_locales_folder().glob("**/LC_MESSAGES/*.mo")
+    }
+
+
 def _get_lang_name_babel(lang_code: str) -> str:
     """
     Get language name using babel library.
@@ -104,10 +159,33 @@ def get_system_locale():
     return lang
 
 
-def get_translation():
+def _gettext(message: str) -> str:
+    translate = _translation_cache.get("gettext") or _load_translation()
+    return translate(message)
+
+
+def get_translation() -> Callable[[str], str]:
     """
     Get translation mechanism, based on user preferences.
+
+    The translation catalog is only loaded when the first message is translated.
     """
+    return _gettext
+
+
+def set_translation(translate: Callable[[str], str] | None):
+    """
+    Override translation mechanism (e.g., mark translatable messages at build time).
+
+    :param translate: Translate function (msgid => message). None = load translation catalog on next message.
+    """
+    if translate is None:
+        _translation_cache.pop("gettext", None)
+    else:
+        _translation_cache["gettext"] = translate
+
+
+def _load_translation() -> Callable[[str], str]:
     import gettext  # app translations / locales
 
     if "gettext" in _translation_cache:
@@ -159,10 +237,12 @@ def get_language_name(lang_code: str) -> str:
 
 
 __all__ = [
+    "AvailableLanguages",
     "AVAILABLE_LANGUAGES",
     "get_default_language",
     "normalize_lang_code",
     "get_system_locale",
     "get_translation",
+    "set_translation",
     "get_language_name",
 ]
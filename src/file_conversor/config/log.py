@@ -1,13 +1,19 @@
 # src\file_conversor\config\log.py
 
+import atexit
 import logging
+import os
+import queue
 import shutil
 import tempfile
+import threading
 
+from contextlib import contextmanager
 from enum import Enum
 from logging import Handler, LogRecord
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Self, override
+from typing import Generator, Self, cast, override
 
 from concurrent_log_handler import ConcurrentTimedRotatingFileHandler
 from rich import print
@@ -35,6 +41,27 @@ class Log:
         def log_to_file(self, value: bool):
             self._log_to_file = value
 
+        def _log(
+            self,
+            level: int,
+            tag: str,
+            msg: object,
+            args: tuple[object, ...],
+            exc_info: None | bool,
+            stack_info: bool,
+            stacklevel: int,
+            extra: dict[str, object] | None,
+        ) -> None:
+            """
+            Log message to file and console (queued, see ``Log.BatchQueueListener``).
+
+            Messages of disabled levels are skipped, and ``%``-style args are formatted by the background writer (not by the caller).
+            """
+            if self.level > level:
+                return
+            extra = {**(extra or {}), Log.ConsoleHandler.TAG_ATTR: tag, Log.FILE_ATTR: self.log_to_file}
+            self._logger.log(level, msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel + 2, extra=extra)
+
         def critical(
                 self,
                 msg: object,
@@ -44,10 +71,7 @@ class Log:
                 stacklevel: int = 1,
                 extra: dict[str, object] | None = None,
         ) -> None:
-            if self.log_to_file:
-                self._logger.critical(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
-            if self.level <= logging.CRITICAL:
-                print(f"[bold reverse red][CRITICAL][/]: {msg}")
+            self._log(logging.CRITICAL, "[bold reverse red][CRITICAL][/]", msg, args, exc_info, stack_info, stacklevel, extra)
 
         def fatal(
             self,
@@ -58,10 +82,7 @@ class Log:
             stacklevel: int = 1,
             extra: dict[str, object] | None = None,
         ) -> None:
-            if self.log_to_file:
-                self._logger.fatal(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
-            if self.level <= logging.FATAL:
-                print(f"[bold reverse red][FATAL][/]: {msg}")
+            self._log(logging.FATAL, "[bold reverse red][FATAL][/]", msg, args, exc_info, stack_info, stacklevel, extra)
 
         def error(
             self,
@@ -72,10 +93,7 @@ class Log:
             stacklevel: int = 1,
             extra: dict[str, object] | None = None,
         ) -> None:
-            if self.log_to_file:
-                self._logger.error(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
-            if self.level <= logging.ERROR:
-                print(f"[bold red][ERROR][/]: {msg}")
+            self._log(logging.ERROR, "[bold red][ERROR][/]", msg, args, exc_info, stack_info, stacklevel, extra)
 
         def warning(
             self,
@@ -86,10 +104,7 @@ class Log:
             stacklevel: int = 1,
             extra: dict[str, object] | None = None,
         ) -> None:
-            if self.log_to_file:
-                self._logger.warning(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
-            if self.level <= logging.WARNING:
-                print(f"[bold yellow][WARN][/]: {msg}")
+            self._log(logging.WARNING, "[bold yellow][WARN][/]", msg, args, exc_info, stack_info, stacklevel, extra)
 
         def info(
             self,
@@ -100,10 +115,7 @@ class Log:
             stacklevel: int = 1,
             extra: dict[str, object] | None = None,
         ) -> None:
-            if self.log_to_file:
-                self._logger.info(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
-            if self.level <= logging.INFO:
-                print(f"[bold white][INFO][/]: {msg}")
+            self._log(logging.INFO, "[bold white][INFO][/]", msg, args, exc_info, stack_info, stacklevel, extra)
 
         def debug(
             self,
@@ -114,10 +126,125 @@ class Log:
             stacklevel: int = 1,
             extra: dict[str, object] | None = None,
         ) -> None:
-            if self.log_to_file:
-                self._logger.debug(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
-            if self.level <= logging.DEBUG:
-                print(f"[bold cyan][DEBUG][/]: {msg}")
+            self._log(logging.DEBUG, "[bold cyan][DEBUG][/]", msg, args, exc_info, stack_info, stacklevel, extra)
+
+    FILE_ATTR = "file_conversor_file"
+    """ record attribute, False if record is not written to the logfile (see ``CustomLogger.log_to_file``) """
+
+    class ConsoleHandler(Handler):
+        """ Prints records of app loggers (see ``CustomLogger``) to the console, with rich markup. """
+        TAG_ATTR = "file_conversor_tag"
+        """ record attribute, holds the console tag of the level (e.g., ``[bold white][INFO][/]``) """
+
+        @override
+        def filter(self, record: LogRecord) -> bool:
+            return hasattr(record, self.TAG_ATTR) and bool(super().filter(record))
+
+        @override
+        def emit(self, record: LogRecord) -> None:
+            try:
+                print(f"{getattr(record, self.TAG_ATTR)}: {record.getMessage()}")
+            except Exception:
+                self.handleError(record)
+
+    class LazyQueueHandler(QueueHandler):
+        """ Enqueues records as they are (message formatting happens in the listener thread, not in the caller). """
+        @override
+        def prepare(self, record: LogRecord) -> LogRecord:
+            return record  # in-process queue, no need to pickle the record
+
+    class BatchFileHandler(ConcurrentTimedRotatingFileHandler):
+        """ Rotating file handler that writes a batch of records under a single (inter-process) file lock. """
+        BATCH_ATTR = "file_conversor_batch"
+        """ record attribute, marks records that hold an already formatted batch of messages """
+
+        @override
+        def filter(self, record: LogRecord) -> bool:
+            return bool(getattr(record, Log.FILE_ATTR, True)) and bool(super().filter(record))
+
+        @override
+        def format(self, record: LogRecord) -> str:
+            if getattr(record, self.BATCH_ATTR, False):
+                return record.getMessage()
+            return super().format(record)
+
+        def emit_batch(self, records: list[LogRecord]) -> None:
+            msgs: list[str] = []
+            for record in records:
+                try:
+                    msgs.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            if not msgs:
+                return
+            # emit a single record with all messages (file lock, rollover and write are handled by emit())
+            batch = logging.makeLogRecord({
+                "name": records[-1].name,
+                "levelno": records[-1].levelno,
+                "levelname": records[-1].levelname,
+                "created": records[-1].created,
+                "msg": self.terminator.join(msgs),
+                self.BATCH_ATTR: True,
+            })
+            self.emit(batch)
+
+    class BatchQueueListener(QueueListener):
+        """ Queue listener (background writer thread) that drains all pending records, and hands them to handlers in batches. """
+        BATCH_SIZE = 512
+
+        _sentinel = None
+        """ end of queue marker (see ``enqueue_sentinel()``) """
+
+        _writer: threading.Thread | None = None
+
+        @property
+        def writer(self) -> threading.Thread | None:
+            """ Background writer thread (None if not started) """
+            return self._writer
+
+        @override
+        def start(self) -> None:
+            """Start background writer thread."""
+            self._writer = threading.Thread(target=self._drain, daemon=True)
+            self._writer.start()
+
+        @override
+        def stop(self) -> None:
+            """Write pending records and stop background writer thread (no-op if not running, e.g., in forked child)."""
+            if self._writer is not None and self._writer.is_alive():
+                self.enqueue_sentinel()
+                self._writer.join()
+            self._writer = None
+
+        def _drain(self) -> None:
+            stop = False
+            while not stop:
+                records: list[LogRecord] = []
+                while not stop and len(records) < self.BATCH_SIZE:
+                    try:
+                        record = cast("LogRecord | None", self.dequeue(not records))  # block until first record of batch
+                    except queue.Empty:
+                        break
+                    if record is None:  # sentinel
+                        stop = True
+                    else:
+                        records.append(record)
+                self.handle_batch(records)
+
+        def handle_batch(self, records: list[LogRecord]) -> None:
+            for handler in self.handlers:
+                accepted = [record for record in records if record.levelno >= handler.level and handler.filter(record)]
+                if not accepted:
+                    continue
+                if isinstance(handler, Log.BatchFileHandler):
+                    handler.acquire()
+                    try:
+                        handler.emit_batch(accepted)
+                    finally:
+                        handler.release()
+                else:
+                    for record in accepted:
+                        handler.handle(record)
 
     class StripMarkupFormatter(logging.Formatter):
         # Use a custom formatter that strips Rich markup
@@ -126,7 +253,7 @@ class Log:
             import re
             TAG_RE = re.compile(r'\[/?[^\]]+\]')  # matches [tag] and [/tag]
             if isinstance(record.msg, str):
-                record.msg = TAG_RE.sub('', record.msg)
+                record = logging.makeLogRecord({**record.__dict__, "msg": TAG_RE.sub('', record.msg)})  # console keeps the markup
             return super().format(record)
 
     # most severe level, to least
@@ -173,10 +300,15 @@ class Log:
     def __init__(self, dest_folder: str | Path | None = ".", level: Level = Level.INFO) -> None:
         """
         Initialize logfile, inside a dest_folder with a log_level
+
+        Records are written to the logfile and console by a background thread (see ``BatchQueueListener``).
         """
         super().__init__()
         self._dest_path: Path | None = None
-        self._file_handler: Handler | None = None
+        self._file_handler: Log.BatchFileHandler | None = None
+        self._console_handler = Log.ConsoleHandler()
+        self._queue_handler: Log.LazyQueueHandler | None = None
+        self._listener: Log.BatchQueueListener | None = None
         self._lock_file_dir = Path(tempfile.mkdtemp()).resolve()
 
         # configure logger
@@ -189,7 +321,13 @@ class Log:
         self._level = level.set()
         self.set_dest_folder(dest_folder)
 
+        # write pending records on exit. Forked workers (which exit without running atexit) write synchronously
+        atexit.register(self._stop_listener)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._stop_listener)
+
     def shutdown(self):
+        self._stop_listener()
         logging.shutdown()
         try:
             if self._lock_file_dir.exists():
@@ -205,15 +343,17 @@ class Log:
 
     def set_dest_folder(self, dest_folder: str | Path | None):
         """Activates / deactivates file logging, and sets destination folder"""
+        self._stop_listener()
+        self._remove_handler(self._file_handler)
         if not dest_folder:
-            self._remove_handler(self._file_handler)
             self._dest_path = None
             self._file_handler = None
+            self._start_listener()
             return
 
         self._dest_path = Path(dest_folder).resolve()
 
-        self._file_handler = ConcurrentTimedRotatingFileHandler(
+        self._file_handler = Log.BatchFileHandler(
             filename=(self._dest_path / Log.FILENAME).resolve(),
             when='midnight',     # rotate at midnight
             interval=1,          # every 1 day
@@ -222,14 +362,53 @@ class Log:
             utc=False,           # set to True if you want UTC-based rotation
             lock_file_directory=str(self._lock_file_dir),
         )
-        self._add_handler(self._file_handler)
+        self._file_handler.setFormatter(self._log_formatter)
+        self._start_listener()
+
+    def flush(self):
+        """Write pending log records (blocks until the background writer is idle)."""
+        if self._listener is not None:
+            self._stop_listener()
+            self._start_listener()
+
+    @contextmanager
+    def paused(self) -> Generator[None, None, None]:
+        """Stop background writer while in context, e.g., around ``fork()`` (records are written synchronously, meanwhile)."""
+        running = self._listener is not None
+        self._stop_listener()
+        try:
+            yield
+        finally:
+            if running:
+                self._start_listener()
+
+    def _get_handlers(self) -> list[Handler]:
+        return [handler for handler in (self._file_handler, self._console_handler) if handler is not None]
+
+    def _start_listener(self):
+        for handler in self._get_handlers():
+            self._remove_handler(handler)  # used directly while listener was stopped
+        self._queue_handler = Log.LazyQueueHandler(queue.SimpleQueue())
+        self._listener = Log.BatchQueueListener(self._queue_handler.queue, *self._get_handlers())
+        self._listener.start()
+        self._add_handler(self._queue_handler)
+
+    def _stop_listener(self):
+        """Write pending records and stop background writer (handlers are used directly, afterwards)."""
+        if self._listener is None:
+            return
+        self._remove_handler(self._queue_handler)
+        self._listener.stop()
+        self._listener = None
+        self._queue_handler = None
+        for handler in self._get_handlers():
+            self._add_handler(handler)
 
     def _remove_handler(self, handler: Handler | None):
         if handler:
             logging.getLogger().removeHandler(handler)
 
     def _add_handler(self, handler: Handler):
-        handler.setFormatter(self._log_formatter)
         logging.getLogger().addHandler(handler)
 
 
@@ -0,0 +1,183 @@
+# src\file_conversor\config\probe_cache.py
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, cast
+
+# user provided imports
+from file_conversor.config.environment import Environment
+from file_conversor.config.log import LOG
+
+
+logger = LOG.getLogger(__name__)
+
+
+class ProbeCache:
+    """
+    Persistent cache of dependency probes (executable lookups in PATH, tool versions, capabilities), shared by backends and runs.
+
+    Executable lookups are keyed by the PATH environment, and validated by the executable stamp (mtime / size).
+    Tool capabilities (e.g., ``tesseract --list-langs``) are validated by the tool stamp (and optional watched paths).
+    Missing executables are never cached (so installed dependencies are found right away).
+    Use ``clear()`` (``--refresh-probes``) to force new probes.
+    """
+    _CACHE_FILE = "probes.json"
+
+    __lock = threading.RLock()
+    __entries: dict[str, dict[str, Any]] | None = None
+    __pending: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def get_file(cls) -> Path:
+        """Get probe cache file."""
+        return Environment.UserFolder.cache() / Environment.get_app_name() / cls._CACHE_FILE
+
+    @classmethod
+    def get_stamp(cls, path: str | Path) -> str | None:
+        """Get file / folder stamp (mtime and size), or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    @classmethod
+    def __get_env_key(cls) -> str:
+        return hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+
+    @classmethod
+    def __load(cls) -> dict[str, dict[str, Any]]:
+        try:
+            entries: Any = json.loads(cls.get_file().read_text())
+        except (OSError, ValueError):
+            return {}
+        return cast("dict[str, dict[str, Any]]", entries) if isinstance(entries, dict) else {}
+
+    @classmethod
+    def __get_entries(cls) -> dict[str, dict[str, Any]]:
+        if cls.__entries is None:
+            cls.__entries = cls.__load()
+            logger.debug(f"Probe cache loaded ({len(cls.__entries)} entries)")
+        return cls.__entries
+
+    @classmethod
+    def __is_valid(cls, entry: dict[str, Any] | None, watch: Iterable[str]) -> bool:
+        if not entry:
+            return False
+        stamps: dict[str, str | None] = entry.get("stamps", {})
+        if any(path not in stamps for path in watch):
+            return False
+        return all(cls.get_stamp(path) == stamp for path, stamp in stamps.items())
+
+    @classmethod
+    def __store(cls, key: str, entry: dict[str, Any]):
+        cls.__get_entries()[key] = entry
+        cls.__pending[key] = entry
+        cls.flush()
+
+    @classmethod
+    def which(cls, name: str | Path) -> Path | None:
+        """
+        Find executable in PATH (cached ``shutil.which()``).
+
+        :param name: Executable name.
+
+        :return: Resolved executable path, or None if not found.
+        """
+        key = f"which:{name}:{cls.__get_env_key()}"
+        with cls.__lock:
+            entry = cls.__get_entries().get(key)
+            if entry and cls.__is_valid(entry, ()):
+                return Path(entry["value"])
+
+        path_str = shutil.which(name)
+        if not path_str:
+            return None
+        path = Path(path_str).resolve()
+        with cls.__lock:
+            cls.__store(key, {"value": str(path), "stamps": {str(path): cls.get_stamp(path)}})
+        return path
+
+    @classmethod
+    def get(cls, tool: str | Path, name: str, compute: Callable[[], Any], watch: Iterable[str | Path] = ()) -> Any:
+        """
+        Get a cached tool probe (e.g., version, capabilities), computing it if missing or stale.
+
+        :param tool: Tool executable path.
+        :param name: Probe name (e.g., ``--list-langs``).
+        :param compute: Function that probes the tool. Its result must be JSON serializable.
+        :param watch: Additional paths that invalidate the probe when changed (e.g., data folders). Defaults to ().
+        """
+        key = f"probe:{Path(tool)}:{name}"
+        watched = [str(Path(tool)), *(str(path) for path in watch)]
+        with cls.__lock:
+            entry = cls.__get_entries().get(key)
+            if entry and cls.__is_valid(entry, watched):
+                return entry["value"]
+
+        value = compute()
+        with cls.__lock:
+            stamps: dict[str, str | None] = dict(entry.get("stamps", {})) if entry else {}
+            stamps.update({path: cls.get_stamp(path) for path in watched})
+            cls.__store(key, {"value": value, "stamps": stamps})
+        return value
+
+    @classmethod
+    def invalidate(cls, tool: str | Path, name: str):
+        """Invalidate a tool probe (e.g., after installing tool data)."""
+        key = f"probe:{Path(tool)}:{name}"
+        with cls.__lock:
+            cls.__get_entries().pop(key, None)
+            cls.__pending[key] = {}
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        """Merge probes of this process into the cache file (empty entries are removed)."""
+        with cls.__lock:
+            if not cls.__pending:
+                return
+            entries = cls.__load()
+            for key, entry in cls.__pending.items():
+                if entry:
+                    entries[key] = entry
+                else:
+                    entries.pop(key, None)
+            cls.__pending.clear()
+
+            cache_file = cls.get_file()
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_text(json.dumps(entries))
+                os.replace(tmp_file, cache_file)  # atomic, readers never see partial files
+            except OSError as e:
+                logger.debug(f"Cannot save probe cache: {repr(e)}")
+            finally:
+                tmp_file.unlink(missing_ok=True)
+
+    @classmethod
+    def reload(cls):
+        """Save pending probes, and reload cached probes from disk on next use (e.g., cache file updated by other processes)."""
+        with cls.__lock:
+            cls.flush()
+            cls.__entries = None
+
+    @classmethod
+    def clear(cls):
+        """Clear cached probes (memory and disk)."""
+        with cls.__lock:
+            cls.__entries = {}
+            cls.__pending.clear()
+            cls.get_file().unlink(missing_ok=True)
+        logger.debug("Probe cache cleared")
+
+
+__all__ = [
+    "ProbeCache",
+]
@@ -0,0 +1,206 @@
+# src\file_conversor\config\process_accounting.py
+
+import contextlib
+import contextvars
+import sys
+import threading
+import time
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Generator
+
+# user provided imports
+from file_conversor.config.log import LOG
+
+
+logger = LOG.getLogger(__name__)
+
+
+class ProcessAccounting:
+    """
+    Resource accounting of external tools (wall time, user / system CPU time, max RSS) and in-process steps (``tracemalloc`` peak).
+
+    Usages are only recorded after ``enable()``. Child process usage is collected with ``os.wait4()`` (POSIX only).
+    Usages are attached to the current collector (see ``collect()``), and summarized per tool (see ``get_summary()``).
+    """
+    PYTHON_TOOL = "in-process"
+    """ tool name of in-process steps """
+
+    @dataclass
+    class Usage:
+        tool: str
+        wall_time: float = 0.0
+        """ seconds """
+        user_time: float = 0.0
+        """ seconds """
+        system_time: float = 0.0
+        """ seconds """
+        max_rss: int = 0
+        """ peak resident memory (bytes), 0 if unknown """
+        peak_memory: int = 0
+        """ peak python heap (bytes, ``tracemalloc``), in-process steps only. 0 if unknown (e.g., parallel thread jobs) """
+
+        def to_dict(self) -> dict[str, Any]:
+            return asdict(self)
+
+    __lock = threading.Lock()
+    __enabled: bool = False
+    __tracing: bool = False  # tracemalloc started by measure()
+    __totals: dict[str, dict[str, float]] = {}
+    __collector: contextvars.ContextVar[list['ProcessAccounting.Usage'] | None] = contextvars.ContextVar("fc_accounting_collector", default=None)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.__enabled
+
+    @classmethod
+    def enable(cls):
+        """Enable resource accounting."""
+        cls.__enabled = True
+        logger.debug("Resource accounting enabled")
+
+    @classmethod
+    def get_tool(cls, executable: str | Path) -> str:
+        """Get tool name of an executable (e.g., ``/usr/bin/ffmpeg`` => ``ffmpeg``)."""
+        return Path(executable).stem.lower()
+
+    @classmethod
+    def from_rusage(cls, tool: str, wall_time: float, rusage: Any) -> 'ProcessAccounting.Usage':
+        """
+        Create usage from ``os.wait4()`` / ``resource.getrusage()`` results.
+
+        :param tool: Tool name.
+        :param wall_time: Wall time (seconds).
+        :param rusage: ``resource.struct_rusage``.
+        """
+        # ru_maxrss is in kilobytes on Linux, bytes on macOS
+        max_rss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+        return cls.Usage(tool=tool, wall_time=wall_time, user_time=rusage.ru_utime, system_time=rusage.ru_stime, max_rss=max_rss)
+
+    @classmethod
+    def get_collector(cls) -> list['ProcessAccounting.Usage'] | None:
+        """Get current collector (usages recorded by current thread / task), or None."""
+        return cls.__collector.get()
+
+    @classmethod
+    def set_collector(cls, collector: list['ProcessAccounting.Usage'] | None):
+        """Set current collector (e.g., inside asyncio tasks that run on behalf of another thread)."""
+        cls.__collector.set(collector)
+
+    @classmethod
+    @contextlib.contextmanager
+    def collect(cls) -> Generator[list['ProcessAccounting.Usage'], None, None]:
+        """Collect usages recorded by current thread, inside the ``with`` block (e.g., a batch step)."""
+        usages: list[ProcessAccounting.Usage] = []
+        token = cls.__collector.set(usages)
+        try:
+            yield usages
+        finally:
+            cls.__collector.reset(token)
+
+    @classmethod
+    def record(cls, usage: 'ProcessAccounting.Usage'):
+        """
+        Record a usage (no-op if accounting is disabled).
+
+        :param usage: Resource usage.
+        """
+        if not cls.__enabled:
+            return
+        collector = cls.__collector.get()
+        if collector is not None:
+            collector.append(usage)
+        cls.add_totals([usage])
+
+    @classmethod
+    def add_totals(cls, usages: list['ProcessAccounting.Usage']):
+        """Add usages to per-tool totals (e.g., usages relayed by process workers)."""
+        with cls.__lock:
+            for usage in usages:
+                total = cls.__totals.setdefault(usage.tool, {
+                    "count": 0, "wall_time": 0.0, "user_time": 0.0, "system_time": 0.0, "max_rss": 0, "peak_memory": 0,
+                })
+                total["count"] += 1
+                total["wall_time"] += usage.wall_time
+                total["user_time"] += usage.user_time
+                total["system_time"] += usage.system_time
+                total["max_rss"] = max(total["max_rss"], usage.max_rss)
+                total["peak_memory"] = max(total["peak_memory"], usage.peak_memory)
+
+    @classmethod
+    @contextlib.contextmanager
+    def measure(cls, tool: str = PYTHON_TOOL, trace_memory: bool = True) -> Generator[None, None, None]:
+        """
+        Measure in-process work inside the ``with`` block (wall time, CPU time of current thread, ``tracemalloc`` peak).
+
+        ``tracemalloc`` is process-wide (peaks of parallel threads overlap), and slows down every allocation while tracing.
+        Tracing is started on first use, and stopped by ``stop_tracing()`` (e.g., at batch end).
+
+        :param tool: Tool name. Defaults to ``PYTHON_TOOL``.
+        :param trace_memory: Measure python heap peak. Use False if other threads run measured work in parallel (peak is unknown). Defaults to True.
+        """
+        if not cls.__enabled:
+            yield
+            return
+        import tracemalloc
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            cls.__tracing = True
+        baseline = 0
+        if trace_memory:
+            baseline, _peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start_cpu = cls._get_thread_cpu()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start
+            end_cpu = cls._get_thread_cpu()
+            usage = cls.Usage(tool=tool, wall_time=wall_time)
+            if trace_memory:
+                _current, peak = tracemalloc.get_traced_memory()
+                usage.peak_memory = max(peak - baseline, 0)
+            if start_cpu is not None and end_cpu is not None:
+                usage.user_time = end_cpu[0] - start_cpu[0]
+                usage.system_time = end_cpu[1] - start_cpu[1]
+            cls.record(usage)
+
+    @classmethod
+    def stop_tracing(cls):
+        """Stop ``tracemalloc`` tracing started by ``measure()`` (tracing started by the user is kept)."""
+        if not cls.__tracing:
+            return
+        import tracemalloc
+
+        tracemalloc.stop()
+        cls.__tracing = False
+
+    @classmethod
+    def _get_thread_cpu(cls) -> tuple[float, float] | None:
+        """Get (user, system) CPU time of current thread, or None if not supported."""
+        try:
+            import resource
+            rusage = resource.getrusage(resource.RUSAGE_THREAD)  # pyright: ignore[reportAttributeAccessIssue]
+        except (ImportError, AttributeError, OSError):
+            return None
+        return rusage.ru_utime, rusage.ru_stime
+
+    @classmethod
+    def get_summary(cls) -> dict[str, dict[str, float]]:
+        """Get per-tool totals (count, wall / user / system time, max RSS, peak memory)."""
+        with cls.__lock:
+            return {tool: dict(total) for tool, total in cls.__totals.items()}
+
+    @classmethod
+    def reset(cls):
+        """Clear per-tool totals."""
+        with cls.__lock:
+            cls.__totals = {}
+
+
+__all__ = [
+    "ProcessAccounting",
+]
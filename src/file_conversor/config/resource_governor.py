@@ -0,0 +1,224 @@
+# src\file_conversor\config\resource_governor.py
+
+import contextlib
+import itertools
+import os
+import threading
+import time
+
+from collections import deque
+from typing import Any, Generator
+
+# user provided imports
+from file_conversor.config.config import Configuration
+from file_conversor.config.environment import Environment
+from file_conversor.config.log import LOG
+from file_conversor.config.state import STATE
+
+
+logger = LOG.getLogger(__name__)
+
+
+class ResourceGovernor:
+    """
+    Process-wide CPU token and memory governor.
+
+    Each batch job acquires CPU tokens (one token = one CPU thread) before running, so parallel jobs never oversubscribe the machine.
+    Backends size their thread pools (codec threads, ocrmypdf jobs, etc) using ``get_threads()``.
+
+    Jobs with a peak memory estimate are only admitted if they fit the memory budget (huge jobs run alone).
+    """
+    AUTO_MEMORY_BUDGET_RATIO = 0.75
+    """ memory budget, if not set (ratio of physical memory) """
+    SHARED_MEMORY_POLL = 0.05
+    """ seconds between admission attempts of process workers (see ``share_memory()``) """
+
+    __lock = threading.Condition()
+    __free_cpus: list[int] | None = None  # free CPU ids (tokens)
+    __total: int = 0
+    __local = threading.local()
+
+    __memory_lock = threading.Condition()
+    __memory_used: int = 0
+    __memory_queue: deque[int] = deque()  # waiting tickets (FIFO admission)
+    __memory_tickets = itertools.count()
+    __memory_shared: Any = None  # memory counter shared by process workers (multiprocessing.Value)
+
+    @classmethod
+    def _get_cpus(cls) -> list[int]:
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))  # CPUs available to this process
+        return list(range(Environment.get_cpu_count()))
+
+    @classmethod
+    def set_partition(cls, index: int, count: int):
+        """
+        Restrict CPU tokens of this process to a partition of the CPUs (process workers, called after fork).
+
+        :param index: Partition index (0-based, wraps around if ``count`` > CPUs).
+        :param count: Number of partitions.
+        """
+        cpus = cls._get_cpus()[:cls.get_total_tokens()]
+        share = max(1, len(cpus) // max(count, 1))
+        start = (index * share) % len(cpus)
+        with cls.__lock:
+            cls.__free_cpus = cpus[start:start + share]
+            cls.__total = len(cls.__free_cpus)
+        logger.debug(f"Process worker {index} owns CPUs {cls.__free_cpus}")
+
+    @classmethod
+    def get_total_tokens(cls) -> int:
+        """Total CPU tokens (``cpu_tokens`` config, or number of CPU threads available)."""
+        total = len(cls._get_cpus())
+        cpu_tokens = Configuration.get().cpu_tokens
+        return min(cpu_tokens, total) if cpu_tokens > 0 else total
+
+    @classmethod
+    def get_threads(cls) -> int:
+        """Get number of threads granted to current job (all CPU tokens, if not running inside a governed job)."""
+        granted: list[int] | None = getattr(cls.__local, "cpus", None)
+        return len(granted) if granted else cls.get_total_tokens()
+
+    @classmethod
+    def is_governed(cls) -> bool:
+        """Check if current thread is running inside a governed job."""
+        return bool(getattr(cls.__local, "cpus", None))
+
+    @classmethod
+    def get_share(cls, jobs: int) -> int:
+        """
+        Get fair CPU share for each of ``jobs`` parallel jobs.
+
+        :param jobs: Number of parallel jobs.
+        """
+        return max(1, cls.get_total_tokens() // max(jobs, 1))
+
+    @classmethod
+    @contextlib.contextmanager
+    def acquire(cls, tokens: int, affinity: bool | None = None) -> Generator[int, None, None]:
+        """
+        Acquire CPU tokens for current job (blocks until available). Nested calls reuse the outer grant.
+
+        :param tokens: Number of tokens (capped to total tokens).
+        :param affinity: Pin current thread (and its child processes) to the granted CPUs. Defaults to None (use ``cpu_affinity`` config).
+
+        :return: Number of granted threads.
+        """
+        if cls.is_governed():
+            yield cls.get_threads()
+            return
+
+        affinity = Configuration.get().cpu_affinity if affinity is None else affinity
+        with cls.__lock:
+            if cls.__free_cpus is None:
+                cls.__free_cpus = cls._get_cpus()[:cls.get_total_tokens()]
+                cls.__total = len(cls.__free_cpus)
+            tokens = max(1, min(tokens, cls.__total))
+            cls.__lock.wait_for(lambda: len(cls.__free_cpus or []) >= tokens)
+            granted, cls.__free_cpus = cls.__free_cpus[:tokens], cls.__free_cpus[tokens:]
+
+        original_affinity: set[int] | None = None
+        if affinity and hasattr(os, "sched_setaffinity"):
+            original_affinity = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, granted)  # 0 = calling thread (linux)
+            logger.debug("Job pinned to CPUs %s", granted)
+
+        cls.__local.cpus = granted
+        try:
+            yield len(granted)
+        finally:
+            cls.__local.cpus = None
+            if original_affinity is not None:
+                os.sched_setaffinity(0, original_affinity)
+            with cls.__lock:
+                cls.__free_cpus = sorted([*(cls.__free_cpus or []), *granted])
+                cls.__lock.notify_all()
+
+    @classmethod
+    def get_total_memory(cls) -> int:
+        """Get physical memory size in bytes (0 if unknown)."""
+        try:
+            return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (AttributeError, ValueError, OSError):
+            return 0
+
+    @classmethod
+    def get_memory_budget(cls) -> int:
+        """Get memory budget in bytes (``--memory-budget`` option, or ``AUTO_MEMORY_BUDGET_RATIO`` of physical memory). 0 = unlimited."""
+        from file_conversor.utils.formatters import parse_bytes
+        budget = parse_bytes(STATE.memory_budget.value)
+        if budget > 0:
+            return budget
+        return int(cls.get_total_memory() * cls.AUTO_MEMORY_BUDGET_RATIO)
+
+    @classmethod
+    def share_memory(cls, counter: Any):
+        """
+        Admit jobs against memory used by all process workers (called after fork).
+
+        :param counter: Memory counter in bytes, created before fork (``multiprocessing.Value``). None = per-process accounting.
+        """
+        cls.__memory_shared = counter
+
+    @classmethod
+    @contextlib.contextmanager
+    def acquire_memory(cls, nbytes: int, budget: int | None = None) -> Generator[None, None, None]:
+        """
+        Admit job with estimated peak memory (blocks until it fits the budget). Jobs are admitted in arrival order.
+
+        Jobs larger than the budget are admitted alone (after all running jobs finish).
+
+        :param nbytes: Estimated peak memory in bytes (0 = unknown, admitted immediately).
+        :param budget: Memory budget in bytes. Defaults to None (use ``get_memory_budget()``). 0 = unlimited.
+        """
+        budget = cls.get_memory_budget() if budget is None else budget
+        if nbytes <= 0 or budget <= 0:
+            yield
+            return
+
+        shared = cls.__memory_shared
+        if shared is not None:
+            with cls.__acquire_shared_memory(shared, nbytes, budget):
+                yield
+            return
+
+        with cls.__memory_lock:
+            ticket = next(cls.__memory_tickets)
+            cls.__memory_queue.append(ticket)
+            if cls.__memory_used > 0 and cls.__memory_used + nbytes > budget:
+                logger.debug("Job waiting for memory (%d bytes, %d / %d bytes in use) ...", nbytes, cls.__memory_used, budget)
+            cls.__memory_lock.wait_for(lambda: cls.__memory_queue[0] == ticket and (cls.__memory_used == 0 or cls.__memory_used + nbytes <= budget))
+            cls.__memory_queue.popleft()
+            cls.__memory_used += nbytes
+            cls.__memory_lock.notify_all()  # next ticket may fit too
+        try:
+            yield
+        finally:
+            with cls.__memory_lock:
+                cls.__memory_used -= nbytes
+                cls.__memory_lock.notify_all()
+
+    @classmethod
+    @contextlib.contextmanager
+    def __acquire_shared_memory(cls, shared: Any, nbytes: int, budget: int) -> Generator[None, None, None]:
+        waiting = False
+        while True:
+            with shared.get_lock():
+                if shared.value == 0 or shared.value + nbytes <= budget:
+                    shared.value += nbytes
+                    break
+                used = shared.value
+            if not waiting:
+                logger.debug("Job waiting for memory (%d bytes, %d / %d bytes in use by all workers) ...", nbytes, used, budget)
+                waiting = True
+            time.sleep(cls.SHARED_MEMORY_POLL)
+        try:
+            yield
+        finally:
+            with shared.get_lock():
+                shared.value -= nbytes
+
+
+__all__ = [
+    "ResourceGovernor",
+]
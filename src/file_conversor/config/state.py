@@ -2,8 +2,10 @@
 
 
 from dataclasses import dataclass
+from typing import Any
 
 # user provided imports
+from file_conversor.config.config import Configuration
 from file_conversor.config.log import LOG, Log
 
 
@@ -74,6 +76,129 @@ class StateOverwriteOutput:
         logger.debug(f"Output overwrite mode: [bold]{'[blue]ENABLED' if self.enabled else '[red]DISABLED'}[/]")
 
 
+class StateResume:
+    def __init__(self, enabled: bool = False) -> None:
+        super().__init__()
+        self.__enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.__enabled = value
+        logger.debug(f"Resume mode: [bold]{'[blue]ENABLED' if self.enabled else '[red]DISABLED'}[/]")
+
+
+class StatePlan:
+    def __init__(self, enabled: bool = False) -> None:
+        super().__init__()
+        self.__enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.__enabled = value
+        logger.debug(f"Plan mode (dry run): [bold]{'[blue]ENABLED' if self.enabled else '[red]DISABLED'}[/]")
+
+
+class StateBackground:
+    def __init__(self, enabled: bool = False) -> None:
+        super().__init__()
+        self.__enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.__enabled = value
+        logger.debug(f"Background execution class: [bold]{'[blue]ENABLED' if self.enabled else '[red]DISABLED'}[/]")
+
+
+class StateSkipUpToDate:
+    def __init__(self, enabled: bool = False) -> None:
+        super().__init__()
+        self.__enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self.__enabled = value
+        logger.debug(f"Skip up-to-date outputs: [bold]{'[blue]ENABLED' if self.enabled else '[red]DISABLED'}[/]")
+
+
+class StateInputFilter:
+    def __init__(self, include: list[str] | None = None, exclude: list[str] | None = None) -> None:
+        super().__init__()
+        self.__include = include or []
+        self.__exclude = exclude or []
+
+    @property
+    def include(self) -> list[str]:
+        """Include globs for files found inside input folders"""
+        return self.__include
+
+    @include.setter
+    def include(self, value: list[str]) -> None:
+        self.__include = value
+        logger.debug(f"Include globs: [bold blue]{value}[/]")
+
+    @property
+    def exclude(self) -> list[str]:
+        """Exclude globs for files found inside input folders"""
+        return self.__exclude
+
+    @exclude.setter
+    def exclude(self, value: list[str]) -> None:
+        self.__exclude = value
+        logger.debug(f"Exclude globs: [bold blue]{value}[/]")
+
+
+class StateJobs:
+    def __init__(self, value: int | None = None) -> None:
+        super().__init__()
+        self.__value = value
+
+    @property
+    def value(self) -> int:
+        """Parallel jobs (defaults to ``jobs`` config, if not set)"""
+        if self.__value is None:
+            return Configuration.get().jobs
+        return self.__value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self.__value = value
+        logger.debug(f"Parallel jobs: [bold blue]{value if value > 0 else 'AUTO'}[/]")
+
+
+class StateMemoryBudget:
+    def __init__(self, value: str | None = None) -> None:
+        super().__init__()
+        self.__value = value
+
+    @property
+    def value(self) -> str:
+        """Memory budget for parallel jobs, e.g. 8G (defaults to ``memory_budget`` config, if not set)"""
+        if self.__value is None:
+            return Configuration.get().memory_budget
+        return self.__value
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self.__value = value
+        logger.debug(f"Memory budget: [bold blue]{value if value != '0' else 'AUTO'}[/]")
+
+
 @dataclass
 class StatesDataModel:
     """States data structure"""
@@ -81,6 +206,71 @@ class StatesDataModel:
     overwrite_output: StateOverwriteOutput
     loglevel: StateLogLevel
     logfile: StateLogfile
+    jobs: StateJobs
+    resume: StateResume
+    plan: StatePlan
+    background: StateBackground
+    skip_up_to_date: StateSkipUpToDate
+    input_filter: StateInputFilter
+    memory_budget: StateMemoryBudget
+
+    def reset(self) -> None:
+        """Reset states to defaults (e.g., before running another CLI invocation in the same process)."""
+        self.progress = StateProgressBar()
+        self.overwrite_output = StateOverwriteOutput()
+        self.loglevel = StateLogLevel()
+        self.logfile = StateLogfile()
+        self.jobs = StateJobs()
+        self.resume = StateResume()
+        self.plan = StatePlan()
+        self.background = StateBackground()
+        self.skip_up_to_date = StateSkipUpToDate()
+        self.input_filter = StateInputFilter()
+        self.memory_budget = StateMemoryBudget()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert states to dictionary (e.g., to run a job with the same options in another process)."""
+        return {
+            "progress": self.progress.enabled,
+            "overwrite_output": self.overwrite_output.enabled,
+            "loglevel": self.loglevel.get().name,
+            "logfile": self.logfile.enabled,
+            "jobs": self.jobs.value,
+            "resume": self.resume.enabled,
+            "plan": self.plan.enabled,
+            "background": self.background.enabled,
+            "skip_up_to_date": self.skip_up_to_date.enabled,
+            "include": self.input_filter.include,
+            "exclude": self.input_filter.exclude,
+            "memory_budget": self.memory_budget.value,
+        }
+
+    def from_dict(self, data: dict[str, Any]) -> None:
+        """Update states from dictionary (see ``to_dict()``). Missing keys are kept unchanged."""
+        if "progress" in data:
+            self.progress.enabled = data["progress"]
+        if "overwrite_output" in data:
+            self.overwrite_output.enabled = data["overwrite_output"]
+        if "loglevel" in data:
+            self.loglevel.level = Log.Level[data["loglevel"]]
+        if "logfile" in data:
+            self.logfile.enabled = data["logfile"]
+        if "jobs" in data:
+            self.jobs.value = data["jobs"]
+        if "resume" in data:
+            self.resume.enabled = data["resume"]
+        if "plan" in data:
+            self.plan.enabled = data["plan"]
+        if "background" in data:
+            self.background.enabled = data["background"]
+        if "skip_up_to_date" in data:
+            self.skip_up_to_date.enabled = data["skip_up_to_date"]
+        if "include" in data:
+            self.input_filter.include = data["include"]
+        if "exclude" in data:
+            self.input_filter.exclude = data["exclude"]
+        if "memory_budget" in data:
+            self.memory_budget.value = data["memory_budget"]
 
 
 # STATE controller dict class
@@ -89,6 +279,13 @@ STATE = StatesDataModel(
     overwrite_output=StateOverwriteOutput(),
     loglevel=StateLogLevel(),
     logfile=StateLogfile(),
+    jobs=StateJobs(),
+    resume=StateResume(),
+    plan=StatePlan(),
+    background=StateBackground(),
+    skip_up_to_date=StateSkipUpToDate(),
+    input_filter=StateInputFilter(),
+    memory_budget=StateMemoryBudget(),
 )
 
 __all__ = [
@@ -0,0 +1,135 @@
+# src\file_conversor\config\tracer.py
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, Generator
+
+# user provided imports
+from file_conversor.config.log import LOG
+
+
+logger = LOG.getLogger(__name__)
+
+_IMPORT_NS = time.perf_counter_ns()
+
+
+class Tracer:
+    """
+    Lightweight tracing spans, exported in Chrome trace-event format (open in Perfetto / chrome://tracing).
+
+    Spans are only recorded after ``enable()``. Forked process workers save their spans with ``flush()``.
+    """
+    __lock = threading.Lock()
+    __path: Path | None = None
+    __origin_ns: int = 0
+    __events: list[dict[str, Any]] = []
+    __threads: set[tuple[int, int]] = set()  # (pid, tid) with name metadata recorded
+
+    @classmethod
+    def _get_process_start_ns(cls) -> int:
+        """Get process start time (``perf_counter_ns()`` clock). Falls back to tracer import time, if unknown."""
+        try:
+            with open("/proc/self/stat", "r") as f:
+                start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])  # field 22 (starttime)
+            uptime_ns = time.clock_gettime_ns(time.CLOCK_BOOTTIME)  # pyright: ignore[reportAttributeAccessIssue]
+            elapsed_ns = uptime_ns - start_ticks * 1_000_000_000 // os.sysconf("SC_CLK_TCK")
+            return time.perf_counter_ns() - max(elapsed_ns, 0)
+        except (OSError, ValueError, IndexError, AttributeError):
+            return _IMPORT_NS
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.__path is not None
+
+    @classmethod
+    def enable(cls, path: Path):
+        """
+        Enable tracing (records a ``startup`` span, from process start until now).
+
+        :param path: Output trace file (.json).
+        """
+        with cls.__lock:
+            cls.__path = path
+            cls.__origin_ns = cls._get_process_start_ns()
+            cls.__events = []
+            cls.__threads = set()
+        cls._add_event("startup", "python", cls.__origin_ns, time.perf_counter_ns())
+        logger.debug(f"Tracing enabled: [bold blue]{path}[/]")
+
+    @classmethod
+    def _add_event(cls, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any] | None = None):
+        pid, tid = os.getpid(), threading.get_native_id()
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",  # complete event
+            "ts": (start_ns - cls.__origin_ns) / 1000.0,  # microseconds
+            "dur": (end_ns - start_ns) / 1000.0,
+            "pid": pid,
+            "tid": tid,
+            "args": args or {},
+        }
+        with cls.__lock:
+            if (pid, tid) not in cls.__threads:
+                cls.__threads.add((pid, tid))
+                cls.__events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": threading.current_thread().name}})
+            cls.__events.append(event)
+
+    @classmethod
+    @contextlib.contextmanager
+    def span(cls, name: str, category: str = "", **args: Any) -> Generator[None, None, None]:
+        """
+        Record a span around the ``with`` block (no-op if tracing is disabled).
+
+        :param name: Span name.
+        :param category: Span category (e.g., step, process, backend).
+        :param args: Span arguments (shown in trace viewer).
+        """
+        if cls.__path is None:
+            yield
+            return
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            cls._add_event(name, category, start_ns, time.perf_counter_ns(), {k: str(v) for k, v in args.items()})
+
+    @classmethod
+    def flush(cls):
+        """Append spans recorded by this (forked worker) process to a partial trace file, merged by ``save()``."""
+        if cls.__path is None:
+            return
+        with cls.__lock:
+            events, cls.__events = cls.__events, []
+        if not events:
+            return
+        with open(f"{cls.__path}.{os.getpid()}.part", "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(event) + "\n" for event in events)
+
+    @classmethod
+    def save(cls):
+        """Save trace file (merging partial traces of process workers)."""
+        if cls.__path is None:
+            return
+        path = cls.__path
+        with cls.__lock:
+            events = list(cls.__events)
+
+        for part in path.parent.glob(f"{path.name}.*.part"):
+            with open(part, "r", encoding="utf-8") as f:
+                events.extend(json.loads(line) for line in f if line.strip())
+            part.unlink()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        logger.info(f"Trace saved: '{path}'")
+
+
+__all__ = [
+    "Tracer",
+]
@@ -0,0 +1,194 @@
+# src\file_conversor\daemon_protocol.py
+
+"""
+Worker daemon wire protocol (JSON lines over a Unix domain socket).
+
+This module only uses the standard library (and platformdirs), so the CLI entry point can forward
+invocations to a running daemon before importing the app.
+"""
+
+import contextlib
+import json
+import os
+import socket
+import stat
+import sys
+
+from pathlib import Path
+from typing import Any
+
+
+class DaemonProtocol:
+    """
+    Worker daemon wire protocol.
+
+    Requests (one per connection):
+
+    - ``{"type": "status"}`` => daemon status.
+    - ``{"type": "shutdown"}`` => ``{"type": "ok"}``.
+    - ``{"type": "cli", "argv": [...]}`` => CLI invocation. Replies ``{"type": "exit", "code": int}``.
+    - ``{"type": "job", "command": "module:QualName", "options": {...}}`` => command model (``model_dump()``).
+      Replies ``progress`` / ``workers`` events and ``{"type": "done", "result": {...}}`` or ``{"type": "error", ...}``.
+
+    ``cli`` and ``job`` requests carry the client working directory and stdin / stdout / stderr
+    (passed as file descriptors), so output, prompts and progress bars reach the client terminal.
+    """
+    APP_NAME = "file_conversor"
+    SOCKET_NAME = "daemon.sock"
+    MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+    NO_DAEMON_OPTIONS = ("--no-daemon", "-nd")
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """Check if platform supports the daemon (Unix domain sockets with file descriptor passing)."""
+        return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+    @classmethod
+    def check_private_dir(cls, path: Path):
+        """
+        Check that folder is owned by the current user, and not accessible by others (e.g., pre-created in a shared temp folder).
+
+        :param path: Folder.
+
+        :raises PermissionError: if folder is not private.
+        """
+        path_stat = path.lstat()  # symlinks are not followed
+        if not stat.S_ISDIR(path_stat.st_mode) or path_stat.st_uid != os.getuid() or path_stat.st_mode & 0o077:
+            raise PermissionError(f"Daemon folder '{path}' must be a directory owned by the current user, with mode 0700")
+
+    @classmethod
+    def get_socket_path(cls) -> Path:
+        """
+        Get daemon socket path (user runtime folder).
+
+        :raises PermissionError: if socket folder is not private (see ``check_private_dir()``).
+        """
+        import warnings
+
+        import platformdirs
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # XDG_RUNTIME_DIR not set (falls back to a temp folder)
+                runtime_path = platformdirs.user_runtime_path().resolve() / cls.APP_NAME
+            runtime_path.mkdir(parents=True, exist_ok=True, mode=0o700)
+        except OSError:
+            import tempfile
+            runtime_path = Path(tempfile.gettempdir()) / f"{cls.APP_NAME}-{os.getuid()}"
+            runtime_path.mkdir(exist_ok=True, mode=0o700)
+        cls.check_private_dir(runtime_path)
+        return runtime_path / cls.SOCKET_NAME
+
+    @classmethod
+    def get_std_fds(cls) -> dict[str, int]:
+        """Get file descriptors of stdin / stdout / stderr (name => fd), if available."""
+        fds: dict[str, int] = {}
+        for name in ("stdin", "stdout", "stderr"):
+            with contextlib.suppress(AttributeError, ValueError, OSError):  # redirected to a non-file object (e.g., tests, GUI)
+                fds[name] = getattr(sys, name).fileno()
+        return fds
+
+    @classmethod
+    def connect(cls, socket_path: Path | None = None) -> socket.socket | None:
+        """
+        Connect to daemon.
+
+        :param socket_path: Daemon socket. Defaults to None (use ``get_socket_path()``).
+
+        :return: Connected socket, or None if daemon is not running.
+        """
+        if not cls.is_supported():
+            return None
+        try:
+            socket_path = socket_path or cls.get_socket_path()
+        except PermissionError:
+            return None  # never hand stdin / stdout to a socket that other users may have created
+        if not socket_path.exists():
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pyright: ignore[reportAttributeAccessIssue]
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            sock.close()
+            return None
+        return sock
+
+    @classmethod
+    def send(cls, sock: socket.socket, message: dict[str, Any], fds: list[int] | None = None):
+        """
+        Send JSON message.
+
+        :param sock: Connected socket.
+        :param message: Message.
+        :param fds: File descriptors to pass along with the message. Defaults to None.
+        """
+        data = (json.dumps(message) + "\n").encode()
+        if fds:
+            sent = socket.send_fds(sock, [data], fds)
+            data = data[sent:]
+        sock.sendall(data)
+
+    @classmethod
+    def receive(cls, sock_file: Any) -> dict[str, Any] | None:
+        """
+        Receive JSON message.
+
+        :param sock_file: Socket file (``sock.makefile("rb")``).
+
+        :return: Message, or None if connection was closed.
+        """
+        line = sock_file.readline(cls.MAX_MESSAGE_SIZE)
+        if not line:
+            return None
+        return json.loads(line)
+
+    @classmethod
+    def send_request(cls, sock: socket.socket, message: dict[str, Any]):
+        """
+        Send request, with client working directory, environment and stdin / stdout / stderr.
+
+        :param sock: Connected socket.
+        :param message: Request message.
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+        std_fds = cls.get_std_fds()
+        cls.send(sock, {
+            **message,
+            "cwd": str(Path.cwd()),
+            "env": dict(os.environ),
+            "fds": list(std_fds),
+        }, fds=list(std_fds.values()))
+
+    @classmethod
+    def forward_cli(cls, argv: list[str], socket_path: Path | None = None) -> int | None:
+        """
+        Run CLI invocation in the daemon (thin client mode).
+
+        :param argv: CLI arguments (without program name).
+        :param socket_path: Daemon socket. Defaults to None (use ``get_socket_path()``).
+
+        :return: Exit code, or None if daemon is not running (or ``--no-daemon`` is used).
+        """
+        if any(arg in cls.NO_DAEMON_OPTIONS for arg in argv):
+            return None
+        sock = cls.connect(socket_path)
+        if sock is None:
+            return None
+        try:
+            with sock, sock.makefile("rb") as sock_file:
+                try:
+                    cls.send_request(sock, {"type": "cli", "argv": argv})
+                except OSError:
+                    return None  # daemon stopping (run in this process)
+                while (message := cls.receive(sock_file)) is not None:
+                    if message.get("type") == "exit":
+                        return int(message.get("code", 1))
+        except KeyboardInterrupt:
+            return 130  # daemon job stops when the connection closes
+        print("Daemon closed the connection before the job finished", file=sys.stderr)
+        return 1
+
+
+__all__ = [
+    "DaemonProtocol",
+]
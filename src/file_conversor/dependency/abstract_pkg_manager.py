@@ -4,13 +4,11 @@
 This module provides functionalities for handling external backends.
 """
 
-import shutil
-
 from abc import abstractmethod
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
-from file_conversor.config import LOG, Environment, get_translation
+from file_conversor.config import LOG, Environment, ProbeCache, get_translation
 from file_conversor.system.abstract_system import AbstractSystem
 
 
@@ -64,7 +62,7 @@ class AbstractPackageManager:
 
         # check if executable exists
         for executable, dependency in self._dependencies.items():
-            found_exe = shutil.which(executable)
+            found_exe = ProbeCache.which(executable)
             if not found_exe:
                 logger.warning(f"ABSTRACT PKG MANAGER - {_('Executable')} '{executable}' {_('not found')}. {_('Marking dependency')} '{dependency}' {_('for installation')}.")
                 missing_dependencies.add(dependency)
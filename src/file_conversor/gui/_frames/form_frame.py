@@ -92,6 +92,7 @@ class FormFrame(QFrame):
 
         self.cmd_thread_handler = CommandThreadHandler()
         self.cmd_thread_handler.progress_updated.connect(self.status_bar.setProgress)
+        self.cmd_thread_handler.workers_updated.connect(self.status_bar.setWorkers)
         self.cmd_thread_handler.finished.connect(self._on_finished_task)
 
     def addRow(self, label: str | QWidget, widget: QWidget | QLayout) -> None:
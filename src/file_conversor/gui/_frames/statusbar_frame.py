@@ -10,6 +10,9 @@ from file_conversor.utils import EmaEta
 
 
 class StatusBarFrame(QFrame):
+    MAX_WORKERS_SHOWN = 3
+    """ files in flight shown in the status bar (all are shown in the tooltip) """
+
     finished = Signal()
 
     def __init__(
@@ -30,6 +33,7 @@ class StatusBarFrame(QFrame):
         layout.setContentsMargins(*margins)
 
         self._label_message = QLabel("")
+        self._label_workers = QLabel("")
         self._label_eta = QLabel("")
 
         self._progress_bar = QProgressBar(minimum=0, maximum=100, value=0)
@@ -40,6 +44,7 @@ class StatusBarFrame(QFrame):
         layout.addWidget(self._label_message, alignment=Qt.AlignmentFlag.AlignVCenter)
         layout.addStretch()
         layout.addWidget(self._progress_bar, alignment=Qt.AlignmentFlag.AlignVCenter)
+        layout.addWidget(self._label_workers, alignment=Qt.AlignmentFlag.AlignVCenter)
         layout.addStretch()
         layout.addWidget(self._label_eta, alignment=Qt.AlignmentFlag.AlignVCenter)
 
@@ -58,12 +63,25 @@ class StatusBarFrame(QFrame):
             self.finished.emit()
         self._label_eta.setText(f"ETA: {self._eta.estimate_eta(value)}")
 
+    def setWorkers(self, workers: dict[str, float]):
+        """ Show files in flight (file name => progress) """
+        self._label_workers.setText(self.formatWorkers(workers))
+        self._label_workers.setToolTip("\n".join(f"{name}: {round(progress)}%" for name, progress in sorted(workers.items())))
+
+    @classmethod
+    def formatWorkers(cls, workers: dict[str, float]) -> str:
+        shown = [f"{name} ({round(progress)}%)" for name, progress in sorted(workers.items())[:cls.MAX_WORKERS_SHOWN]]
+        if len(workers) > cls.MAX_WORKERS_SHOWN:
+            shown.append(f"+{len(workers) - cls.MAX_WORKERS_SHOWN}")
+        return ", ".join(shown)
+
     def showMessage(self, message: str):
         self._label_message.setText(message)
 
     def startTask(self, message: str, finished_message: str = ""):
         self._eta = EmaEta()
         self.setProgress(0)
+        self.setWorkers({})
         self.showMessage(message)
         if finished_message:
             self.finished.connect(lambda: self.showMessage(finished_message))
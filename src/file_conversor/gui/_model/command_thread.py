@@ -5,6 +5,7 @@ from typing import override
 from PySide6.QtCore import QObject, QThread, Signal
 from PySide6.QtWidgets import QMessageBox
 
+from file_conversor.command.progress_aggregator import ProgressAggregator
 from file_conversor.config import LOG, get_translation
 from file_conversor.utils.protocols import CommandProtocol
 
@@ -15,12 +16,14 @@ logger = LOG.getLogger(__name__)
 
 class _CommandThread(QThread):
     progress_updated = Signal(float)
+    workers_updated = Signal(dict)  # files in flight (file name => progress)
     error = Signal(str)
 
     def __init__(self, command: CommandProtocol) -> None:
         super().__init__()
         self.command = command
-        self.command.set_progress_callback(self.progress_updated.emit)
+        self.aggregator = ProgressAggregator(self.progress_updated.emit, workers_callback=self.workers_updated.emit)
+        self.command.set_progress_callback(self.aggregator)
 
     @override
     def run(self) -> None:
@@ -31,10 +34,13 @@ class _CommandThread(QThread):
         except Exception as e:
             logger.error(f"CommandThread - {e}")
             self.error.emit(str(e))
+        finally:
+            self.aggregator.flush()
 
 
 class CommandThreadHandler(QObject):
     progress_updated = Signal(float)
+    workers_updated = Signal(dict)
     finished = Signal()
 
     def __init__(self) -> None:
@@ -64,6 +70,7 @@ class CommandThreadHandler(QObject):
         self.__cmd_thread = _CommandThread(command=command)
 
         self.__cmd_thread.progress_updated.connect(self.progress_updated.emit)
+        self.__cmd_thread.workers_updated.connect(self.workers_updated.emit)
         self.__cmd_thread.finished.connect(self.finished.emit)
         self.__cmd_thread.finished.connect(self._cleanup_thread)
         self.__cmd_thread.error.connect(self._handle_error)
@@ -0,0 +1 @@
+# src\file_conversor\tests\file_conversor\cli\bench\__init__.py
@@ -0,0 +1,12 @@
+# tests\cli\bench\test__init.py
+
+from file_conversor.cli import AppTyperGroup, BenchTyperGroup
+from file_conversor.tests.utils import TestTyper
+
+
+class TestBenchHelpCLI:
+    def test_bench_help(self,):
+        result = TestTyper.invoke(AppTyperGroup.Commands.BENCH.value, "--help")
+        for mode in BenchTyperGroup.Commands:
+            assert mode.value in result.output
+        assert result.exit_code == 0
@@ -0,0 +1,32 @@
+# tests\cli\bench\test_bench_run_cli.py
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.cli import AppTyperGroup, BenchTyperGroup
+from file_conversor.cli.bench.run_cli import BenchRunCommand, BenchSuite
+from file_conversor.tests.utils import TestTyper
+
+
+@pytest.mark.skipif(not BenchRunCommand.check_dependencies(), reason="External dependencies not installed")
+class TestBenchRunCLI:
+    def test_bench_run(self, tmp_path: Path):
+        out_path = tmp_path / "bench.json"
+        result = TestTyper.invoke(
+            AppTyperGroup.Commands.BENCH.value, BenchTyperGroup.Commands.RUN.value,
+            "-s", BenchSuite.PILLOW_RESIZE.value,
+            "-n", "2",
+            *TestTyper.get_out_file_params(out_path),
+        )
+        assert result.exit_code == 0
+
+        suite = json.loads(out_path.read_text())["suites"][BenchSuite.PILLOW_RESIZE.value]
+        assert suite["status"] == "ok"
+        assert suite["files"] == 2
+        assert suite["latency_p50_ms"] <= suite["latency_p95_ms"]
+
+    def test_bench_run_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.BENCH.value, BenchTyperGroup.Commands.RUN.value)
@@ -0,0 +1,41 @@
+# tests\cli\bench\test_bench_startup_cli.py
+
+import json
+
+from pathlib import Path
+
+from file_conversor.cli import AppTyperGroup, BenchTyperGroup
+from file_conversor.cli.bench.startup_cli import BenchStartupCommand, BenchStartupTarget
+from file_conversor.tests.utils import TestTyper
+
+
+class TestBenchStartupCLI:
+    def test_bench_startup(self, tmp_path: Path):
+        out_path = tmp_path / "startup.json"
+        result = TestTyper.invoke(
+            AppTyperGroup.Commands.BENCH.value, BenchTyperGroup.Commands.STARTUP.value,
+            "-t", BenchStartupTarget.VERSION.value,
+            "-n", "2",
+            "--top", "3",
+            *TestTyper.get_out_file_params(out_path),
+        )
+        assert result.exit_code == 0
+
+        target = json.loads(out_path.read_text())["targets"][BenchStartupTarget.VERSION.value]
+        assert target["status"] == "ok"
+        assert target["runs"] == 2
+        assert target["wall_p50_ms"] <= target["wall_p95_ms"]
+        assert len(target["top_cumulative"]) == 3
+        assert all(entry["module"].startswith("file_conversor") for entry in target["top_app_cumulative"])
+
+    def test_parse_importtime(self):
+        modules = BenchStartupCommand.parse_importtime(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |     encodings.aliases\n"
+            "import time:       250 |        350 |   encodings\n"
+            "unrelated line\n"
+        )
+        assert modules == {"encodings.aliases": (100, 100, 1), "encodings": (250, 350, 0)}
+
+    def test_bench_startup_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.BENCH.value, BenchTyperGroup.Commands.STARTUP.value)
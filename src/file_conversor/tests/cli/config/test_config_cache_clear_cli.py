@@ -0,0 +1,13 @@
+# tests\cli\config\test_config_cache_clear_cli.py
+
+import pytest
+
+from file_conversor.cli import AppTyperGroup, ConfigTyperGroup
+from file_conversor.cli.config.cache_clear_cli import ConfigCacheClearCommand
+from file_conversor.tests.utils import TestTyper
+
+
+@pytest.mark.skipif(not ConfigCacheClearCommand.check_dependencies(), reason="External dependencies not installed")
+class TestConfigCacheClearCLI:
+    def test_config_cache_clear_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.CONFIG.value, ConfigTyperGroup.Commands.CACHE_CLEAR.value)
@@ -0,0 +1,13 @@
+# tests\cli\config\test_config_cache_show_cli.py
+
+import pytest
+
+from file_conversor.cli import AppTyperGroup, ConfigTyperGroup
+from file_conversor.cli.config.cache_show_cli import ConfigCacheShowCommand
+from file_conversor.tests.utils import TestTyper
+
+
+@pytest.mark.skipif(not ConfigCacheShowCommand.check_dependencies(), reason="External dependencies not installed")
+class TestConfigCacheShowCLI:
+    def test_config_cache_show_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.CONFIG.value, ConfigTyperGroup.Commands.CACHE_SHOW.value)
@@ -0,0 +1,12 @@
+# tests\cli\daemon\test__init.py
+
+from file_conversor.cli import AppTyperGroup, DaemonTyperGroup
+from file_conversor.tests.utils import TestTyper
+
+
+class TestDaemonHelpCLI:
+    def test_daemon_help(self,):
+        result = TestTyper.invoke(AppTyperGroup.Commands.DAEMON.value, "--help")
+        for mode in DaemonTyperGroup.Commands:
+            assert mode.value in result.output
+        assert result.exit_code == 0
@@ -0,0 +1,54 @@
+# tests\cli\daemon\test_daemon_start_cli.py
+
+import multiprocessing
+import shutil
+import tempfile
+import time
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.cli import AppTyperGroup, DaemonTyperGroup
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.daemon_protocol import DaemonProtocol
+from file_conversor.tests.conftest import PatchClassmethod
+from file_conversor.tests.utils import TestTyper
+
+
+def _start():
+    TestTyper.invoke(AppTyperGroup.Commands.DAEMON.value, DaemonTyperGroup.Commands.START.value)
+
+
+@pytest.mark.skipif(not DaemonProtocol.is_supported(), reason="daemon requires Unix domain sockets")
+class TestDaemonStartCLI:
+    def test_daemon_start_stop(self, patch_classmethod: PatchClassmethod):
+        # short path (Unix socket paths are limited to ~100 chars)
+        socket_dir = Path(tempfile.mkdtemp(prefix="fc_"))
+        socket_path = socket_dir / DaemonProtocol.SOCKET_NAME
+        patch_classmethod(DaemonProtocol, "get_socket_path", lambda: socket_path)
+
+        process = multiprocessing.get_context("fork").Process(target=_start, daemon=True)  # inherits patched socket path
+        process.start()
+        try:
+            for _ in range(100):
+                if DaemonClient.is_running():
+                    break
+                time.sleep(0.05)
+
+            result = TestTyper.invoke(AppTyperGroup.Commands.DAEMON.value, DaemonTyperGroup.Commands.STATUS.value)
+            assert result.exit_code == 0
+            assert str(process.pid) in result.output
+
+            result = TestTyper.invoke(AppTyperGroup.Commands.DAEMON.value, DaemonTyperGroup.Commands.STOP.value)
+            assert result.exit_code == 0
+            process.join(timeout=10)
+            assert process.exitcode == 0
+            assert DaemonClient.is_running() is False
+        finally:
+            if process.is_alive():
+                process.kill()
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+    def test_daemon_start_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.DAEMON.value, DaemonTyperGroup.Commands.START.value)
@@ -0,0 +1 @@
+# src\file_conversor\tests\file_conversor\cli\queue\__init__.py
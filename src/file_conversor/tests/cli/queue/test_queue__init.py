@@ -0,0 +1,36 @@
+# tests\cli\queue\test__init.py
+
+from pathlib import Path
+
+import typer
+
+from PIL import Image
+
+from file_conversor.cli import AppTyperGroup, QueueTyperGroup
+from file_conversor.cli._utils import CommandCapture
+from file_conversor.command.image import ImageResizeCommand
+from file_conversor.config import STATE
+from file_conversor.tests.utils import TestTyper
+
+
+class TestQueueHelpCLI:
+    def test_queue_help(self,):
+        result = TestTyper.invoke(AppTyperGroup.Commands.QUEUE.value, "--help")
+        for mode in QueueTyperGroup.Commands:
+            assert mode.value in result.output
+        assert result.exit_code == 0
+
+
+class TestCommandCapture:
+    def test_capture(self, tmp_path: Path):
+        in_path = tmp_path / "input.png"
+        Image.new("RGB", (16, 16)).save(in_path)
+        overwrite_output = STATE.overwrite_output.enabled
+
+        ctx = typer.Context(typer.main.get_command(AppTyperGroup().get_typer()))
+        command, state = CommandCapture.from_args(ctx, ["-oo", "image", "resize", str(in_path), "-s", "0.5"])
+        assert isinstance(command, ImageResizeCommand)
+        assert command.scale == 0.5
+        assert state["overwrite_output"] is True
+        assert STATE.overwrite_output.enabled == overwrite_output  # states restored
+        assert not list(tmp_path.glob("*_resized.png"))  # not executed
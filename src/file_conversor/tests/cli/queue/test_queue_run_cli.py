@@ -0,0 +1,36 @@
+# tests\cli\queue\test_queue_run_cli.py
+
+from pathlib import Path
+
+from PIL import Image
+
+from file_conversor.cli import AppTyperGroup, QueueTyperGroup
+from file_conversor.config.environment import Environment
+from file_conversor.tests.conftest import PatchClassmethod
+from file_conversor.tests.utils import TestTyper
+
+
+class TestQueueRunCLI:
+    def test_queue_submit_run(self, tmp_path: Path, patch_classmethod: PatchClassmethod):
+        patch_classmethod(Environment, "get_data_folder", lambda: tmp_path / "data")
+        in_path, out_dir = tmp_path / "input.png", tmp_path / "out"
+        Image.new("RGB", (16, 16)).save(in_path)
+
+        result = TestTyper.invoke(
+            AppTyperGroup.Commands.QUEUE.value, QueueTyperGroup.Commands.SUBMIT.value,
+            "--", "image", "resize", str(in_path), "-s", "0.5", "-od", str(out_dir),
+        )
+        assert result.exit_code == 0
+        assert not (out_dir / "input_resized.png").exists()  # not executed yet
+
+        result = TestTyper.invoke(AppTyperGroup.Commands.QUEUE.value, QueueTyperGroup.Commands.RUN.value)
+        assert result.exit_code == 0
+        with Image.open(out_dir / "input_resized.png") as img:
+            assert img.size == (8, 8)
+
+        result = TestTyper.invoke(AppTyperGroup.Commands.QUEUE.value, QueueTyperGroup.Commands.STATUS.value, "-s", "done")
+        assert result.exit_code == 0
+        assert "'done': 1" in result.output
+
+    def test_queue_run_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.QUEUE.value, QueueTyperGroup.Commands.RUN.value)
@@ -1,6 +1,8 @@
 
 # tests\cli\test_app__init.py
 
+from pathlib import Path
+
 import typer
 
 from file_conversor.cli import AppTyperGroup
@@ -46,3 +48,42 @@ class TestCLI:
         result = TestTyper.invoke("-h")
         ctx = typer.Context(_get_app_cmd())
         assert ctx.command.get_help(ctx) in result.output
+
+    def test_lazy_groups(self,):
+        import subprocess
+        import sys
+
+        # only the selected group is imported
+        code = (
+            "import sys, typer\n"
+            "from file_conversor.cli import AppTyperGroup\n"
+            "typer.main.get_command(AppTyperGroup().get_typer()).main(['hash', '--help'], standalone_mode=False)\n"
+            "print(sorted(m for m in ('file_conversor.cli.hash', 'file_conversor.cli.image', 'file_conversor.command.pdf') if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+        assert result.stdout.splitlines()[-1] == "['file_conversor.cli.hash']"
+
+    def test_deferred_init(self):
+        import subprocess
+        import sys
+
+        # importing the CLI does not load configuration or translation catalog
+        code = (
+            "from file_conversor.config import Configuration, locale\n"
+            "import file_conversor.cli\n"
+            "print(Configuration._Configuration__data is None, 'gettext' not in locale._translation_cache)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+        assert result.stdout.splitlines()[-1] == "True True"
+
+    def test_command_index_up_to_date(self, tmp_path: Path):
+        import subprocess
+        import sys
+
+        from file_conversor.cli._utils import CommandIndex
+
+        # regenerate with `invoke base.command-index`
+        index_file = tmp_path / "command_index.json"
+        code = f"from pathlib import Path; from file_conversor.cli._utils.command_index_builder import CommandIndexBuilder; CommandIndexBuilder.generate(Path({str(index_file)!r}))"
+        subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)  # noqa: S603
+        assert index_file.read_text(encoding="utf-8") == CommandIndex.get_file().read_text(encoding="utf-8")
@@ -0,0 +1,12 @@
+# tests\cli\watch\test__init.py
+
+from file_conversor.cli import AppTyperGroup, WatchTyperGroup
+from file_conversor.tests.utils import TestTyper
+
+
+class TestWatchHelpCLI:
+    def test_watch_help(self,):
+        result = TestTyper.invoke(AppTyperGroup.Commands.WATCH.value, "--help")
+        for mode in WatchTyperGroup.Commands:
+            assert mode.value in result.output
+        assert result.exit_code == 0
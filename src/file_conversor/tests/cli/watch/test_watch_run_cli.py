@@ -0,0 +1,27 @@
+# tests\cli\watch\test_watch_run_cli.py
+
+from pathlib import Path
+
+from PIL import Image
+
+from file_conversor.cli import AppTyperGroup, WatchTyperGroup
+from file_conversor.tests.utils import TestTyper
+
+
+class TestWatchRunCLI:
+    def test_watch_run(self, tmp_path: Path):
+        input_dir, out_dir = tmp_path / "hot", tmp_path / "out"
+        input_dir.mkdir()
+        Image.new("RGB", (16, 16)).save(input_dir / "input.png")
+
+        result = TestTyper.invoke(
+            AppTyperGroup.Commands.WATCH.value, WatchTyperGroup.Commands.RUN.value,
+            "-t", "0.1", "-it", "1",
+            "--", "image", "resize", str(input_dir), "-s", "0.5", "-od", str(out_dir),
+        )
+        assert result.exit_code == 0
+        with Image.open(out_dir / "input_resized.png") as img:
+            assert img.size == (8, 8)
+
+    def test_watch_run_help(self,):
+        TestTyper.invoke_test_help(AppTyperGroup.Commands.WATCH.value, WatchTyperGroup.Commands.RUN.value)
@@ -0,0 +1,108 @@
+# tests\command\test_batch_executor.py
+
+import os
+import sys
+import threading
+
+import pytest
+
+from file_conversor.command.batch_executor import BatchExecutor
+from file_conversor.config.environment import Environment
+
+
+class TestBatchExecutor:
+    def test_serial_when_single_job(self):
+        executor = BatchExecutor(jobs=1, mode=BatchExecutor.Mode.PROCESS)
+        assert executor.mode == BatchExecutor.Mode.SERIAL
+        assert executor.jobs == 1
+
+    def test_zero_jobs_uses_cpu_count(self):
+        executor = BatchExecutor(jobs=0, mode=BatchExecutor.Mode.THREAD)
+        assert executor.jobs >= 1
+
+    def test_invalid_jobs(self):
+        with pytest.raises(ValueError):
+            BatchExecutor(jobs=-1)
+
+    @pytest.mark.parametrize("mode", [BatchExecutor.Mode.SERIAL, BatchExecutor.Mode.THREAD])
+    def test_map(self, mode: BatchExecutor.Mode):
+        results: list[int] = []
+        lock = threading.Lock()
+
+        def func(item: int):
+            with lock:
+                results.append(item * 2)
+
+        BatchExecutor(jobs=4, mode=mode).map(func, range(20))
+        assert sorted(results) == [i * 2 for i in range(20)]
+
+    def test_map_process_relay(self):
+        executor = BatchExecutor(jobs=2, mode=BatchExecutor.Mode.PROCESS)
+        if executor.mode != BatchExecutor.Mode.PROCESS:
+            pytest.skip("fork() not available")
+
+        messages: list[int] = []
+        executor.map(BatchExecutor.relay, range(10), relay_callback=messages.append)
+        assert sorted(messages) == list(range(10))
+        assert not BatchExecutor.in_worker()  # worker state only exists in children
+
+    def test_map_process_forks_single_threaded(self, monkeypatch: pytest.MonkeyPatch):
+        executor = BatchExecutor(jobs=2, mode=BatchExecutor.Mode.PROCESS)
+        if executor.mode != BatchExecutor.Mode.PROCESS:
+            pytest.skip("fork() not available")
+
+        fork = os.fork
+        forked_threads: list[list[str]] = []
+
+        def _fork() -> int:
+            forked_threads.append([thread.name for thread in threading.enumerate()])
+            return fork()
+
+        # helper threads (log writer, process supervisor) are running, before the batch
+        list(Environment.stream_lines(sys.executable, "-c", "print('ok')"))
+        monkeypatch.setattr(os, "fork", _fork)
+        executor.map(BatchExecutor.relay, range(4), relay_callback=lambda _msg: None)
+        assert forked_threads == [[threading.current_thread().name]] * 2
+
+    def test_map_error(self):
+        def func(item: int):
+            if item == 3:
+                raise RuntimeError("fail")
+
+        with pytest.raises(RuntimeError, match="fail"):
+            BatchExecutor(jobs=2, mode=BatchExecutor.Mode.THREAD).map(func, range(10))
+
+    def test_map_stages_pipeline(self):
+        executor = BatchExecutor(jobs=1, mode=BatchExecutor.Mode.PIPELINE)
+        assert executor.mode == BatchExecutor.Mode.PIPELINE
+
+        step_two_started = threading.Event()
+        overlapped: list[bool] = []
+        results: list[int] = []
+
+        def stage_one(item: int) -> int:
+            if item > 0:
+                # step one of item i+1 must run while step two of item i runs
+                overlapped.append(step_two_started.wait(timeout=5))
+            return item * 10
+
+        def stage_two(item: int) -> int:
+            step_two_started.set()
+            results.append(item)
+            return item
+
+        executor.map_stages([stage_one, stage_two], range(5))
+        assert results == [0, 10, 20, 30, 40]
+        assert all(overlapped)
+
+    def test_map_stages_pipeline_error(self):
+        def stage_one(item: int) -> int:
+            return item
+
+        def stage_two(item: int) -> int:
+            if item == 2:
+                raise RuntimeError("fail")
+            return item
+
+        with pytest.raises(RuntimeError, match="fail"):
+            BatchExecutor(jobs=2, mode=BatchExecutor.Mode.PIPELINE).map_stages([stage_one, stage_two], range(100))
@@ -0,0 +1,118 @@
+# tests\command\test_batch_journal.py
+
+import os
+
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from file_conversor.command.batch_journal import BatchJournal
+from file_conversor.command.data_models import BatchFilesDataModel, FileDataModel
+from file_conversor.config import STATE
+from file_conversor.config.state import StateResume
+
+
+def _create_files(folder: Path, count: int) -> list[Path]:
+    input_files: list[Path] = []
+    for idx in range(count):
+        input_file = folder / f"file{idx}.txt"
+        input_file.write_text(f"{idx}")
+        input_files.append(input_file)
+    return input_files
+
+
+@pytest.fixture
+def resume_state() -> Iterator[StateResume]:
+    yield STATE.resume
+    STATE.resume.enabled = False
+
+
+class TestBatchJournal:
+    def test_records(self, tmp_path: Path):
+        input_file = tmp_path / "in.txt"
+        input_file.write_text("in")
+        output_file = tmp_path / "out" / "out.txt"
+
+        journal = BatchJournal(tmp_path / "out", "key")
+        journal.record_start(input_file, output_file, 0)
+        output_file.write_text("out")
+        journal.record_done(input_file, output_file, 0)
+        journal.close()
+
+        # simulate crash while writing a record
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"event": "start", "inp')
+
+        journal = BatchJournal(tmp_path / "out", "key", resume=True)
+        assert journal.is_done(input_file, output_file, 0)
+        assert not journal.is_orphan(input_file, output_file, 0)
+
+        output_file.write_text("truncated output")
+        assert not journal.is_done(input_file, output_file, 0)
+
+        assert BatchJournal(tmp_path / "out", "other").path != journal.path
+        assert journal.path.exists()
+        assert not BatchJournal(tmp_path / "out", "key", resume=False).path.exists()
+
+    def test_sync_per_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        synced: list[int] = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        input_files = _create_files(tmp_path, 3)
+
+        def step(data: FileDataModel, _get_progress: Callable[[float], float]):
+            data.output_file.write_text(data.input_file.read_text())
+
+        out_dir = tmp_path / "out"
+        BatchFilesDataModel(input_files=input_files, output_dir=out_dir, overwrite_output=False, jobs=1).execute(step, step)
+        assert len(synced) == 3  # one sync per file (not per record)
+        assert not list(out_dir.glob(".file_conversor_journal*"))  # completed batch, nothing to resume
+
+    def test_resume_batch(self, tmp_path: Path, resume_state: StateResume):
+        input_files = _create_files(tmp_path, 3)
+        out_dir = tmp_path / "out"
+
+        calls: list[str] = []
+        fail = True
+
+        def step_one(data: FileDataModel, _get_progress: Callable[[float], float]):
+            calls.append(f"1:{data.input_file.name}")
+            data.output_file.write_text(data.input_file.read_text() + "a")
+
+        def step_two(data: FileDataModel, _get_progress: Callable[[float], float]):
+            calls.append(f"2:{data.input_file.name}")
+            if fail and data.output_file.name == "file1.txt":
+                data.output_file.write_text("partial")
+                raise RuntimeError("crash")
+            data.output_file.write_text(data.input_file.read_text() + "b")
+
+        def run():
+            BatchFilesDataModel(
+                input_files=input_files,
+                output_dir=out_dir,
+                overwrite_output=False,
+                jobs=1,
+            ).execute(step_one, step_two)
+
+        with pytest.raises(RuntimeError):
+            run()
+        assert (out_dir / "file0.txt").read_text() == "0ab"
+        assert (out_dir / "file1.txt").read_text() == "partial"
+
+        # other batch in the same output folder keeps the journal of the interrupted batch
+        other_file = tmp_path / "other.txt"
+        other_file.write_text("other")
+        BatchFilesDataModel(input_files=[other_file], output_dir=out_dir, overwrite_output=False, jobs=1).execute(step_one)
+        assert len(list(out_dir.glob(".file_conversor_journal*"))) == 1
+
+        calls.clear()
+        fail = False
+        resume_state.enabled = True
+        run()
+
+        # file0 completed, file1 resumed at step two (partial output cleaned), file2 processed from scratch
+        assert calls == ["2:file1_step0.txt", "1:file2.txt", "2:file2_step0.txt"]
+        for idx in range(3):
+            assert (out_dir / f"file{idx}.txt").read_text() == f"{idx}ab"
+        assert not list(out_dir.glob("*_step*"))
+        assert not list(out_dir.glob(".file_conversor_journal*"))
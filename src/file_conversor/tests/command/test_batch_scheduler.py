@@ -0,0 +1,49 @@
+# tests\command\test_batch_scheduler.py
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.command.batch_scheduler import BatchScheduler
+
+
+class TestBatchScheduler:
+    def test_longest_first(self):
+        costs = {"a": 10.0, "b": 300.0, "c": 5.0, "d": 42.0}
+        scheduler = BatchScheduler(lambda p: costs[p.name], jobs=2)
+        scheduled = list(scheduler.schedule([Path(n) for n in costs], get_path=lambda p: p))
+        assert [p.name for p, _ in scheduled] == ["b", "d", "a", "c"]
+        assert [c for _, c in scheduled] == [300.0, 42.0, 10.0, 5.0]
+
+    def test_unknown_cost(self):
+        def estimator(path: Path) -> float:
+            if path.name == "bad":
+                raise RuntimeError("cannot estimate")
+            return 10.0 if path.name == "a" else 30.0
+
+        scheduler = BatchScheduler(estimator, jobs=2)
+        estimated = list(scheduler.estimate([Path("a"), Path("bad"), Path("b")], get_path=lambda p: p))
+        assert [(p.name, c) for p, c in estimated] == [("a", 10.0), ("bad", 20.0), ("b", 30.0)]
+
+    def test_no_sort_uses_file_size(self, tmp_path: Path):
+        def estimator(path: Path) -> float:
+            raise AssertionError(f"unexpected estimate of '{path}'")
+
+        (tmp_path / "a").write_bytes(b"0" * 10)
+        (tmp_path / "b").write_bytes(b"0" * 300)
+        scheduler = BatchScheduler(estimator, jobs=2, sort=False)
+        scheduled = list(scheduler.schedule([tmp_path / "a", tmp_path / "b", tmp_path / "missing"], get_path=lambda p: p))
+        assert [(p.name, c) for p, c in scheduled] == [("a", 10.0), ("b", 300.0), ("missing", 155.0)]  # unknown = window mean
+
+    def test_windows(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(BatchScheduler, "WINDOW", 4)
+        scheduler = BatchScheduler(lambda p: float(p.name), jobs=1)
+        names = [str(i) for i in range(1, 11)]
+        scheduled = [p.name for p, _ in scheduler.schedule([Path(n) for n in names], get_path=lambda p: p)]
+        # windows of 2, 4, 4 items (sorted inside each window)
+        assert scheduled == ["2", "1", "6", "5", "4", "3", "10", "9", "8", "7"]
+
+    def test_file_size(self, tmp_path: Path):
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"0" * 123)
+        assert BatchScheduler.file_size(path) == 123.0
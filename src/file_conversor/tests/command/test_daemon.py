@@ -0,0 +1,116 @@
+# tests\command\test_daemon.py
+
+import multiprocessing
+import shutil
+import stat
+import tempfile
+import time
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.command.config import ConfigCacheShowCommand
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.daemon_server import DaemonServer
+from file_conversor.config import STATE
+from file_conversor.config.log import Log
+from file_conversor.daemon_protocol import DaemonProtocol
+
+
+pytestmark = pytest.mark.skipif(not DaemonProtocol.is_supported(), reason="daemon requires Unix domain sockets")
+
+
+def _serve(socket_path: Path):
+    DaemonServer(socket_path).serve()
+
+
+@pytest.fixture
+def daemon_socket():
+    # short path (Unix socket paths are limited to ~100 chars)
+    socket_dir = Path(tempfile.mkdtemp(prefix="fc_"))
+    socket_path = socket_dir / DaemonProtocol.SOCKET_NAME
+    process = multiprocessing.get_context("fork").Process(target=_serve, args=(socket_path,), daemon=True)
+    process.start()
+    try:
+        for _ in range(100):
+            if DaemonClient.is_running(socket_path):
+                break
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        DaemonClient.shutdown(socket_path)
+        process.join(timeout=10)
+        if process.is_alive():
+            process.kill()
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+class TestDaemon:
+    def test_not_running(self, tmp_path: Path):
+        socket_path = tmp_path / DaemonProtocol.SOCKET_NAME
+        assert DaemonClient.get_status(socket_path) is None
+        assert DaemonClient.submit(ConfigCacheShowCommand(), socket_path) is False
+        assert DaemonProtocol.forward_cli(["--help"], socket_path) is None
+
+    def test_no_daemon_option(self, daemon_socket: Path):
+        assert DaemonProtocol.forward_cli(["--no-daemon", "--help"], daemon_socket) is None
+
+    def test_status_and_shutdown(self, daemon_socket: Path):
+        status = DaemonClient.get_status(daemon_socket)
+        assert status is not None
+        assert status["jobs_running"] == 0
+        assert status["socket"] == str(daemon_socket)
+
+        assert DaemonClient.shutdown(daemon_socket) is True
+        for _ in range(100):
+            if not daemon_socket.exists():
+                break
+            time.sleep(0.05)
+        assert DaemonClient.is_running(daemon_socket) is False
+
+    def test_submit_job(self, daemon_socket: Path):
+        command = ConfigCacheShowCommand()
+        assert DaemonClient.submit(command, daemon_socket) is True
+        assert "entries" in command.output
+
+        status = DaemonClient.get_status(daemon_socket)
+        assert status is not None
+        assert status["jobs_done"] + status["jobs_running"] == 1
+
+    def test_socket_is_private(self, daemon_socket: Path):
+        assert stat.S_IMODE(daemon_socket.stat().st_mode) & 0o077 == 0
+
+    def test_untrusted_socket_folder(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        import platformdirs
+
+        runtime_path = tmp_path / "runtime"
+        (runtime_path / DaemonProtocol.APP_NAME).mkdir(parents=True, mode=0o755)  # e.g., pre-created by another user
+        (runtime_path / DaemonProtocol.APP_NAME).chmod(0o755)
+        monkeypatch.setattr(platformdirs, "user_runtime_path", lambda: runtime_path)
+        with pytest.raises(PermissionError):
+            DaemonProtocol.get_socket_path()
+        assert DaemonProtocol.connect() is None
+        with pytest.raises(PermissionError):
+            DaemonServer()
+
+        (runtime_path / DaemonProtocol.APP_NAME).chmod(0o700)
+        assert DaemonProtocol.get_socket_path() == runtime_path.resolve() / DaemonProtocol.APP_NAME / DaemonProtocol.SOCKET_NAME
+
+    def test_get_command_class(self):
+        name = DaemonClient.get_command_name(ConfigCacheShowCommand())
+        assert DaemonClient.get_command_class(name) is ConfigCacheShowCommand
+        with pytest.raises(ValueError):
+            DaemonClient.get_command_class("os:system")
+
+
+class TestStateDict:
+    def test_round_trip(self):
+        data = STATE.to_dict()
+        try:
+            STATE.from_dict({**data, "jobs": 3, "loglevel": Log.Level.DEBUG.name})
+            assert STATE.jobs.value == 3
+            assert STATE.loglevel.level == Log.Level.DEBUG
+        finally:
+            STATE.from_dict(data)
+        assert STATE.to_dict() == data
@@ -0,0 +1,169 @@
+# tests\command\test_data_models.py
+
+import logging
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from file_conversor.command.batch_executor import BatchExecutor
+from file_conversor.command.data_models import BatchFilesDataModel, FileDataModel
+from file_conversor.tests.conftest import UseExecutor
+
+
+GetProgress = Callable[[float], float]
+
+
+class TestBatchFilesDataModel:
+    @pytest.mark.parametrize("mode", [BatchExecutor.Mode.THREAD, BatchExecutor.Mode.PIPELINE])
+    def test_batch_files_parallel(self, tmp_path: Path, use_executor: UseExecutor, mode: BatchExecutor.Mode):
+        use_executor(mode)
+
+        input_files: list[Path] = []
+        for idx in range(6):
+            input_file = tmp_path / f"file{idx}.txt"
+            input_file.write_text(f"{idx}")
+            input_files.append(input_file)
+
+        progress: list[float] = []
+        datamodel = BatchFilesDataModel(
+            input_files=input_files,
+            output_dir=tmp_path / "out",
+            overwrite_output=True,
+            jobs=3,
+        )
+
+        def step_one(data: FileDataModel, get_progress: GetProgress):
+            data.output_file.write_text(data.input_file.read_text() + "a")
+            get_progress(50.0)
+
+        def step_two(data: FileDataModel, get_progress: GetProgress):
+            data.output_file.write_text(data.input_file.read_text() + "b")
+            progress.append(get_progress(100.0))
+
+        datamodel.execute(step_one, step_two)
+
+        for idx in range(6):
+            assert (tmp_path / "out" / f"file{idx}.txt").read_text() == f"{idx}ab"
+            assert not (tmp_path / "out" / f"file{idx}_step0.txt").exists()
+        assert max(progress) == pytest.approx(100.0)
+
+    @pytest.mark.parametrize("folder", [False, True])
+    def test_batch_files_skip_up_to_date(self, tmp_path: Path, caplog: pytest.LogCaptureFixture, folder: bool):
+        import os
+
+        in_dir = tmp_path / "in"
+        in_dir.mkdir()
+        input_files: list[Path] = []
+        for idx in range(3):
+            input_file = in_dir / f"file{idx}.txt"
+            input_file.write_text(f"{idx}")
+            os.utime(input_file, (1000, 1000))
+            input_files.append(input_file)
+
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        (out_dir / "file0.txt").write_text("up to date")
+        (out_dir / "file1.txt").write_text("outdated")
+        os.utime(out_dir / "file1.txt", (10, 10))
+
+        processed: list[str] = []
+
+        def step_one(data: FileDataModel, _get_progress: GetProgress):
+            processed.append(data.input_file.name)
+            data.output_file.write_text(data.input_file.read_text())
+
+        def run():
+            BatchFilesDataModel(
+                input_files=[in_dir] if folder else input_files,
+                output_dir=out_dir,
+                overwrite_output=False,
+                skip_up_to_date=True,
+            ).execute(step_one)
+
+        with caplog.at_level(logging.INFO):
+            run()
+        assert sorted(processed) == ["file1.txt", "file2.txt"]
+        assert (out_dir / "file0.txt").read_text() == "up to date"
+        assert (out_dir / "file1.txt").read_text() == "1"
+        assert (out_dir / "file2.txt").read_text() == "2"
+        assert any(message.endswith(": 1 / 3") for message in caplog.messages)  # files inside folders are counted
+
+        processed.clear()
+        run()
+        assert not processed
+
+    @pytest.mark.parametrize("mode", [BatchExecutor.Mode.SERIAL, BatchExecutor.Mode.PROCESS])
+    def test_batch_files_input_folder(self, tmp_path: Path, use_executor: UseExecutor, mode: BatchExecutor.Mode):
+        use_executor(mode)
+
+        in_dir = tmp_path / "in"
+        (in_dir / "sub").mkdir(parents=True)
+        (in_dir / "a.txt").write_text("a")
+        (in_dir / "sub" / "b.txt").write_text("b")
+        (in_dir / "sub" / "c.md").write_text("c")
+        for idx in range(8):  # more files than the first scheduler window (workers start before the scan ends)
+            (in_dir / "sub" / f"file{idx}.txt").write_text(f"d{idx}")
+
+        progress: list[float] = []
+        datamodel = BatchFilesDataModel(
+            input_files=[in_dir],
+            output_dir=tmp_path / "out",
+            overwrite_output=False,
+            in_formats=["txt"],
+            progress_callback=progress.append,
+        )
+
+        def step_one(data: FileDataModel, get_progress: GetProgress):
+            data.output_file.write_text(data.input_file.read_text().upper())
+            progress.append(get_progress(100.0))
+
+        datamodel.execute(step_one)
+        assert (tmp_path / "out" / "a.txt").read_text() == "A"
+        assert (tmp_path / "out" / "sub" / "b.txt").read_text() == "B"
+        for idx in range(8):
+            assert (tmp_path / "out" / "sub" / f"file{idx}.txt").read_text() == f"D{idx}"
+        assert not (tmp_path / "out" / "sub" / "c.md").exists()
+        assert progress[-1] == pytest.approx(100.0)
+
+    def test_batch_files_serial_weighted_progress(self, tmp_path: Path, use_executor: UseExecutor):
+        use_executor(BatchExecutor.Mode.SERIAL)
+        big, small = tmp_path / "big.txt", tmp_path / "small.txt"
+        big.write_bytes(b"0" * 300)
+        small.write_bytes(b"0" * 100)
+
+        progress: list[float] = []
+
+        def step_one(data: FileDataModel, get_progress: GetProgress):
+            data.output_file.write_bytes(data.input_file.read_bytes())
+            progress.append(get_progress(100.0))
+
+        BatchFilesDataModel(
+            input_files=[big, small],
+            output_dir=tmp_path / "out",
+            overwrite_output=False,
+        ).execute(step_one)
+        assert progress[0] == pytest.approx(75.0)  # weighted by file size (serial batches are not sorted)
+        assert progress[-1] == pytest.approx(100.0)
+
+    @pytest.mark.parametrize("mode", [BatchExecutor.Mode.SERIAL, BatchExecutor.Mode.THREAD])
+    def test_batch_files_accounting(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], use_executor: UseExecutor, mode: BatchExecutor.Mode):
+        import tracemalloc
+
+        from file_conversor.config import ProcessAccounting
+
+        monkeypatch.setattr(ProcessAccounting, "_ProcessAccounting__enabled", True)
+        use_executor(mode)
+        input_files: list[Path] = []
+        for idx in range(2):
+            input_file = tmp_path / f"file{idx}.txt"
+            input_file.write_text(f"{idx}")
+            input_files.append(input_file)
+
+        def step_one(data: FileDataModel, _get_progress: GetProgress):
+            data.output_file.write_text(data.input_file.read_text() * 1024)
+
+        BatchFilesDataModel(input_files=input_files, output_dir=tmp_path / "out", overwrite_output=False).execute(step_one)
+        assert "Resource usage" in capsys.readouterr().out
+        assert not tracemalloc.is_tracing()  # stopped at batch end (parallel thread jobs never start it)
@@ -0,0 +1,78 @@
+# tests\command\test_job_queue.py
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.command.abstract_cmd import AbstractCommand, CommandCapturedError
+from file_conversor.command.config import ConfigCacheShowCommand
+from file_conversor.command.job_queue import JobQueue
+
+
+class TestJobQueue:
+    def test_priority_order(self, tmp_path: Path):
+        job_queue = JobQueue(tmp_path / "queue.sqlite")
+        low = job_queue.submit(ConfigCacheShowCommand())
+        high = job_queue.submit(ConfigCacheShowCommand(), priority=10)
+        low_2 = job_queue.submit(ConfigCacheShowCommand())
+
+        claimed = [job_queue.claim("worker") for _ in range(4)]
+        assert [job.id for job in claimed if job] == [high, low, low_2]
+        assert claimed[-1] is None
+        assert all(job.status == JobQueue.Status.RUNNING and job.attempts == 1 for job in claimed if job)
+
+    def test_retries(self, tmp_path: Path):
+        job_queue = JobQueue(tmp_path / "queue.sqlite")
+        job_id = job_queue.submit(ConfigCacheShowCommand(), retries=1)
+
+        job = job_queue.claim()
+        assert job is not None
+        assert job_queue.fail(job, "error 1") is True  # retry
+        assert job_queue.get_stats()[JobQueue.Status.PENDING] == 1
+
+        job = job_queue.claim()
+        assert job is not None and job.attempts == 2
+        assert job_queue.fail(job, "error 2") is False
+
+        failed = job_queue.get_job(job_id)
+        assert failed is not None
+        assert failed.status == JobQueue.Status.FAILED
+        assert failed.error == "error 2"
+
+    def test_requeue_stale(self, tmp_path: Path):
+        job_queue = JobQueue(tmp_path / "queue.sqlite")
+        job_queue.submit(ConfigCacheShowCommand())
+        job = job_queue.claim(f"{JobQueue.get_worker_name().rpartition(':')[0]}:999999999")  # dead worker
+        assert job is not None
+
+        assert job_queue.requeue_stale() == 1
+        requeued = job_queue.get_job(job.id)
+        assert requeued is not None
+        assert requeued.status == JobQueue.Status.PENDING
+        assert requeued.attempts == 0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run(self, tmp_path: Path, workers: int):
+        job_queue = JobQueue(tmp_path / "queue.sqlite")
+        job_ids = [job_queue.submit(ConfigCacheShowCommand()) for _ in range(4)]
+
+        progress: list[float] = []
+        job_queue.run(workers=workers, progress_callback=progress.append)
+
+        stats = job_queue.get_stats()
+        assert stats[JobQueue.Status.DONE] == 4
+        assert stats["mean_duration"] >= 0.0
+        assert progress[-1] == pytest.approx(100.0)
+        result = job_queue.get_result(job_ids[0])
+        assert result is not None and "entries" in result["output"]
+
+        assert job_queue.clear() == 4
+        assert job_queue.list_jobs() == []
+
+
+class TestCommandCapture:
+    def test_capture(self):
+        with pytest.raises(CommandCapturedError) as exc_info, AbstractCommand.capture():
+            ConfigCacheShowCommand()
+        assert isinstance(exc_info.value.command, ConfigCacheShowCommand)
+        ConfigCacheShowCommand()  # capture disabled
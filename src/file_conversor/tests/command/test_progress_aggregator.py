@@ -0,0 +1,106 @@
+# tests\command\test_progress_aggregator.py
+
+import threading
+import time
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from file_conversor.command.data_models import BatchFilesDataModel, FileDataModel
+from file_conversor.command.progress_aggregator import ProgressAggregator
+
+
+class TestProgressAggregator:
+    def test_rate_limited(self):
+        emitted: list[float] = []
+        aggregator = ProgressAggregator(emitted.append, rate=1.0)
+        for p in range(100):
+            assert aggregator(float(p)) == float(p)
+        assert emitted == [0.0]  # first update, others coalesced
+        assert aggregator.get_overall() == pytest.approx(99.0)
+
+        aggregator.flush()
+        assert emitted == [0.0, 99.0]
+        aggregator.flush()  # nothing pending
+        assert emitted == [0.0, 99.0]
+
+    def test_complete_always_emitted(self):
+        emitted: list[float] = []
+        aggregator = ProgressAggregator(emitted.append, rate=1.0)
+        aggregator(10.0)
+        aggregator(100.0)
+        assert emitted == [10.0, 100.0]
+
+    def test_pending_update_emitted_after_interval(self):
+        emitted: list[float] = []
+        aggregator = ProgressAggregator(emitted.append, rate=20.0)
+        aggregator(10.0)
+        aggregator(20.0)
+        time.sleep(0.3)
+        assert emitted == [10.0, 20.0]
+
+    def test_unlimited_rate(self):
+        emitted: list[float] = []
+        aggregator = ProgressAggregator(emitted.append, rate=0)
+        for p in (10.0, 20.0, 30.0):
+            aggregator(p)
+        assert emitted == [10.0, 20.0, 30.0]
+
+    def test_workers(self):
+        workers: list[dict[str, float]] = []
+        aggregator = ProgressAggregator(workers_callback=workers.append, rate=0)
+        aggregator.set_worker("a.jpg", 50.0)
+        aggregator.set_worker("b.jpg", 150.0)
+        assert aggregator.get_workers() == {"a.jpg": 50.0, "b.jpg": 100.0}
+        aggregator.remove_worker("a.jpg")
+        assert workers[-1] == {"b.jpg": 100.0}
+
+    def test_threads(self):
+        emitted: list[float] = []
+        aggregator = ProgressAggregator(emitted.append, rate=1000.0)
+
+        def worker(worker_idx: int):
+            for p in range(101):
+                aggregator.update(p / 2, workers={f"file_{worker_idx}": float(p)})
+            aggregator.remove_worker(f"file_{worker_idx}")
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        aggregator.flush()
+
+        assert aggregator.get_workers() == {}
+        assert emitted[-1] == pytest.approx(50.0)
+        assert len(emitted) < 8 * 101
+
+    def test_batch_files_workers(self, tmp_path: Path):
+        input_files: list[Path] = []
+        for idx in range(3):
+            input_file = tmp_path / f"input_{idx}.txt"
+            input_file.write_text(str(idx))
+            input_files.append(input_file)
+
+        seen_workers: list[dict[str, float]] = []
+        aggregator = ProgressAggregator(workers_callback=seen_workers.append, rate=0)
+
+        def step(data: FileDataModel, get_progress: Callable[[float], float]):
+            get_progress(50.0)
+            data.output_file.write_text(data.input_file.read_text())
+
+        BatchFilesDataModel(
+            input_files=input_files,
+            output_dir=tmp_path / "out",
+            out_stem="_copy",
+            overwrite_output=True,
+            jobs=1,
+            journal=False,
+            progress_callback=aggregator,
+        ).execute(step)
+
+        assert aggregator.get_overall() == pytest.approx(100.0)
+        assert aggregator.get_workers() == {}
+        assert {"input_0.txt": 50.0} in seen_workers
@@ -0,0 +1,74 @@
+# tests\command\test_progress_manager.py
+
+import threading
+
+import pytest
+
+from file_conversor.command.progress_manager import ProgressManager
+
+
+class TestProgressManager:
+    def test_serial_progress(self):
+        progress_mgr = ProgressManager(out_files=2, steps_per_file=2)
+        assert progress_mgr.get_progress(50.0) == pytest.approx(12.5)
+        assert progress_mgr.next_step() == pytest.approx(25.0)
+        assert progress_mgr.next_step() == pytest.approx(50.0)
+        assert progress_mgr.get_progress(100.0) == pytest.approx(75.0)
+        assert progress_mgr.next_step() == pytest.approx(75.0)
+        assert progress_mgr.next_step() == pytest.approx(100.0)
+        assert progress_mgr.get_progress(0.0) == pytest.approx(100.0)
+
+    def test_set_progress_out_of_order(self):
+        progress_mgr = ProgressManager(out_files=4)
+        assert progress_mgr.set_progress(3, 0, 100.0) == pytest.approx(25.0)
+        assert progress_mgr.set_progress(1, 0, 50.0) == pytest.approx(37.5)
+        assert progress_mgr.set_progress(1, 0, 150.0) == pytest.approx(50.0)
+        assert progress_mgr.get_overall_progress() == pytest.approx(50.0)
+
+    def test_set_progress_invalid_file(self):
+        progress_mgr = ProgressManager(out_files=1)
+        with pytest.raises(RuntimeError):
+            progress_mgr.set_progress(1, 0, 10.0)
+
+    def test_set_progress_threads(self):
+        total_files = 32
+        progress_mgr = ProgressManager(out_files=total_files, steps_per_file=2)
+
+        def worker(file_idx: int):
+            for step_idx in range(2):
+                for p in range(0, 101, 10):
+                    progress_mgr.set_progress(file_idx, step_idx, p)
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(total_files)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert progress_mgr.get_overall_progress() == pytest.approx(100.0)
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            ProgressManager(out_files=0)
+        with pytest.raises(ValueError):
+            ProgressManager(steps_per_file=0)
+
+    def test_set_out_files(self):
+        progress_mgr = ProgressManager(out_files=1)
+        progress_mgr.set_out_files(4)
+        assert progress_mgr.set_progress(3, 0, 100.0) == pytest.approx(25.0)
+        progress_mgr.set_progress(0, 0, 100.0)
+        progress_mgr.set_out_files(2)
+        assert progress_mgr.get_overall_progress() == pytest.approx(50.0)
+
+    def test_weighted_progress(self):
+        progress_mgr = ProgressManager(out_files=3)
+        progress_mgr.set_weight(0, 300.0)
+        progress_mgr.set_weight(1, 100.0)
+        # file 2 is unweighted (uses mean weight = 200)
+        assert progress_mgr.set_progress(0, 0, 100.0) == pytest.approx(50.0)
+        assert progress_mgr.set_progress(1, 0, 100.0) == pytest.approx(100.0 * 400 / 600)
+        assert progress_mgr.set_progress(2, 0, 50.0) == pytest.approx(100.0 * 500 / 600)
+        progress_mgr.set_weight(2, 200.0)
+        assert progress_mgr.get_overall_progress() == pytest.approx(100.0 * 500 / 600)
+        progress_mgr.set_progress(2, 0, 100.0)
+        assert progress_mgr.get_overall_progress() == pytest.approx(100.0)
@@ -0,0 +1,126 @@
+# tests\command\test_result_cache.py
+
+import os
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from file_conversor.command import abstract_cmd
+from file_conversor.command.batch_executor import BatchExecutor
+from file_conversor.command.data_models import BatchFilesDataModel, FileDataModel
+from file_conversor.command.image.compress_cmd import ImageCompressCommand
+from file_conversor.command.result_cache import ResultCache
+from file_conversor.config import CONFIG, ProbeCache
+from file_conversor.tests.conftest import PatchClassmethod, UseExecutor
+
+
+@pytest.fixture
+def cache_folder(tmp_path: Path, patch_classmethod: PatchClassmethod) -> Path:
+    folder = tmp_path / "cache"
+    folder.mkdir()
+    patch_classmethod(ResultCache, "get_folder", lambda: folder)
+    ResultCache.clear()
+    return folder
+
+
+@pytest.mark.usefixtures("cache_folder")
+class TestResultCache:
+    def test_store_and_restore(self, tmp_path: Path):
+        input_file = tmp_path / "in.txt"
+        input_file.write_text("input")
+        output_file = tmp_path / "out.txt"
+        output_file.write_text("output")
+
+        key = ResultCache.get_key(input_file, "fingerprint", ".txt")
+        assert key != ResultCache.get_key(input_file, "other", ".txt")
+        assert key != ResultCache.get_key(input_file, "fingerprint", ".md")
+
+        restored = tmp_path / "restored.txt"
+        assert not ResultCache.restore(key, restored)
+
+        ResultCache.store(key, output_file, max_size=1024)
+        assert ResultCache.restore(key, restored)
+        assert restored.read_text() == "output"
+
+        stats = ResultCache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        ResultCache.clear()
+        assert ResultCache.get_stats()["entries"] == 0
+
+    def test_lru_eviction(self, tmp_path: Path, cache_folder: Path):
+        output_file = tmp_path / "out.bin"
+        output_file.write_bytes(b"0" * 100)
+        restored = tmp_path / "restored.bin"
+
+        ResultCache.store("aa01", output_file, max_size=1000)
+        ResultCache.store("bb02", output_file, max_size=1000)
+        os.utime(cache_folder / "aa" / "aa01", (1, 1))  # least recently used
+        assert ResultCache.restore("bb02", restored)
+
+        in_flight = cache_folder / "dd" / "dd04.123_456.tmp"  # store of another process
+        in_flight.parent.mkdir()
+        in_flight.write_bytes(b"0" * 100)
+
+        ResultCache.store("cc03", output_file, max_size=250)
+        assert not ResultCache.restore("aa01", restored)
+        assert ResultCache.restore("bb02", restored)
+        assert ResultCache.restore("cc03", restored)
+        assert in_flight.exists()
+        assert ResultCache.get_stats()["entries"] == 2
+
+    @pytest.mark.parametrize("mode", [BatchExecutor.Mode.SERIAL, BatchExecutor.Mode.PROCESS])
+    def test_batch_files_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_executor: UseExecutor, mode: BatchExecutor.Mode):
+        use_executor(mode)
+        monkeypatch.setattr(CONFIG, "result_cache", True)
+        input_files = [tmp_path / "in.txt", tmp_path / "in2.txt"]
+        for idx, input_file in enumerate(input_files):
+            input_file.write_text(f"abc{idx}")
+        calls: list[Path] = []
+
+        def step_one(data: FileDataModel, _get_progress: Callable[[float], float]):
+            calls.append(data.input_file)
+            data.output_file.write_text(data.input_file.read_text().upper())
+
+        for _ in range(2):
+            BatchFilesDataModel(
+                input_files=input_files,
+                output_dir=tmp_path / "out",
+                overwrite_output=True,
+                cache_fingerprint="upper",
+            ).execute(step_one)
+            assert (tmp_path / "out" / "in.txt").read_text() == "ABC0"
+        if mode == BatchExecutor.Mode.SERIAL:
+            assert len(calls) == 2  # process workers do not share ``calls``
+        stats = ResultCache.get_stats()  # hits / misses of process workers are relayed to the parent process
+        assert (stats["hits"], stats["misses"]) == (2, 2)
+
+    def test_command_fingerprint(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, patch_classmethod: PatchClassmethod):
+        probed: list[str] = []
+
+        def which(name: str | Path) -> Path | None:
+            probed.append(str(name))
+            return None
+
+        patch_classmethod(ProbeCache, "which", which)
+        monkeypatch.setattr(abstract_cmd, "_tool_stamps", {})
+
+        def get_fingerprint(quality: int) -> str | None:
+            return ImageCompressCommand(input_files=[tmp_path / "in.jpg"], quality=quality, output_dir=tmp_path).get_cache_fingerprint()
+
+        monkeypatch.setattr(CONFIG, "result_cache", False)
+        assert get_fingerprint(80) is None
+        assert not probed  # dependencies are probed only if cache is enabled
+
+        monkeypatch.setattr(CONFIG, "result_cache", True)
+        fingerprint = get_fingerprint(80)
+        assert sorted(probed) == sorted(ImageCompressCommand._external_dependencies())  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+        probed.clear()
+        assert get_fingerprint(80) == fingerprint
+        assert get_fingerprint(90) != fingerprint
+        assert not probed  # probed once per process
@@ -0,0 +1,134 @@
+# tests\command\test_throughput_history.py
+
+import os
+
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from file_conversor.command.batch_executor import BatchExecutor
+from file_conversor.command.batch_planner import BatchPlanner
+from file_conversor.command.data_models import BatchFilesDataModel, FileDataModel
+from file_conversor.command.throughput_history import ThroughputHistory
+from file_conversor.config import STATE
+from file_conversor.config.state import StatePlan
+from file_conversor.tests.conftest import PatchClassmethod, UseExecutor
+
+
+GetProgress = Callable[[float], float]
+
+
+@pytest.fixture
+def history_file(tmp_path: Path, patch_classmethod: PatchClassmethod) -> Path:
+    file = tmp_path / "history.json"
+    patch_classmethod(ThroughputHistory, "get_file", lambda: file)
+    ThroughputHistory.pop_samples()  # samples left by other tests
+    return file
+
+
+@pytest.fixture
+def plan_state() -> Iterator[StatePlan]:
+    STATE.plan.enabled = True
+    yield STATE.plan
+    STATE.plan.enabled = False
+
+
+class TestThroughputHistory:
+    def test_record_and_estimate(self, history_file: Path):
+        key = ThroughputHistory.get_key(Path("in.PNG"), Path("out.jpg"), "_resized")
+        assert key == ".png>.jpg:_resized"
+        assert ThroughputHistory.estimate(key, cost=10, in_size=100) == (None, None)
+
+        ThroughputHistory.record(key, cost=10, duration=2.0, in_size=100, out_size=50)
+        ThroughputHistory.record(key, cost=30, duration=6.0, in_size=300, out_size=150)
+        ThroughputHistory.flush()
+        assert history_file.exists()
+
+        duration, out_size = ThroughputHistory.estimate(key, cost=20, in_size=1000)
+        assert duration == pytest.approx(4.0)
+        assert out_size == 500
+
+    @pytest.mark.usefixtures("history_file")
+    def test_samples_decay(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(ThroughputHistory, "MAX_SAMPLES", 4)
+        for _ in range(10):
+            ThroughputHistory.record("key", cost=1, duration=1.0, in_size=1, out_size=1)
+        ThroughputHistory.flush()
+
+        stats = ThroughputHistory.get_stats("key")
+        assert stats is not None
+        assert stats["count"] == pytest.approx(4)
+        assert ThroughputHistory.estimate("key", cost=2, in_size=2) == (pytest.approx(2.0), 2)
+
+    @pytest.mark.usefixtures("history_file")
+    def test_process_workers(self, tmp_path: Path, use_executor: UseExecutor):
+        use_executor(BatchExecutor.Mode.PROCESS)
+        input_files: list[Path] = []
+        for idx in range(4):
+            input_file = tmp_path / f"in{idx}.txt"
+            input_file.write_text("0123456789")
+            input_files.append(input_file)
+
+        def step_one(data: FileDataModel, _get_progress: GetProgress):
+            data.output_file.write_text(data.input_file.read_text())
+
+        BatchFilesDataModel(input_files=input_files, output_dir=tmp_path / "out", overwrite_output=False, jobs=2).execute(step_one)
+
+        # samples of process workers are saved by the parent process
+        stats = ThroughputHistory.get_stats(".txt>.txt:")
+        assert stats is not None
+        assert stats["count"] == pytest.approx(4)
+
+
+class TestBatchPlan:
+    @pytest.mark.usefixtures("history_file", "plan_state")
+    def test_plan_writes_nothing(self, tmp_path: Path):
+        input_file = tmp_path / "in.txt"
+        input_file.write_text("0123456789")
+        ThroughputHistory.record(".txt>.txt:", cost=10, duration=1.0, in_size=10, out_size=20)
+        ThroughputHistory.flush()
+
+        out_dir = tmp_path / "out"
+        calls: list[Path] = []
+
+        def step_one(data: FileDataModel, _get_progress: GetProgress):
+            calls.append(data.input_file)
+
+        BatchFilesDataModel(input_files=[input_file], output_dir=out_dir, overwrite_output=False).execute(step_one)
+        assert not calls
+        assert not out_dir.exists()
+
+    @pytest.mark.usefixtures("plan_state")
+    def test_plan_skips_up_to_date(self, tmp_path: Path):
+        input_file = tmp_path / "in.txt"
+        input_file.write_text("0123456789")
+        os.utime(input_file, (1000, 1000))
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        (out_dir / "in.txt").write_text("up to date")
+
+        datamodel = BatchFilesDataModel(input_files=[input_file], output_dir=out_dir, overwrite_output=False, skip_up_to_date=True)
+        assert not datamodel.get_list()  # plan lists only files that would run
+
+    @pytest.mark.usefixtures("history_file")
+    def test_planner_totals(self, tmp_path: Path):
+        ThroughputHistory.record(".txt>.txt:", cost=10, duration=1.0, in_size=10, out_size=20)
+        input_files: list[Path] = []
+        for idx in range(4):
+            input_file = tmp_path / f"in{idx}.bin" if idx == 3 else tmp_path / f"in{idx}.txt"
+            input_file.write_text("0123456789")
+            input_files.append(input_file)
+
+        planner = BatchPlanner(jobs=2)
+        for input_file in input_files:
+            output_file = tmp_path / "out" / input_file.name
+            planner.add(input_file, output_file, ThroughputHistory.get_key(input_file, output_file), cost=10)
+
+        totals = planner.get_totals()
+        assert totals["files"] == 4
+        assert totals["unknown"] == 1
+        assert totals["duration"] == pytest.approx(3.0)
+        assert totals["wall_time"] == pytest.approx(1.5)
+        assert totals["out_size"] == 3 * 20 + 10  # unknown output size = input size
+        planner.print(tmp_path / "out")
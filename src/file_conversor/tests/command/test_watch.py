@@ -0,0 +1,48 @@
+# tests\command\test_watch.py
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from PIL import Image
+
+from file_conversor.command.daemon_client import DaemonClient
+from file_conversor.command.image import ImageResizeCommand, ImageResizeResamplingOption
+from file_conversor.command.watch import WatchRunCommand
+
+
+class TestWatchRunCommand:
+    def _get_command(self, input_dir: Path, output_dir: Path, **kwargs: Any) -> WatchRunCommand:
+        resize = ImageResizeCommand(input_files=[input_dir], scale=0.5, width=None, resampling=ImageResizeResamplingOption.BICUBIC, output_dir=output_dir)
+        return WatchRunCommand(
+            command=DaemonClient.get_command_name(resize),
+            options=resize.model_dump(mode="json"),
+            stable_time=0.1,
+            **kwargs,
+        )
+
+    def test_watch_run(self, tmp_path: Path):
+        input_dir, output_dir = tmp_path / "hot", tmp_path / "out"
+        (input_dir / "sub").mkdir(parents=True)
+        Image.new("RGB", (16, 16)).save(input_dir / "a.png")
+        Image.new("RGB", (16, 16)).save(input_dir / "sub" / "b.png")
+        (input_dir / "notes.txt").write_text("not an image")
+
+        command = self._get_command(input_dir, output_dir, max_files=2, idle_timeout=5.0)
+        command.execute()
+
+        assert (command.processed, command.failed) == (2, 0)
+        assert (output_dir / "a_resized.png").exists()
+        assert (output_dir / "sub" / "b_resized.png").exists()  # mirrors input folder structure
+
+    def test_output_inside_watched_folder(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            self._get_command(tmp_path, tmp_path / "out").execute()
+
+    def test_idle_timeout(self, tmp_path: Path):
+        input_dir = tmp_path / "hot"
+        input_dir.mkdir()
+        command = self._get_command(input_dir, tmp_path / "out", idle_timeout=0.3)
+        command.execute()
+        assert (command.processed, command.failed) == (0, 0)
@@ -0,0 +1,51 @@
+# tests\config\test_background_mode.py
+
+import os
+import sys
+import threading
+
+from typing import Iterator
+
+import pytest
+
+from file_conversor.config.background_mode import BackgroundMode
+from file_conversor.config.environment import Environment
+from file_conversor.config.state import STATE, StateBackground
+from file_conversor.tests.conftest import PatchClassmethod
+
+
+@pytest.fixture
+def background_state() -> Iterator[StateBackground]:
+    STATE.background.enabled = True
+    yield STATE.background
+    STATE.background.enabled = False
+
+
+class TestBackgroundMode:
+    def test_disabled(self):
+        assert BackgroundMode.prepare(("tool", "arg")) == (["tool", "arg"], {})
+        assert Environment.prepare_command(("tool", "arg")) == (["tool", "arg"], {})
+
+    @pytest.mark.usefixtures("background_state")
+    def test_scope_prefix(self, patch_classmethod: PatchClassmethod):
+        patch_classmethod(BackgroundMode, "apply", lambda: None)
+        patch_classmethod(BackgroundMode, "_get_scope_prefix", lambda: ["systemd-run", "--scope", "--"])
+        cmd, _kwargs = BackgroundMode.prepare(("tool", "arg"))
+        if sys.platform != "win32":
+            assert cmd == ["systemd-run", "--scope", "--", "tool", "arg"]
+        assert BackgroundMode.prepare(("tool", "arg"), wrap=False)[0] == ["tool", "arg"]
+
+    @pytest.mark.skipif(not hasattr(os, "getpriority"), reason="requires os.getpriority()")
+    @pytest.mark.usefixtures("background_state")
+    def test_child_niceness(self, patch_classmethod: PatchClassmethod):
+        patch_classmethod(BackgroundMode, "_get_scope_prefix", list)
+        niceness: list[int] = []
+
+        def run():  # runs in its own thread (background priority is never restored)
+            result = Environment.run(sys.executable, "-c", "import os; print(os.getpriority(os.PRIO_PROCESS, 0))")
+            niceness.append(int(result.stdout))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        assert niceness == [max(19, os.getpriority(os.PRIO_PROCESS, 0))]
@@ -0,0 +1,66 @@
+# tests\config\test_environment.py
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from file_conversor.config.environment import Environment
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+class TestEnvironment:
+    def test_stream_lines(self):
+        cmd = _python("import sys; sys.stdout.write('a\\nprogress 1\\rprogress 2\\r\\nb\\n'); sys.stdout.flush(); sys.stderr.write('err\\n')")
+        assert list(Environment.stream_lines(*cmd)) == ["a", "progress 1", "progress 2", "b", "err"]
+
+    def test_stream_lines_error(self):
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            for _line in Environment.stream_lines(*_python("print('failed'); raise SystemExit(3)")):
+                pass
+        assert exc_info.value.returncode == 3
+        assert exc_info.value.output == "failed"
+
+    def test_stream_lines_timeout(self):
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            list(Environment.stream_lines(*_python("import time; time.sleep(30)"), timeout=0.5))
+        assert time.monotonic() - start < 10.0
+
+    def test_stream_lines_close_kills(self):
+        lines = Environment.stream_lines(*_python("import os, time; print(os.getpid(), flush=True); time.sleep(30)"))
+        pid = int(next(lines))
+        lines.close()  # type: ignore
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)  # killed and reaped
+
+    def test_concurrent_processes(self):
+        cmd = _python("import time; [print(i, flush=True) or time.sleep(0.05) for i in range(5)]")
+
+        def _stream(_idx: int) -> list[str]:
+            return list(Environment.stream_lines(*cmd))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(_stream, range(8)))
+        assert all(lines == ["0", "1", "2", "3", "4"] for lines in results)
+
+    def test_run_async(self):
+        async def run_all():
+            lines: list[str] = []
+            return lines, await asyncio.gather(
+                Environment.run_async(*_python("print('x')"), line_callback=lines.append),
+                Environment.run_async(*_python("raise SystemExit(1)"), check=False),
+            )
+
+        lines, (ok, failed) = asyncio.run(run_all())
+        assert lines == ["x"]
+        assert ok.returncode == 0 and ok.stdout == "x"
+        assert failed.returncode == 1
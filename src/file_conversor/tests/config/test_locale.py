@@ -0,0 +1,48 @@
+# tests\config\test_locale.py
+
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.config import locale
+from file_conversor.config.environment import Environment
+from file_conversor.tests.conftest import PatchClassmethod
+
+
+@pytest.fixture
+def available_languages():
+    """ Reload available languages before and after the test (language index patched). """
+    locale.AVAILABLE_LANGUAGES.reload()
+    yield locale.AVAILABLE_LANGUAGES
+    locale.AVAILABLE_LANGUAGES.reload()
+
+
+class TestLocale:
+    def test_language_index(self, tmp_path: Path, patch_classmethod: PatchClassmethod, available_languages: locale.AvailableLanguages):
+        (tmp_path / locale.LANGUAGE_INDEX_FILE).write_text(json.dumps(["en_US", "pt_BR"]))
+        patch_classmethod(Environment, "get_build_data_folder", lambda: tmp_path)
+        languages = available_languages
+        assert "pt_BR" in languages
+        assert sorted(languages) == ["en_US", "pt_BR"]
+        assert languages & {"pt_BR", "xx_XX"} == {"pt_BR"}
+
+    def test_language_index_missing(self, tmp_path: Path, patch_classmethod: PatchClassmethod, available_languages: locale.AvailableLanguages):
+        (tmp_path / "xx_XX" / "LC_MESSAGES").mkdir(parents=True)
+        (tmp_path / "xx_XX" / "LC_MESSAGES" / "messages.mo").write_bytes(b"")
+        patch_classmethod(Environment, "get_build_data_folder", lambda: tmp_path / "missing")
+        patch_classmethod(Environment, "get_locales_folder", lambda: tmp_path)
+        assert set(available_languages) == {"xx_XX"}
+
+    def test_deferred_init(self):
+        # importing the config package does not load configuration, language list or translation catalog
+        code = (
+            "from file_conversor.config import Configuration, locale\n"
+            "_ = locale.get_translation()\n"
+            "print(Configuration._Configuration__data is None, locale.AVAILABLE_LANGUAGES._AvailableLanguages__languages is None, 'gettext' not in locale._translation_cache)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+        assert result.stdout.splitlines()[-1] == "True True True"
@@ -0,0 +1,114 @@
+# tests\config\test_log.py
+
+import logging
+import os
+import threading
+
+from pathlib import Path
+from typing import override
+
+import pytest
+
+from file_conversor.config.log import Log
+
+
+@pytest.fixture
+def log(tmp_path: Path):
+    level = Log.Level.get()
+    log = Log(dest_folder=tmp_path, level=Log.Level.INFO)
+    yield log
+    log.set_dest_folder(None)
+    log._stop_listener()  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    log._remove_handler(log._console_handler)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    level.set()
+
+
+class TestLog:
+    def test_background_writer(self, log: Log, tmp_path: Path):
+        logger = log.getLogger("test_log")
+        logger.info("message %d of [bold]%s[/]", 1, "test")
+        for idx in range(1000):
+            logger.info("batch %d", idx)
+        log.flush()
+
+        lines = (tmp_path / Log.FILENAME).read_text(encoding="utf-8").splitlines()
+        assert lines[0].endswith("[INFO]: message 1 of test")
+        assert [line.rsplit(" ", 1)[-1] for line in lines[1:]] == [str(idx) for idx in range(1000)]
+
+    def test_writer_thread(self, log: Log):
+        listener = log._listener  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        writer = listener.writer if listener is not None else None
+        assert writer is not None and writer is not threading.current_thread()
+        assert any(isinstance(handler, Log.LazyQueueHandler) for handler in logging.getLogger().handlers)
+
+        queue_handler, file_handler = log._queue_handler, log._file_handler  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        log.set_dest_folder(None)
+        assert not writer.is_alive()
+        assert queue_handler not in logging.getLogger().handlers
+        assert file_handler not in logging.getLogger().handlers
+
+    def test_disabled_level_not_formatted(self, log: Log, tmp_path: Path):
+        class _Arg:
+            calls = 0
+
+            @override
+            def __str__(self) -> str:
+                _Arg.calls += 1
+                return "arg"
+
+        logger = log.getLogger("test_log")
+        logger.debug("skipped %s", _Arg())
+        log.flush()
+        assert _Arg.calls == 0
+
+        logger.info("logged %s", _Arg())
+        log.flush()
+        assert _Arg.calls > 0
+        assert "skipped" not in (tmp_path / Log.FILENAME).read_text(encoding="utf-8")
+
+    def test_console_formatted_by_writer(self, log: Log, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+        threads: list[threading.Thread] = []
+
+        class _Arg:
+            @override
+            def __str__(self) -> str:
+                threads.append(threading.current_thread())
+                return "arg"
+
+        logger = log.getLogger("test_log")
+        logger.log_to_file = False
+        listener = log._listener  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        writer = listener.writer if listener is not None else None
+        logger.info("console only %s", _Arg())
+        log.getLogger("test_log").info("file and console")
+        log.flush()
+
+        assert writer is not None and writer in threads  # not formatted by the caller (only by pytest log capture)
+        out = capsys.readouterr().out
+        assert "console only arg" in out and "file and console" in out
+        text = (tmp_path / Log.FILENAME).read_text(encoding="utf-8")
+        assert "console only" not in text and "file and console" in text
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() not supported")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")  # fork() of multi-threaded process
+    def test_forked_child(self, log: Log, tmp_path: Path):
+        logger = log.getLogger("test_log")
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover (child exits without atexit callbacks)
+            logger.info("from child")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        log.flush()
+        assert "from child" in (tmp_path / Log.FILENAME).read_text(encoding="utf-8")
+
+    def test_paused(self, log: Log, tmp_path: Path):
+        logger = log.getLogger("test_log")
+        with log.paused():
+            assert log._listener is None  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+            logger.info("while paused")
+        logger.info("after pause")
+        log.flush()
+
+        text = (tmp_path / Log.FILENAME).read_text(encoding="utf-8")
+        assert text.count("while paused") == 1
+        assert text.count("after pause") == 1  # file handler is not used twice (directly and by the writer)
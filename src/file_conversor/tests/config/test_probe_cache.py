@@ -0,0 +1,76 @@
+# tests\config\test_probe_cache.py
+
+import json
+import os
+import sys
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from file_conversor.config.probe_cache import ProbeCache
+from file_conversor.tests.conftest import PatchClassmethod
+
+
+@pytest.fixture
+def probe_cache(tmp_path: Path, patch_classmethod: PatchClassmethod) -> Iterator[type[ProbeCache]]:
+    ProbeCache.flush()  # pending probes of the real cache file
+    patch_classmethod(ProbeCache, "get_file", lambda: tmp_path / "probes.json")
+    ProbeCache.clear()
+    yield ProbeCache
+    ProbeCache.clear()
+    ProbeCache.reload()
+
+
+@pytest.mark.usefixtures("probe_cache")
+class TestProbeCache:
+    def test_which(self, monkeypatch: pytest.MonkeyPatch):
+        python = ProbeCache.which(Path(sys.executable).name)
+        assert python is not None
+        assert ProbeCache.which("__missing_executable__") is None
+
+        # served from memory / disk, while PATH and the executable are unchanged
+        def which(_name: str) -> str | None:
+            return None
+        monkeypatch.setattr("shutil.which", which)
+        assert ProbeCache.which(Path(sys.executable).name) == python
+        ProbeCache.reload()
+        assert ProbeCache.which(Path(sys.executable).name) == python
+
+        # PATH changes invalidate lookups
+        monkeypatch.setenv("PATH", os.environ["PATH"] + os.pathsep + "changed")
+        assert ProbeCache.which(Path(sys.executable).name) is None
+
+    def test_get(self, tmp_path: Path):
+        tool = tmp_path / "tool"
+        tool.write_text("v1")
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        calls: list[int] = []
+
+        def compute():
+            calls.append(1)
+            return f"probe {len(calls)}"
+
+        assert ProbeCache.get(tool, "--version", compute) == "probe 1"
+        assert ProbeCache.get(tool, "--version", compute) == "probe 1"
+        assert ProbeCache.get(tool, "--version", compute, watch=[data_dir]) == "probe 2"  # new watched path
+        assert ProbeCache.get(tool, "--version", compute) == "probe 2"
+
+        (data_dir / "new_file").write_text("")
+        assert ProbeCache.get(tool, "--version", compute) == "probe 3"
+
+        tool.write_text("v2 (upgraded)")
+        assert ProbeCache.get(tool, "--version", compute) == "probe 4"
+        assert json.loads(ProbeCache.get_file().read_text())[f"probe:{tool}:--version"]["value"] == "probe 4"
+
+        ProbeCache.invalidate(tool, "--version")
+        assert ProbeCache.get(tool, "--version", compute) == "probe 5"
+
+    def test_clear(self, tmp_path: Path):
+        ProbeCache.get(tmp_path, "probe", lambda: 1)
+        assert ProbeCache.get_file().exists()
+        ProbeCache.clear()
+        assert not ProbeCache.get_file().exists()
+        assert ProbeCache.get(tmp_path, "probe", lambda: 2) == 2
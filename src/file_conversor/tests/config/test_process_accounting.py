@@ -0,0 +1,85 @@
+# tests\config\test_process_accounting.py
+
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from typing import Iterator
+
+import pytest
+
+from file_conversor.config.environment import Environment
+from file_conversor.config.process_accounting import ProcessAccounting
+
+
+_BURN_CPU = "import time; end = time.process_time() + 0.2\nwhile time.process_time() < end: pass\nprint('done')"
+
+
+@pytest.fixture
+def accounting(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[ProcessAccounting]]:
+    monkeypatch.setattr(ProcessAccounting, "_ProcessAccounting__enabled", True)
+    ProcessAccounting.reset()
+    yield ProcessAccounting
+    ProcessAccounting.reset()
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="requires os.wait4()")
+class TestProcessAccounting:
+    @pytest.mark.usefixtures("accounting")
+    def test_run(self):
+        with ProcessAccounting.collect() as usages:
+            Environment.run(sys.executable, "-c", _BURN_CPU)
+        assert len(usages) == 1
+        usage = usages[0]
+        assert usage.tool == ProcessAccounting.get_tool(sys.executable)
+        assert usage.user_time + usage.system_time >= 0.1
+        assert usage.wall_time >= usage.user_time * 0.5
+        assert usage.max_rss > 1024 * 1024
+
+    @pytest.mark.usefixtures("accounting")
+    def test_stream_lines(self):
+        with ProcessAccounting.collect() as usages:
+            assert list(Environment.stream_lines(sys.executable, "-c", _BURN_CPU)) == ["done"]
+        assert len(usages) == 1
+        assert usages[0].user_time + usages[0].system_time >= 0.1
+
+        summary = ProcessAccounting.get_summary()
+        assert summary[usages[0].tool]["count"] == 1
+
+    @pytest.mark.usefixtures("accounting")
+    def test_run_nowait(self):
+        with ProcessAccounting.collect() as usages:
+            process = Environment.run_nowait(sys.executable, "-c", _BURN_CPU)
+            with pytest.raises(subprocess.TimeoutExpired):
+                process.wait(timeout=0.01)
+            assert process.poll() is None
+            assert process.wait(timeout=30) == 0
+            assert process.poll() == 0
+        assert len(usages) == 1
+        assert usages[0].user_time + usages[0].system_time >= 0.1
+
+    @pytest.mark.usefixtures("accounting")
+    def test_measure(self):
+        with ProcessAccounting.collect() as usages, ProcessAccounting.measure():
+            data = [bytearray(1024) for _ in range(1024)]
+            del data
+        assert [u.tool for u in usages] == [ProcessAccounting.PYTHON_TOOL]
+        assert usages[0].peak_memory >= 1024 * 1024
+        assert tracemalloc.is_tracing()
+
+        ProcessAccounting.stop_tracing()
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.usefixtures("accounting")
+    def test_measure_parallel(self):
+        with ProcessAccounting.collect() as usages, ProcessAccounting.measure(trace_memory=False):
+            data = [bytearray(1024) for _ in range(1024)]
+            del data
+        assert usages[0].peak_memory == 0  # unknown
+        assert not tracemalloc.is_tracing()
+
+    def test_disabled(self):
+        with ProcessAccounting.collect() as usages:
+            Environment.run(sys.executable, "-c", "pass")
+        assert not usages
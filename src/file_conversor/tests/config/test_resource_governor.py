@@ -0,0 +1,119 @@
+# tests\config\test_resource_governor.py
+
+import threading
+import time
+
+import pytest
+
+from file_conversor.config.resource_governor import ResourceGovernor
+from file_conversor.tests.conftest import PatchClassmethod
+
+
+class TestResourceGovernor:
+    @pytest.fixture
+    def four_cpus(self, monkeypatch: pytest.MonkeyPatch, patch_classmethod: PatchClassmethod):
+        patch_classmethod(ResourceGovernor, "_get_cpus", lambda: [0, 1, 2, 3])
+        monkeypatch.setattr(ResourceGovernor, "_ResourceGovernor__free_cpus", None)
+        monkeypatch.setattr(ResourceGovernor, "_ResourceGovernor__total", 0)
+
+    @pytest.mark.usefixtures("four_cpus")
+    def test_threads(self):
+        assert not ResourceGovernor.is_governed()
+        assert ResourceGovernor.get_threads() == 4
+        assert ResourceGovernor.get_share(3) == 1
+        assert ResourceGovernor.get_share(2) == 2
+
+        with ResourceGovernor.acquire(2, affinity=False) as granted:
+            assert granted == 2
+            assert ResourceGovernor.is_governed()
+            assert ResourceGovernor.get_threads() == 2
+            with ResourceGovernor.acquire(4, affinity=False) as nested:
+                assert nested == 2  # reuses outer grant
+        assert not ResourceGovernor.is_governed()
+
+    @pytest.mark.usefixtures("four_cpus")
+    def test_partition(self):
+        ResourceGovernor.set_partition(1, 2)  # process worker 1 of 2
+        with ResourceGovernor.acquire(4, affinity=False) as granted:
+            assert granted == 2
+
+        ResourceGovernor.set_partition(5, 8)  # more workers than CPUs (wraps around)
+        with ResourceGovernor.acquire(4, affinity=False) as granted:
+            assert granted == 1
+
+    def test_blocking(self):
+        total = ResourceGovernor.get_total_tokens()
+        running, max_running = 0, 0
+        lock = threading.Lock()
+
+        def job():
+            nonlocal running, max_running
+            with ResourceGovernor.acquire(total, affinity=False):
+                with lock:
+                    running += 1
+                    max_running = max(max_running, running)
+                time.sleep(0.02)
+                with lock:
+                    running -= 1
+
+        threads = [threading.Thread(target=job) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert max_running == 1
+
+    def test_memory_admission(self):
+        running: list[int] = []
+        max_running: list[int] = []
+        lock = threading.Lock()
+
+        def job(nbytes: int):
+            with ResourceGovernor.acquire_memory(nbytes, budget=100):
+                with lock:
+                    running.append(nbytes)
+                    max_running.append(sum(running))
+                time.sleep(0.02)
+                with lock:
+                    running.remove(nbytes)
+
+        # two small jobs fit together, the huge one runs alone
+        threads = [threading.Thread(target=job, args=(n,)) for n in (40, 40, 500, 30)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert max(max_running) == 500
+        assert all(total <= 100 or total == 500 for total in max_running)
+
+    def test_memory_admission_shared(self):
+        import multiprocessing
+
+        running: list[int] = []
+        max_running: list[int] = []
+        lock = threading.Lock()
+
+        def job(nbytes: int):
+            with ResourceGovernor.acquire_memory(nbytes, budget=100):
+                with lock:
+                    running.append(nbytes)
+                    max_running.append(sum(running))
+                time.sleep(0.02)
+                with lock:
+                    running.remove(nbytes)
+
+        # counter shared by process workers (threads stand in for workers here)
+        ResourceGovernor.share_memory(multiprocessing.get_context("fork").Value("q", 0))
+        try:
+            threads = [threading.Thread(target=job, args=(n,)) for n in (60, 60, 30)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            ResourceGovernor.share_memory(None)
+        assert all(total <= 100 for total in max_running)
+
+    def test_memory_unlimited(self):
+        with ResourceGovernor.acquire_memory(10**15, budget=0), ResourceGovernor.acquire_memory(10**15, budget=0):
+            pass
@@ -0,0 +1,41 @@
+# tests\config\test_tracer.py
+
+import json
+import os
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from file_conversor.config.tracer import Tracer
+
+
+class TestTracer:
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(Tracer, "_Tracer__path", None)
+        with Tracer.span("noop"):
+            pass
+        Tracer.save()  # nothing to save
+        assert not Tracer.is_enabled()
+
+    def test_spans(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(Tracer, "_Tracer__path", None)
+        trace_file = tmp_path / "trace.json"
+        Tracer.enable(trace_file)
+        with Tracer.span("outer", "step", input_file=Path("a.png")), Tracer.span("inner", "process"):
+            pass
+
+        # spans of process workers are merged from partial trace files
+        part_event: dict[str, Any] = {"name": "child", "cat": "step", "ph": "X", "ts": 1.0, "dur": 1.0, "pid": os.getpid() + 1, "tid": 1, "args": {}}
+        Path(f"{trace_file}.{os.getpid() + 1}.part").write_text(json.dumps(part_event) + "\n")
+        Tracer.save()
+
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        spans = {e["name"]: e for e in events if e["ph"] == "X"}
+        assert set(spans) == {"startup", "outer", "inner", "child"}
+        assert spans["outer"]["args"] == {"input_file": "a.png"}
+        assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+        assert spans["inner"]["dur"] <= spans["outer"]["dur"]
+        assert any(e["ph"] == "M" for e in events)
+        assert not list(tmp_path.glob("*.part"))
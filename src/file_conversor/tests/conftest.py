@@ -2,9 +2,39 @@
 import sys
 
 from pathlib import Path
+from typing import Any, Callable
+
+import pytest
 
 
 src_dir = str(Path(__file__).resolve().parents[1] / "src")
 sys.path.insert(0, src_dir)
 
 print(f"Added to sys.path:\n'{src_dir}'")
+
+# user-provided modules
+from file_conversor.command.batch_executor import BatchExecutor  # noqa: E402
+
+
+PatchClassmethod = Callable[[type, str, Callable[..., Any]], None]
+UseExecutor = Callable[[BatchExecutor.Mode], None]
+
+
+@pytest.fixture
+def patch_classmethod(monkeypatch: pytest.MonkeyPatch) -> PatchClassmethod:
+    """ Replace a classmethod (for the duration of the test) with a function, called without ``cls``. """
+    def _patch(cls: type, name: str, func: Callable[..., Any]) -> None:
+        def _classmethod(_cls: Any, *args: Any, **kwargs: Any) -> Any:
+            return func(*args, **kwargs)
+        monkeypatch.setattr(cls, name, classmethod(_classmethod))
+    return _patch
+
+
+@pytest.fixture
+def use_executor(patch_classmethod: PatchClassmethod) -> UseExecutor:
+    """ Make batch commands use an executor mode (``BatchExecutor.from_state()``), regardless of app config. """
+    def _use(mode: BatchExecutor.Mode) -> None:
+        def _from_state(jobs: int | None = None) -> BatchExecutor:
+            return BatchExecutor(jobs=jobs or 2, mode=mode)
+        patch_classmethod(BatchExecutor, "from_state", _from_state)
+    return _use
@@ -0,0 +1,55 @@
+# tests\gui\test_form_frame.py
+
+import os
+
+from typing import Any, Callable
+
+import pytest
+
+from file_conversor.command.progress_aggregator import ProgressAggregator
+from file_conversor.config.environment import Environment
+
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from file_conversor.gui._frames.form_frame import FormFrame  # noqa: E402
+from file_conversor.gui._frames.statusbar_frame import StatusBarFrame  # noqa: E402
+
+
+class _Command:
+    def __init__(self) -> None:
+        super().__init__()
+        self._callback: Callable[[float], Any] = lambda p: p
+
+    def set_progress_callback(self, callback: Callable[[float], Any]) -> None:
+        self._callback = callback
+
+    def execute(self) -> None:
+        assert isinstance(self._callback, ProgressAggregator)
+        self._callback.update(progress=25.0, workers={"a.txt": 50.0, "b.txt": 0.0})
+
+
+class TestFormFrame:
+    def test_workers_updated(self):
+        _app = QApplication.instance() or QApplication([])
+        frame = FormFrame(gui_path=Environment.get_gui_folder(), title="test")
+        workers: list[dict[str, float]] = []
+        frame.cmd_thread_handler.workers_updated.connect(workers.append)
+
+        loop = QEventLoop()
+        frame.cmd_thread_handler.finished.connect(loop.quit)
+        QTimer.singleShot(10_000, loop.quit)
+        frame.cmd_thread_handler.start(_Command())
+        loop.exec()
+
+        assert workers[-1] == {"a.txt": 50.0, "b.txt": 0.0}
+        assert frame.status_bar._label_workers.text() == "a.txt (50%), b.txt (0%)"  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    def test_format_workers(self):
+        workers = {f"file{idx}.txt": 10.0 * idx for idx in range(5)}
+        assert StatusBarFrame.formatWorkers(workers) == "file0.txt (0%), file1.txt (10%), file2.txt (20%), +2"
+        assert not StatusBarFrame.formatWorkers({})
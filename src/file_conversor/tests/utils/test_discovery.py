@@ -0,0 +1,50 @@
+# tests\utils\test_discovery.py
+
+from pathlib import Path
+
+from file_conversor.utils.discovery import iter_files, match_file
+
+
+class TestUtilsDiscovery:
+    def _create_tree(self, root: Path):
+        for rel_path in [
+            "a.pdf",
+            "b.PDF",
+            "c.txt",
+            "sub/d.pdf",
+            "sub/deep/e.pdf",
+            "drafts/f.pdf",
+            ".git/g.pdf",
+        ]:
+            path = root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel_path)
+
+    def _rel(self, root: Path, files: list[Path]) -> set[str]:
+        return {f.relative_to(root).as_posix() for f in files}
+
+    def test_iter_files(self, tmp_path: Path):
+        self._create_tree(tmp_path)
+        assert self._rel(tmp_path, list(iter_files(tmp_path))) == {
+            "a.pdf", "b.PDF", "c.txt", "sub/d.pdf", "sub/deep/e.pdf", "drafts/f.pdf", ".git/g.pdf",
+        }
+
+    def test_iter_files_formats(self, tmp_path: Path):
+        self._create_tree(tmp_path)
+        assert self._rel(tmp_path, list(iter_files(tmp_path, file_formats=["pdf"], recursive=False))) == {"a.pdf", "b.PDF"}
+
+    def test_iter_files_globs(self, tmp_path: Path):
+        self._create_tree(tmp_path)
+        files = iter_files(tmp_path, file_formats=["pdf"], exclude=[".git", "drafts/*"], include=["*.pdf", "sub/*"])
+        assert self._rel(tmp_path, list(files)) == {"a.pdf", "sub/d.pdf", "sub/deep/e.pdf"}
+
+    def test_iter_files_is_lazy(self, tmp_path: Path):
+        self._create_tree(tmp_path)
+        files = iter_files(tmp_path)
+        assert isinstance(next(files), Path)
+
+    def test_match_file_same_as_iter_files(self, tmp_path: Path):
+        self._create_tree(tmp_path)
+        file_formats, include, exclude = ["pdf"], ["*.pdf", "sub/*"], [".git", "drafts/*"]
+        matched = [f for f in iter_files(tmp_path) if match_file(f, tmp_path, file_formats=file_formats, include=include, exclude=exclude)]
+        assert self._rel(tmp_path, matched) == self._rel(tmp_path, list(iter_files(tmp_path, file_formats=file_formats, include=include, exclude=exclude)))
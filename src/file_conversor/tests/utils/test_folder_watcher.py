@@ -0,0 +1,82 @@
+# tests\utils\test_folder_watcher.py
+
+import threading
+import time
+
+from pathlib import Path
+
+import pytest
+
+from file_conversor.utils.folder_watcher import FolderWatcher
+
+
+MODES = [False, pytest.param(True, marks=pytest.mark.skipif(not FolderWatcher.is_inotify_supported(), reason="inotify not available"))]
+
+
+def _collect(watcher: FolderWatcher, stop_event: threading.Event) -> tuple[list[Path], threading.Thread]:
+    found: list[Path] = []
+
+    def _watch():
+        for path in watcher.watch(stop_event):
+            found.append(path)
+    thread = threading.Thread(target=_watch, daemon=True)
+    thread.start()
+    return found, thread
+
+
+def _wait_for(found: list[Path], count: int, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while len(found) < count and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+class TestFolderWatcher:
+    @pytest.mark.parametrize("use_inotify", MODES)
+    def test_new_files(self, tmp_path: Path, use_inotify: bool):
+        (tmp_path / "old.txt").write_text("old")
+        watcher = FolderWatcher(tmp_path, file_filter=lambda p: p.suffix == ".txt", existing=False,
+                                stable_time=0.2, poll_interval=0.05, use_inotify=use_inotify)
+        stop_event = threading.Event()
+        found, thread = _collect(watcher, stop_event)
+        try:
+            time.sleep(0.2)
+            (tmp_path / "ignored.tmp").write_text("tmp")
+            (tmp_path / "sub").mkdir()
+            (tmp_path / "sub" / "new.txt").write_text("new")
+            _wait_for(found, 1)
+            time.sleep(0.3)  # nothing else reported
+        finally:
+            stop_event.set()
+            thread.join()
+        assert found == [(tmp_path / "sub" / "new.txt").resolve()]
+
+    @pytest.mark.parametrize("use_inotify", MODES)
+    def test_partial_file_debounced(self, tmp_path: Path, use_inotify: bool):
+        watcher = FolderWatcher(tmp_path, stable_time=0.5, poll_interval=0.05, use_inotify=use_inotify)
+        stop_event = threading.Event()
+        found, thread = _collect(watcher, stop_event)
+        try:
+            path = tmp_path / "big.bin"
+            with open(path, "wb") as f:
+                for _ in range(5):
+                    f.write(b"x" * 1024)
+                    f.flush()
+                    time.sleep(0.15)
+                    assert found == []  # still being written
+            _wait_for(found, 1)
+        finally:
+            stop_event.set()
+            thread.join()
+        assert found == [path.resolve()]
+        assert path.stat().st_size == 5 * 1024
+
+    def test_existing_files(self, tmp_path: Path):
+        (tmp_path / "a.txt").write_text("a")
+        watcher = FolderWatcher(tmp_path, stable_time=0.0, poll_interval=0.05, use_inotify=False)
+        stop_event = threading.Event()
+        found, thread = _collect(watcher, stop_event)
+        _wait_for(found, 1)
+        time.sleep(0.2)  # unchanged files are reported once
+        stop_event.set()
+        thread.join()
+        assert found == [(tmp_path / "a.txt").resolve()]
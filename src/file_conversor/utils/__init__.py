@@ -7,6 +7,8 @@ It can contain utility functions or classes that are used across the application
 """
 
 from file_conversor.utils.ema_eta import *
+from file_conversor.utils.discovery import *
+from file_conversor.utils.folder_watcher import *
 from file_conversor.utils.formatters import *
 from file_conversor.utils.protocols import *
 from file_conversor.utils.validators import *
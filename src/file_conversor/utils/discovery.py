@@ -0,0 +1,112 @@
+# src\file_conversor\utils\discovery.py
+
+import fnmatch
+import os
+import re
+
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# user-provided modules
+from file_conversor.config.locale import get_translation
+
+
+_ = get_translation()
+
+
+def _compile_globs(globs: Iterable[str]) -> re.Pattern[str] | None:
+    patterns = [fnmatch.translate(glob) for glob in globs]
+    return re.compile("|".join(patterns)) if patterns else None
+
+
+def match_file(
+    file: Path,
+    root: Path,
+    file_formats: Iterable[str] = (),
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+) -> bool:
+    """
+    Check if a file inside ``root`` is accepted by the same filters used by ``iter_files()`` (e.g., files found by folder watchers).
+
+    :param file: File path.
+    :param root: Root folder.
+    :param file_formats: Accepted file formats (suffix without dot). If empty, accept all formats.
+    :param include: Include globs. If empty, include all files.
+    :param exclude: Exclude globs (also matched against parent folders).
+    """
+    formats = {f.lower().lstrip(".") for f in file_formats}
+    include_re = _compile_globs(include)
+    exclude_re = _compile_globs(exclude)
+    try:
+        rel_parts = file.relative_to(root).parts
+    except ValueError:
+        rel_parts = (file.name,)
+
+    if exclude_re:
+        for idx, name in enumerate(rel_parts):
+            if exclude_re.match(name) or exclude_re.match("/".join(rel_parts[:idx + 1])):
+                return False
+    if formats and file.suffix[1:].lower() not in formats:
+        return False
+    return not include_re or bool(include_re.match(file.name) or include_re.match("/".join(rel_parts)))
+
+
+def iter_files(
+    root: Path,
+    file_formats: Iterable[str] = (),
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    recursive: bool = True,
+) -> Iterator[Path]:
+    """
+    Find files inside a folder, lazily (streaming, uses ``os.scandir()`` and its cached file type info).
+
+    Globs are matched against the file name and against the path relative to ``root`` (e.g., ``*.pdf``, ``drafts/*``).
+
+    :param root: Root folder.
+    :param file_formats: Accepted file formats (suffix without dot). If empty, accept all formats.
+    :param include: Include globs. If empty, include all files.
+    :param exclude: Exclude globs (also prunes matching folders).
+    :param recursive: Search subfolders. Defaults to True.
+
+    :return: Iterator of file paths.
+    """
+    formats = {f.lower().lstrip(".") for f in file_formats}
+    include_re = _compile_globs(include)
+    exclude_re = _compile_globs(exclude)
+
+    def _matches(pattern: re.Pattern[str], name: str, rel_path: str) -> bool:
+        return bool(pattern.match(name) or pattern.match(rel_path))
+
+    stack: list[tuple[str, str]] = [(str(root), "")]  # (folder path, relative path)
+    while stack:
+        folder, rel_folder = stack.pop()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    rel_path = f"{rel_folder}{entry.name}"
+                    if exclude_re and _matches(exclude_re, entry.name, rel_path):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append((entry.path, f"{rel_path}/"))
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if formats and os.path.splitext(entry.name)[1][1:].lower() not in formats:
+                        continue
+                    if include_re and not _matches(include_re, entry.name, rel_path):
+                        continue
+                    yield Path(entry.path)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue  # folder removed / not readable during the scan
+
+
+__all__ = [
+    "match_file",
+    "iter_files",
+]
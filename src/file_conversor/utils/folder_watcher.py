@@ -0,0 +1,276 @@
+# src\file_conversor\utils\folder_watcher.py
+
+import os
+import struct
+import sys
+import threading
+import time
+
+from pathlib import Path
+from typing import Callable, Iterator
+
+# user-provided modules
+from file_conversor.config import LOG, get_translation
+from file_conversor.utils.discovery import iter_files
+
+
+_ = get_translation()
+logger = LOG.getLogger(__name__)
+
+
+class _Inotify:
+    """ Minimal inotify binding (Linux, ``ctypes``). """
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        return sys.platform.startswith("linux")
+
+    def __init__(self) -> None:
+        import ctypes
+        import ctypes.util
+
+        super().__init__()
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watches: dict[int, Path] = {}
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, folder: Path):
+        import ctypes
+
+        wd: int = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self.WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(folder))
+        self._watches[wd] = folder
+
+    def read_events(self) -> Iterator[tuple[Path | None, int]]:
+        """ Read pending events (path, mask). Path is None for queue overflows. """
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                yield None, mask
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)  # folder removed
+                continue
+            folder = self._watches.get(wd)
+            if folder is not None:
+                yield (folder / os.fsdecode(name)) if name else folder, mask
+
+    def close(self):
+        os.close(self._fd)
+
+
+class FolderWatcher:
+    """
+    Watch a folder for new (or rewritten) files, using inotify (Linux) or polling (other platforms).
+
+    Files are reported once they are complete: no events for ``stable_time`` seconds, and same size / mtime
+    between two checks (debounces files that are still being written or copied).
+    """
+    STABLE_TIME = 2.0
+    """ default time (seconds) a file must be unchanged before it is reported """
+    POLL_INTERVAL = 1.0
+    """ default interval (seconds) between folder scans (polling mode) """
+
+    def __init__(
+        self,
+        folder: Path,
+        file_filter: Callable[[Path], bool] | None = None,
+        recursive: bool = True,
+        existing: bool = True,
+        stable_time: float | None = None,
+        poll_interval: float | None = None,
+        use_inotify: bool | None = None,
+    ) -> None:
+        """
+        Inits folder watcher.
+
+        :param folder: Folder to watch.
+        :param file_filter: Accept file (e.g., ``match_file()``). Defaults to None (all files).
+        :param recursive: Watch subfolders (including new ones). Defaults to True.
+        :param existing: Report files already inside the folder. Defaults to True.
+        :param stable_time: Time (seconds) a file must be unchanged before it is reported. Defaults to None (``STABLE_TIME``).
+        :param poll_interval: Interval (seconds) between folder scans, in polling mode. Defaults to None (``POLL_INTERVAL``).
+        :param use_inotify: Use inotify. Defaults to None (use it, if available).
+        """
+        super().__init__()
+        self._folder = folder.resolve()
+        self._file_filter: Callable[[Path], bool] = file_filter or (lambda _path: True)
+        self._recursive = recursive
+        self._existing = existing
+        self._stable_time = self.STABLE_TIME if stable_time is None else max(stable_time, 0.0)
+        self._poll_interval = self.POLL_INTERVAL if poll_interval is None else max(poll_interval, 0.01)
+        self._use_inotify = self.is_inotify_supported() if use_inotify is None else use_inotify
+
+        self._pending: dict[Path, tuple[int, int, float]] = {}
+        """ files waiting to be stable (path => size, mtime, last change) """
+        self._reported: dict[Path, tuple[int, int]] = {}
+        """ reported files (path => size, mtime), so unchanged files are reported only once """
+
+    @classmethod
+    def is_inotify_supported(cls) -> bool:
+        """Check if inotify is available (otherwise, folder is polled)."""
+        return _Inotify.is_supported()
+
+    @property
+    def folder(self) -> Path:
+        return self._folder
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._use_inotify
+
+    def _stat(self, path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns) if path.is_file() else None
+
+    def _touch(self, path: Path, now: float):
+        """ File changed (event or scan), (re)start its stable timer. """
+        stat = self._stat(path)
+        if stat is None:
+            self._pending.pop(path, None)
+            self._reported.pop(path, None)
+            return
+        if self._reported.get(path) == stat or not self._file_filter(path):
+            return
+        self._pending[path] = (*stat, now)
+
+    def _scan(self, now: float, report: bool = True):
+        """ Scan folder (start, polling mode, lost events). Unreported or changed files become pending. """
+        found: set[Path] = set()
+        for path in iter_files(self._folder, recursive=self._recursive):
+            found.add(path)
+            if report:
+                if path not in self._pending:
+                    self._touch(path, now)
+            elif (stat := self._stat(path)) is not None:
+                self._reported[path] = stat  # ignore existing files
+        for path in set(self._reported) - found:
+            del self._reported[path]  # removed (e.g., moved out after processing)
+
+    def _pop_ready(self, now: float) -> list[Path]:
+        ready: list[Path] = []
+        for path, (size, mtime, changed) in list(self._pending.items()):
+            stat = self._stat(path)
+            if stat is None:
+                del self._pending[path]
+            elif stat != (size, mtime):
+                self._pending[path] = (*stat, now)  # still being written
+            elif now - changed >= self._stable_time:
+                del self._pending[path]
+                self._reported[path] = stat
+                ready.append(path)
+        return sorted(ready)
+
+    def _add_watches(self, inotify: _Inotify, folder: Path):
+        inotify.add_watch(folder)
+        if not self._recursive:
+            return
+        for root, dirs, _files in os.walk(folder):
+            for name in dirs:
+                try:
+                    inotify.add_watch(Path(root) / name)
+                except OSError as e:
+                    logger.debug(f"Cannot watch folder '{Path(root) / name}': {repr(e)}")
+
+    def watch(self, stop_event: threading.Event | None = None) -> Iterator[Path]:
+        """
+        Watch folder, and yield files once they are complete.
+
+        :param stop_event: Stop watching when set. Defaults to None (watch forever).
+
+        :return: Iterator of complete files.
+        """
+        stop_event = stop_event or threading.Event()
+        inotify: _Inotify | None = None
+        if self._use_inotify:
+            try:
+                inotify = _Inotify()
+                self._add_watches(inotify, self._folder)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"{_('inotify not available, falling back to polling')}: {repr(e)}")
+                if inotify is not None:
+                    inotify.close()
+                inotify = None
+        logger.info(f"{_('Watching folder')} '{self._folder}' ({'inotify' if inotify else _('polling')}) ...")
+
+        try:
+            self._scan(time.monotonic(), report=self._existing)
+            last_scan = time.monotonic()
+            tick = min(max(self._stable_time / 4, 0.05), 0.5)  # stop_event / stable timers granularity
+            while not stop_event.is_set():
+                now = time.monotonic()
+                if inotify is None:
+                    if now - last_scan >= self._poll_interval:
+                        self._scan(now)
+                        last_scan = now
+                    timeout = min(tick, self._poll_interval)
+                else:
+                    timeout = tick if self._pending else 0.5
+                    self._read_inotify(inotify, now)
+
+                yield from self._pop_ready(time.monotonic())
+                if inotify is None:
+                    stop_event.wait(timeout)
+                else:
+                    import select
+                    select.select([inotify], [], [], timeout)
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def _read_inotify(self, inotify: _Inotify, now: float):
+        for path, mask in inotify.read_events():
+            if path is None:
+                logger.warning(_("inotify queue overflow, rescanning folder"))
+                self._scan(now)
+            elif mask & _Inotify.IN_DELETE_SELF and path == self._folder:
+                raise FileNotFoundError(f"{_('Watched folder removed')}: '{self._folder}'")
+            elif mask & _Inotify.IN_ISDIR:
+                if self._recursive and mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO):
+                    self._add_watches(inotify, path)
+                    for file in iter_files(path):
+                        self._touch(file, now)  # files created before the watch was added
+            elif mask & (_Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM):
+                self._pending.pop(path, None)
+                self._reported.pop(path, None)
+            else:
+                self._touch(path, now)
+
+
+__all__ = [
+    "FolderWatcher",
+]
@@ -172,19 +172,22 @@ def check_positive_integer(num: int | float | None, allow_zero: bool = False):
     return num
 
 
-def check_file_format(filename_or_list: Path | Iterable[Path] | None, file_formats: Iterable[str], exists: bool = False):
+def check_file_format(filename_or_list: Path | Iterable[Path] | None, file_formats: Iterable[str], exists: bool = False, allow_dirs: bool = False):
     """
     Checks if the provided format is supported.
 
     :param filename_or_list: Filename or iterable list
     :param file_formats: Supported file formats
     :param exists: Check if file exists. Default False (do not check).
+    :param allow_dirs: Accept existing folders (their files are filtered by format later). Default False.
 
     :raises typer.BadParameter: Unsupported format, or file not found.
     :raises TypeError: Invalid parameter type.
     """
     file_list: list[Path] = [filename_or_list] if isinstance(filename_or_list, Path) else list(filename_or_list or [])
     for path in file_list:
+        if allow_dirs and path.is_dir():
+            continue
         file_format = path.suffix[1:]
         if file_formats and file_format not in file_formats:
             raise typer.BadParameter(f"\n{_('Unsupported format')} '{file_format}'. {_('Supported formats are')}: {', '.join([str(f) for f in file_formats])}.")
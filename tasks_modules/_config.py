@@ -42,6 +42,7 @@ PROJECT_ENTRYPOINTS: list[str] = list(PYPROJECT["project"]["scripts"].values())
 PROJECT_HOMEPAGE = f"https://github.com/andre-romano/{PROJECT_NAME}"
 CHOCO_PKG_REPO_URL = f"https://github.com/andre-romano/{PROJECT_NAME}"
 
+DATA_PATH = Path(PYPROJECT["tool"]["myproject"]["data_path"])
 ICONS_PATH = Path(PYPROJECT["tool"]["myproject"]["icons_path"])
 I18N_PATH = Path(PYPROJECT["tool"]["myproject"]["locales_path"])
 
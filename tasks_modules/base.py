@@ -163,6 +163,17 @@ def deps(c: InvokeContext):
     print("[bold]Checking for circular dependencies ... [/][bold green]OK[/]")
 
 
+@task
+def command_index(c: InvokeContext):
+    """ Generate CLI command index (help texts of command groups, used by --help / shell completion) """
+    print(f"[bold] Generating command index ... [/]")
+    result = c.run(f'pdm run python -c "from {PROJECT_NAME}.cli._utils.command_index_builder import CommandIndexBuilder; CommandIndexBuilder.generate()"')
+    assert (result is not None) and (result.return_code == 0)
+    if not (DATA_PATH / "command_index.json").exists():
+        raise RuntimeError("Command index not created")
+    print(f"[bold] Generating command index ... [/][bold green]OK[/]")
+
+
 @task(pre=[clean_htmlcov, locales.build])   # pyright: ignore[reportUntypedFunctionDecorator, reportUnknownMemberType]
 def tests(c: InvokeContext, app: str = f"pdm run python -m {PROJECT_NAME}"):
     print("[bold] Running self tests ... [/]")
@@ -1,5 +1,7 @@
 # tasks_modules\locales.py
 
+import json
+
 import polib
 
 from deep_translator import GoogleTranslator  # pyright: ignore[reportMissingTypeStubs]
@@ -138,3 +140,9 @@ def build(c: InvokeContext) -> None:
     result = c.run(f"pdm run pybabel compile -d {I18N_PATH}")
     assert (result is not None) and (result.return_code == 0)
     print(f"[bold] Building locales .mo files ... [/][bold green]OK[/]")
+
+    print(f"[bold] Building language index ... [/]")
+    languages = sorted({mo.relative_to(I18N_PATH).parts[0] for mo in I18N_PATH.glob("**/LC_MESSAGES/*.mo")})
+    DATA_PATH.mkdir(parents=True, exist_ok=True)
+    (DATA_PATH / "languages.json").write_text(json.dumps(languages) + "\n", encoding="utf-8")
+    print(f"[bold] Building language index ({len(languages)} languages) ... [/][bold green]OK[/]")
@@ -27,7 +27,7 @@ def clean_app_folder(_: InvokeContext):
     _config.remove_path_pattern(str(APP_FOLDER))
 
 
-@task(pre=[mkdirs, locales.build])  # pyright: ignore[reportUntypedFunctionDecorator, reportUnknownMemberType]
+@task(pre=[mkdirs, locales.build, base.command_index])  # pyright: ignore[reportUntypedFunctionDecorator, reportUnknownMemberType]
 def copy_dependencies(c: InvokeContext):
     print("[bold]Copying dependencies into pyinstaller ...[/]")
     SITE_PACKAGES = APP_FOLDER / "_internal"
@@ -5,7 +5,7 @@ from pathlib import Path
 from invoke.tasks import task  # pyright: ignore[reportUnknownVariableType]
 
 # user provided
-from tasks_modules import _config, locales
+from tasks_modules import _config, base, locales
 from tasks_modules._config import *  # noqa: S2208
 
 
@@ -34,7 +34,7 @@ def check_requirements(c: InvokeContext):
     print("[bold]Checking requirements ... [/][bold green]OK[/]")
 
 
-@task(pre=[locales.build])  # pyright: ignore[reportUntypedFunctionDecorator, reportUnknownMemberType]
+@task(pre=[locales.build, base.command_index])  # pyright: ignore[reportUntypedFunctionDecorator, reportUnknownMemberType]
 def copy_includes(_: InvokeContext):
     print("[bold]Copying MANIFEST.in includes ...[/]")
     for include in _config.parse_manifest_includes():